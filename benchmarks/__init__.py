@@ -0,0 +1 @@
+"""Performance benchmarks of analyzers, widgets and serialization, run them with `python -m benchmarks`"""
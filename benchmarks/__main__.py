@@ -0,0 +1,62 @@
+"""Run benchmarks and compare them with a baseline:
+
+    python -m benchmarks --rows 10000 100000 --output results.json
+    python -m benchmarks --rows 10000 100000 --baseline results.json
+
+The exit code is 1 if there are regressions against the baseline.
+"""
+import argparse
+import itertools
+import sys
+
+from benchmarks.cases import get_cases
+from benchmarks.datasets import DatasetSpec
+from benchmarks.runner import compare
+from benchmarks.runner import format_comparisons
+from benchmarks.runner import format_results
+from benchmarks.runner import load_results
+from benchmarks.runner import run_case
+from benchmarks.runner import save_results
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000], help="Rows counts of datasets")
+    parser.add_argument("--num-columns", type=int, nargs="+", default=[10], help="Numeric features counts")
+    parser.add_argument("--cat-columns", type=int, nargs="+", default=[5], help="Categorical features counts")
+    parser.add_argument("--cardinality", type=int, nargs="+", default=[10], help="Categorical features cardinalities")
+    parser.add_argument("--filter", default=None, help="Run only benchmarks with this substring in names")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs count to take the best time")
+    parser.add_argument("--output", default=None, help="Path to save results as a JSON file")
+    parser.add_argument("--baseline", default=None, help="Path to baseline results to compare with")
+    parser.add_argument("--time-tolerance", type=float, default=0.2, help="Allowed share of slowdown")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2, help="Allowed share of memory increase")
+    parsed = parser.parse_args(args)
+
+    specs = [
+        DatasetSpec(rows, num_columns, cat_columns, cardinality)
+        for rows, num_columns, cat_columns, cardinality in itertools.product(
+            parsed.rows, parsed.num_columns, parsed.cat_columns, parsed.cardinality
+        )
+    ]
+    results = []
+
+    for case in get_cases(specs):
+        if parsed.filter is None or parsed.filter in case.full_name:
+            results.append(run_case(case, parsed.repeat))
+            print(format_results(results[-1:]).splitlines()[-1], flush=True)
+
+    if parsed.output is not None:
+        save_results(results, parsed.output)
+
+    if parsed.baseline is None:
+        return 0
+
+    comparisons = compare(results, load_results(parsed.baseline), parsed.time_tolerance, parsed.memory_tolerance)
+    print()
+    print(format_comparisons(comparisons))
+    return 1 if any(comparison.regression for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
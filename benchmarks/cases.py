@@ -0,0 +1,152 @@
+"""Benchmark cases: analyzers, tabs widgets, dashboards and profiles serialization"""
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Type
+
+from evidently.analyzers.base_analyzer import Analyzer
+from evidently.analyzers.cat_target_drift_analyzer import CatTargetDriftAnalyzer
+from evidently.analyzers.classification_performance_analyzer import ClassificationPerformanceAnalyzer
+from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
+from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
+from evidently.analyzers.num_target_drift_analyzer import NumTargetDriftAnalyzer
+from evidently.analyzers.prob_classification_performance_analyzer import ProbClassificationPerformanceAnalyzer
+from evidently.analyzers.regression_performance_analyzer import RegressionPerformanceAnalyzer
+from evidently.analyzers.stattests.utils import get_binned_data
+from evidently.dashboard import Dashboard
+from evidently.dashboard.tabs import CatTargetDriftTab
+from evidently.dashboard.tabs import ClassificationPerformanceTab
+from evidently.dashboard.tabs import DataDriftTab
+from evidently.dashboard.tabs import DataQualityTab
+from evidently.dashboard.tabs import NumTargetDriftTab
+from evidently.dashboard.tabs import ProbClassificationPerformanceTab
+from evidently.dashboard.tabs import RegressionPerformanceTab
+from evidently.dashboard.tabs.base_tab import Tab
+from evidently.model_profile import Profile
+from evidently.model_profile.sections import DataDriftProfileSection
+from evidently.model_profile.sections import DataQualityProfileSection
+from evidently.model_profile.sections import RegressionPerformanceProfileSection
+from evidently.options import OptionsProvider
+from evidently.pipeline.pipeline import _calculate_analyzer
+
+from benchmarks.datasets import CLASSIFICATION
+from benchmarks.datasets import PROBABILISTIC_CLASSIFICATION
+from benchmarks.datasets import REGRESSION
+from benchmarks.datasets import DatasetSpec
+from benchmarks.datasets import make_datasets
+
+ANALYZERS_TASKS = (
+    (DataDriftAnalyzer, None),
+    (DataQualityAnalyzer, None),
+    (NumTargetDriftAnalyzer, REGRESSION),
+    (CatTargetDriftAnalyzer, CLASSIFICATION),
+    (RegressionPerformanceAnalyzer, REGRESSION),
+    (ClassificationPerformanceAnalyzer, CLASSIFICATION),
+    (ProbClassificationPerformanceAnalyzer, PROBABILISTIC_CLASSIFICATION),
+)
+
+TABS_TASKS = (
+    (DataDriftTab, None),
+    (DataQualityTab, None),
+    (NumTargetDriftTab, REGRESSION),
+    (CatTargetDriftTab, CLASSIFICATION),
+    (RegressionPerformanceTab, REGRESSION),
+    (ClassificationPerformanceTab, CLASSIFICATION),
+    (ProbClassificationPerformanceTab, PROBABILISTIC_CLASSIFICATION),
+)
+
+
+@dataclass
+class BenchmarkCase:
+    """A benchmark: `setup` prepares data and returns the function to measure, setup time is not measured"""
+    group: str
+    name: str
+    spec: DatasetSpec
+    setup: Callable[[], Callable[[], Any]]
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.group}.{self.name}[{self.spec.name}]"
+
+
+def _analyzer_case(analyzer: Type[Analyzer], task: Optional[str], spec: DatasetSpec) -> BenchmarkCase:
+    def setup():
+        reference_data, current_data, column_mapping = make_datasets(spec, task)
+        return lambda: _calculate_analyzer(analyzer, OptionsProvider(), reference_data, current_data, column_mapping)
+
+    return BenchmarkCase("analyzers", analyzer.__name__, spec, setup)
+
+
+def _tab_widgets_case(tab_class: Type[Tab], task: Optional[str], spec: DatasetSpec) -> BenchmarkCase:
+    def setup():
+        reference_data, current_data, column_mapping = make_datasets(spec, task)
+        dashboard = Dashboard(tabs=[tab_class()])
+        analyzers_results = {
+            analyzer: _calculate_analyzer(
+                analyzer, dashboard.options_provider, reference_data, current_data, column_mapping
+            )
+            for analyzer in dict.fromkeys(dashboard.get_analyzers())
+        }
+        tab = dashboard.stages[0]
+        tab.options_provider = dashboard.options_provider
+
+        def run():
+            tab.calculate(reference_data, current_data, column_mapping, analyzers_results)
+            return tab.info()
+
+        return run
+
+    return BenchmarkCase("widgets", tab_class.__name__, spec, setup)
+
+
+def _dashboard_html_case(spec: DatasetSpec) -> BenchmarkCase:
+    def setup():
+        reference_data, current_data, column_mapping = make_datasets(spec, REGRESSION)
+        dashboard = Dashboard(tabs=[DataDriftTab(), RegressionPerformanceTab()])
+        dashboard.calculate(reference_data, current_data, column_mapping)
+        return dashboard.html
+
+    return BenchmarkCase("serialization", "Dashboard.html", spec, setup)
+
+
+def _profile_json_case(spec: DatasetSpec) -> BenchmarkCase:
+    def setup():
+        reference_data, current_data, column_mapping = make_datasets(spec, REGRESSION)
+        profile = Profile(
+            sections=[DataDriftProfileSection(), DataQualityProfileSection(), RegressionPerformanceProfileSection()]
+        )
+        profile.calculate(reference_data, current_data, column_mapping)
+        return profile.json
+
+    return BenchmarkCase("serialization", "Profile.json", spec, setup)
+
+
+def _binned_data_case(spec: DatasetSpec) -> BenchmarkCase:
+    def setup():
+        reference_data, current_data, _ = make_datasets(spec)
+        columns = [column for column in reference_data if column.startswith(("num_", "cat_"))]
+
+        def run():
+            for column in columns:
+                feature_type = "num" if column.startswith("num_") else "cat"
+                get_binned_data(reference_data[column], current_data[column], feature_type, 10)
+
+        return run
+
+    return BenchmarkCase("stattests", "get_binned_data", spec, setup)
+
+
+def get_cases(specs: List[DatasetSpec]) -> List[BenchmarkCase]:
+    """Get all benchmark cases for the datasets sizes"""
+    cases = []
+
+    for spec in specs:
+        cases.extend(_analyzer_case(analyzer, task, spec) for analyzer, task in ANALYZERS_TASKS)
+        cases.extend(_tab_widgets_case(tab_class, task, spec) for tab_class, task in TABS_TASKS)
+        cases.append(_binned_data_case(spec))
+        cases.append(_dashboard_html_case(spec))
+        cases.append(_profile_json_case(spec))
+
+    return cases
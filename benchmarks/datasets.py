@@ -0,0 +1,99 @@
+"""Synthetic datasets for benchmarks"""
+from dataclasses import dataclass
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from evidently import ColumnMapping
+
+REGRESSION = "regression"
+CLASSIFICATION = "classification"
+PROBABILISTIC_CLASSIFICATION = "probabilistic_classification"
+
+LABELS = ["label_a", "label_b", "label_c"]
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Size of reference and current datasets
+
+    - rows - rows count of each dataset
+    - num_columns - numeric features count
+    - cat_columns - categorical features count
+    - cardinality - unique values count of categorical features
+    """
+    rows: int = 10000
+    num_columns: int = 10
+    cat_columns: int = 5
+    cardinality: int = 10
+
+    @property
+    def name(self) -> str:
+        return f"{self.rows}r_{self.num_columns}n_{self.cat_columns}c_{self.cardinality}u"
+
+
+def _make_frame(spec: DatasetSpec, task: Optional[str], drift: float, seed: int) -> pd.DataFrame:
+    random_generator = np.random.default_rng(seed)
+    data = {
+        f"num_{index}": random_generator.normal(drift * index / max(1, spec.num_columns), 1, size=spec.rows)
+        for index in range(spec.num_columns)
+    }
+    # integer categories, string values are not supported by the regression performance errors bias table
+    categories = np.arange(spec.cardinality)
+    # skewed categories distribution, the drift moves it to the next categories
+    weights = 1 / np.arange(1, spec.cardinality + 1)
+    weights = np.roll(weights, int(drift * spec.cardinality / 2))
+
+    for index in range(spec.cat_columns):
+        data[f"cat_{index}"] = random_generator.choice(categories, size=spec.rows, p=weights / weights.sum())
+
+    data["datetime"] = pd.date_range("2022-01-01", periods=spec.rows, freq="min")
+    dataset = pd.DataFrame(data)
+
+    if task == REGRESSION:
+        dataset["target"] = dataset[[f"num_{index}" for index in range(min(3, spec.num_columns))]].sum(axis=1)
+        dataset["prediction"] = dataset["target"] + random_generator.normal(drift, 1, size=spec.rows)
+
+    elif task in (CLASSIFICATION, PROBABILISTIC_CLASSIFICATION):
+        dataset["target"] = random_generator.choice(LABELS, size=spec.rows)
+        probabilities = random_generator.dirichlet(np.ones(len(LABELS)), size=spec.rows)
+        # predictions are correct with the probability about 2/3
+        probabilities[np.arange(spec.rows), pd.Categorical(dataset["target"], categories=LABELS).codes] += 1
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+
+        if task == CLASSIFICATION:
+            dataset["prediction"] = np.array(LABELS)[probabilities.argmax(axis=1)]
+
+        else:
+            for label_index, label in enumerate(LABELS):
+                dataset[label] = probabilities[:, label_index]
+
+    elif task is not None:
+        raise ValueError(f"Unexpected task {task}")
+
+    return dataset
+
+
+def make_datasets(
+    spec: DatasetSpec, task: Optional[str] = None, seed: int = 0
+) -> Tuple[pd.DataFrame, pd.DataFrame, ColumnMapping]:
+    """Get reference and current datasets with a drift and their column mapping.
+
+    Args:
+        spec: size of the datasets
+        task: None for datasets without target and prediction, or one of REGRESSION, CLASSIFICATION
+            and PROBABILISTIC_CLASSIFICATION
+        seed: random seed, datasets are the same for the same arguments
+    """
+    reference_data = _make_frame(spec, task, drift=0, seed=seed)
+    current_data = _make_frame(spec, task, drift=0.5, seed=seed + 1)
+    column_mapping = ColumnMapping(
+        target="target" if task is not None else None,
+        prediction=(LABELS if task == PROBABILISTIC_CLASSIFICATION else "prediction") if task is not None else None,
+        numerical_features=[f"num_{index}" for index in range(spec.num_columns)],
+        categorical_features=[f"cat_{index}" for index in range(spec.cat_columns)],
+        task=REGRESSION if task == REGRESSION else (CLASSIFICATION if task is not None else None),
+    )
+    return reference_data, current_data, column_mapping
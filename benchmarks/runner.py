@@ -0,0 +1,143 @@
+"""Measurement of benchmark cases and comparison with a baseline"""
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from benchmarks.cases import BenchmarkCase
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of a benchmark case
+
+    - time - the best time of repeats in seconds
+    - peak_memory - peak size of memory allocated by Python and NumPy during the case in bytes
+    - error - an error message if the case failed, measurements are None then
+    """
+    name: str
+    time: Optional[float] = None
+    peak_memory: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: BenchmarkResult
+    result: BenchmarkResult
+    time_ratio: Optional[float]
+    memory_ratio: Optional[float]
+    regression: bool
+
+
+def run_case(case: BenchmarkCase, repeat: int = 3) -> BenchmarkResult:
+    """Measure the best time of `repeat` runs and the peak memory of a separate run, tracing slows the run down"""
+    try:
+        func = case.setup()
+        times = []
+
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+
+        gc.collect()
+        tracemalloc.start()
+
+        try:
+            func()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+
+        finally:
+            tracemalloc.stop()
+
+    except Exception as error:  # pylint: disable=broad-except
+        return BenchmarkResult(case.full_name, error=f"{type(error).__name__}: {error}")
+
+    return BenchmarkResult(case.full_name, time=min(times), peak_memory=peak_memory)
+
+
+def save_results(results: List[BenchmarkResult], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as out_file:
+        json.dump([asdict(result) for result in results], out_file, indent=2)
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    with open(path, encoding="utf-8") as in_file:
+        return [BenchmarkResult(**result) for result in json.load(in_file)]
+
+
+def _ratio(value: Optional[float], baseline_value: Optional[float]) -> Optional[float]:
+    if value is None or not baseline_value:
+        return None
+
+    return value / baseline_value
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: List[BenchmarkResult],
+    time_tolerance: float = 0.2,
+    memory_tolerance: float = 0.2,
+) -> List[Comparison]:
+    """Compare results with baseline results of the same cases.
+
+    A case is a regression if it is slower or uses more memory than the baseline by more than the tolerance share,
+    or if it fails while the baseline case does not fail.
+    """
+    baseline_by_name: Dict[str, BenchmarkResult] = {result.name: result for result in baseline}
+    comparisons = []
+
+    for result in results:
+        baseline_result = baseline_by_name.get(result.name)
+
+        if baseline_result is None:
+            continue
+
+        time_ratio = _ratio(result.time, baseline_result.time)
+        memory_ratio = _ratio(result.peak_memory, baseline_result.peak_memory)
+        regression = (
+            (result.error is not None and baseline_result.error is None)
+            or (time_ratio is not None and time_ratio > 1 + time_tolerance)
+            or (memory_ratio is not None and memory_ratio > 1 + memory_tolerance)
+        )
+        comparisons.append(Comparison(result.name, baseline_result, result, time_ratio, memory_ratio, regression))
+
+    return comparisons
+
+
+def _format_ratio(ratio: Optional[float]) -> str:
+    return "-" if ratio is None else f"{ratio:.2f}x"
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    lines = [f"{'benchmark':<70} {'time, s':>10} {'peak memory, MB':>16}"]
+
+    for result in results:
+        if result.error is not None:
+            lines.append(f"{result.name:<70} {'error: ' + result.error}")
+
+        else:
+            lines.append(f"{result.name:<70} {result.time:>10.4f} {result.peak_memory / 2 ** 20:>16.1f}")
+
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: List[Comparison]) -> str:
+    lines = [f"{'benchmark':<70} {'time':>8} {'memory':>8}"]
+
+    for comparison in comparisons:
+        status = " REGRESSION" if comparison.regression else ""
+        lines.append(
+            f"{comparison.name:<70} {_format_ratio(comparison.time_ratio):>8} "
+            f"{_format_ratio(comparison.memory_ratio):>8}{status}"
+        )
+
+    return "\n".join(lines)
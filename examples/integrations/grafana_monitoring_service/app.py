@@ -8,22 +8,22 @@ The service gets a reference dataset from reference.csv file and process current
 Metrics calculation results are available with `GET /metrics` HTTP method in Prometheus compatible format.
 """
 import hashlib
+import itertools
 import os.path
 
 import dataclasses
 import datetime
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 import flask
 import pandas
 from flask import Flask
 from flask.logging import create_logger
-from prometheus_client import Gauge
-from prometheus_client import make_wsgi_app
 import yaml
-from werkzeug.middleware.dispatcher import DispatcherMiddleware
 
 from evidently import model_monitoring
+from evidently.model_monitoring.exporter import CONTENT_TYPE
+from evidently.model_monitoring.monitoring import ModelMonitoringMetric
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.model_monitoring import (
     DataDriftMonitor,
@@ -35,8 +35,8 @@ from evidently.runner.loader import DataLoader, DataOptions
 
 app = Flask(__name__)
 logger = create_logger(app)
-# Add prometheus wsgi middleware to route /metrics requests
-app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {"/metrics": make_wsgi_app()})
+# metrics for /metrics requests, they are updated after each calculation
+EXPORTER = model_monitoring.OpenMetricsExporter()
 
 
 @dataclasses.dataclass
@@ -59,40 +59,33 @@ monitor_mapping = {
 
 
 class MonitoringService:
-    metric: Dict[str, Gauge]
     last_run: Optional[datetime.datetime]
 
     def __init__(
         self, reference: pandas.DataFrame, options: MonitoringServiceOptions, column_mapping: ColumnMapping = None
     ):
-        self.monitoring = model_monitoring.ModelMonitoring(
-            monitors=[monitor_mapping[k]() for k in options.monitors], options=[]
+        # metrics are calculated for a sliding window of the latest rows, the window is updated with each request
+        self.monitoring = model_monitoring.IncrementalModelMonitoring(
+            monitors=[monitor_mapping[k]() for k in options.monitors], window_size=options.window_size, options=[]
         )
 
         if options.use_reference:
             self.reference = reference.iloc[: -options.window_size, :].copy()
-            self.current = reference.iloc[-options.window_size :, :].copy()
+            current = reference.iloc[-options.window_size :, :].copy()
         else:
             self.reference = reference.copy()
-            self.current = pandas.DataFrame().reindex_like(reference).dropna()
-        self.column_mapping = column_mapping
+            current = None
+        self.monitoring.start(self.reference, column_mapping)
+        if current is not None:
+            self.monitoring.update(current)
         self.options = options
-        self.metrics = {}
         self.next_run_time = None
-        self.new_rows = 0
         self.hash = hashlib.sha256(pandas.util.hash_pandas_object(self.reference).values).hexdigest()
-        self.hash_metric = Gauge("evidently:reference_dataset_hash", "", labelnames=["hash"])
+        self.hash_metric = ModelMonitoringMetric("reference_dataset_hash", ["hash"])
 
     def iterate(self, new_rows: pandas.DataFrame):
-        rows_count = new_rows.shape[0]
-
-        self.current = self.current.append(new_rows, ignore_index=True)
-        self.new_rows += rows_count
-        current_size = self.current.shape[0]
-
-        if self.new_rows < self.options.window_size < current_size:
-            self.current.drop(index=list(range(0, current_size - self.options.window_size)), inplace=True)
-            self.current.reset_index(drop=True, inplace=True)
+        self.monitoring.update(new_rows)
+        current_size = len(self.monitoring.window)
 
         if current_size < self.options.window_size:
             logger.info(
@@ -103,18 +96,7 @@ class MonitoringService:
             logger.info(f"Next run at {self.next_run_time}")
             return
         self.next_run_time = datetime.datetime.now() + datetime.timedelta(seconds=self.options.calculation_period_sec)
-        self.monitoring.execute(self.reference, self.current, self.column_mapping)
-        self.hash_metric.labels(hash=self.hash).set(1)
-        for metric, value, labels in self.monitoring.metrics():
-            metric_key = f"evidently:{metric.name}"
-            found = self.metrics.get(metric_key)
-            if not found:
-                found = Gauge(metric_key, "", () if labels is None else list(sorted(labels.keys())))
-                self.metrics[metric_key] = found
-            if labels is None:
-                found.set(value)
-            else:
-                found.labels(**labels).set(value)
+        EXPORTER.update(itertools.chain([self.hash_metric.create(1, dict(hash=self.hash))], self.monitoring.metrics()))
 
 
 SERVICE: Optional[MonitoringService] = None
@@ -150,6 +132,11 @@ def configure_service():
     )
 
 
+@app.route("/metrics")
+def metrics():
+    return flask.Response(EXPORTER.render(), content_type=CONTENT_TYPE)
+
+
 @app.route("/iterate", methods=["POST"])
 def iterate():
     item = flask.request.json
@@ -63,7 +63,9 @@ setup_args = dict(
             "pytest==6.2.5",
             "types-PyYAML==6.0.1",
             "types-requests==2.26.0",
-        ]
+        ],
+        "parquet": ["pyarrow"],
+        "fast-json": ["orjson"],
     },
     entry_points={},
 )
@@ -5,3 +5,4 @@ from ._version import __version__, version_info
 from .nbextension import _jupyter_nbextension_paths
 
 from .pipeline.column_mapping import ColumnMapping
+from .pipeline.reference_sketch import ReferenceSketch
@@ -3,7 +3,7 @@ import json
 import logging
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from dataclasses import dataclass
 
@@ -23,6 +23,19 @@ class DataFormatOptions:
     header: bool
     separator: str
     date_column: str
+    file_format: str = "auto"
+    usecols: Optional[List[str]] = None
+    dtypes: Optional[Dict[str, str]] = None
+    chunk_size: Optional[int] = None
+
+    def get_data_options(self) -> DataOptions:
+        return DataOptions(date_column=self.date_column,
+                           separator=self.separator,
+                           header=self.header,
+                           file_format=self.file_format,
+                           usecols=self.usecols,
+                           dtypes=self.dtypes,
+                           chunk_size=self.chunk_size)
 
 
 @dataclass
@@ -41,6 +54,7 @@ class CalculateOptions:
 @dataclass
 class DashboardOptions(CalculateOptions):
     dashboard_tabs: Dict[str, Dict[str, object]]
+    external_graphs: bool = False
 
 
 @dataclass
@@ -64,7 +78,8 @@ def __load_config_file(config_file: str):
     return opts_data
 
 
-def calculate_dashboard(config: str, reference: str, current: str, output_path: str, report_name: str, **_kv):
+def calculate_dashboard(config: str, reference: str, current: str, output_path: str, report_name: str,
+                        profile_timings: bool = False, **_kv):
     usage = dict(type="dashboard")
 
     opts_data = __load_config_file(config)
@@ -79,6 +94,7 @@ def calculate_dashboard(config: str, reference: str, current: str, output_path:
         data_format=DataFormatOptions(**opts_data["data_format"]),
         column_mapping=opts_data["column_mapping"],
         dashboard_tabs=opts_data["dashboard_tabs"],
+        external_graphs=opts_data.get("external_graphs", False),
         sampling=Sampling(
             reference=SamplingOptions(**ref_sampling),
             current=SamplingOptions(**cur_sampling),
@@ -86,27 +102,26 @@ def calculate_dashboard(config: str, reference: str, current: str, output_path:
 
     runner = DashboardRunner(DashboardRunnerOptions(
         reference_data_path=reference,
-        reference_data_options=DataOptions(date_column=opts.data_format.date_column,
-                                           separator=opts.data_format.separator,
-                                           header=opts.data_format.header),
+        reference_data_options=opts.data_format.get_data_options(),
         reference_data_sampling=opts.sampling.reference,
         current_data_path=current,
-        current_data_options=DataOptions(date_column=opts.data_format.date_column,
-                                         separator=opts.data_format.separator,
-                                         header=opts.data_format.header),
+        current_data_options=opts.data_format.get_data_options(),
         current_data_sampling=opts.sampling.current,
         dashboard_tabs=opts.dashboard_tabs,
+        external_graphs=opts.external_graphs,
         options=parse_options(opts_data["options"]),
         column_mapping=ColumnMapping(**opts.column_mapping),
         output_path=os.path.join(output_path, report_name),
+        profile_timings=profile_timings,
     ))
-    runner.run()
     if TELEMETRY_ENABLED:
-        sender = TelemetrySender(TELEMETRY_ADDRESS)
-        sender.send(usage)
+        # telemetry is sent from a background thread while the report is calculated
+        TelemetrySender(TELEMETRY_ADDRESS).send(usage)
+    runner.run()
 
 
-def calculate_profile(config: str, reference: str, current: str, output_path: str, report_name: str, **_kv):
+def calculate_profile(config: str, reference: str, current: str, output_path: str, report_name: str,
+                      profile_timings: bool = False, **_kv):
     usage = dict(type="profile")
 
     opts_data = __load_config_file(config)
@@ -128,25 +143,22 @@ def calculate_profile(config: str, reference: str, current: str, output_path: st
 
     runner = ProfileRunner(ProfileRunnerOptions(
         reference_data_path=reference,
-        reference_data_options=DataOptions(date_column=opts.data_format.date_column,
-                                           separator=opts.data_format.separator,
-                                           header=opts.data_format.header),
+        reference_data_options=opts.data_format.get_data_options(),
         reference_data_sampling=opts.sampling.reference,
         current_data_path=current,
-        current_data_options=DataOptions(date_column=opts.data_format.date_column,
-                                         separator=opts.data_format.separator,
-                                         header=opts.data_format.header),
+        current_data_options=opts.data_format.get_data_options(),
         current_data_sampling=opts.sampling.current,
         profile_parts=opts.profile_parts,
         column_mapping=ColumnMapping(**opts.column_mapping),
         options=parse_options(opts_data.get("options", None)),
         output_path=os.path.join(output_path, report_name),
         pretty_print=opts.pretty_print,
+        profile_timings=profile_timings,
     ))
-    runner.run()
     if TELEMETRY_ENABLED:
-        sender = TelemetrySender(TELEMETRY_ADDRESS)
-        sender.send(usage)
+        # telemetry is sent from a background thread while the report is calculated
+        TelemetrySender(TELEMETRY_ADDRESS).send(usage)
+    runner.run()
 
 
 def help_handler(**_kv):
@@ -161,6 +173,9 @@ def _add_default_parameters(configurable_parser, default_output_name: str):
     configurable_parser.add_argument("--report_name", dest="report_name", default=default_output_name,
                                      help="Report name")
     configurable_parser.add_argument("--config", dest="config", required=True, help="Path to configuration")
+    configurable_parser.add_argument("--profile-timings", dest="profile_timings", action="store_true",
+                                     help="Save time and memory of analyzers, tabs and widgets "
+                                          "to <report_name>_timings.json in the output path")
 
 
 logging.basicConfig(level=logging.INFO)
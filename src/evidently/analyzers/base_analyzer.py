@@ -28,6 +28,9 @@ class BaseAnalyzerResult:
 
 
 class Analyzer:
+    # the analyzer can get `evidently.pipeline.reference_sketch.ReferenceSketch` as reference data
+    supports_reference_sketch: bool = False
+
     @abc.abstractmethod
     def calculate(self,
                   reference_data: pd.DataFrame,
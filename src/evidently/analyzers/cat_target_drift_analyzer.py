@@ -1,13 +1,11 @@
 #!/usr/bin/env python
 # coding: utf-8
-from typing import Callable, Tuple
 from typing import Optional
 from typing import Sequence
 
 
 from dataclasses import dataclass
 
-import numpy as np
 import pandas as pd
 
 from evidently import ColumnMapping
@@ -17,26 +15,7 @@ from evidently.analyzers.stattests import chi_stat_test, z_stat_test
 from evidently.analyzers.stattests.registry import get_stattest
 from evidently.analyzers.utils import process_columns
 from evidently.options import DataDriftOptions
-
-
-def _remove_nans_and_infinities(dataframe):
-    #   document somewhere, that all analyzers are mutators, i.e. they will change
-    #   the dataframe, like here: replace inf and nan values. That means if far down the pipeline
-    #   somebody wants to compute number of nans, the results will be 0.
-    #   Consider return copies of dataframes, even though it will drain memory for large datasets
-    dataframe.replace([np.inf, -np.inf], np.nan, inplace=True)
-    dataframe.dropna(axis=0, how="any", inplace=True)
-    return dataframe
-
-
-def _compute_statistic(
-    reference_data: pd.DataFrame,
-    current_data: pd.DataFrame,
-    feature_type: str,
-    column_name: str,
-    statistic_fun: Callable[[pd.Series, pd.Series, str, float], Tuple[float, bool]],
-):
-    return statistic_fun(reference_data[column_name], current_data[column_name], feature_type, 0)[0]
+from evidently.utils.data_operations import get_finite_data
 
 
 @dataclass
@@ -58,6 +37,23 @@ class CatTargetDriftAnalyzerResults(BaseAnalyzerResult):
     current_data_count: int = 0
 
 
+def calculate_drift_metrics(
+    reference_column: pd.Series, current_column: pd.Series, options: DataDriftOptions
+) -> DataDriftMetrics:
+    """Calculate drift of a categorical target or prediction column without NaN and infinite values"""
+    feature_type = "cat"
+
+    if not options.cat_target_stattest_func:
+        labels = set(reference_column) | set(current_column)
+        stattest = get_stattest(chi_stat_test if len(labels) > 2 else z_stat_test, feature_type)
+
+    else:
+        stattest = get_stattest(options.cat_target_stattest_func, feature_type)
+
+    p_value = stattest.func(reference_column, current_column, feature_type, 0)[0]
+    return DataDriftMetrics(column_name=reference_column.name, stattest_name=stattest.display_name, drift=p_value)
+
+
 class CatTargetDriftAnalyzer(Analyzer):
     """Categorical target drift analyzer.
 
@@ -83,7 +79,8 @@ class CatTargetDriftAnalyzer(Analyzer):
         Otherwise, uses a z-test.
 
         Notes:
-            Be aware that any nan or infinity values will be dropped from the dataframes in place.
+            Be aware that rows with any nan or infinity values are not taken into account.
+            The dataframes themselves are not changed.
 
             You can also provide a custom function that computes a statistic by adding special
             `DataDriftOptions` object to the `option_provider` of the class.::
@@ -127,40 +124,17 @@ class CatTargetDriftAnalyzer(Analyzer):
             columns=columns, reference_data_count=reference_data.shape[0], current_data_count=current_data.shape[0]
         )
 
-        # consider replacing only values in target and prediction column, see comment above
-        #   _remove_nans_and_infinities
-        reference_data = _remove_nans_and_infinities(reference_data)
-        current_data = _remove_nans_and_infinities(current_data)
-        feature_type = "cat"
+        # consider taking only values in target and prediction column
+        reference_data = get_finite_data(reference_data)
+        current_data = get_finite_data(current_data)
         if target_column is not None:
-            if not options.cat_target_stattest_func:
-                target_labels = set(reference_data[target_column]) | set(
-                    current_data[target_column]
-                )
-                target_test = get_stattest(chi_stat_test if len(target_labels) > 2 else z_stat_test, feature_type)
-            else:
-                target_test = get_stattest(options.cat_target_stattest_func, feature_type)
-
-            p_value = _compute_statistic(
-                reference_data, current_data, feature_type, target_column, target_test.func
-            )
-            result.target_metrics = DataDriftMetrics(
-                column_name=target_column, stattest_name=target_test.display_name, drift=p_value
+            result.target_metrics = calculate_drift_metrics(
+                reference_data[target_column], current_data[target_column], options
             )
+
         if prediction_column is not None:
-            if not options.cat_target_stattest_func:
-                prediction_labels = set(reference_data[prediction_column]) | set(
-                    current_data[prediction_column]
-                )
-                pred_test = get_stattest(chi_stat_test if len(prediction_labels) > 2 else z_stat_test, feature_type)
-            else:
-                pred_test = get_stattest(options.cat_target_stattest_func, feature_type)
-
-            p_value = _compute_statistic(
-                reference_data, current_data, feature_type, prediction_column, pred_test.func
-            )
-            result.prediction_metrics = DataDriftMetrics(
-                column_name=prediction_column, stattest_name=pred_test.display_name, drift=p_value
+            result.prediction_metrics = calculate_drift_metrics(
+                reference_data[prediction_column], current_data[prediction_column], options
             )
 
         return result
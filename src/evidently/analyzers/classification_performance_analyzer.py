@@ -6,16 +6,16 @@ from typing import Optional
 from typing import Sequence
 from typing import Union
 
-import pandas as pd
 import numpy as np
+import pandas as pd
 from dataclasses import dataclass
-from sklearn import metrics
 
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.analyzers.utils import process_columns
 from evidently.analyzers.utils import calculate_confusion_by_classes
+from evidently.utils.data_operations import get_finite_data
 
 
 @dataclass
@@ -50,12 +50,25 @@ def _calculate_performance_metrics(
     prediction_column: Union[str, Sequence[str]],
     target_names: Optional[List[str]],
 ) -> ClassificationPerformanceMetrics:
-    # remove all rows with infinite and NaN values from the dataset
-    data.replace([np.inf, -np.inf], np.nan, inplace=True)
-    data.dropna(axis=0, how="any", inplace=True)
+    # take all rows without infinite and NaN values from the dataset
+    data = get_finite_data(data)
+    return calculate_performance_metrics(data[target_column], data[prediction_column], target_names)
+
 
+def calculate_performance_metrics(
+    target: pd.Series,
+    prediction: pd.Series,
+    target_names: Optional[List[str]],
+    counts: Optional[np.ndarray] = None,
+) -> ClassificationPerformanceMetrics:
+    """Calculate classification performance metrics for target and prediction values without NaN values.
+
+    If `counts` is set, each pair of target and prediction values is repeated `counts` times, so the metrics
+    can be calculated from a confusion table without the data.
+    """
+    from sklearn import metrics  # pylint: disable=import-outside-toplevel
     # calculate metrics matrix
-    metrics_matrix = metrics.classification_report(data[target_column], data[prediction_column], output_dict=True)
+    metrics_matrix = metrics.classification_report(target, prediction, sample_weight=counts, output_dict=True)
     # get quality metrics from the metrics matrix, do not calculate them again
     accuracy_score = metrics_matrix["accuracy"]
     avg_precision = metrics_matrix["macro avg"]["precision"]
@@ -63,9 +76,18 @@ def _calculate_performance_metrics(
     avg_f1 = metrics_matrix["macro avg"]["f1-score"]
 
     # calculate confusion matrix
-    confusion_matrix = metrics.confusion_matrix(data[target_column], data[prediction_column])
+    confusion_matrix = metrics.confusion_matrix(target, prediction, sample_weight=counts)
+
+    if counts is not None:
+        # supports and matrix values are weights sums with counts, they are integers without them
+        confusion_matrix = confusion_matrix.astype(np.int64)
+
+        for class_metrics in metrics_matrix.values():
+            if isinstance(class_metrics, dict):
+                class_metrics["support"] = int(class_metrics["support"])
+
     # get labels from data mapping or get all values kinds from target and prediction columns
-    labels = target_names if target_names else sorted(set(data[target_column]) | set(data[prediction_column]))
+    labels = target_names if target_names else sorted(set(target) | set(prediction))
     confusion_by_classes = calculate_confusion_by_classes(confusion_matrix, labels)
 
     return ClassificationPerformanceMetrics(
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # coding: utf-8
 import collections
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 import pandas as pd
@@ -10,9 +10,16 @@ import numpy as np
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
-from evidently.analyzers.stattests import chi_stat_test, z_stat_test, ks_stat_test, get_stattest
+from evidently.analyzers.stattests import chi_stat_test, z_stat_test, ks_stat_test, get_stattest, StatTest
+from evidently.analyzers.stattests.ks_stattest import KS_EXACT_MAX_SIZE, ks_sorted_p_values
 from evidently.options import DataDriftOptions
+from evidently.analyzers.utils import calculate_sorted_histograms
 from evidently.analyzers.utils import process_columns
+from evidently.pipeline.reference_sketch import ColumnSketch
+from evidently.pipeline.reference_sketch import ReferenceSketch
+
+# max number of values in reference and current data blocks that are processed at once
+BATCH_BLOCK_SIZE = 2 ** 22
 
 
 def dataset_drift_evaluation(p_values, drift_share=0.5) -> Tuple[int, float, bool]:
@@ -25,6 +32,90 @@ def dataset_drift_evaluation(p_values, drift_share=0.5) -> Tuple[int, float, boo
 PValueWithDrift = collections.namedtuple("PValueWithDrift", ["p_value", "drifted"])
 
 
+def _is_batch_column(column: pd.Series) -> bool:
+    return isinstance(column.dtype, np.dtype) and column.dtype.kind in "iuf"
+
+
+def _get_reference_column(
+        reference_data: Union[pd.DataFrame, ReferenceSketch],
+        feature_name: str,
+        stat_test: StatTest,
+) -> Union[pd.Series, ColumnSketch]:
+    if not isinstance(reference_data, ReferenceSketch):
+        return reference_data[feature_name]
+
+    column_sketch = reference_data.get_column(feature_name)
+
+    if stat_test.supports_reference_sketch:
+        return column_sketch
+
+    return column_sketch.to_series()
+
+
+def _calculate_num_features_batch(
+        reference_data: Union[pd.DataFrame, ReferenceSketch],
+        current_data: pd.DataFrame,
+        stattests: Dict[str, StatTest],
+        data_drift_options: DataDriftOptions,
+) -> Tuple[Dict[str, Tuple[list, list]], Dict[str, float]]:
+    """Calculate small histograms and default K-S test p-values for numerical features in blocks of columns.
+
+    Returns:
+        histograms: (current_small_hist, ref_small_hist) for features with numpy numeric types
+        ks_p_values: p-values for features with the default K-S test if they can be calculated in batch,
+            other features should be tested one by one
+    """
+    histograms: Dict[str, Tuple[list, list]] = {}
+    ks_p_values: Dict[str, float] = {}
+    is_sketch = isinstance(reference_data, ReferenceSketch)
+    reference_schema = reference_data.schema if is_sketch else reference_data
+    # K-S p-values are calculated in batch for the asymptotic distribution only
+    use_batch_ks = min(len(reference_data), len(current_data)) > 0 and \
+        max(len(reference_data), len(current_data)) > KS_EXACT_MAX_SIZE
+    features_by_nbinsx: Dict[int, List[str]] = collections.defaultdict(list)
+
+    for feature_name in stattests:
+        if _is_batch_column(reference_schema[feature_name]) and _is_batch_column(current_data[feature_name]):
+            features_by_nbinsx[data_drift_options.get_nbinsx(feature_name)].append(feature_name)
+
+    block_width = max(1, BATCH_BLOCK_SIZE // max(len(reference_data) + len(current_data), 1))
+
+    for nbinsx, feature_names in features_by_nbinsx.items():
+        for block_start in range(0, len(feature_names), block_width):
+            block = feature_names[block_start:block_start + block_width]
+            # columns are sorted once for both histograms and K-S test, NaN values are sorted to the end
+            if is_sketch:
+                reference_block = np.column_stack(
+                    [reference_data.get_column(feature_name).sorted_values for feature_name in block]
+                )
+
+            else:
+                reference_block = np.sort(reference_data[block].to_numpy(dtype=np.float64), axis=0)
+
+            current_block = np.sort(current_data[block].to_numpy(dtype=np.float64), axis=0)
+            ref_histograms = calculate_sorted_histograms(reference_block, nbinsx)
+            current_histograms = calculate_sorted_histograms(current_block, nbinsx)
+
+            for feature_name, ref_histogram, current_histogram in zip(block, ref_histograms, current_histograms):
+                histograms[feature_name] = (
+                    [t.tolist() for t in current_histogram],
+                    [t.tolist() for t in ref_histogram],
+                )
+
+            if not use_batch_ks:
+                continue
+
+            ks_mask = np.array([stattests[feature_name] is ks_stat_test for feature_name in block])
+            ks_mask &= ~np.isnan(reference_block[-1]) & ~np.isnan(current_block[-1])
+
+            if ks_mask.any():
+                ks_features = [feature_name for feature_name, is_ks in zip(block, ks_mask) if is_ks]
+                p_values = ks_sorted_p_values(reference_block[:, ks_mask], current_block[:, ks_mask])
+                ks_p_values.update(zip(ks_features, p_values))
+
+    return histograms, ks_p_values
+
+
 @dataclass
 class DataDriftAnalyzerFeatureMetrics:
     current_small_hist: list
@@ -51,18 +142,29 @@ class DataDriftAnalyzerResults(BaseAnalyzerResult):
 
 
 class DataDriftAnalyzer(Analyzer):
+    supports_reference_sketch = True
+
     @staticmethod
     def get_results(analyzer_results) -> DataDriftAnalyzerResults:
         return analyzer_results[DataDriftAnalyzer]
 
     def calculate(
-            self, reference_data: pd.DataFrame, current_data: Optional[pd.DataFrame], column_mapping: ColumnMapping
+            self,
+            reference_data: Union[pd.DataFrame, ReferenceSketch],
+            current_data: Optional[pd.DataFrame],
+            column_mapping: ColumnMapping,
     ) -> DataDriftAnalyzerResults:
         if current_data is None:
             raise ValueError("current_data should be present")
 
         data_drift_options = self.options_provider.get(DataDriftOptions)
-        columns = process_columns(reference_data, column_mapping)
+
+        if isinstance(reference_data, ReferenceSketch):
+            columns = process_columns(reference_data.schema, column_mapping)
+
+        else:
+            columns = process_columns(reference_data, column_mapping)
+
         num_feature_names = columns.num_feature_names
         cat_feature_names = columns.cat_feature_names
         drift_share = data_drift_options.drift_share
@@ -71,23 +173,47 @@ class DataDriftAnalyzer(Analyzer):
         features_metrics = {}
         p_values = {}
 
+        num_stattests = {
+            feature_name: get_stattest(data_drift_options.get_feature_stattest_func(feature_name, ks_stat_test), "num")
+            for feature_name in num_feature_names
+        }
+        num_histograms, ks_p_values = _calculate_num_features_batch(
+            reference_data, current_data, num_stattests, data_drift_options
+        )
+
         for feature_name in num_feature_names:
             threshold = data_drift_options.get_threshold(feature_name)
             feature_type = "num"
-            test = get_stattest(data_drift_options.get_feature_stattest_func(feature_name, ks_stat_test), feature_type)
-            p_value, drifted = test.func(reference_data[feature_name],
-                                         current_data[feature_name],
-                                         feature_type,
-                                         threshold)
+            test = num_stattests[feature_name]
+
+            if feature_name in ks_p_values:
+                p_value = ks_p_values[feature_name]
+                drifted = p_value <= threshold
+
+            else:
+                p_value, drifted = test.func(_get_reference_column(reference_data, feature_name, test),
+                                             current_data[feature_name],
+                                             feature_type,
+                                             threshold)
+
             p_values[feature_name] = PValueWithDrift(p_value, drifted)
-            current_nbinsx = data_drift_options.get_nbinsx(feature_name)
+
+            if feature_name in num_histograms:
+                current_small_hist, ref_small_hist = num_histograms[feature_name]
+
+            else:
+                current_nbinsx = data_drift_options.get_nbinsx(feature_name)
+                reference_column = reference_data[feature_name]
+                current_small_hist = [t.tolist() for t in
+                                      np.histogram(current_data[feature_name][np.isfinite(current_data[feature_name])],
+                                                   bins=current_nbinsx, density=True)]
+                ref_small_hist = [t.tolist() for t in
+                                  np.histogram(reference_column[np.isfinite(reference_column)],
+                                               bins=current_nbinsx, density=True)]
+
             features_metrics[feature_name] = DataDriftAnalyzerFeatureMetrics(
-                current_small_hist=[t.tolist() for t in
-                                    np.histogram(current_data[feature_name][np.isfinite(current_data[feature_name])],
-                                                 bins=current_nbinsx, density=True)],
-                ref_small_hist=[t.tolist() for t in
-                                np.histogram(reference_data[feature_name][np.isfinite(reference_data[feature_name])],
-                                             bins=current_nbinsx, density=True)],
+                current_small_hist=current_small_hist,
+                ref_small_hist=ref_small_hist,
                 feature_type='num',
                 stattest_name=test.display_name,
                 p_value=p_value,
@@ -96,21 +222,33 @@ class DataDriftAnalyzer(Analyzer):
 
         for feature_name in cat_feature_names:
             threshold = data_drift_options.get_threshold(feature_name)
-            feature_ref_data = reference_data[feature_name].dropna()
             feature_cur_data = current_data[feature_name].dropna()
-            keys = set(list(feature_ref_data.unique()) +
-                       list(feature_cur_data.unique())) - {np.nan}
+
+            if isinstance(reference_data, ReferenceSketch):
+                feature_ref_data = reference_data.get_column(feature_name).dropna()
+                ref_value_counts = feature_ref_data.value_counts
+
+            else:
+                feature_ref_data = reference_data[feature_name].dropna()
+                ref_value_counts = feature_ref_data.value_counts()
+
+            cur_value_counts = feature_cur_data.value_counts()
+            keys = set(ref_value_counts[ref_value_counts > 0].index) | set(cur_value_counts[cur_value_counts > 0].index)
             default_test = chi_stat_test if len(keys) > 2 else z_stat_test
             feature_type = "cat"
             stat_test = get_stattest(data_drift_options.get_feature_stattest_func(feature_name, default_test),
                                      feature_type)
+
+            if isinstance(feature_ref_data, ColumnSketch) and not stat_test.supports_reference_sketch:
+                feature_ref_data = feature_ref_data.to_series()
+
             p_value, drifted = stat_test.func(feature_ref_data, feature_cur_data, feature_type, threshold)
 
             p_values[feature_name] = PValueWithDrift(p_value, drifted)
 
             features_metrics[feature_name] = DataDriftAnalyzerFeatureMetrics(
-                ref_small_hist=list(reversed(list(map(list, zip(*feature_ref_data.value_counts().items()))))),
-                current_small_hist=list(reversed(list(map(list, zip(*feature_cur_data.value_counts().items()))))),
+                ref_small_hist=list(reversed(list(map(list, zip(*ref_value_counts.items()))))),
+                current_small_hist=list(reversed(list(map(list, zip(*cur_value_counts.items()))))),
                 feature_type='cat',
                 stattest_name=stat_test.display_name,
                 p_value=p_value,
@@ -0,0 +1,482 @@
+"""Mergeable accumulators for data quality statistics.
+
+The accumulators calculate `FeatureQualityStats` from data chunks, so a dataset can be processed
+without loading it into memory at once. Accumulators for different chunks can be calculated separately
+(for example, in different processes) and merged:
+
+    columns = process_columns(first_chunk, column_mapping)
+    accumulator = DataQualityStatsAccumulator(columns)
+
+    for chunk in pd.read_csv("data.csv", chunksize=1_000_000):
+        accumulator.update(chunk)
+
+    stats = accumulator.get_stats()
+
+Counts, missing and infinite values, min, max, mean and std are exact.
+Percentiles, most common values and unique values counts are exact while the number of values
+is less than sketches sizes and approximate for bigger data.
+"""
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from evidently.analyzers.data_quality_analyzer import DataQualityStats
+from evidently.analyzers.data_quality_analyzer import FeatureQualityStats
+from evidently.analyzers.utils import DatasetColumns
+from evidently.analyzers.utils import process_columns
+from evidently.pipeline.column_mapping import ColumnMapping
+
+
+class QuantileSketch:
+    """Mergeable sketch for quantiles of numeric values.
+
+    Keeps all values while their number is less than `max_exact_size`, after that values are compressed
+    to `compression` weighted centroids with equal weights, so rank error of quantiles is about 1 / compression.
+    """
+
+    def __init__(self, max_exact_size: int = 2 ** 16, compression: int = 2 ** 12):
+        self.max_exact_size = max_exact_size
+        self.compression = compression
+        self.values = np.empty(0)
+        self.weights = np.empty(0)
+
+    def update(self, values: np.ndarray) -> None:
+        self._add(values, np.ones(len(values)))
+
+    def merge(self, other: "QuantileSketch") -> None:
+        self._add(other.values, other.weights)
+
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def quantile(self, q: float) -> float:
+        """Get a quantile with linear interpolation between values, as `pandas.Series.quantile` does"""
+        if len(self.values) == 0:
+            return np.nan
+
+        # centroid positions in ranks of all values
+        positions = np.cumsum(self.weights) - (self.weights + 1) / 2
+        rank = q * (self.count() - 1)
+        return float(np.interp(rank, positions, self.values))
+
+    def _add(self, values: np.ndarray, weights: np.ndarray) -> None:
+        values = np.concatenate([self.values, values])
+        order = np.argsort(values, kind="mergesort")
+        self.values = values[order]
+        self.weights = np.concatenate([self.weights, weights])[order]
+
+        if len(self.values) > self.max_exact_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        cumulative_weights = np.cumsum(self.weights)
+        groups = np.minimum(
+            (cumulative_weights - self.weights) * self.compression // cumulative_weights[-1], self.compression - 1
+        ).astype(np.intp)
+        weights = np.bincount(groups, weights=self.weights, minlength=self.compression)
+        sums = np.bincount(groups, weights=self.values * self.weights, minlength=self.compression)
+        non_empty = weights > 0
+        self.weights = weights[non_empty]
+        self.values = sums[non_empty] / self.weights
+
+
+class FrequentValuesSketch:
+    """Mergeable Misra-Gries summary for the most frequent values.
+
+    Counts are exact while the number of unique values is not bigger than `capacity`,
+    for more unique values counts can be underestimated by the total count / (capacity + 1) at most.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+
+    def update(self, values: pd.Series) -> None:
+        self._add(values.value_counts())
+
+    def merge(self, other: "FrequentValuesSketch") -> None:
+        self._add(other.counts)
+
+    def most_common(self, n: int = 1) -> pd.Series:
+        return self.counts.nlargest(n, keep="first")
+
+    def _add(self, counts: pd.Series) -> None:
+        if self.counts.empty:
+            self.counts = counts
+
+        elif not counts.empty:
+            self.counts = pd.concat([self.counts, counts]).groupby(level=0, sort=False).sum()
+
+        if len(self.counts) > self.capacity:
+            self.counts = self.counts.sort_values(ascending=False, kind="mergesort")
+            # values with zero counts are kept while there is a room for them, so values with equal counts
+            # (for example, when all values are unique) are not removed all together
+            self.counts = (self.counts - self.counts.iloc[self.capacity]).iloc[:self.capacity]
+
+
+class UniqueCountSketch:
+    """Mergeable counter of unique values.
+
+    Keeps hashes of values while their number is not bigger than `max_exact_size`, after that switches
+    to HyperLogLog with 2 ** precision registers (relative error is about 1.04 / 2 ** (precision / 2)).
+    """
+
+    def __init__(self, precision: int = 14, max_exact_size: int = 2 ** 14):
+        self.precision = precision
+        self.max_exact_size = max_exact_size
+        self.hashes: Optional[np.ndarray] = np.empty(0, dtype=np.uint64)
+        self.registers: Optional[np.ndarray] = None
+
+    def update(self, values: pd.Series) -> None:
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            # integer values can become float in chunks with NaN values, hash them in the same way.
+            # Adding zero converts -0.0 to 0.0, pandas counts them as the same value
+            hashes = pd.util.hash_array(values.to_numpy(dtype=np.float64) + 0.0)
+
+        else:
+            hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+        self._add_hashes(hashes)
+
+    def merge(self, other: "UniqueCountSketch") -> None:
+        if other.hashes is not None:
+            self._add_hashes(other.hashes)
+            return
+
+        self._switch_to_registers()
+        self.registers = np.maximum(self.registers, other.registers)
+
+    def count(self) -> int:
+        if self.hashes is not None:
+            return len(self.hashes)
+
+        n_registers = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / n_registers)
+        estimate = alpha * n_registers ** 2 / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        n_zero_registers = np.count_nonzero(self.registers == 0)
+
+        if estimate <= 2.5 * n_registers and n_zero_registers > 0:
+            # linear counting for small cardinalities
+            estimate = n_registers * np.log(n_registers / n_zero_registers)
+
+        return int(round(estimate))
+
+    def _add_hashes(self, hashes: np.ndarray) -> None:
+        if self.hashes is not None:
+            self.hashes = np.union1d(self.hashes, hashes)
+
+            if len(self.hashes) > self.max_exact_size:
+                self._switch_to_registers()
+
+            return
+
+        rest_bits = 64 - self.precision
+        indices = (hashes >> np.uint64(rest_bits)).astype(np.intp)
+        rest = (hashes & np.uint64((1 << rest_bits) - 1)).astype(np.float64)
+        # position of the leftmost 1-bit in the rest bits, the rest is less than 2 ** 53 and is converted exactly
+        ranks = np.where(rest > 0, rest_bits - np.frexp(rest)[1] + 1, rest_bits + 1).astype(np.uint8)
+        np.maximum.at(self.registers, indices, ranks)
+
+    def _switch_to_registers(self) -> None:
+        if self.hashes is None:
+            return
+
+        hashes = self.hashes
+        self.hashes = None
+        self.registers = np.zeros(2 ** self.precision, dtype=np.uint8)
+        self._add_hashes(hashes)
+
+
+class NumericMoments:
+    """Mergeable count, mean and sum of squared deviations of finite values and counts of infinite values"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.
+        self.squares_sum = 0.
+        self.positive_infinite_count = 0
+        self.negative_infinite_count = 0
+
+    def update(self, values: np.ndarray) -> None:
+        self.positive_infinite_count += int(np.count_nonzero(values == np.inf))
+        self.negative_infinite_count += int(np.count_nonzero(values == -np.inf))
+        finite_values = values[np.isfinite(values)]
+
+        if len(finite_values) > 0:
+            mean = finite_values.mean()
+            self._add(len(finite_values), mean, np.sum((finite_values - mean) ** 2))
+
+    def merge(self, other: "NumericMoments") -> None:
+        self.positive_infinite_count += other.positive_infinite_count
+        self.negative_infinite_count += other.negative_infinite_count
+        self._add(other.count, other.mean, other.squares_sum)
+
+    def remove(self, values: np.ndarray) -> None:
+        """Remove values that were added before, for moments of a sliding window"""
+        self.positive_infinite_count -= int(np.count_nonzero(values == np.inf))
+        self.negative_infinite_count -= int(np.count_nonzero(values == -np.inf))
+        finite_values = values[np.isfinite(values)]
+
+        if len(finite_values) > 0:
+            mean = finite_values.mean()
+            self._subtract(len(finite_values), mean, np.sum((finite_values - mean) ** 2))
+
+    def get_infinite_count(self) -> int:
+        return self.positive_infinite_count + self.negative_infinite_count
+
+    def get_mean_and_std(self) -> Tuple[float, float]:
+        # the same results as pandas gives for data with infinite values
+        if self.positive_infinite_count > 0 and self.negative_infinite_count > 0:
+            return np.nan, np.nan
+
+        if self.positive_infinite_count > 0:
+            return np.inf, np.nan
+
+        if self.negative_infinite_count > 0:
+            return -np.inf, np.nan
+
+        if self.count == 0:
+            return np.nan, np.nan
+
+        if self.count == 1:
+            return self.mean, np.nan
+
+        return self.mean, np.sqrt(self.squares_sum / (self.count - 1))
+
+    def _add(self, count: int, mean: float, squares_sum: float) -> None:
+        # parallel version of Welford's algorithm
+        if count == 0:
+            return
+
+        total_count = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total_count
+        self.squares_sum += squares_sum + delta ** 2 * self.count * count / total_count
+        self.count = total_count
+
+    def _subtract(self, count: int, mean: float, squares_sum: float) -> None:
+        # the inverse of `_add`: moments of the rest are restored from the moments of the whole and the part
+        rest_count = self.count - count
+
+        if rest_count <= 0:
+            self.count = 0
+            self.mean = 0.
+            self.squares_sum = 0.
+            return
+
+        rest_mean = (self.mean * self.count - mean * count) / rest_count
+        delta = mean - rest_mean
+        self.squares_sum = max(0., self.squares_sum - squares_sum - delta ** 2 * rest_count * count / self.count)
+        self.mean = rest_mean
+        self.count = rest_count
+
+
+class FeatureStatsAccumulator:
+    """Mergeable accumulator of `FeatureQualityStats` for a feature
+
+    Args:
+        values_type: `numeric` for numeric stats, `datetime` for min and max of datetime values, `other` for counts only
+    """
+
+    def __init__(self, values_type: str = "other"):
+        self.values_type = values_type
+        self.all_values_count = 0
+        self.missing_count = 0
+        self.frequent_values = FrequentValuesSketch()
+        self.unique_values = UniqueCountSketch()
+        self.moments = NumericMoments()
+        self.quantiles = QuantileSketch()
+        self.min = None
+        self.max = None
+
+    def update(self, feature: pd.Series) -> None:
+        values = feature.dropna()
+        self.all_values_count += feature.shape[0]
+        self.missing_count += feature.shape[0] - values.shape[0]
+        self.frequent_values.update(values)
+        self.unique_values.update(values)
+
+        if values.empty:
+            return
+
+        if self.values_type == "datetime":
+            self._update_min_max(values.min(), values.max())
+
+        elif self.values_type == "numeric":
+            numeric_values = values.to_numpy(dtype=np.float64)
+            self.moments.update(numeric_values)
+            self.quantiles.update(numeric_values)
+            self._update_min_max(numeric_values.min(), numeric_values.max())
+
+    def merge(self, other: "FeatureStatsAccumulator") -> None:
+        self.all_values_count += other.all_values_count
+        self.missing_count += other.missing_count
+        self.frequent_values.merge(other.frequent_values)
+        self.unique_values.merge(other.unique_values)
+        self.moments.merge(other.moments)
+        self.quantiles.merge(other.quantiles)
+
+        if other.min is not None:
+            self._update_min_max(other.min, other.max)
+
+    def get_stats(self, feature_type: str) -> FeatureQualityStats:
+        """Get stats in the same format as `DataQualityAnalyzer` calculates them for a whole feature"""
+        def get_percentage_from_all_values(value: int) -> float:
+            return np.round(100 * value / self.all_values_count, 2)
+
+        result = FeatureQualityStats(feature_type=feature_type)
+
+        if not self.all_values_count > 0:
+            # we have no data, return default stats for en empty dataset
+            return result
+
+        result.missing_count = self.missing_count
+        result.count = self.all_values_count - self.missing_count
+        result.missing_percentage = get_percentage_from_all_values(self.missing_count)
+        result.unique_count = self.unique_values.count()
+        result.unique_percentage = get_percentage_from_all_values(result.unique_count)
+        most_common_values = self.frequent_values.most_common()
+
+        if result.count > 0 and most_common_values.iloc[0] >= self.missing_count:
+            result.most_common_value = most_common_values.index[0]
+            result.most_common_value_percentage = get_percentage_from_all_values(most_common_values.iloc[0])
+
+        else:
+            result.most_common_value = np.nan
+            result.most_common_value_percentage = get_percentage_from_all_values(self.missing_count)
+
+            if result.count > 0:
+                result.most_common_not_null_value = most_common_values.index[0]
+                result.most_common_not_null_value_percentage = get_percentage_from_all_values(
+                    most_common_values.iloc[0]
+                )
+
+        if feature_type == "num":
+            # round most common feature value for numeric features to 1e-5
+            result.most_common_value = np.round(result.most_common_value, 5)
+            result.infinite_count = self.moments.get_infinite_count()
+            result.infinite_percentage = get_percentage_from_all_values(result.infinite_count)
+            result.max = np.round(self.max, 2) if self.max is not None else np.nan
+            result.min = np.round(self.min, 2) if self.min is not None else np.nan
+            mean, std = self.moments.get_mean_and_std()
+            result.std = np.round(std, 2)
+            result.mean = np.round(mean, 2)
+            result.percentile_25 = np.round(self.quantiles.quantile(0.25), 2)
+            result.percentile_50 = np.round(self.quantiles.quantile(0.5), 2)
+            result.percentile_75 = np.round(self.quantiles.quantile(0.75), 2)
+
+        if feature_type == "datetime":
+            # cast datatime value to str for datetime features
+            result.most_common_value = str(result.most_common_value)
+            result.max = str(self.max)
+            result.min = str(self.min)
+
+        return result
+
+    def _update_min_max(self, min_value, max_value) -> None:
+        self.min = min_value if self.min is None else min(self.min, min_value)
+        self.max = max_value if self.max is None else max(self.max, max_value)
+
+
+class DataQualityStatsAccumulator:
+    """Mergeable accumulator of `DataQualityStats` for features of a dataset.
+
+    Args:
+        columns: dataset columns, for example, from `process_columns` for the first chunk of data
+        task: `regression` or `classification`, defines target stats type.
+            If it is not defined, target with numeric values and at least 5 unique values is used as regression target.
+    """
+
+    def __init__(self, columns: DatasetColumns, task: Optional[str] = None):
+        self.columns = columns
+        self.task = task
+        self.num_features = {name: FeatureStatsAccumulator("numeric") for name in columns.num_feature_names}
+        self.cat_features = {name: FeatureStatsAccumulator() for name in columns.cat_feature_names}
+        date_list = list(columns.datetime_feature_names)
+
+        if columns.utility_columns.date:
+            date_list.append(columns.utility_columns.date)
+
+        self.datetime_features = {name: FeatureStatsAccumulator("datetime") for name in date_list}
+        self.target: Optional[FeatureStatsAccumulator] = None
+
+    def update(self, dataset: pd.DataFrame) -> None:
+        for accumulators in (self.num_features, self.cat_features, self.datetime_features):
+            for feature_name, accumulator in accumulators.items():
+                accumulator.update(dataset[feature_name])
+
+        target_name = self.columns.utility_columns.target
+
+        if target_name is not None and target_name in dataset:
+            if self.target is None:
+                is_numeric = self.task != "classification" and pd.api.types.is_numeric_dtype(dataset[target_name])
+                self.target = FeatureStatsAccumulator("numeric" if is_numeric else "other")
+
+            self.target.update(dataset[target_name])
+
+    def merge(self, other: "DataQualityStatsAccumulator") -> None:
+        for accumulators, other_accumulators in (
+            (self.num_features, other.num_features),
+            (self.cat_features, other.cat_features),
+            (self.datetime_features, other.datetime_features),
+        ):
+            for feature_name, accumulator in accumulators.items():
+                accumulator.merge(other_accumulators[feature_name])
+
+        if self.target is None:
+            self.target = other.target
+
+        elif other.target is not None:
+            self.target.merge(other.target)
+
+    def get_task(self) -> Optional[str]:
+        if self.task is not None:
+            return self.task
+
+        if self.target is None:
+            return None
+
+        if self.target.values_type == "numeric" and self.target.unique_values.count() >= 5:
+            return "regression"
+
+        return "classification"
+
+    def get_stats(self) -> DataQualityStats:
+        result = DataQualityStats(
+            num_features_stats={name: stats.get_stats("num") for name, stats in self.num_features.items()},
+            cat_features_stats={name: stats.get_stats("cat") for name, stats in self.cat_features.items()},
+            datetime_features_stats={
+                name: stats.get_stats("datetime") for name, stats in self.datetime_features.items()
+            },
+        )
+
+        if self.target is not None:
+            target_type = "cat" if self.get_task() == "classification" else "num"
+            result.target_stats = {self.columns.utility_columns.target: self.target.get_stats(target_type)}
+
+        return result
+
+
+def calculate_data_quality_stats(
+    chunks: Iterable[pd.DataFrame],
+    column_mapping: Optional[ColumnMapping] = None,
+) -> Tuple[DatasetColumns, DataQualityStats]:
+    """Calculate data quality stats for a dataset split to chunks, columns are defined by the first chunk"""
+    if column_mapping is None:
+        column_mapping = ColumnMapping()
+
+    accumulator: Optional[DataQualityStatsAccumulator] = None
+
+    for chunk in chunks:
+        if accumulator is None:
+            accumulator = DataQualityStatsAccumulator(process_columns(chunk, column_mapping), column_mapping.task)
+
+        accumulator.update(chunk)
+
+    if accumulator is None:
+        raise ValueError("chunks should contain at least one dataset")
+
+    return accumulator.columns, accumulator.get_stats()
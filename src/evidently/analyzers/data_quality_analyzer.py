@@ -9,13 +9,36 @@ from typing import Union
 from dataclasses import dataclass, fields
 import numpy as np
 import pandas as pd
-from scipy.stats import chi2_contingency
 
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.analyzers.utils import DatasetColumns
 from evidently.analyzers.utils import process_columns
+from evidently.options import DataQualityOptions
+
+
+def _cramer_v_from_codes(x_codes: np.ndarray, x_size: int, y_codes: np.ndarray, y_size: int) -> float:
+    """Calculate Cramér's V for values factorized with `pd.factorize`, NaN values (code -1) are skipped.
+
+    The contingency table is the same as `pd.crosstab` gives, chi-squared statistic is calculated
+    as `scipy.stats.chi2_contingency(table, correction=False)` does.
+    """
+    mask = (x_codes >= 0) & (y_codes >= 0)
+    table = np.bincount(
+        x_codes[mask].astype(np.int64) * y_size + y_codes[mask], minlength=x_size * y_size
+    ).reshape(x_size, y_size)
+    # crosstab contains only values that are present in pairs without NaN
+    table = table[table.any(axis=1)][:, table.any(axis=0)]
+    n_rows, n_cols = table.shape
+
+    if min(n_cols - 1, n_rows - 1) <= 0:
+        return np.nan
+
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / table.sum()
+    chi2_stat = ((table - expected) ** 2 / expected).sum()
+    phi2 = chi2_stat / table.sum()
+    return np.sqrt(phi2 / min(n_cols - 1, n_rows - 1))
 
 
 @dataclass
@@ -153,6 +176,26 @@ class DataQualityAnalyzerResults(BaseAnalyzerResult):
     current_correlations: Optional[Dict[str, pd.DataFrame]] = None
 
 
+def set_values_representation_stats(
+    feature_stats: FeatureQualityStats, reference_values_set: set, current_values_set: set
+) -> None:
+    """Set counts of new and unused values of a categorical feature in the current dataset"""
+    unique_in_current = current_values_set - reference_values_set
+    new_in_current_values_count: int = len(unique_in_current)
+    unique_in_reference = reference_values_set - current_values_set
+    unused_in_current_values_count: int = len(unique_in_reference)
+
+    # take into account that NaN values in Python sets do not support substitution correctly
+    # {nan} - {nan} can be equals {nan}
+    # use pd.isnull because it supports strings values correctly, np.isnan raises and exception
+    if any(pd.isnull(list(unique_in_current))) and any(pd.isnull(list(unique_in_reference))):
+        new_in_current_values_count -= 1
+        unused_in_current_values_count -= 1
+
+    feature_stats.new_in_current_values_count = new_in_current_values_count
+    feature_stats.unused_in_current_values_count = unused_in_current_values_count
+
+
 class DataQualityAnalyzer(Analyzer):
     """Data quality analyzer
     provides detailed feature statistics and feature behavior overview
@@ -198,6 +241,19 @@ class DataQualityAnalyzer(Analyzer):
 
         return result
 
+    @classmethod
+    def get_task(
+        cls, reference_data: pd.DataFrame, column_mapping: ColumnMapping, target_name: Optional[str]
+    ) -> Optional[str]:
+        """Get the task from the column mapping or recognize it by the reference target"""
+        if column_mapping.task is not None:
+            return column_mapping.task
+
+        if target_name:
+            return cls._recognize_task(target_name, reference_data)
+
+        return None
+
     @staticmethod
     def _recognize_task(target_name: str, reference_data: pd.DataFrame) -> str:
         """Try to guess about the target type:
@@ -228,6 +284,7 @@ class DataQualityAnalyzer(Analyzer):
         """Calculates base statistics for numerical, categorical and datetime features.
         For categorical features, calculates the Cramer's v correlation matrix.
         For numerical features, Evidently calculates the Pearson, Spearman and Kendall matrices.
+        Calculated matrices and sampling of big datasets for them are set with `DataQualityOptions`.
 
         Args:
             reference_data: usually the data which you used in training.
@@ -243,16 +300,7 @@ class DataQualityAnalyzer(Analyzer):
 
         columns = process_columns(reference_data, column_mapping)
         target_name = columns.utility_columns.target
-        task: Optional[str]
-
-        if column_mapping.task is not None:
-            task = column_mapping.task
-
-        elif column_mapping.task is None and target_name:
-            task = self._recognize_task(target_name, reference_data)
-
-        else:
-            task = None
+        task = self.get_task(reference_data, column_mapping, target_name)
 
         reference_features_stats = self._calculate_stats(reference_data, columns, task)
 
@@ -280,35 +328,27 @@ class DataQualityAnalyzer(Analyzer):
                     else:
                         reference_values_set = set()
 
-                    unique_in_current = current_values_set - reference_values_set
-                    new_in_current_values_count: int = len(unique_in_current)
-                    unique_in_reference = reference_values_set - current_values_set
-                    unused_in_current_values_count: int = len(unique_in_reference)
-
-                    # take into account that NaN values in Python sets do not support substitution correctly
-                    # {nan} - {nan} can be equals {nan}
-                    # use pd.isnull because it supports strings values correctly, np.isnan raises and exception
-                    if any(pd.isnull(list(unique_in_current))) and any(pd.isnull(list(unique_in_reference))):
-                        new_in_current_values_count -= 1
-                        unused_in_current_values_count -= 1
-
-                    cat_feature_stats.new_in_current_values_count = new_in_current_values_count
-                    cat_feature_stats.unused_in_current_values_count = unused_in_current_values_count
+                    set_values_representation_stats(cat_feature_stats, reference_values_set, current_values_set)
 
         else:
             current_features_stats = None
 
         # calculate correlations
 
+        data_quality_options = self.options_provider.get(DataQualityOptions)
         num_for_corr, cat_for_corr = self._select_features_for_corr(reference_features_stats, target_name)
         reference_correlations = {}
         current_correlations = {}
-        for kind in ['pearson', 'spearman', 'kendall', 'cramer_v']:
-            reference_correlations[kind] = self._calculate_correlations(reference_data, num_for_corr, cat_for_corr,
-                                                                        kind)
+        for kind in data_quality_options.get_correlation_kinds():
+            rows_limit = data_quality_options.get_rows_limit(kind)
+            random_state = data_quality_options.sample_random_state
+            reference_correlations[kind] = self._calculate_correlations(
+                self._limit_rows(reference_data, rows_limit, random_state), num_for_corr, cat_for_corr, kind
+            )
             if current_data is not None:
-                current_correlations[kind] = self._calculate_correlations(current_data, num_for_corr, cat_for_corr,
-                                                                          kind)
+                current_correlations[kind] = self._calculate_correlations(
+                    self._limit_rows(current_data, rows_limit, random_state), num_for_corr, cat_for_corr, kind
+                )
         results = DataQualityAnalyzerResults(
             columns=columns,
             reference_features_stats=reference_features_stats,
@@ -414,16 +454,37 @@ class DataQualityAnalyzer(Analyzer):
         Returns:
             Value of the Cramér's V
         """
-        arr = pd.crosstab(x, y).values
-        chi2_stat = chi2_contingency(arr, correction=False)
-        phi2 = chi2_stat[0] / arr.sum()
-        n_rows, n_cols = arr.shape
-        if min(n_cols - 1, n_rows - 1) == 0:
-            value = np.nan
-        else:
-            value = np.sqrt(phi2 / min(n_cols - 1, n_rows - 1))
+        x_codes, x_uniques = pd.factorize(x)
+        y_codes, y_uniques = pd.factorize(y)
+        return _cramer_v_from_codes(x_codes, len(x_uniques), y_codes, len(y_uniques))
 
-        return value
+    def _cramer_v_matrix(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute pairwise Cramér's V of columns, the same as `_corr_matrix(df, _cramer_v)`.
+
+        Each column is factorized to integer codes once and contingency tables
+        for pairs of columns are calculated by counting combined codes.
+        Args:
+            df: initial data frame.
+        Returns:
+            Correlation matrix.
+        """
+        columns = df.columns
+        K = df.shape[1]
+        if K <= 1:
+            return pd.DataFrame()
+
+        factorized = [pd.factorize(df[column]) for column in columns]
+        codes = [column_codes for column_codes, _ in factorized]
+        sizes = [len(uniques) for _, uniques in factorized]
+        corr_array = np.eye(K)
+
+        for i in range(K):
+            for j in range(i):
+                c = _cramer_v_from_codes(codes[i], sizes[i], codes[j], sizes[j])
+                corr_array[i, j] = c
+                corr_array[j, i] = c
+
+        return pd.DataFrame(data=corr_array, columns=columns, index=columns)
 
     def _corr_matrix(self, df: pd.Series, func: Callable[[pd.Series, pd.Series], float]) -> pd.DataFrame:
         """Compute pairwise correlation of columns
@@ -449,6 +510,16 @@ class DataQualityAnalyzer(Analyzer):
                     corr_array[j, i] = c
             return pd.DataFrame(data=corr_array, columns=columns, index=columns)
 
+    @staticmethod
+    def _limit_rows(df: pd.DataFrame, rows_limit: Optional[int], random_state: int) -> pd.DataFrame:
+        """Get a random sample of rows if the data frame has more rows than the limit.
+        The sample is deterministic: the same data frame and random state give the same rows.
+        """
+        if rows_limit is None or df.shape[0] <= rows_limit:
+            return df
+
+        return df.sample(n=rows_limit, random_state=random_state)
+
     def _calculate_correlations(self, df, num_for_corr, cat_for_corr, kind):
         """Calculate correlation matrix depending on the kind parameter
         Args:
@@ -470,4 +541,4 @@ class DataQualityAnalyzer(Analyzer):
         elif kind == 'kendall':
             return df[num_for_corr].corr('kendall')
         elif kind == 'cramer_v':
-            return self._corr_matrix(df[cat_for_corr], self._cramer_v)
+            return self._cramer_v_matrix(df[cat_for_corr])
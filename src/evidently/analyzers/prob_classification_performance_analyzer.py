@@ -8,7 +8,6 @@ from typing import Union
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass
-from sklearn import metrics
 
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
@@ -16,6 +15,9 @@ from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.options import QualityMetricsOptions
 from evidently.analyzers.utils import process_columns
 from evidently.analyzers.utils import calculate_confusion_by_classes
+from evidently.analyzers.utils import calculate_pr_table
+from evidently.analyzers.utils import get_curve_points_indices
+from evidently.utils.data_operations import get_finite_data
 
 
 @dataclass
@@ -42,6 +44,37 @@ class ClassificationPerformanceMetrics:
     pr_table: Optional[Union[dict, list]] = None
 
 
+def _calculate_roc_curve(target: pd.Series, prediction: pd.Series, max_points: Optional[int]) -> dict:
+    from sklearn import metrics  # pylint: disable=import-outside-toplevel
+    fpr, tpr, thrs = metrics.roc_curve(target, prediction)
+
+    if max_points is not None:
+        indices = get_curve_points_indices(fpr, tpr, max_points)
+        fpr, tpr, thrs = fpr[indices], tpr[indices], thrs[indices]
+
+    return {
+        'fpr': fpr.tolist(),
+        'tpr': tpr.tolist(),
+        'thrs': thrs.tolist()
+    }
+
+
+def _calculate_pr_curve(target: pd.Series, prediction: pd.Series, max_points: Optional[int]) -> dict:
+    from sklearn import metrics  # pylint: disable=import-outside-toplevel
+    pr, rcl, thrs = metrics.precision_recall_curve(target, prediction)
+
+    if max_points is not None:
+        indices = get_curve_points_indices(rcl, pr, max_points)
+        # the last point of the curve has no threshold and is always selected
+        pr, rcl, thrs = pr[indices], rcl[indices], thrs[indices[:-1]]
+
+    return {
+        'pr': pr.tolist(),
+        'rcl': rcl.tolist(),
+        'thrs': thrs.tolist()
+    }
+
+
 @dataclass
 class ProbClassificationPerformanceAnalyzerResults(BaseAnalyzerResult):
     quality_metrics_options: QualityMetricsOptions
@@ -58,6 +91,7 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                   reference_data: pd.DataFrame,
                   current_data: Optional[pd.DataFrame],
                   column_mapping: ColumnMapping) -> ProbClassificationPerformanceAnalyzerResults:
+        from sklearn import metrics  # pylint: disable=import-outside-toplevel
         if reference_data is None:
             raise ValueError('reference_data should be present')
 
@@ -70,10 +104,10 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
             quality_metrics_options=quality_metrics_options,
         )
         classification_threshold = quality_metrics_options.classification_threshold
+        max_curve_points = quality_metrics_options.max_curve_points
 
         if target_column is not None and prediction_column is not None:
-            reference_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-            reference_data.dropna(axis=0, how='any', inplace=True)
+            reference_data = get_finite_data(reference_data)
             binaraized_target = (reference_data[target_column].values.reshape(-1, 1) == prediction_column).astype(int)
             array_prediction = reference_data[prediction_column].to_numpy()
 
@@ -127,40 +161,17 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                 binaraized_target = pd.DataFrame(binaraized_target[:, 0])
                 binaraized_target.columns = ['target']
 
-                fpr, tpr, thrs = metrics.roc_curve(binaraized_target, reference_data[prediction_column[0]])
-                result.reference_metrics.roc_curve = {
-                    'fpr': fpr.tolist(),
-                    'tpr': tpr.tolist(),
-                    'thrs': thrs.tolist()
-                }
-
-                pr, rcl, thrs = metrics.precision_recall_curve(binaraized_target, reference_data[prediction_column[0]])
-                result.reference_metrics.pr_curve = {
-                    'pr': pr.tolist(),
-                    'rcl': rcl.tolist(),
-                    'thrs': thrs.tolist()
-                }
-
-                pr_table = []
-                step_size = 0.05
-                binded = list(zip(binaraized_target['target'].tolist(),
-                                  reference_data[prediction_column[0]].tolist()))
-                binded.sort(key=lambda item: item[1], reverse=True)
-                data_size = len(binded)
-                target_class_size = sum([x[0] for x in binded])
-                offset = max(round(data_size * step_size), 1)
-
-                for step in np.arange(offset, data_size + offset, offset):
-                    count = min(step, data_size)
-                    prob = round(binded[min(step, data_size - 1)][1], 2)
-                    top = round(100.0 * min(step, data_size) / data_size, 1)
-                    tp = sum([x[0] for x in binded[:min(step, data_size)]])
-                    fp = count - tp
-                    precision = round(100.0 * tp / count, 1)
-                    recall = round(100.0 * tp / target_class_size, 1)
-                    pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-
-                result.reference_metrics.pr_table = pr_table
+                result.reference_metrics.roc_curve = _calculate_roc_curve(
+                    binaraized_target['target'], reference_data[prediction_column[0]], max_curve_points
+                )
+
+                result.reference_metrics.pr_curve = _calculate_pr_curve(
+                    binaraized_target['target'], reference_data[prediction_column[0]], max_curve_points
+                )
+
+                result.reference_metrics.pr_table = calculate_pr_table(
+                    binaraized_target['target'], reference_data[prediction_column[0]]
+                )
 
             else:
                 binaraized_target = pd.DataFrame(binaraized_target)
@@ -171,43 +182,20 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                 result.reference_metrics.pr_table = {}
 
                 for label in prediction_column:
-                    fpr, tpr, thrs = metrics.roc_curve(binaraized_target[label], reference_data[label])
-                    result.reference_metrics.roc_curve[label] = {
-                        'fpr': fpr.tolist(),
-                        'tpr': tpr.tolist(),
-                        'thrs': thrs.tolist()
-                    }
-
-                    pr, rcl, thrs = metrics.precision_recall_curve(binaraized_target[label], reference_data[label])
-                    result.reference_metrics.pr_curve[label] = {
-                        'pr': pr.tolist(),
-                        'rcl': rcl.tolist(),
-                        'thrs': thrs.tolist()
-                    }
-
-                    pr_table = []
-                    step_size = 0.05
-                    binded = list(zip(binaraized_target[label].tolist(),
-                                      reference_data[label].tolist()))
-                    binded.sort(key=lambda item: item[1], reverse=True)
-                    data_size = len(binded)
-                    target_class_size = sum([x[0] for x in binded])
-                    offset = max(round(data_size * step_size), 1)
-
-                    for step in np.arange(offset, data_size + offset, offset):
-                        count = min(step, data_size)
-                        prob = round(binded[min(step, data_size - 1)][1], 2)
-                        top = round(100.0 * min(step, data_size) / data_size, 1)
-                        tp = sum([x[0] for x in binded[:min(step, data_size)]])
-                        fp = count - tp
-                        precision = round(100.0 * tp / count, 1)
-                        recall = round(100.0 * tp / target_class_size, 1)
-                        pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-                    result.reference_metrics.pr_table[label] = pr_table
+                    result.reference_metrics.roc_curve[label] = _calculate_roc_curve(
+                        binaraized_target[label], reference_data[label], max_curve_points
+                    )
+
+                    result.reference_metrics.pr_curve[label] = _calculate_pr_curve(
+                        binaraized_target[label], reference_data[label], max_curve_points
+                    )
+
+                    result.reference_metrics.pr_table[label] = calculate_pr_table(
+                        binaraized_target[label], reference_data[label]
+                    )
 
             if current_data is not None:
-                current_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-                current_data.dropna(axis=0, how='any', inplace=True)
+                current_data = get_finite_data(current_data)
 
                 binaraized_target = (current_data[target_column].values.reshape(-1, 1) == prediction_column).astype(int)
 
@@ -262,42 +250,17 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                     binaraized_target = pd.DataFrame(binaraized_target[:, 0])
                     binaraized_target.columns = ['target']
 
-                    fpr, tpr, thrs = metrics.roc_curve(binaraized_target, current_data[prediction_column[0]])
-                    result.current_metrics.roc_curve = {
-                        'fpr': fpr.tolist(),
-                        'tpr': tpr.tolist(),
-                        'thrs': thrs.tolist()
-                    }
-
-                    pr, rcl, thrs = metrics.precision_recall_curve(binaraized_target,
-                                                                   current_data[prediction_column[0]])
-                    result.current_metrics.pr_curve = {
-                        'pr': pr.tolist(),
-                        'rcl': rcl.tolist(),
-                        'thrs': thrs.tolist()
-                    }
-
-                    pr_table = []
-                    step_size = 0.05
-                    binded = list(zip(
-                        binaraized_target['target'].tolist(), current_data[prediction_column[0]].tolist()
-                    ))
-                    binded.sort(key=lambda item: item[1], reverse=True)
-                    data_size = len(binded)
-                    target_class_size = sum([x[0] for x in binded])
-                    offset = max(round(data_size * step_size), 1)
-
-                    for step in np.arange(offset, data_size + offset, offset):
-                        count = min(step, data_size)
-                        prob = round(binded[min(step, data_size - 1)][1], 2)
-                        top = round(100.0 * min(step, data_size) / data_size, 1)
-                        tp = sum([x[0] for x in binded[:min(step, data_size)]])
-                        fp = count - tp
-                        precision = round(100.0 * tp / count, 1)
-                        recall = round(100.0 * tp / target_class_size, 1)
-                        pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-
-                    result.current_metrics.pr_table = pr_table
+                    result.current_metrics.roc_curve = _calculate_roc_curve(
+                        binaraized_target['target'], current_data[prediction_column[0]], max_curve_points
+                    )
+
+                    result.current_metrics.pr_curve = _calculate_pr_curve(
+                        binaraized_target['target'], current_data[prediction_column[0]], max_curve_points
+                    )
+
+                    result.current_metrics.pr_table = calculate_pr_table(
+                        binaraized_target['target'], current_data[prediction_column[0]]
+                    )
 
                 else:
                     binaraized_target = pd.DataFrame(binaraized_target)
@@ -308,39 +271,16 @@ class ProbClassificationPerformanceAnalyzer(Analyzer):
                     result.current_metrics.pr_table = {}
 
                     for label in prediction_column:
-                        fpr, tpr, thrs = metrics.roc_curve(binaraized_target[label], current_data[label])
-                        result.current_metrics.roc_curve[label] = {
-                            'fpr': fpr.tolist(),
-                            'tpr': tpr.tolist(),
-                            'thrs': thrs.tolist()
-                        }
-
-                        pr, rcl, thrs = metrics.precision_recall_curve(binaraized_target[label], current_data[label])
-                        result.current_metrics.pr_curve[label] = {
-                            'pr': pr.tolist(),
-                            'rcl': rcl.tolist(),
-                            'thrs': thrs.tolist()
-                        }
-
-                        pr_table = []
-                        step_size = 0.05
-                        binded = list(zip(binaraized_target[label].tolist(),
-                                          current_data[label].tolist()))
-                        binded.sort(key=lambda item: item[1], reverse=True)
-                        data_size = len(binded)
-                        target_class_size = sum([x[0] for x in binded])
-                        offset = max(round(data_size * step_size), 1)
-
-                        for step in np.arange(offset, data_size + offset, offset):
-                            count = min(step, data_size)
-                            prob = round(binded[min(step, data_size - 1)][1], 2)
-                            top = round(100.0 * min(step, data_size) / data_size, 1)
-                            tp = sum([x[0] for x in binded[:min(step, data_size)]])
-                            fp = count - tp
-                            precision = round(100.0 * tp / count, 1)
-                            recall = round(100.0 * tp / target_class_size, 1)
-                            pr_table.append([top, int(count), prob, int(tp), int(fp), precision, recall])
-
-                        result.current_metrics.pr_table[label] = pr_table
+                        result.current_metrics.roc_curve[label] = _calculate_roc_curve(
+                            binaraized_target[label], current_data[label], max_curve_points
+                        )
+
+                        result.current_metrics.pr_curve[label] = _calculate_pr_curve(
+                            binaraized_target[label], current_data[label], max_curve_points
+                        )
+
+                        result.current_metrics.pr_table[label] = calculate_pr_table(
+                            binaraized_target[label], current_data[label]
+                        )
 
         return result
@@ -5,12 +5,12 @@ from typing import Dict, Optional
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass
-from scipy.stats import probplot
 
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.analyzers.base_analyzer import BaseAnalyzerResult
 from evidently.analyzers.utils import process_columns
+from evidently.utils.data_operations import get_finite_data
 
 
 class ErrorWithQuantiles:
@@ -75,7 +75,7 @@ class RegressionPerformanceAnalyzer(Analyzer):
         cat_feature_names = columns.cat_feature_names
 
         if target_column is not None and prediction_column is not None:
-            _prepare_dataset(reference_data)
+            reference_data = get_finite_data(reference_data)
 
             # calculate quality metrics
             quality_metrics = _calculate_quality_metrics(reference_data, prediction_column, target_column)
@@ -96,7 +96,7 @@ class RegressionPerformanceAnalyzer(Analyzer):
                           for feature, bias in ref_feature_bias.items()}
 
             if current_data is not None:
-                _prepare_dataset(current_data)
+                current_data = get_finite_data(current_data)
 
                 # calculate quality metrics
                 quality_metrics = _calculate_quality_metrics(current_data, prediction_column, target_column)
@@ -124,6 +124,7 @@ class RegressionPerformanceAnalyzer(Analyzer):
 
 
 def _calculate_error_normality(error: ErrorWithQuantiles):
+    from scipy.stats import probplot  # pylint: disable=import-outside-toplevel
     qq_lines = probplot(error.error, dist="norm", plot=None)
     # theoretical_q_x = np.linspace(qq_lines[0][0][0], qq_lines[0][0][-1], 100) # TODO: review  unused?
 
@@ -160,11 +161,6 @@ def _calculate_quality_metrics(dataset, prediction_column, target_column, conf_i
     }
 
 
-def _prepare_dataset(dataset):
-    dataset.replace([np.inf, -np.inf], np.nan, inplace=True)
-    dataset.dropna(axis=0, how='any', inplace=True)
-
-
 def _calculate_underperformance(err_quantiles: ErrorWithQuantiles, conf_interval_n_sigmas: int = 1):
     error = err_quantiles.error
     quantile_5 = err_quantiles.quantile_5
@@ -1,27 +1,36 @@
 #!/usr/bin/env python
 # coding: utf-8
 from typing import Tuple
+from typing import Union
 
 import numpy as np
 import pandas as pd
 
-from scipy.stats import chisquare
-
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.pipeline.reference_sketch import ColumnSketch
 
 
 def _chi_stat_test(
-        reference_data: pd.Series,
+        reference_data: Union[pd.Series, ColumnSketch],
         current_data: pd.Series,
         feature_type: str,
         threshold: float) -> Tuple[float, bool]:
+    from scipy.stats import chisquare  # pylint: disable=import-outside-toplevel
     #  TODO: simplify ignoring NaN values here, in z_stat_test and data_drift_analyzer
-    keys = list((set(reference_data) | set(current_data)) - {np.nan})
+    if isinstance(reference_data, ColumnSketch):
+        reference_values = reference_data.unique_values
+        reference_value_counts = reference_data.value_counts
+
+    else:
+        reference_values = reference_data
+        reference_value_counts = reference_data.value_counts()
+
+    keys = list((set(reference_values) | set(current_data)) - {np.nan})
 
-    ref_feature_dict = {**dict.fromkeys(keys, 0), **dict(reference_data.value_counts())}
+    ref_feature_dict = {**dict.fromkeys(keys, 0), **dict(reference_value_counts)}
     current_feature_dict = {**dict.fromkeys(keys, 0), **dict(current_data.value_counts())}
 
-    k_norm = current_data.shape[0] / reference_data.shape[0]
+    k_norm = current_data.shape[0] / len(reference_data)
 
     f_exp = [ref_feature_dict[key] * k_norm for key in keys]
     f_obs = [current_feature_dict[key] for key in keys]
@@ -33,7 +42,8 @@ chi_stat_test = StatTest(
     name="chisquare",
     display_name="chi-square p_value",
     func=_chi_stat_test,
-    allowed_feature_types=["cat"]
+    allowed_feature_types=["cat"],
+    supports_reference_sketch=True,
 )
 
 register_stattest(chi_stat_test)
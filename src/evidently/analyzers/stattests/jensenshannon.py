@@ -1,21 +1,22 @@
 from typing import Tuple
+from typing import Union
 
 import pandas as pd
-from scipy.spatial import distance
 
 from evidently.analyzers.stattests.utils import get_binned_data
+from evidently.pipeline.reference_sketch import ColumnSketch
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
 
 
 def _jensenshannon(
-        reference_data: pd.Series,
+        reference_data: Union[pd.Series, ColumnSketch],
         current_data: pd.Series,
         feature_type: str,
         threshold: float,
         n_bins: int = 30) -> Tuple[float, bool]:
     """Compute the Jensen-Shannon distance between two arrays
     Args:
-        reference_data: reference data
+        reference_data: reference data or its sketch
         current_data: current data
         feature_type: feature type
         threshold: all walues above this threshold means data drift
@@ -24,6 +25,7 @@ def _jensenshannon(
         jensenshannon: calculated Jensen-Shannon distance
         test_result: wether the drift is detected
     """
+    from scipy.spatial import distance  # pylint: disable=import-outside-toplevel
     reference_percents, current_percents = get_binned_data(reference_data, current_data, feature_type, n_bins)
     jensenshannon_value = distance.jensenshannon(reference_percents, current_percents)
     return jensenshannon_value, jensenshannon_value >= threshold
@@ -33,7 +35,8 @@ jensenshannon_stat_test = StatTest(
     name="jensenshannon",
     display_name="Jensen-Shannon distance",
     func=_jensenshannon,
-    allowed_feature_types=["cat", "num"]
+    allowed_feature_types=["cat", "num"],
+    supports_reference_sketch=True,
 )
 
 register_stattest(jensenshannon_stat_test)
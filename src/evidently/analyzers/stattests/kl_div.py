@@ -1,21 +1,22 @@
 from typing import Tuple
+from typing import Union
 
 import pandas as pd
-from scipy import stats
 
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
 from evidently.analyzers.stattests.utils import get_binned_data
+from evidently.pipeline.reference_sketch import ColumnSketch
 
 
 def kl_div(
-        reference_data: pd.Series,
+        reference_data: Union[pd.Series, ColumnSketch],
         current_data: pd.Series,
         feature_type: str,
         threshold: float,
         n_bins: int = 30) -> Tuple[float, bool]:
     """Compute the Kullback-Leibler divergence between two arrays
     Args:
-        reference_data: reference data
+        reference_data: reference data or its sketch
         current_data: current data
         feature_type: feature type
         threshold: all walues above this threshold means data drift
@@ -24,6 +25,7 @@ def kl_div(
         kl_div: calculated Kullback-Leibler divergence value
         test_result: wether the drift is detected
     """
+    from scipy import stats  # pylint: disable=import-outside-toplevel
     reference_percents, current_percents = get_binned_data(reference_data, current_data, feature_type, n_bins)
     kl_div_value = stats.entropy(reference_percents, current_percents)
     return kl_div_value, kl_div_value >= threshold
@@ -33,7 +35,8 @@ kl_div_stat_test = StatTest(
     name="kl_div",
     display_name="Kullback-Leibler divergence",
     func=kl_div,
-    allowed_feature_types=["cat", "num"]
+    allowed_feature_types=["cat", "num"],
+    supports_reference_sketch=True,
 )
 
 register_stattest(kl_div_stat_test)
@@ -1,21 +1,23 @@
 #!/usr/bin/env python
 # coding: utf-8
 from typing import Tuple
+from typing import Union
 
+import numpy as np
 import pandas as pd
-from scipy.stats import ks_2samp
 
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.pipeline.reference_sketch import ColumnSketch
 
 
 def _ks_stat_test(
-        reference_data: pd.Series,
+        reference_data: Union[pd.Series, ColumnSketch],
         current_data: pd.Series,
         feature_type: str,
         threshold: float) -> Tuple[float, bool]:
     """Run the two-sample Kolmogorov-Smirnov test of two samples. Alternative: two-sided
     Args:
-        reference_data: reference data
+        reference_data: reference data or its sketch
         current_data: current data
         feature_type: feature type
         threshold: level of significance
@@ -23,15 +25,72 @@ def _ks_stat_test(
         p_value: two-tailed p-value
         test_result: wether the drift is detected
     """
+    from scipy.stats import ks_2samp  # pylint: disable=import-outside-toplevel
+    if isinstance(reference_data, ColumnSketch):
+        reference_data = reference_data.sorted_values
+
     p_value = ks_2samp(reference_data, current_data)[1]
     return p_value, p_value <= threshold
 
 
+# scipy.stats.ks_2samp uses the exact p-value calculation for samples with up to this size
+# and the asymptotic distribution for bigger samples
+KS_EXACT_MAX_SIZE = 10000
+
+
+def ks_sorted_statistics(reference_sorted: np.ndarray, current_sorted: np.ndarray) -> np.ndarray:
+    """Calculate the two-sample Kolmogorov-Smirnov statistics for all columns of 2D arrays.
+    Args:
+        reference_sorted: 2D reference data without NaN values, one column per feature, sorted by columns
+        current_sorted: 2D current data without NaN values with the same columns, sorted by columns
+    Returns:
+        statistics: array with the two-sided statistic for each column
+    """
+    n_reference = reference_sorted.shape[0]
+    n_current = current_sorted.shape[0]
+    statistics = np.empty(reference_sorted.shape[1])
+
+    for column_idx in range(reference_sorted.shape[1]):
+        reference_column = reference_sorted[:, column_idx]
+        current_column = current_sorted[:, column_idx]
+        # the same ECDF differences as in ks_2samp, but the samples are already sorted
+        max_diff = 0.
+        min_diff = 0.
+
+        for points in (reference_column, current_column):
+            cdf_diffs = np.searchsorted(reference_column, points, side="right") / n_reference - \
+                np.searchsorted(current_column, points, side="right") / n_current
+            max_diff = max(max_diff, cdf_diffs.max())
+            min_diff = min(min_diff, cdf_diffs.min())
+
+        statistics[column_idx] = max(max_diff, np.clip(-min_diff, 0, 1))
+
+    return statistics
+
+
+def ks_sorted_p_values(reference_sorted: np.ndarray, current_sorted: np.ndarray) -> np.ndarray:
+    """Run the two-sample Kolmogorov-Smirnov test for all columns of 2D arrays at once. Alternative: two-sided
+
+    Gives the same results as ks_2samp with the asymptotic method,
+    so it should be used when one of the samples is bigger than KS_EXACT_MAX_SIZE.
+    Args:
+        reference_sorted: 2D reference data without NaN values, one column per feature, sorted by columns
+        current_sorted: 2D current data without NaN values with the same columns, sorted by columns
+    Returns:
+        p_values: array with two-tailed p-value for each column
+    """
+    from scipy.stats import kstwo  # pylint: disable=import-outside-toplevel
+    n_max, n_min = sorted([float(reference_sorted.shape[0]), float(current_sorted.shape[0])], reverse=True)
+    statistics = ks_sorted_statistics(reference_sorted, current_sorted)
+    return np.clip(kstwo.sf(statistics, np.round(n_max * n_min / (n_max + n_min))), 0, 1)
+
+
 ks_stat_test = StatTest(
     name="ks",
     display_name="K-S p_value",
     func=_ks_stat_test,
     allowed_feature_types=["num"],
+    supports_reference_sketch=True,
 )
 
 register_stattest(ks_stat_test)
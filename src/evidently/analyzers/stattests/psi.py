@@ -1,21 +1,23 @@
 from typing import Tuple
+from typing import Union
 
 import pandas as pd
 import numpy as np
 
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
 from evidently.analyzers.stattests.utils import get_binned_data
+from evidently.pipeline.reference_sketch import ColumnSketch
 
 
 def psi(
-        reference_data: pd.Series,
+        reference_data: Union[pd.Series, ColumnSketch],
         current_data: pd.Series,
         feature_type: str,
         threshold: float,
         n_bins: int = 30) -> Tuple[float, bool]:
     """Calculate the PSI
     Args:
-        reference_data: reference data
+        reference_data: reference data or its sketch
         current_data: current data
         feature_type: feature type
         threshold: all values above this threshold means data drift
@@ -44,7 +46,8 @@ psi_stat_test = StatTest(
     name="psi",
     display_name="PSI",
     func=psi,
-    allowed_feature_types=["cat", "num"]
+    allowed_feature_types=["cat", "num"],
+    supports_reference_sketch=True,
 )
 
 register_stattest(psi_stat_test)
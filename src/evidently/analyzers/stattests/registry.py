@@ -14,6 +14,8 @@ class StatTest:
     display_name: str
     func: StatTestFuncType
     allowed_feature_types: List[str]
+    # the function accepts a column sketch from evidently.pipeline.reference_sketch as reference data
+    supports_reference_sketch: bool = False
 
 
 PossibleStatTestType = Union[str, StatTestFuncType, StatTest]
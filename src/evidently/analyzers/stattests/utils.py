@@ -1,11 +1,17 @@
+from typing import Union
+
 import pandas as pd
 import numpy as np
 
+from evidently.pipeline.reference_sketch import ColumnSketch
+from evidently.pipeline.reference_sketch import MAX_UNIQUE_VALUES_WITHOUT_BINS
+from evidently.pipeline.reference_sketch import get_n_quantiles
+
 
-def get_binned_data(reference: pd.Series, current: pd.Series, feature_type: str, n: int):
+def get_binned_data(reference: Union[pd.Series, ColumnSketch], current: pd.Series, feature_type: str, n: int):
     """Split variable into n buckets based on reference quantiles
     Args:
-        reference: reference data
+        reference: reference data or its sketch
         current: current data
         feature_type: feature type
         n: number of quantiles
@@ -13,19 +19,26 @@ def get_binned_data(reference: pd.Series, current: pd.Series, feature_type: str,
         reference_percents: % of records in each bucket for reference
         current_percents: % of records in each bucket for reference
     """
-    n_vals = reference.nunique()
-    if feature_type == 'num' and n_vals > 20:
-        if n_vals < 50:
-            n = 15
-        _, bins = pd.qcut(reference, n, retbins=True, duplicates='drop')
+    is_sketch = isinstance(reference, ColumnSketch)
+    n_vals = reference.n_unique if is_sketch else reference.nunique()
+    if feature_type == 'num' and n_vals > MAX_UNIQUE_VALUES_WITHOUT_BINS:
+        n = get_n_quantiles(n_vals, n)
+
+        if is_sketch:
+            bins, reference_counts = reference.get_quantile_bins(n)
+
+        else:
+            _, bins = pd.qcut(reference, n, retbins=True, duplicates='drop')
+            reference_counts = np.histogram(reference, bins)[0]
 
-        reference_percents = np.histogram(reference, bins)[0] / len(reference)
+        reference_percents = reference_counts / len(reference)
         current_percents = np.histogram(current, bins)[0] / len(current)
 
     else:
-        keys = list((set(reference) | set(current)) - {np.nan})
+        keys = list((set(reference.unique_values if is_sketch else reference) | set(current)) - {np.nan})
+        reference_value_counts = reference.value_counts if is_sketch else reference.value_counts()
 
-        ref_feature_dict = {**dict.fromkeys(keys, 0), **dict(reference.value_counts())}
+        ref_feature_dict = {**dict.fromkeys(keys, 0), **dict(reference_value_counts)}
         current_feature_dict = {**dict.fromkeys(keys, 0), **dict(current.value_counts())}
 
         reference_percents = np.array([ref_feature_dict[key] / len(reference) for key in keys])
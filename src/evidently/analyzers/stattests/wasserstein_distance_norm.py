@@ -1,20 +1,21 @@
 from typing import Tuple
+from typing import Union
 
 import pandas as pd
 import numpy as np
-from scipy import stats
 
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.pipeline.reference_sketch import ColumnSketch
 
 
 def _wasserstein_distance_norm(
-        reference_data: pd.Series,
+        reference_data: Union[pd.Series, ColumnSketch],
         current_data: pd.Series,
         feature_type: str,
         threshold: float) -> Tuple[float, bool]:
     """Compute the first Wasserstein distance between two arrays normed by mean value of reference data
     Args:
-        reference_data: reference data
+        reference_data: reference data or its sketch
         current_data: current data
         feature_type: feature type
         threshold: all walues above this threshold means data drift
@@ -22,7 +23,15 @@ def _wasserstein_distance_norm(
         wasserstein_distance_norm: normed Wasserstein distance
         test_result: wether the drift is detected
     """
-    norm = np.mean(reference_data) if np.mean(reference_data) != 0 else 0.0001
+    from scipy import stats  # pylint: disable=import-outside-toplevel
+    if isinstance(reference_data, ColumnSketch):
+        reference_mean = reference_data.mean
+        reference_data = reference_data.sorted_values
+
+    else:
+        reference_mean = np.mean(reference_data)
+
+    norm = reference_mean if reference_mean != 0 else 0.0001
     wd_norm_value = stats.wasserstein_distance(reference_data, current_data) / np.abs(norm)
     return wd_norm_value, wd_norm_value >= threshold
 
@@ -31,7 +40,8 @@ wasserstein_stat_test = StatTest(
     name="wasserstein",
     display_name="Wasserstein distance (normed)",
     func=_wasserstein_distance_norm,
-    allowed_feature_types=["num"]
+    allowed_feature_types=["num"],
+    supports_reference_sketch=True,
 )
 
 register_stattest(wasserstein_stat_test)
@@ -1,28 +1,30 @@
 #!/usr/bin/env python
 # coding: utf-8
 from typing import Tuple
+from typing import Union
 
 import numpy as np
 import pandas as pd
 
-from scipy.stats import norm
-
 from evidently.analyzers.stattests.registry import StatTest, register_stattest
+from evidently.pipeline.reference_sketch import ColumnSketch
 
 
 def proportions_diff_z_stat_ind(ref: pd.DataFrame, curr: pd.DataFrame):
-    # pylint: disable=invalid-name
-    n1 = len(ref)
-    n2 = len(curr)
+    return _proportions_diff_z_stat(sum(ref), len(ref), sum(curr), len(curr))
+
 
-    p1 = float(sum(ref)) / n1
-    p2 = float(sum(curr)) / n2
+def _proportions_diff_z_stat(ref_successes: int, n1: int, curr_successes: int, n2: int):
+    # pylint: disable=invalid-name
+    p1 = float(ref_successes) / n1
+    p2 = float(curr_successes) / n2
     P = float(p1 * n1 + p2 * n2) / (n1 + n2)
 
     return (p1 - p2) / np.sqrt(P * (1 - P) * (1. / n1 + 1. / n2))
 
 
 def proportions_diff_z_test(z_stat, alternative='two-sided'):
+    from scipy.stats import norm  # pylint: disable=import-outside-toplevel
     if alternative == 'two-sided':
         return 2 * (1 - norm.cdf(np.abs(z_stat)))
 
@@ -37,22 +39,39 @@ def proportions_diff_z_test(z_stat, alternative='two-sided'):
 
 
 def _z_stat_test(
-        reference_data: pd.Series,
+        reference_data: Union[pd.Series, ColumnSketch],
         current_data: pd.Series,
         feature_type: str,
         threshold: float) -> Tuple[float, bool]:
     #  TODO: simplify ignoring NaN values here, in chi_stat_test and data_drift_analyzer
-    if (reference_data.nunique() == 1
+    if isinstance(reference_data, ColumnSketch):
+        reference_nunique = reference_data.n_unique
+        reference_unique = reference_data.unique_values
+
+    else:
+        reference_nunique = reference_data.nunique()
+        reference_unique = list(reference_data.unique())
+
+    if (reference_nunique == 1
             and current_data.nunique() == 1
-            and reference_data.unique()[0] == current_data.unique()[0]):
+            and reference_unique[0] == current_data.unique()[0]):
         p_value = 1
     else:
-        keys = set(list(reference_data.unique()) + list(current_data.unique())) - {np.nan}
+        keys = set(reference_unique + list(current_data.unique())) - {np.nan}
         ordered_keys = sorted(list(keys))
+
+        if isinstance(reference_data, ColumnSketch):
+            reference_successes = len(reference_data) - reference_data.value_counts.get(ordered_keys[0], 0)
+
+        else:
+            reference_successes = sum(reference_data.apply(lambda x, key=ordered_keys[0]: 0 if x == key else 1))
+
         p_value = proportions_diff_z_test(
-            proportions_diff_z_stat_ind(
-                reference_data.apply(lambda x, key=ordered_keys[0]: 0 if x == key else 1),
-                current_data.apply(lambda x, key=ordered_keys[0]: 0 if x == key else 1)
+            _proportions_diff_z_stat(
+                reference_successes,
+                len(reference_data),
+                sum(current_data.apply(lambda x, key=ordered_keys[0]: 0 if x == key else 1)),
+                len(current_data),
             )
         )
     return p_value, p_value < threshold
@@ -63,6 +82,7 @@ z_stat_test = StatTest(
     display_name="Z-test p_value",
     func=_z_stat_test,
     allowed_feature_types=["cat"],
+    supports_reference_sketch=True,
 )
 
 register_stattest(z_stat_test)
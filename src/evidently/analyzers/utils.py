@@ -1,7 +1,10 @@
+import copy
+import heapq
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Union
 
 import numpy as np
@@ -9,6 +12,7 @@ import pandas as pd
 from dataclasses import dataclass
 
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.data_operations import get_cached_value
 
 
 @dataclass
@@ -80,10 +84,43 @@ class DatasetColumns:
         return len(self.num_feature_names) + len(self.cat_feature_names) + len_time_columns
 
 
+def _get_column_mapping_key(column_mapping: ColumnMapping) -> Tuple:
+    return tuple(
+        tuple(value) if isinstance(value, (list, tuple, np.ndarray, pd.Index)) else value
+        for value in (
+            column_mapping.target,
+            column_mapping.prediction,
+            column_mapping.datetime,
+            column_mapping.id,
+            column_mapping.numerical_features,
+            column_mapping.categorical_features,
+            column_mapping.datetime_features,
+            column_mapping.target_names,
+        )
+    )
+
+
 def process_columns(dataset: pd.DataFrame, column_mapping: ColumnMapping) -> DatasetColumns:
+    """Get columns of the dataset by their types and roles in the column mapping.
+
+    Types inference is slow for wide datasets, so while a pipeline is executed the result is calculated once
+    for a dataset, its schema and the column mapping and shared by analyzers and widgets.
+    """
     if column_mapping is None:
         # data mapping should not be empy in this step
         raise ValueError("column_mapping should be present")
+    key = (
+        "columns",
+        _get_column_mapping_key(column_mapping),
+        tuple(dataset.columns),
+        tuple(dataset.dtypes),
+    )
+    columns = get_cached_value(dataset, key, lambda: _process_columns(dataset, column_mapping))
+    # callers get their own copy of the lists
+    return copy.deepcopy(columns)
+
+
+def _process_columns(dataset: pd.DataFrame, column_mapping: ColumnMapping) -> DatasetColumns:
     date_column = column_mapping.datetime if column_mapping.datetime in dataset else None
     # index column name
     id_column = column_mapping.id
@@ -196,3 +233,136 @@ def calculate_confusion_by_classes(confusion_matrix: pd.DataFrame, class_names:
         }
 
     return confusion_by_classes
+
+
+def calculate_pr_table(
+    target: Union[np.ndarray, pd.Series], prediction: Union[np.ndarray, pd.Series], step_size: float = 0.05
+) -> List[list]:
+    """Calculate precision-recall table for top predictions by probability with `step_size` share steps.
+
+    Args:
+        target: binarized target, 1 for the class and 0 for other classes.
+        prediction: predicted probabilities of the class.
+        step_size: share of the data in each step.
+
+    Returns a list of rows like:
+        [top percent, count, probability threshold, TP, FP, precision percent, recall percent]
+    """
+    target = np.asarray(target)
+    prediction = np.asarray(prediction)
+    # stable sort keeps objects with the same probability in the original order
+    order = np.argsort(-prediction, kind="stable")
+    sorted_prediction = prediction[order]
+    true_positive = np.cumsum(target[order])
+    data_size = len(target)
+    target_class_size = int(true_positive[-1]) if data_size > 0 else 0
+    offset = max(round(data_size * step_size), 1)
+    pr_table = []
+
+    for step in range(offset, data_size + offset, offset):
+        count = min(step, data_size)
+        prob = round(float(sorted_prediction[min(step, data_size - 1)]), 2)
+        top = round(100.0 * count / data_size, 1)
+        tp = int(true_positive[count - 1])
+        fp = count - tp
+        precision = round(100.0 * tp / count, 1)
+        recall = round(100.0 * tp / target_class_size, 1)
+        pr_table.append([top, count, prob, tp, fp, precision, recall])
+
+    return pr_table
+
+
+def get_curve_points_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Select indices of points that approximate a curve with at most `max_points` points.
+
+    Uses the Ramer-Douglas-Peucker algorithm with a points budget: starting from the first and the last points,
+    the point with the largest distance from the current polyline is added while there are less than
+    `max_points` selected points and not all points lie on the polyline. The first and the last points
+    are always selected, the result is sorted.
+    """
+    if max_points < 2:
+        raise ValueError("max_points should be >= 2")
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    if len(x) <= max_points:
+        return np.arange(len(x))
+
+    def get_farthest_point(start: int, end: int) -> Tuple[float, int, int, int]:
+        dx = x[end] - x[start]
+        dy = y[end] - y[start]
+        points_x = x[start + 1:end] - x[start]
+        points_y = y[start + 1:end] - y[start]
+        segment_length = np.hypot(dx, dy)
+
+        if segment_length > 0:
+            distances = np.abs(dx * points_y - dy * points_x) / segment_length
+
+        else:
+            distances = np.hypot(points_x, points_y)
+
+        farthest = int(np.argmax(distances))
+        # negative distance for the max-heap order
+        return -float(distances[farthest]), start + 1 + farthest, start, end
+
+    selected = [0, len(x) - 1]
+    segments = [get_farthest_point(0, len(x) - 1)]
+
+    while segments and len(selected) < max_points:
+        distance, index, start, end = heapq.heappop(segments)
+
+        # the rest points lie on the polyline up to float rounding errors
+        if -distance < 1e-12:
+            break
+
+        selected.append(index)
+
+        for segment_start, segment_end in ((start, index), (index, end)):
+            if segment_end - segment_start > 1:
+                heapq.heappush(segments, get_farthest_point(segment_start, segment_end))
+
+    return np.sort(selected)
+
+
+def calculate_sorted_histograms(sorted_data: np.ndarray, bins: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Calculate density histograms of finite values for all columns of a 2D array sorted by columns.
+
+    Gives the same result as `np.histogram(column[np.isfinite(column)], bins=bins, density=True)`
+    for each column: all bins but the last are half-open, the last one includes the right edge.
+
+    Returns a list with (density, bin_edges) tuple for each column.
+    """
+    # finite values of a sorted column are between -inf and inf, NaN values are sorted to the end
+    finite_starts = np.array([
+        np.searchsorted(sorted_data[:, column_idx], -np.inf, side="right") for column_idx in range(sorted_data.shape[1])
+    ], dtype=np.intp)
+    finite_ends = np.array([
+        np.searchsorted(sorted_data[:, column_idx], np.inf, side="left") for column_idx in range(sorted_data.shape[1])
+    ], dtype=np.intp)
+    has_values = finite_starts < finite_ends
+
+    if not has_values.all():
+        # keep numpy behaviour for columns without finite values
+        histograms = iter(calculate_sorted_histograms(sorted_data[:, has_values], bins) if has_values.any() else [])
+        return [
+            next(histograms) if column_has_values else np.histogram(sorted_data[:0, column_idx], bins=bins, density=True)
+            for column_idx, column_has_values in enumerate(has_values)
+        ]
+
+    columns = np.arange(sorted_data.shape[1])
+    first_edges = sorted_data[finite_starts, columns]
+    last_edges = sorted_data[finite_ends - 1, columns]
+    same_edges = first_edges == last_edges
+    first_edges[same_edges] -= 0.5
+    last_edges[same_edges] += 0.5
+    bin_edges = np.linspace(first_edges, last_edges, bins + 1)
+    counts = np.empty((sorted_data.shape[1], bins), dtype=np.intp)
+
+    for column_idx in columns:
+        edge_positions = np.searchsorted(sorted_data[:, column_idx], bin_edges[:-1, column_idx], side="left")
+        edge_positions[0] = finite_starts[column_idx]
+        counts[column_idx] = np.diff(np.append(edge_positions, finite_ends[column_idx]))
+
+    densities = counts / np.diff(bin_edges, axis=0).T / counts.sum(axis=1, keepdims=True)
+    return [(densities[column_idx], bin_edges[:, column_idx]) for column_idx in columns]
@@ -6,8 +6,8 @@ import json
 import os
 import uuid
 import base64
-from dataclasses import asdict
-from typing import List, Callable, Dict, Optional, Sequence
+from typing import List, Callable, Dict, Optional, Sequence, Union
+from urllib.parse import quote
 
 import pandas
 
@@ -15,8 +15,11 @@ import evidently
 from evidently.model.dashboard import DashboardInfo
 from evidently.pipeline.pipeline import Pipeline
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.pipeline.reference_sketch import ReferenceSketch
+from evidently.pipeline.timings import RENDER
+from evidently.pipeline.timings import measure_timings
 from evidently.dashboard.tabs.base_tab import Tab
-from evidently.utils import NumpyEncoder
+from evidently.utils import json_serializer
 
 
 @dataclasses.dataclass()
@@ -27,7 +30,7 @@ class TemplateParams:
 
 
 def __dashboard_info_to_json(dashboard_info: DashboardInfo):
-    return json.dumps(asdict(dashboard_info), cls=NumpyEncoder)
+    return json_serializer.dumps(dashboard_info)
 
 
 def inline_template(params: TemplateParams):
@@ -48,7 +51,7 @@ svg {{
 </style>
 <script>
     var {params.dashboard_id} = {__dashboard_info_to_json(params.dashboard_info)};
-    var additional_graphs_{params.dashboard_id} = {json.dumps(params.additional_graphs)};
+    var additional_graphs_{params.dashboard_id} = {json_serializer.dumps(params.additional_graphs)};
 </script>
 <script>
 function domReady(fn) {{
@@ -108,7 +111,7 @@ def file_html_template(params: TemplateParams):
 </style>
 <script>
     var {params.dashboard_id} = {__dashboard_info_to_json(params.dashboard_info)};
-    var additional_graphs_{params.dashboard_id} = {json.dumps(params.additional_graphs)};
+    var additional_graphs_{params.dashboard_id} = {json_serializer.dumps(params.additional_graphs)};
 </script>
 </head>
 <body>
@@ -132,6 +135,32 @@ def __load_js():
     return open(os.path.join(__STATIC_PATH, "index.js"), encoding='utf-8').read()
 
 
+def save_additional_graphs(additional_graphs: Dict, graphs_path: str, graphs_url: str) -> Dict[str, str]:
+    """Save additional graphs to separate script files, so the dashboard loads them when they are shown.
+
+    Graphs are saved as scripts instead of JSON files, because browsers do not allow to fetch local files
+    when a dashboard is opened as a file.
+
+    Returns:
+        urls of the graphs scripts by graphs ids, they are used by the dashboard instead of the graphs
+    """
+    os.makedirs(graphs_path, exist_ok=True)
+    graphs_urls = {}
+
+    for index, (graph_id, graph) in enumerate(additional_graphs.items()):
+        file_name = f"{index}.js"
+        graph_url = f"{graphs_url}/{file_name}"
+
+        with open(os.path.join(graphs_path, file_name), "w", encoding="utf-8") as out_file:
+            out_file.write(f"window.evidentlyGraphLoaded({json.dumps(graph_url)}, ")
+            json_serializer.dump(graph, out_file)
+            out_file.write(");\n")
+
+        graphs_urls[graph_id] = graph_url
+
+    return graphs_urls
+
+
 def __load_font():
     return base64.b64encode(
         open(os.path.join(__STATIC_PATH, "material-ui-icons.woff2"), 'rb').read()).decode()
@@ -145,13 +174,20 @@ class Dashboard(Pipeline):
         super().__init__(tabs, options if options is not None else [])
 
     def calculate(self,
-                  reference_data: pandas.DataFrame,
+                  reference_data: Union[pandas.DataFrame, ReferenceSketch],
                   current_data: Optional[pandas.DataFrame] = None,
                   column_mapping: Optional[ColumnMapping] = None):
         column_mapping = column_mapping or ColumnMapping()
         self.execute(reference_data, current_data, column_mapping)
 
-    def __render(self, template: Callable[[TemplateParams], str]):
+    def __render(self, template: Callable[[TemplateParams], str], graphs_path: Optional[str] = None):
+        with measure_timings(self.timings, RENDER, template.__name__) as record:
+            html = self.__render_template(template, graphs_path)
+            if record is not None:
+                record.payload_size = len(html.encode("utf-8"))
+        return html
+
+    def __render_template(self, template: Callable[[TemplateParams], str], graphs_path: Optional[str] = None):
         dashboard_id = "evidently_dashboard_" + str(uuid.uuid4()).replace("-", "")
         tab_widgets = [t.info() for t in self.stages]
 
@@ -162,20 +198,27 @@ class Dashboard(Pipeline):
                 continue
             for graph in widget.get_additional_graphs():
                 additional_graphs[graph.id] = graph.params
+        if graphs_path is not None:
+            # graphs are loaded by urls relative to the dashboard file
+            additional_graphs = save_additional_graphs(
+                additional_graphs, graphs_path, quote(os.path.basename(graphs_path))
+            )
         return template(TemplateParams(dashboard_id, dashboard_info, additional_graphs))
 
-    def _json(self):
+    def _get_dashboard_info(self) -> DashboardInfo:
         dashboard_id = "evidently_dashboard_" + str(uuid.uuid4()).replace("-", "")
         tab_widgets = [t.info() for t in self.stages]
-        dashboard_info = DashboardInfo(dashboard_id, [item for tab in tab_widgets for item in tab if item is not None])
-        return json.dumps(asdict(dashboard_info), cls=NumpyEncoder)
+        return DashboardInfo(dashboard_id, [item for tab in tab_widgets for item in tab if item is not None])
+
+    def _json(self):
+        return json_serializer.dumps(self._get_dashboard_info())
 
     def _save_to_json(self, filename):
         parent_dir = os.path.dirname(filename)
         if parent_dir and not os.path.exists(parent_dir):
             os.makedirs(parent_dir, exist_ok=True)
         with open(filename, 'w', encoding='utf-8') as out_file:
-            out_file.write(self._json())
+            json_serializer.dump(self._get_dashboard_info(), out_file)
 
     def show(self, mode='auto'):
         # pylint: disable=import-outside-toplevel
@@ -199,9 +242,21 @@ class Dashboard(Pipeline):
     def html(self):
         return self.__render(file_html_template)
 
-    def save(self, filename):
+    def save(self, filename, external_graphs: bool = False):
+        """Save the dashboard to an HTML file.
+
+        Args:
+            filename: a path to the HTML file
+            external_graphs: if True, additional graphs (for example, details of features in tables) are saved
+                to `<filename without extension>_graphs` directory near the HTML file and loaded only when they
+                are shown, so the dashboard opens faster. The directory should be kept with the HTML file.
+        """
         parent_dir = os.path.dirname(filename)
         if parent_dir and not os.path.exists(parent_dir):
             os.makedirs(parent_dir, exist_ok=True)
+        if external_graphs:
+            html = self.__render(file_html_template, os.path.splitext(filename)[0] + "_graphs")
+        else:
+            html = self.html()
         with open(filename, 'w', encoding='utf-8') as out_file:
-            out_file.write(self.html())
+            out_file.write(html)
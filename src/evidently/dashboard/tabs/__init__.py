@@ -1,10 +1,40 @@
 #!/usr/bin/env python
 # coding: utf-8
+"""Dashboard tabs.
 
-from .data_drift_tab import DataDriftTab
-from .data_quality_tab import DataQualityTab
-from .num_target_drift_tab import NumTargetDriftTab
-from .cat_target_drift_tab import CatTargetDriftTab
-from .regression_performance_tab import RegressionPerformanceTab
-from .classification_performance_tab import ClassificationPerformanceTab
-from .prob_classification_performance_tab import ProbClassificationPerformanceTab
+Tabs are imported on first use, so importing `evidently.dashboard` does not import widgets and plotting libraries.
+"""
+import importlib
+import sys
+
+# tabs names and their modules
+_TABS_MODULES = {
+    "DataDriftTab": "data_drift_tab",
+    "DataQualityTab": "data_quality_tab",
+    "NumTargetDriftTab": "num_target_drift_tab",
+    "CatTargetDriftTab": "cat_target_drift_tab",
+    "RegressionPerformanceTab": "regression_performance_tab",
+    "ClassificationPerformanceTab": "classification_performance_tab",
+    "ProbClassificationPerformanceTab": "prob_classification_performance_tab",
+}
+
+__all__ = list(_TABS_MODULES)
+
+
+def __getattr__(name: str):
+    if name not in _TABS_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{_TABS_MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, import all tabs
+    for _name in __all__:
+        globals()[_name] = __getattr__(_name)
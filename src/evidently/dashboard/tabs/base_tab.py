@@ -8,6 +8,9 @@ from evidently.analyzers.base_analyzer import Analyzer
 from evidently.model.widget import BaseWidgetInfo
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.pipeline.stage import PipelineStage
+from evidently.pipeline.timings import WIDGET
+from evidently.pipeline.timings import measure_timings
+from evidently.pipeline.timings import payload_size
 from evidently.dashboard.widgets.widget import Widget
 
 
@@ -60,10 +63,12 @@ class Tab(PipelineStage):
         self._widget_results.clear()
         for widget in self._widgets:
             widget.options_provider = self.options_provider
-            self._widget_results.append(widget.calculate(reference_data,
-                                                         current_data,
-                                                         column_mapping,
-                                                         analyzers_results))
+            with measure_timings(self.timings, WIDGET, widget.title) as record:
+                widget_info = widget.calculate(reference_data, current_data, column_mapping, analyzers_results)
+            # the size is measured out of the span to keep serialization out of the widget duration
+            if record is not None and widget_info is not None:
+                record.payload_size = payload_size(widget_info)
+            self._widget_results.append(widget_info)
 
     def info(self) -> List[Optional[BaseWidgetInfo]]:
         return self._widget_results
@@ -13,6 +13,7 @@ from evidently.analyzers.cat_target_drift_analyzer import CatTargetDriftAnalyzer
 from evidently.model.widget import BaseWidgetInfo, AdditionalGraphInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.dashboard.widgets.utils import CutQuantileTransformer
+from evidently.dashboard.widgets.utils import concat_with_dataset_column
 from evidently.options import QualityMetricsOptions
 
 
@@ -65,8 +66,6 @@ class CatTargetPredFeatureTable(Widget):
                 )
 
                 # create target plot
-                reference_data['dataset'] = 'Reference'
-                current_data['dataset'] = 'Current'
                 if cut_quantile and quality_metrics_options.get_cut_quantile(feature_name):
                     side, q = quality_metrics_options.get_cut_quantile(feature_name)
                     cqt = CutQuantileTransformer(side=side, q=q)
@@ -76,7 +75,7 @@ class CatTargetPredFeatureTable(Widget):
                 else:
                     reference_data_to_plot = reference_data
                     current_data_to_plot = current_data
-                merged_data = pd.concat([reference_data_to_plot, current_data_to_plot])
+                merged_data = concat_with_dataset_column(reference_data_to_plot, current_data_to_plot)
 
                 target_fig = px.histogram(merged_data, x=feature_name, color=target_name,
                                           facet_col="dataset", barmode='overlay',
@@ -152,8 +151,6 @@ class CatTargetPredFeatureTable(Widget):
 
                 # create target plot
                 # TO DO%: out pf the cycle
-                reference_data['dataset'] = 'Reference'
-                current_data['dataset'] = 'Current'
                 if cut_quantile and quality_metrics_options.get_cut_quantile(feature_name):
                     side, q = quality_metrics_options.get_cut_quantile(feature_name)
                     cqt = CutQuantileTransformer(side=side, q=q)
@@ -163,7 +160,7 @@ class CatTargetPredFeatureTable(Widget):
                 else:
                     reference_data_to_plot = reference_data
                     current_data_to_plot = current_data
-                merged_data = pd.concat([reference_data_to_plot, current_data_to_plot])
+                merged_data = concat_with_dataset_column(reference_data_to_plot, current_data_to_plot)
 
                 target_fig = px.histogram(merged_data, x=feature_name, color=target_name,
                                           facet_col="dataset", barmode='overlay',
@@ -219,8 +216,6 @@ class CatTargetPredFeatureTable(Widget):
                 )
 
                 # create target plot
-                reference_data['dataset'] = 'Reference'
-                current_data['dataset'] = 'Current'
                 if cut_quantile and quality_metrics_options.get_cut_quantile(feature_name):
                     side, q = quality_metrics_options.get_cut_quantile(feature_name)
                     cqt = CutQuantileTransformer(side=side, q=q)
@@ -230,7 +225,7 @@ class CatTargetPredFeatureTable(Widget):
                 else:
                     reference_data_to_plot = reference_data
                     current_data_to_plot = current_data
-                merged_data = pd.concat([reference_data_to_plot, current_data_to_plot])
+                merged_data = concat_with_dataset_column(reference_data_to_plot, current_data_to_plot)
 
                 prediction_fig = px.histogram(merged_data, x=feature_name, barmode='overlay',
                                               color=results.columns.utility_columns.prediction, facet_col="dataset",
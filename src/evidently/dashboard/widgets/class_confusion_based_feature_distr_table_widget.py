@@ -12,6 +12,7 @@ from evidently.analyzers.classification_performance_analyzer import Classificati
 from evidently.model.widget import BaseWidgetInfo, AdditionalGraphInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.dashboard.widgets.utils import CutQuantileTransformer
+from evidently.dashboard.widgets.utils import concat_with_dataset_column
 from evidently.options import QualityMetricsOptions
 
 
@@ -60,8 +61,6 @@ class ClassConfusionBasedFeatureDistrTable(Widget):
                 )
 
                 # create confusion based plots
-                reference_data['dataset'] = 'Reference'
-                current_data['dataset'] = 'Current'
                 if cut_quantile and quality_metrics_options.get_cut_quantile(feature_name):
                     side, q = quality_metrics_options.get_cut_quantile(feature_name)
                     cqt = CutQuantileTransformer(side=side, q=q)
@@ -71,7 +70,7 @@ class ClassConfusionBasedFeatureDistrTable(Widget):
                 else:
                     reference_data_to_plot = reference_data
                     current_data_to_plot = current_data
-                merged_data = pd.concat([reference_data_to_plot, current_data_to_plot])
+                merged_data = concat_with_dataset_column(reference_data_to_plot, current_data_to_plot)
 
                 fig = px.histogram(merged_data, x=feature_name, color=target_name,
                                    facet_col="dataset", histnorm='', barmode='overlay',
@@ -182,7 +181,9 @@ class ClassConfusionBasedFeatureDistrTable(Widget):
                 def _confusion_func(row, label=label):
                     return _confusion(row, target_name, prediction_name, label)
 
-                reference_data['Confusion'] = reference_data.apply(_confusion_func, axis=1)
+                reference_data_to_plot = reference_data_to_plot.assign(
+                    Confusion=reference_data_to_plot.apply(_confusion_func, axis=1)
+                )
 
                 fig = px.histogram(
                     reference_data_to_plot, x=feature_name, color='Confusion', histnorm='', barmode='overlay',
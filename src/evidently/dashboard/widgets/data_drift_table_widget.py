@@ -13,8 +13,12 @@ from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer, DataDrift
 from evidently.model.widget import BaseWidgetInfo, AdditionalGraphInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.dashboard.widgets.utils import CutQuantileTransformer
+from evidently.dashboard.widgets.utils import get_histogram
+from evidently.dashboard.widgets.utils import get_histogram_bins
+from evidently.dashboard.widgets.utils import get_scatter_points_indices
 from evidently.options import ColorOptions
 from evidently.options import DataDriftOptions
+from evidently.options import PlotOptions
 from evidently.options import QualityMetricsOptions
 
 
@@ -48,16 +52,12 @@ def _generate_additional_graph_num_feature(
     data_drift_options: DataDriftOptions,
     quality_metrics_options: QualityMetricsOptions,
     color_options: ColorOptions,
+    max_points: Optional[int],
 ) -> List[AdditionalGraphInfo]:
     # plot distributions
     conf_interval_n_sigmas = quality_metrics_options.conf_interval_n_sigmas
     fig = go.Figure()
-    if data_drift_options.xbins and data_drift_options.xbins.get(name):
-        current_xbins = data_drift_options.xbins.get(name)
-        current_nbinsx = None
-    else:
-        current_xbins = None
-        current_nbinsx = data_drift_options.get_nbinsx(name)
+    current_xbins = data_drift_options.xbins.get(name) if data_drift_options.xbins else None
     quantiles = quality_metrics_options.get_cut_quantile(name)
     if quantiles:
         side, q = quantiles
@@ -68,33 +68,39 @@ def _generate_additional_graph_num_feature(
     else:
         reference_data_to_plot = reference_data[name]
         current_data_to_plot = current_data[name]
+    # histograms are aggregated here, so raw values are not sent to the dashboard
+    bins = get_histogram_bins(
+        [reference_data_to_plot, current_data_to_plot],
+        nbins=None if current_xbins else data_drift_options.get_nbinsx(name),
+        xbins=current_xbins,
+    )
+    reference_x, reference_y = get_histogram(reference_data_to_plot, bins, histnorm="probability")
+    current_x, current_y = get_histogram(current_data_to_plot, bins, histnorm="probability")
     fig.add_trace(
-        go.Histogram(
-            x=reference_data_to_plot,
+        go.Bar(
+            x=reference_x,
+            y=reference_y,
             marker_color=color_options.get_reference_data_color(),
             opacity=0.6,
-            xbins=current_xbins,
-            nbinsx=current_nbinsx,
             name="Reference",
-            histnorm="probability",
         )
     )
 
     fig.add_trace(
-        go.Histogram(
-            x=current_data_to_plot,
+        go.Bar(
+            x=current_x,
+            y=current_y,
             marker_color=color_options.get_current_data_color(),
             opacity=0.6,
-            xbins=current_xbins,
-            nbinsx=current_nbinsx,
             name="Current",
-            histnorm="probability",
         )
     )
     fig.update_layout(
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
         xaxis_title=name,
         yaxis_title="Share",
+        barmode="overlay",
+        bargap=0,
     )
 
     distr_figure = json.loads(fig.to_json())
@@ -104,12 +110,16 @@ def _generate_additional_graph_num_feature(
     reference_std = np.std(reference_data[name][np.isfinite(reference_data[name])], ddof=1)
     x_title = "Timestamp" if date_column else "Index"
 
+    current_points = current_data.iloc[get_scatter_points_indices(
+        [current_data[date_column] if date_column else current_data.index, current_data[name]], max_points
+    )]
+
     fig = go.Figure()
 
     fig.add_trace(
         go.Scatter(
-            x=current_data[date_column] if date_column else current_data.index,
-            y=current_data[name],
+            x=current_points[date_column] if date_column else current_points.index,
+            y=current_points[name],
             mode="markers",
             name="Current",
             marker=dict(size=6, color=color_options.get_current_data_color()),
@@ -248,6 +258,7 @@ class DataDriftTableWidget(Widget):
         params_data = []
         data_drift_options = self.options_provider.get(DataDriftOptions)
         quality_metrics_options = self.options_provider.get(QualityMetricsOptions)
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
         for feature_name in all_features:
             params_data.append(
                 _generate_feature_params(
@@ -269,6 +280,7 @@ class DataDriftTableWidget(Widget):
                     data_drift_options,
                     quality_metrics_options,
                     color_options,
+                    max_points,
                 )
             elif data_drift_results.metrics.features[feature_name].feature_type == "cat":
                 additional_graphs_data += _generate_additional_graph_cat_feature(
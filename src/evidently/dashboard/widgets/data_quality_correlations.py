@@ -39,7 +39,8 @@ class DataQualityCorrelationsWidget(Widget):
         additional_graphs = []
         parts = []
         for kind in ['pearson', 'spearman', 'kendall', 'cramer_v']:
-            if reference_correlations[kind].shape[0] > 1:
+            # some kinds can be switched off with DataQualityOptions
+            if kind in reference_correlations and reference_correlations[kind].shape[0] > 1:
                 correlation_figure = self._plot_correlation_figure(kind, reference_correlations, current_correlations)
                 additional_graphs.append(
                     AdditionalGraphInfo(
@@ -153,6 +154,10 @@ class DataQualityCorrelationsWidget(Widget):
 
     def _make_metrics(self, reference_correlations: dict, current_correlations: Optional[dict]):
         metrics = []
+        empty_correlations = pd.DataFrame()
+        reference_correlations = {
+            kind: reference_correlations.get(kind, empty_correlations) for kind in ['spearman', 'cramer_v']
+        }
         if current_correlations is not None:
             if reference_correlations['spearman'].shape[0] > 1:
                 com_num_corr = self._get_rel_diff_corr_features_sorted(reference_correlations['spearman'],
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # coding: utf-8
 import json
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -16,6 +17,8 @@ from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzerResults
 from evidently.analyzers.data_quality_analyzer import FeatureQualityStats
 from evidently.model.widget import BaseWidgetInfo, AdditionalGraphInfo
 from evidently.dashboard.widgets.widget import Widget
+from evidently.dashboard.widgets.utils import get_histogram
+from evidently.dashboard.widgets.utils import get_histogram_bins
 from evidently.options import ColorOptions
 
 
@@ -48,7 +51,22 @@ class DataQualityFeaturesWidget(Widget):
 
         cat_feature_names = data_quality_results.columns.cat_feature_names
         date_column = columns.date
-        self._transform_cat_features(reference_data, current_data, cat_feature_names, target_column, target_type)
+        reference_columns, current_columns = self._transform_cat_features(
+            reference_data, current_data, cat_feature_names, target_column, target_type
+        )
+
+        if date_column:
+            freq = self._choose_agg_period(date_column, reference_data, current_data)
+            reference_columns[date_column + "_period"] = reference_data[date_column].dt.to_period(freq=freq)
+
+            if current_data is not None:
+                current_columns[date_column + "_period"] = current_data[date_column].dt.to_period(freq=freq)
+
+        # the shared datasets are read-only, plot transformed data from new dataframes
+        reference_data = _with_columns(reference_data, reference_columns)
+
+        if current_data is not None:
+            current_data = _with_columns(current_data, current_columns)
 
         all_features = data_quality_results.columns.get_all_features_list(
             cat_before_num=True, include_datetime_feature=True
@@ -74,10 +92,9 @@ class DataQualityFeaturesWidget(Widget):
             parts = self.assemble_parts(target_column, date_column, feature_name, feature_type)
             # additional_graphs = []
             if date_column and feature_type != "datetime":
-                freq = self._choose_agg_period(date_column, reference_data, current_data)
-                reference_data[date_column + "_period"] = reference_data[date_column].dt.to_period(freq=freq)
+                # update period prefix, it can be changed by datetime features plots
+                self._choose_agg_period(date_column, reference_data, current_data)
                 if current_data is not None:
-                    current_data[date_column + "_period"] = current_data[date_column].dt.to_period(freq=freq)
                     feature_in_time_figure = self._plot_feature_in_time_2_df(
                         reference_data, current_data, date_column, feature_name, feature_type, color_options
                     )
@@ -247,13 +264,16 @@ class DataQualityFeaturesWidget(Widget):
         color_options: ColorOptions,
     ) -> dict:
         if feature_type == "num":
+            # histograms are aggregated here, so raw values are not sent to the dashboard
+            reference_log_values = np.log10(reference_data.loc[reference_data[feature_name] > 0, feature_name])
+
             if current_data is None:
-                trace1 = go.Histogram(x=reference_data[feature_name], marker_color=color_options.primary_color)
-                trace2 = go.Histogram(
-                    x=np.log10(reference_data.loc[reference_data[feature_name] > 0, feature_name]),
-                    marker_color=color_options.primary_color,
-                    visible=False,
-                )
+                bins = get_histogram_bins([reference_data[feature_name]])
+                log_bins = get_histogram_bins([reference_log_values])
+                x, y = get_histogram(reference_data[feature_name], bins)
+                trace1 = go.Bar(x=x, y=y, marker_color=color_options.primary_color)
+                x, y = get_histogram(reference_log_values, log_bins)
+                trace2 = go.Bar(x=x, y=y, marker_color=color_options.primary_color, visible=False)
                 data = [trace1, trace2]
                 updatemenus = [
                     dict(
@@ -271,24 +291,25 @@ class DataQualityFeaturesWidget(Widget):
                 ]
 
             else:
-                trace1 = go.Histogram(
-                    x=reference_data[feature_name],
-                    marker_color=color_options.get_reference_data_color(),
-                    name="reference"
-                )
-                trace2 = go.Histogram(
-                    x=np.log10(reference_data.loc[reference_data[feature_name] > 0, feature_name]),
+                current_log_values = np.log10(current_data.loc[current_data[feature_name] > 0, feature_name])
+                bins = get_histogram_bins([reference_data[feature_name], current_data[feature_name]])
+                log_bins = get_histogram_bins([reference_log_values, current_log_values])
+                x, y = get_histogram(reference_data[feature_name], bins)
+                trace1 = go.Bar(x=x, y=y, marker_color=color_options.get_reference_data_color(), name="reference")
+                x, y = get_histogram(reference_log_values, log_bins)
+                trace2 = go.Bar(
+                    x=x,
+                    y=y,
                     marker_color=color_options.get_reference_data_color(),
                     visible=False,
                     name="reference",
                 )
-                trace3 = go.Histogram(
-                    x=current_data[feature_name],
-                    marker_color=color_options.get_current_data_color(),
-                    name="current"
-                )
-                trace4 = go.Histogram(
-                    x=np.log10(current_data.loc[current_data[feature_name] > 0, feature_name]),
+                x, y = get_histogram(current_data[feature_name], bins)
+                trace3 = go.Bar(x=x, y=y, marker_color=color_options.get_current_data_color(), name="current")
+                x, y = get_histogram(current_log_values, log_bins)
+                trace4 = go.Bar(
+                    x=x,
+                    y=y,
                     marker_color=color_options.get_current_data_color(),
                     visible=False,
                     name="current",
@@ -315,7 +336,7 @@ class DataQualityFeaturesWidget(Widget):
                         ),
                     )
                 ]
-            layout = dict(updatemenus=updatemenus)
+            layout = dict(updatemenus=updatemenus, bargap=0)
 
             fig = go.Figure(data=data, layout=layout)
 
@@ -326,23 +347,19 @@ class DataQualityFeaturesWidget(Widget):
                 cats.remove("other")
                 cats = cats + ["other"]
             if current_data is None:
-                fig.add_trace(go.Histogram(x=reference_data[feature_name], marker_color=color_options.primary_color))
+                x, y = get_histogram(reference_data[feature_name])
+                fig.add_trace(go.Bar(x=x, y=y, marker_color=color_options.primary_color))
             else:
+                x, y = get_histogram(reference_data[feature_name])
                 fig.add_trace(
-                    go.Histogram(
-                        x=reference_data[feature_name],
-                        marker_color=color_options.get_reference_data_color(),
-                        name="reference"
-                    )
+                    go.Bar(x=x, y=y, marker_color=color_options.get_reference_data_color(), name="reference")
                 )
+                x, y = get_histogram(current_data[feature_name])
                 fig.add_trace(
-                    go.Histogram(
-                        x=current_data[feature_name],
-                        marker_color=color_options.get_current_data_color(),
-                        name="current"
-                    )
+                    go.Bar(x=x, y=y, marker_color=color_options.get_current_data_color(), name="current")
                 )
             fig.update_xaxes(categoryorder="array", categoryarray=cats)
+            fig.update_layout(bargap=0)
 
         elif feature_type == "datetime":
             freq = self._choose_agg_period(feature_name, reference_data, current_data)
@@ -727,19 +744,26 @@ class DataQualityFeaturesWidget(Widget):
         cat_feature_names: List[str],
         target_column: Optional[str],
         target_type: Optional[str],
-    ):
+    ) -> Tuple[Dict[str, pd.Series], Dict[str, pd.Series]]:
+        """Get category features with more than 6 values where all values except top 5 are replaced with "other".
+
+        Returns new columns for reference and current data, the datasets are not changed.
+        """
+        reference_columns = {}
+        current_columns = {}
         if target_column and target_type == "cat":
             cat_feature_names = cat_feature_names + [target_column]
         for feature_name in cat_feature_names:
             if reference_data[feature_name].nunique() > 6:
                 cats = reference_data[feature_name].value_counts().iloc[:5].index.astype(str)
-                reference_data[feature_name] = reference_data[feature_name].apply(
+                reference_columns[feature_name] = reference_data[feature_name].apply(
                     lambda x: x if str(x) in cats else "other"
                 )
                 if current_data is not None:
-                    current_data[feature_name] = current_data[feature_name].apply(
+                    current_columns[feature_name] = current_data[feature_name].apply(
                         lambda x: x if str(x) in cats else "other"
                     )
+        return reference_columns, current_columns
 
     def _choose_agg_period(
         self, date_column: str, reference_data: pd.DataFrame, current_data: Optional[pd.DataFrame]
@@ -763,3 +787,16 @@ class DataQualityFeaturesWidget(Widget):
         )
         self.period_prefix = prefix_dict[time_points.idxmin()]
         return str(time_points.idxmin())
+
+
+def _with_columns(dataset: pd.DataFrame, columns: Dict[str, pd.Series]) -> pd.DataFrame:
+    """Get a new dataframe with added or replaced columns, the dataset is not changed."""
+    if not columns:
+        return dataset
+
+    result = dataset.copy()
+
+    for column_name, column in columns.items():
+        result[column_name] = column
+
+    return result
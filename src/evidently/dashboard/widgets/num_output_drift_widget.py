@@ -14,6 +14,7 @@ from evidently.dashboard.widgets.widget import Widget
 from evidently.dashboard.widgets.utils import CutQuantileTransformer
 from evidently.options import ColorOptions
 from evidently.options import QualityMetricsOptions
+from evidently.utils.data_operations import get_finite_data
 
 
 class NumOutputDriftWidget(Widget):
@@ -64,16 +65,19 @@ class NumOutputDriftWidget(Widget):
         output_p_value = metrics.drift
         output_sim_test = "detected" if output_p_value < 0.05 else "not detected"
 
-        # plot output distributions
+        # plot output distributions, KDE does not support NaN and infinite values
+        reference_column = get_finite_data(reference_data, [column_name])[column_name]
+        current_column = get_finite_data(current_data, [column_name])[column_name]
+
         if cut_quantile and quality_metrics_options.get_cut_quantile(column_name):
             side, q = quality_metrics_options.get_cut_quantile(column_name)
             cqt = CutQuantileTransformer(side=side, q=q)
-            cqt.fit(reference_data[column_name])
-            reference_data_to_plot = cqt.transform(reference_data[column_name])
-            current_data_to_plot = cqt.transform(current_data[column_name])
+            cqt.fit(reference_column)
+            reference_data_to_plot = cqt.transform(reference_column)
+            current_data_to_plot = cqt.transform(current_column)
         else:
-            reference_data_to_plot = reference_data[column_name]
-            current_data_to_plot = current_data[column_name]
+            reference_data_to_plot = reference_column
+            current_data_to_plot = current_column
 
         output_distr = ff.create_distplot(
             [reference_data_to_plot,
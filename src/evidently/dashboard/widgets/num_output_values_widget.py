@@ -13,8 +13,11 @@ from evidently import ColumnMapping
 from evidently.analyzers.num_target_drift_analyzer import NumTargetDriftAnalyzer
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
+from evidently.dashboard.widgets.utils import get_scatter_points_indices
 from evidently.options import ColorOptions
+from evidently.options import PlotOptions
 from evidently.options import QualityMetricsOptions
+from evidently.utils.data_operations import get_finite_data
 
 
 class NumOutputValuesWidget(Widget):
@@ -58,16 +61,30 @@ class NumOutputValuesWidget(Widget):
             raise ValueError(f"Widget [{self.title}] requires 'target' or 'prediction' kind parameter value")
 
         utility_columns_date = results.columns.utility_columns.date
-        # plot values
-        reference_mean = np.mean(reference_data[column_name])
-        reference_std = np.std(reference_data[column_name], ddof=1)
+        # plot values without NaN and infinite values
+        plot_columns = [column_name, utility_columns_date] if utility_columns_date else [column_name]
+        reference_finite_data = get_finite_data(reference_data, plot_columns)
+        current_finite_data = get_finite_data(current_data, plot_columns)
+        reference_mean = np.mean(reference_finite_data[column_name])
+        reference_std = np.std(reference_finite_data[column_name], ddof=1)
         x_title = "Timestamp" if utility_columns_date else "Index"
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
+        reference_points = reference_finite_data.iloc[get_scatter_points_indices(
+            [reference_finite_data[utility_columns_date] if utility_columns_date else reference_finite_data.index,
+             reference_finite_data[column_name]],
+            max_points,
+        )]
+        current_points = current_finite_data.iloc[get_scatter_points_indices(
+            [current_finite_data[utility_columns_date] if utility_columns_date else current_finite_data.index,
+             current_finite_data[column_name]],
+            max_points,
+        )]
 
         output_values = go.Figure()
 
         output_values.add_trace(go.Scatter(
-            x=reference_data[utility_columns_date] if utility_columns_date else reference_data.index,
-            y=reference_data[column_name],
+            x=reference_points[utility_columns_date] if utility_columns_date else reference_points.index,
+            y=reference_points[column_name],
             mode='markers',
             name='Reference',
             marker=dict(
@@ -77,8 +94,8 @@ class NumOutputValuesWidget(Widget):
         ))
 
         output_values.add_trace(go.Scatter(
-            x=current_data[utility_columns_date] if utility_columns_date else current_data.index,
-            y=current_data[column_name],
+            x=current_points[utility_columns_date] if utility_columns_date else current_points.index,
+            y=current_points[column_name],
             mode='markers',
             name='Current',
             marker=dict(
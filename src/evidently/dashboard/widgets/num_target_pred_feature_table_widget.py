@@ -13,7 +13,9 @@ from evidently import ColumnMapping
 from evidently.analyzers.num_target_drift_analyzer import NumTargetDriftAnalyzer
 from evidently.model.widget import BaseWidgetInfo, AdditionalGraphInfo
 from evidently.dashboard.widgets.widget import Widget
+from evidently.dashboard.widgets.utils import get_scatter_points_indices
 from evidently.options import ColorOptions
+from evidently.options import PlotOptions
 
 
 class NumTargetPredFeatureTable(Widget):
@@ -37,6 +39,9 @@ class NumTargetPredFeatureTable(Widget):
         if target_column and prediction_column:
             return None
 
+        output_columns = [column for column in (target_column, prediction_column) if column is not None]
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
+
         additional_graphs_data = []
         params_data = []
 
@@ -57,14 +62,21 @@ class NumTargetPredFeatureTable(Widget):
                 }
             )
 
+            reference_points = reference_data.iloc[get_scatter_points_indices(
+                [reference_data[column] for column in [feature_name] + output_columns], max_points
+            )]
+            current_points = current_data.iloc[get_scatter_points_indices(
+                [current_data[column] for column in [feature_name] + output_columns], max_points
+            )]
+
             # create plot
             fig = make_subplots(rows=1, cols=2, subplot_titles=("Reference", "Current"))
 
             if prediction_column is not None:
                 fig.add_trace(
                     go.Scatter(
-                        x=reference_data[feature_name],
-                        y=reference_data[prediction_column],
+                        x=reference_points[feature_name],
+                        y=reference_points[prediction_column],
                         mode='markers',
                         name='Prediction (ref)',
                         marker=dict(
@@ -78,8 +90,8 @@ class NumTargetPredFeatureTable(Widget):
             if target_column is not None:
                 fig.add_trace(
                     go.Scatter(
-                        x=reference_data[feature_name],
-                        y=reference_data[target_column],
+                        x=reference_points[feature_name],
+                        y=reference_points[target_column],
                         mode='markers',
                         name='Target (ref)',
                         marker=dict(
@@ -93,8 +105,8 @@ class NumTargetPredFeatureTable(Widget):
             if prediction_column is not None:
                 fig.add_trace(
                     go.Scatter(
-                        x=current_data[feature_name],
-                        y=current_data[prediction_column],
+                        x=current_points[feature_name],
+                        y=current_points[prediction_column],
                         mode='markers',
                         name='Prediction (curr)',
                         marker=dict(
@@ -108,8 +120,8 @@ class NumTargetPredFeatureTable(Widget):
             if target_column is not None:
                 fig.add_trace(
                     go.Scatter(
-                        x=current_data[feature_name],
-                        y=current_data[target_column],
+                        x=current_points[feature_name],
+                        y=current_points[target_column],
                         mode='markers',
                         name='Target (curr)',
                         marker=dict(
@@ -2,10 +2,11 @@
 # coding: utf-8
 
 import json
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 import pandas as pd
-import numpy as np
 import plotly.graph_objs as go
 import plotly.express as px
 from plotly.subplots import make_subplots
@@ -15,10 +16,32 @@ from evidently.analyzers.prob_classification_performance_analyzer import ProbCla
 from evidently.model.widget import BaseWidgetInfo, AdditionalGraphInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.dashboard.widgets.utils import CutQuantileTransformer
+from evidently.dashboard.widgets.utils import concat_with_dataset_column
+from evidently.dashboard.widgets.utils import get_grouped_histograms
+from evidently.dashboard.widgets.utils import get_scatter_points_indices
 from evidently.options import ColorOptions
+from evidently.options import PlotOptions
 from evidently.options import QualityMetricsOptions
 
 
+def _get_label_points(data: pd.DataFrame, feature_name: str, target_name: str, label,
+                      max_points: Optional[int]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Get downsampled points of the label and of other labels for a scatter plot of the label probability"""
+    is_label = data[target_name] == label
+    points = data.iloc[get_scatter_points_indices([data[feature_name], data[label]], max_points, groups=is_label)]
+    points_is_label = points[target_name] == label
+    return points[points_is_label], points[~points_is_label]
+
+
+def _plot_histograms(data: pd.DataFrame, feature_name: str, target_name: str, groups: List[str], **kwargs):
+    histograms = get_grouped_histograms(data, feature_name, groups)
+    # targets are colored as categories like in a histogram
+    histograms[target_name] = histograms[target_name].astype(str)
+    fig = px.bar(histograms, x=feature_name, y="count", color=target_name, barmode="overlay", **kwargs)
+    fig.update_layout(bargap=0)
+    return fig
+
+
 class ProbClassConfusionBasedFeatureDistrTable(Widget):
     def analyzers(self):
         return [ProbClassificationPerformanceAnalyzer]
@@ -33,22 +56,12 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
         quality_metrics_options = self.options_provider.get(QualityMetricsOptions)
         cut_quantile = quality_metrics_options.cut_quantile
         utility_columns = results.columns.utility_columns
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
 
         if utility_columns.target is None or utility_columns.prediction is None:
             raise ValueError(f"Widget [{self.title}] requires 'target' or 'prediction' columns")
 
         if current_data is not None:
-            ref_array_prediction = reference_data[utility_columns.prediction].to_numpy()
-            ref_prediction_ids = np.argmax(ref_array_prediction, axis=-1)
-            ref_prediction_labels = [utility_columns.prediction[x] for x in ref_prediction_ids]
-            reference_data['prediction_labels'] = ref_prediction_labels
-
-            current_array_prediction = current_data[utility_columns.prediction].to_numpy()
-            current_prediction_ids = np.argmax(current_array_prediction, axis=-1)
-            current_prediction_labels = [utility_columns.prediction[x] for x in
-                                         current_prediction_ids]
-            current_data['prediction_labels'] = current_prediction_labels
-
             additional_graphs_data = []
             params_data = []
 
@@ -68,8 +81,6 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                 )
 
                 # create confusion based plots
-                reference_data['dataset'] = 'Reference'
-                current_data['dataset'] = 'Current'
                 if cut_quantile and quality_metrics_options.get_cut_quantile(feature_name):
                     side, q = quality_metrics_options.get_cut_quantile(feature_name)
                     cqt = CutQuantileTransformer(side=side, q=q)
@@ -79,11 +90,11 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                 else:
                     reference_data_to_plot = reference_data
                     current_data_to_plot = current_data
-                merged_data = pd.concat([reference_data_to_plot, current_data_to_plot])
+                merged_data = concat_with_dataset_column(reference_data_to_plot, current_data_to_plot)
 
-                fig = px.histogram(merged_data, x=feature_name, color=utility_columns.target,
-                                   facet_col="dataset", histnorm='', barmode='overlay',
-                                   category_orders={"dataset": ["Reference", "Current"]})
+                fig = _plot_histograms(merged_data, feature_name, utility_columns.target,
+                                       ["dataset", utility_columns.target], facet_col="dataset",
+                                       category_orders={"dataset": ["Reference", "Current"]})
 
                 fig_json = json.loads(fig.to_json())
 
@@ -99,13 +110,18 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                 )
 
                 for label in labels:
+                    reference_label_points, reference_other_points = _get_label_points(
+                        reference_data, feature_name, utility_columns.target, label, max_points
+                    )
+                    current_label_points, current_other_points = _get_label_points(
+                        current_data, feature_name, utility_columns.target, label, max_points
+                    )
                     fig = make_subplots(rows=1, cols=2, subplot_titles=("Reference", "Current"))
 
                     # REF
                     fig.add_trace(go.Scatter(
-                        x=reference_data[reference_data[utility_columns.target] == label][
-                            feature_name],
-                        y=reference_data[reference_data[utility_columns.target] == label][label],
+                        x=reference_label_points[feature_name],
+                        y=reference_label_points[label],
                         mode='markers',
                         name=str(label) + ' (ref)',
                         marker=dict(
@@ -117,9 +133,8 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                     )
 
                     fig.add_trace(go.Scatter(
-                        x=reference_data[reference_data[utility_columns.target] != label][
-                            feature_name],
-                        y=reference_data[reference_data[utility_columns.target] != label][label],
+                        x=reference_other_points[feature_name],
+                        y=reference_other_points[label],
                         mode='markers',
                         name='other (ref)',
                         marker=dict(
@@ -144,8 +159,8 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
 
                     # current Prediction
                     fig.add_trace(go.Scatter(
-                        x=current_data[current_data[utility_columns.target] == label][feature_name],
-                        y=current_data[current_data[utility_columns.target] == label][label],
+                        x=current_label_points[feature_name],
+                        y=current_label_points[label],
                         mode='markers',
                         name=str(label) + ' (curr)',
                         marker=dict(
@@ -158,8 +173,8 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                     )
 
                     fig.add_trace(go.Scatter(
-                        x=current_data[current_data[utility_columns.target] != label][feature_name],
-                        y=current_data[current_data[utility_columns.target] != label][label],
+                        x=current_other_points[feature_name],
+                        y=current_other_points[label],
                         mode='markers',
                         name='other (curr)',
                         marker=dict(
@@ -204,11 +219,6 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                         )
                     )
         else:
-            ref_array_prediction = reference_data[utility_columns.prediction].to_numpy()
-            ref_prediction_ids = np.argmax(ref_array_prediction, axis=-1)
-            ref_prediction_labels = [utility_columns.prediction[x] for x in ref_prediction_ids]
-            reference_data['prediction_labels'] = ref_prediction_labels
-
             additional_graphs_data = []
             params_data = []
 
@@ -228,8 +238,6 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                 )
 
                 # create confusion based plots
-                fig = px.histogram(reference_data, x=feature_name, color=utility_columns.target,
-                                   histnorm='')
                 if cut_quantile and quality_metrics_options.get_cut_quantile(feature_name):
                     side, q = quality_metrics_options.get_cut_quantile(feature_name)
                     cqt = CutQuantileTransformer(side=side, q=q)
@@ -238,8 +246,8 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                 else:
                     reference_data_to_plot = reference_data
 
-                fig = px.histogram(reference_data_to_plot, x=feature_name, color=utility_columns.target,
-                                   histnorm='', barmode='overlay')
+                fig = _plot_histograms(reference_data_to_plot, feature_name, utility_columns.target,
+                                       [utility_columns.target])
 
                 fig_json = json.loads(fig.to_json())
 
@@ -255,12 +263,14 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                 )
 
                 for label in labels:
+                    reference_label_points, reference_other_points = _get_label_points(
+                        reference_data, feature_name, utility_columns.target, label, max_points
+                    )
                     fig = go.Figure()
 
                     fig.add_trace(go.Scatter(
-                        x=reference_data[reference_data[utility_columns.target] == label][
-                            feature_name],
-                        y=reference_data[reference_data[utility_columns.target] == label][label],
+                        x=reference_label_points[feature_name],
+                        y=reference_label_points[label],
                         mode='markers',
                         name=str(label),
                         marker=dict(
@@ -270,9 +280,8 @@ class ProbClassConfusionBasedFeatureDistrTable(Widget):
                     ))
 
                     fig.add_trace(go.Scatter(
-                        x=reference_data[reference_data[utility_columns.target] != label][
-                            feature_name],
-                        y=reference_data[reference_data[utility_columns.target] != label][label],
+                        x=reference_other_points[feature_name],
+                        y=reference_other_points[label],
                         mode='markers',
                         name='other',
                         marker=dict(
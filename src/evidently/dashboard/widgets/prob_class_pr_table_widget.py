@@ -10,6 +10,16 @@ from evidently.analyzers.prob_classification_performance_analyzer import ProbCla
 from evidently.model.widget import BaseWidgetInfo, TabInfo
 from evidently.dashboard.widgets.widget import Widget
 
+PR_TABLE_COLUMNS = [
+    {"title": "Top(%)", "field": "f1", "sort": "asc"},
+    {"title": "Count", "field": "f2"},
+    {"title": "Prob", "field": "f3"},
+    {"title": "TP", "field": "f4"},
+    {"title": "FP", "field": "f5"},
+    {"title": "Precision", "field": "f6"},
+    {"title": "Recall", "field": "f7"},
+]
+
 
 class ProbClassPRTableWidget(Widget):
     def __init__(self, title: str, dataset: str = 'reference'):
@@ -57,26 +67,6 @@ class ProbClassPRTableWidget(Widget):
                 raise ValueError(f"Widget [{self.title}] got incorrect type for pr_table value")
 
             pr_table_data: list = metrics.pr_table
-            params_data = []
-
-            for line in pr_table_data:
-                count = line[1]
-                prob = round(line[2], 2)
-                top = round(line[0], 1)
-                tp = line[3]
-                fp = line[4]
-                precision = round(line[5], 1)
-                recall = round(line[6], 1)
-
-                params_data.append({
-                    'f1': float(top),
-                    'f2': int(count),
-                    'f3': float(prob),
-                    'f4': int(tp),
-                    'f5': int(fp),
-                    'f6': float(precision),
-                    'f7': float(recall)
-                })
 
             widget_info = BaseWidgetInfo(
                 title=self.title,
@@ -84,38 +74,8 @@ class ProbClassPRTableWidget(Widget):
                 size=1 if current_data is not None else 2,
                 params={
                     "rowsPerPage": 21,
-                    "columns": [
-                        {
-                            "title": "Top(%)",
-                            "field": "f1",
-                            "sort": "asc"
-                        },
-                        {
-                            "title": "Count",
-                            "field": "f2"
-                        },
-                        {
-                            "title": "Prob",
-                            "field": "f3",
-                        },
-                        {
-                            "title": "TP",
-                            "field": "f4"
-                        },
-                        {
-                            "title": "FP",
-                            "field": "f5"
-                        },
-                        {
-                            "title": "Precision",
-                            "field": "f6"
-                        },
-                        {
-                            "title": "Recall",
-                            "field": "f7"
-                        }
-                    ],
-                    "data": params_data
+                    "columns": PR_TABLE_COLUMNS,
+                    "data": self._get_table_data(pr_table_data)
                 },
             )
 
@@ -124,8 +84,6 @@ class ProbClassPRTableWidget(Widget):
             tabs = []
 
             for label in utility_columns.prediction:
-                params_data = []
-
                 if metrics.pr_table is None:
                     raise ValueError(f"Widget [{self.title}] got no pr_table value")
 
@@ -134,23 +92,6 @@ class ProbClassPRTableWidget(Widget):
 
                 pr_table_data_list = metrics.pr_table[label]
 
-                for line in pr_table_data_list:
-                    count = line[1]
-                    prob = round(line[2], 2)
-                    top = round(line[0], 1)
-                    tp = line[3]
-                    fp = line[4]
-                    precision = round(line[5], 1)
-                    recall = round(line[6], 1)
-
-                    params_data.append({'f1': float(top),
-                                        'f2': int(count),
-                                        'f3': float(prob),
-                                        'f4': int(tp),
-                                        'f5': int(fp),
-                                        'f6': float(precision),
-                                        'f7': float(recall)})
-
                 tabs.append(TabInfo(
                     id=label,
                     title=label,
@@ -160,38 +101,8 @@ class ProbClassPRTableWidget(Widget):
                         size=2,  # if current_data is not None else 2,
                         params={
                             "rowsPerPage": 21,
-                            "columns": [
-                                {
-                                    "title": "Top(%)",
-                                    "field": "f1",
-                                    "sort": "asc"
-                                },
-                                {
-                                    "title": "Count",
-                                    "field": "f2"
-                                },
-                                {
-                                    "title": "Prob",
-                                    "field": "f3"
-                                },
-                                {
-                                    "title": "TP",
-                                    "field": "f4"
-                                },
-                                {
-                                    "title": "FP",
-                                    "field": "f5"
-                                },
-                                {
-                                    "title": "Precision",
-                                    "field": "f6"
-                                },
-                                {
-                                    "title": "Recall",
-                                    "field": "f7"
-                                }
-                            ],
-                            "data": params_data
+                            "columns": PR_TABLE_COLUMNS,
+                            "data": self._get_table_data(pr_table_data_list)
                         },
                         additionalGraphs=[]
                     )
@@ -204,3 +115,19 @@ class ProbClassPRTableWidget(Widget):
                 tabs=tabs
             )
         return widget_info
+
+    @staticmethod
+    def _get_table_data(pr_table: list) -> list:
+        """Convert rows of a table from `evidently.analyzers.utils.calculate_pr_table` to the widget data"""
+        return [
+            {
+                'f1': float(round(top, 1)),
+                'f2': int(count),
+                'f3': float(round(prob, 2)),
+                'f4': int(tp),
+                'f5': int(fp),
+                'f6': float(round(precision, 1)),
+                'f7': float(round(recall, 1)),
+            }
+            for top, count, prob, tp, fp, precision, recall in pr_table
+        ]
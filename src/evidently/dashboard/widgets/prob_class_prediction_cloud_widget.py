@@ -15,6 +15,9 @@ from evidently.analyzers.prob_classification_performance_analyzer import ProbCla
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.options import PlotOptions
+from evidently.dashboard.widgets.utils import get_scatter_points_indices
+from evidently.utils.data_operations import get_finite_data
 
 
 class ProbClassPredictionCloudWidget(Widget):
@@ -40,28 +43,33 @@ class ProbClassPredictionCloudWidget(Widget):
             return None
 
         if self.dataset == 'current':
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
 
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == 'reference':
                 raise ValueError(f"Widget [{self.title}] requires reference dataset but it is None")
             return None
 
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
-        dataset_to_plot.dropna(axis=0, how='any', inplace=True)
+        dataset_to_plot = get_finite_data(dataset_to_plot)
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
         # plot clouds
         graphs = []
 
         for label in utility_columns.prediction:
+            # the label and other classes are sampled separately, so both clouds keep their shapes
+            is_label = (dataset_to_plot[utility_columns.target] == label).to_numpy()
+            points = get_scatter_points_indices([dataset_to_plot[label]], max_points, is_label)
+            label_data = dataset_to_plot.iloc[points]
+            is_label = is_label[points]
             fig = go.Figure()
 
             fig.add_trace(go.Scatter(
                 x=np.random.random(
-                    dataset_to_plot[dataset_to_plot[utility_columns.target] == label].shape[0]),
-                y=dataset_to_plot[dataset_to_plot[utility_columns.target] == label][label],
+                    label_data[is_label].shape[0]),
+                y=label_data[is_label][label],
                 mode='markers',
                 name=str(label),
                 marker=dict(
@@ -72,8 +80,8 @@ class ProbClassPredictionCloudWidget(Widget):
 
             fig.add_trace(go.Scatter(
                 x=np.random.random(
-                    dataset_to_plot[dataset_to_plot[utility_columns.target] != label].shape[0]),
-                y=dataset_to_plot[dataset_to_plot[utility_columns.target] != label][label],
+                    label_data[~is_label].shape[0]),
+                y=label_data[~is_label][label],
                 mode='markers',
                 name='other',
                 marker=dict(
@@ -15,6 +15,9 @@ from evidently.analyzers.regression_performance_analyzer import RegressionPerfor
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.options import PlotOptions
+from evidently.dashboard.widgets.utils import get_time_series_rows_indices
+from evidently.utils.data_operations import get_finite_data
 
 
 class RegAbsPercErrorTimeWidget(Widget):
@@ -39,16 +42,15 @@ class RegAbsPercErrorTimeWidget(Widget):
                 raise ValueError(f"Widget [{self.title}] requires 'target' and 'prediction' columns")
             return None
         if self.dataset == 'current':
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == 'reference':
                 raise ValueError(f"Widget [{self.title}] requires reference dataset but it is None")
             return None
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
-        dataset_to_plot.dropna(axis=0, how='any', inplace=True)
+        dataset_to_plot = get_finite_data(dataset_to_plot)
 
         # plot absolute error in time
         abs_perc_error_time = go.Figure()
@@ -57,6 +59,14 @@ class RegAbsPercErrorTimeWidget(Widget):
             dataset_to_plot[results_utility_columns.prediction]
             - dataset_to_plot[results_utility_columns.target]
         ) / dataset_to_plot[results_utility_columns.target]
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
+        points = get_time_series_rows_indices(
+            dataset_to_plot[results_utility_columns.date] if results_utility_columns.date else dataset_to_plot.index,
+            [abs_perc_error],
+            max_points,
+        )
+        dataset_to_plot = dataset_to_plot.iloc[points]
+        abs_perc_error = abs_perc_error.iloc[points]
 
         error_trace = go.Scatter(
             x=dataset_to_plot[results_utility_columns.date] if results_utility_columns.date else dataset_to_plot.index,
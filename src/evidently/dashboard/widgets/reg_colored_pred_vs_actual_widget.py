@@ -14,6 +14,9 @@ from evidently.analyzers.regression_performance_analyzer import RegressionPerfor
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.options import PlotOptions
+from evidently.dashboard.widgets.utils import get_scatter_points_indices
+from evidently.utils.data_operations import get_finite_data
 
 
 class RegColoredPredActualWidget(Widget):
@@ -40,35 +43,44 @@ class RegColoredPredActualWidget(Widget):
             return None
 
         if self.dataset == 'current':
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
 
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == 'reference':
                 raise ValueError(f"Widget [{self.title}] requires reference dataset but it is None")
             return None
 
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
-        dataset_to_plot.dropna(axis=0, how='any', inplace=True)
+        dataset_to_plot = get_finite_data(dataset_to_plot)
 
         error = dataset_to_plot[results_utility_columns.prediction] - dataset_to_plot[results_utility_columns.target]
 
         quantile_5 = np.quantile(error, .05)
         quantile_95 = np.quantile(error, .95)
 
-        dataset_to_plot['Error bias'] = list(map(
+        error_bias = pd.Series(list(map(
             lambda x: 'Underestimation'
                       if x <= quantile_5 else 'Majority'
-                      if x < quantile_95 else 'Overestimation', error))
+                      if x < quantile_95 else 'Overestimation', error)), index=dataset_to_plot.index)
+
+        # error bias groups are sampled separately, so the plot keeps underestimation and overestimation points
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
+        points = get_scatter_points_indices(
+            [dataset_to_plot[results_utility_columns.target], dataset_to_plot[results_utility_columns.prediction]],
+            max_points,
+            error_bias,
+        )
+        dataset_to_plot = dataset_to_plot.iloc[points]
+        error_bias = error_bias.iloc[points]
 
         # plot output correlations
         pred_actual = go.Figure()
 
         pred_actual.add_trace(go.Scatter(
-            x=dataset_to_plot[dataset_to_plot['Error bias'] == 'Underestimation'][results_utility_columns.target],
-            y=dataset_to_plot[dataset_to_plot['Error bias'] == 'Underestimation'][results_utility_columns.prediction],
+            x=dataset_to_plot[error_bias == 'Underestimation'][results_utility_columns.target],
+            y=dataset_to_plot[error_bias == 'Underestimation'][results_utility_columns.prediction],
             mode='markers',
             name='Underestimation',
             marker=dict(
@@ -78,8 +90,8 @@ class RegColoredPredActualWidget(Widget):
         ))
 
         pred_actual.add_trace(go.Scatter(
-            x=dataset_to_plot[dataset_to_plot['Error bias'] == 'Overestimation'][results_utility_columns.target],
-            y=dataset_to_plot[dataset_to_plot['Error bias'] == 'Overestimation'][results_utility_columns.prediction],
+            x=dataset_to_plot[error_bias == 'Overestimation'][results_utility_columns.target],
+            y=dataset_to_plot[error_bias == 'Overestimation'][results_utility_columns.prediction],
             mode='markers',
             name='Overestimation',
             marker=dict(
@@ -89,8 +101,8 @@ class RegColoredPredActualWidget(Widget):
         ))
 
         pred_actual.add_trace(go.Scatter(
-            x=dataset_to_plot[dataset_to_plot['Error bias'] == 'Majority'][results_utility_columns.target],
-            y=dataset_to_plot[dataset_to_plot['Error bias'] == 'Majority'][results_utility_columns.prediction],
+            x=dataset_to_plot[error_bias == 'Majority'][results_utility_columns.target],
+            y=dataset_to_plot[error_bias == 'Majority'][results_utility_columns.prediction],
             mode='markers',
             name='Majority',
             marker=dict(
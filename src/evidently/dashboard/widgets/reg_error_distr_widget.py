@@ -5,7 +5,6 @@ import json
 from typing import Optional
 
 import pandas as pd
-import numpy as np
 import plotly.graph_objs as go
 
 from evidently import ColumnMapping
@@ -13,6 +12,7 @@ from evidently.analyzers.regression_performance_analyzer import RegressionPerfor
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.utils.data_operations import get_finite_data
 
 
 class RegErrorDistrWidget(Widget):
@@ -40,10 +40,10 @@ class RegErrorDistrWidget(Widget):
             return None
 
         if self.dataset == 'current':
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
 
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == 'reference':
@@ -51,8 +51,7 @@ class RegErrorDistrWidget(Widget):
 
             return None
 
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
-        dataset_to_plot.dropna(axis=0, how='any', inplace=True)
+        dataset_to_plot = get_finite_data(dataset_to_plot)
 
         # plot distributions
         error_distr = go.Figure()
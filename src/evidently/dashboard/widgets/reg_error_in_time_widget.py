@@ -5,7 +5,6 @@ import json
 from typing import Optional
 
 import pandas as pd
-import numpy as np
 
 import plotly.graph_objs as go
 
@@ -14,6 +13,9 @@ from evidently.analyzers.regression_performance_analyzer import RegressionPerfor
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.options import PlotOptions
+from evidently.dashboard.widgets.utils import get_time_series_rows_indices
+from evidently.utils.data_operations import get_finite_data
 
 
 class RegErrorTimeWidget(Widget):
@@ -40,18 +42,23 @@ class RegErrorTimeWidget(Widget):
             return None
 
         if self.dataset == 'current':
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
 
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == 'reference':
                 raise ValueError(f"Widget [{self.title}] requires reference dataset but it is None")
             return None
 
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
-        dataset_to_plot.dropna(axis=0, how='any', inplace=True)
+        dataset_to_plot = get_finite_data(dataset_to_plot)
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
+        dataset_to_plot = dataset_to_plot.iloc[get_time_series_rows_indices(
+            dataset_to_plot[results_utility_columns.date] if results_utility_columns.date else dataset_to_plot.index,
+            [dataset_to_plot[results_utility_columns.prediction] - dataset_to_plot[results_utility_columns.target]],
+            max_points,
+        )]
 
         # plot error in time
         error_in_time = go.Figure()
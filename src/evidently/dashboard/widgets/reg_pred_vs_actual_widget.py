@@ -5,7 +5,6 @@ import json
 from typing import Optional
 
 import pandas as pd
-import numpy as np
 
 import plotly.graph_objs as go
 
@@ -14,6 +13,9 @@ from evidently.analyzers.regression_performance_analyzer import RegressionPerfor
 from evidently.model.widget import BaseWidgetInfo
 from evidently.dashboard.widgets.widget import Widget
 from evidently.options import ColorOptions
+from evidently.options import PlotOptions
+from evidently.dashboard.widgets.utils import get_scatter_points_indices
+from evidently.utils.data_operations import get_finite_data
 
 
 class RegPredActualWidget(Widget):
@@ -42,10 +44,10 @@ class RegPredActualWidget(Widget):
             return None
 
         if self.dataset == 'current':
-            dataset_to_plot = current_data.copy(deep=False) if current_data is not None else None
+            dataset_to_plot = current_data
 
         else:
-            dataset_to_plot = reference_data.copy(deep=False)
+            dataset_to_plot = reference_data
 
         if dataset_to_plot is None:
             if self.dataset == 'reference':
@@ -53,8 +55,11 @@ class RegPredActualWidget(Widget):
 
             return None
 
-        dataset_to_plot.replace([np.inf, -np.inf], np.nan, inplace=True)
-        dataset_to_plot.dropna(axis=0, how='any', inplace=True)
+        dataset_to_plot = get_finite_data(dataset_to_plot)
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
+        dataset_to_plot = dataset_to_plot.iloc[get_scatter_points_indices(
+            [dataset_to_plot[target_name], dataset_to_plot[prediction_name]], max_points
+        )]
 
         # plot output correlations
         pred_actual = go.Figure()
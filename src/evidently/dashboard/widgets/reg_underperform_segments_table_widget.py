@@ -14,6 +14,11 @@ from evidently import ColumnMapping
 from evidently.analyzers.regression_performance_analyzer import RegressionPerformanceAnalyzer
 from evidently.model.widget import BaseWidgetInfo, AdditionalGraphInfo
 from evidently.dashboard.widgets.widget import Widget
+from evidently.dashboard.widgets.utils import concat_with_dataset_column
+from evidently.dashboard.widgets.utils import get_grouped_histograms
+from evidently.dashboard.widgets.utils import get_scatter_points_indices
+from evidently.options import PlotOptions
+from evidently.utils.data_operations import get_finite_data
 
 
 def _error_bias_string(quantile_5, quantile_95):
@@ -43,13 +48,11 @@ class UnderperformSegmTableWidget(Widget):
         if target_name is None or prediction_name is None:
             raise ValueError(f"Widget [{self.title}] requires 'target' and 'prediction' columns.")
 
+        max_points = self.options_provider.get(PlotOptions).get_max_points(type(self).__name__)
         widget_info = None
         if current_data is not None:
-            current_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-            current_data.dropna(axis=0, how='any', inplace=True)
-
-            reference_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-            reference_data.dropna(axis=0, how='any', inplace=True)
+            current_data = get_finite_data(current_data)
+            reference_data = get_finite_data(reference_data)
 
             ref_error = reference_data[prediction_name] - reference_data[target_name]
             current_error = current_data[prediction_name] - current_data[target_name]
@@ -61,16 +64,16 @@ class UnderperformSegmTableWidget(Widget):
             current_quntile_95 = np.quantile(current_error, .95)
 
             # create subplots
-            reference_data['dataset'] = 'Reference'
-            reference_data['Error bias'] = list(map(_error_bias_string(ref_quntile_5, ref_quntile_95), ref_error))
-
-            current_data['dataset'] = 'Current'
-            current_data['Error bias'] = list(map(_error_bias_string(current_quntile_5, current_quntile_95),
-                                                  current_error))
-            merged_data = pd.concat([reference_data, current_data])
-
-            reference_data.drop(['dataset', 'Error bias'], axis=1, inplace=True)
-            current_data.drop(['dataset', 'Error bias'], axis=1, inplace=True)
+            merged_data = concat_with_dataset_column(reference_data, current_data)
+            merged_data['Error bias'] = list(map(_error_bias_string(ref_quntile_5, ref_quntile_95), ref_error)) + \
+                list(map(_error_bias_string(current_quntile_5, current_quntile_95), current_error))
+            # points of predicted vs actual plots are the same for all features, colors ranges use all rows
+            reference_points = reference_data.iloc[get_scatter_points_indices(
+                [reference_data[target_name], reference_data[prediction_name]], max_points
+            )]
+            current_points = current_data.iloc[get_scatter_points_indices(
+                [current_data[target_name], current_data[prediction_name]], max_points
+            )]
 
             params_data = []
             additional_graphs_data = []
@@ -78,11 +81,14 @@ class UnderperformSegmTableWidget(Widget):
             for feature_name in results.columns.num_feature_names:
                 feature_type = 'num'
 
-                feature_hist = px.histogram(merged_data, x=feature_name, color='Error bias', facet_col="dataset",
-                                            histnorm='percent', barmode='overlay',
-                                            category_orders={"dataset": ["Reference", "Current"],
-                                                             "Error bias": ["Underestimation", "Overestimation",
-                                                                            "Majority"]})
+                feature_hist = px.bar(get_grouped_histograms(merged_data, feature_name, ['dataset', 'Error bias'],
+                                                             histnorm='percent'),
+                                      x=feature_name, y='percent', color='Error bias', facet_col="dataset",
+                                      barmode='overlay',
+                                      category_orders={"dataset": ["Reference", "Current"],
+                                                       "Error bias": ["Underestimation", "Overestimation",
+                                                                      "Majority"]})
+                feature_hist.update_layout(bargap=0)
 
                 feature_hist_json = json.loads(feature_hist.to_json())
 
@@ -90,14 +96,14 @@ class UnderperformSegmTableWidget(Widget):
 
                 segment_fig.add_trace(
                     go.Scatter(
-                        x=reference_data[target_name],
-                        y=reference_data[prediction_name],
+                        x=reference_points[target_name],
+                        y=reference_points[prediction_name],
                         mode='markers',
                         marker=dict(
                             size=6,
                             cmax=max(max(reference_data[feature_name]), max(current_data[feature_name])),
                             cmin=min(min(reference_data[feature_name]), min(current_data[feature_name])),
-                            color=reference_data[feature_name],
+                            color=reference_points[feature_name],
                         ),
                         showlegend=False,
                     ),
@@ -106,14 +112,14 @@ class UnderperformSegmTableWidget(Widget):
 
                 segment_fig.add_trace(
                     go.Scatter(
-                        x=current_data[target_name],
-                        y=current_data[prediction_name],
+                        x=current_points[target_name],
+                        y=current_points[prediction_name],
                         mode='markers',
                         marker=dict(
                             size=6,
                             cmax=max(max(reference_data[feature_name]), max(current_data[feature_name])),
                             cmin=min(min(reference_data[feature_name]), min(current_data[feature_name])),
-                            color=current_data[feature_name],
+                            color=current_points[feature_name],
                             colorbar=dict(
                                 title=feature_name
                             ),
@@ -189,11 +195,14 @@ class UnderperformSegmTableWidget(Widget):
             for feature_name in results.columns.cat_feature_names:
                 feature_type = 'cat'
 
-                feature_hist = px.histogram(merged_data, x=feature_name, color='Error bias', facet_col="dataset",
-                                            histnorm='percent', barmode='overlay',
-                                            category_orders={"dataset": ["Reference", "Current"],
-                                                             "Error bias": ["Underestimation", "Overestimation",
-                                                                            "Majority"]})
+                feature_hist = px.bar(get_grouped_histograms(merged_data, feature_name, ['dataset', 'Error bias'],
+                                                             histnorm='percent'),
+                                      x=feature_name, y='percent', color='Error bias', facet_col="dataset",
+                                      barmode='overlay',
+                                      category_orders={"dataset": ["Reference", "Current"],
+                                                       "Error bias": ["Underestimation", "Overestimation",
+                                                                      "Majority"]})
+                feature_hist.update_layout(bargap=0)
 
                 feature_hist_json = json.loads(feature_hist.to_json())
 
@@ -201,14 +210,14 @@ class UnderperformSegmTableWidget(Widget):
 
                 segment_fig.add_trace(
                     go.Scatter(
-                        x=reference_data[target_name],
-                        y=reference_data[prediction_name],
+                        x=reference_points[target_name],
+                        y=reference_points[prediction_name],
                         mode='markers',
                         marker=dict(
                             size=6,
                             cmax=max(max(reference_data[feature_name]), max(current_data[feature_name])),
                             cmin=min(min(reference_data[feature_name]), min(current_data[feature_name])),
-                            color=reference_data[feature_name],
+                            color=reference_points[feature_name],
                         ),
                         showlegend=False,
                     ),
@@ -217,14 +226,14 @@ class UnderperformSegmTableWidget(Widget):
 
                 segment_fig.add_trace(
                     go.Scatter(
-                        x=current_data[target_name],
-                        y=current_data[prediction_name],
+                        x=current_points[target_name],
+                        y=current_points[prediction_name],
                         mode='markers',
                         marker=dict(
                             size=6,
                             cmax=max(max(reference_data[feature_name]), max(current_data[feature_name])),
                             cmin=min(min(reference_data[feature_name]), min(current_data[feature_name])),
-                            color=current_data[feature_name],
+                            color=current_points[feature_name],
                             colorbar=dict(
                                 title=feature_name
                             ),
@@ -352,18 +361,21 @@ class UnderperformSegmTableWidget(Widget):
             )
 
         else:
-            reference_data.replace([np.inf, -np.inf], np.nan, inplace=True)
-            reference_data.dropna(axis=0, how='any', inplace=True)
+            reference_data = get_finite_data(reference_data)
 
             error = reference_data[prediction_name] - reference_data[target_name]
 
             quntile_5 = np.quantile(error, .05)
             quntile_95 = np.quantile(error, .95)
 
-            reference_data['Error bias'] = reference_data['Error bias'] = list(
+            # the shared dataset is read-only, add error bias column to a new dataframe
+            reference_data = reference_data.assign(**{'Error bias': list(
                 map(lambda x: 'Underestimation'
                               if x <= quntile_5 else 'Majority'
-                              if x < quntile_95 else 'Overestimation', error))
+                              if x < quntile_95 else 'Overestimation', error))})
+            reference_points = reference_data.iloc[get_scatter_points_indices(
+                [reference_data[target_name], reference_data[prediction_name]], max_points
+            )]
 
             params_data = []
             additional_graphs_data = []
@@ -372,13 +384,14 @@ class UnderperformSegmTableWidget(Widget):
 
                 feature_type = 'num'
 
-                hist = px.histogram(reference_data, x=feature_name, color='Error bias', histnorm='percent',
-                                    barmode='overlay',
-                                    category_orders={"Error bias": ["Underestimation", "Overestimation", "Majority"]})
+                hist = px.bar(get_grouped_histograms(reference_data, feature_name, ['Error bias'], histnorm='percent'),
+                              x=feature_name, y='percent', color='Error bias', barmode='overlay',
+                              category_orders={"Error bias": ["Underestimation", "Overestimation", "Majority"]})
+                hist.update_layout(bargap=0)
 
                 hist_figure = json.loads(hist.to_json())
 
-                segm = px.scatter(reference_data, x=target_name,
+                segm = px.scatter(reference_points, x=target_name,
                                   y=prediction_name, color=feature_name)
                 segm_figure = json.loads(segm.to_json())
 
@@ -435,17 +448,16 @@ class UnderperformSegmTableWidget(Widget):
 
                 feature_type = 'cat'
 
-                hist = px.histogram(reference_data, x=feature_name, color='Error bias', histnorm='percent',
-                                    barmode='overlay',
-                                    category_orders={"Error bias": ["Underestimation", "Overestimation", "Majority"]})
+                hist = px.bar(get_grouped_histograms(reference_data, feature_name, ['Error bias'], histnorm='percent'),
+                              x=feature_name, y='percent', color='Error bias', barmode='overlay',
+                              category_orders={"Error bias": ["Underestimation", "Overestimation", "Majority"]})
+                hist.update_layout(bargap=0)
 
                 hist_figure = json.loads(hist.to_json())
 
-                initial_type = reference_data[feature_name].dtype
-                reference_data[feature_name] = reference_data[feature_name].astype(str)
-                segm = px.scatter(reference_data, x=target_name,
-                                  y=prediction_name, color=feature_name)
-                reference_data[feature_name] = reference_data[feature_name].astype(initial_type)
+                # string values get discrete colors
+                segm = px.scatter(reference_points.assign(**{feature_name: reference_points[feature_name].astype(str)}),
+                                  x=target_name, y=prediction_name, color=feature_name)
 
                 segm_figure = json.loads(segm.to_json())
 
@@ -497,8 +509,6 @@ class UnderperformSegmTableWidget(Widget):
                     )
                 )
 
-            reference_data.drop('Error bias', axis=1, inplace=True)
-
             widget_info = BaseWidgetInfo(
                 title=self.title,
                 type="big_table",
@@ -1,5 +1,14 @@
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 
+# limit of bins count of histograms if it is chosen by values
+MAX_HISTOGRAM_BINS = 100
+
 
 class CutQuantileTransformer:
     def __init__(self,
@@ -34,3 +43,249 @@ class CutQuantileTransformer:
             return df[df[feature] <= self.q_val_right]
         else:
             return df[df[feature].between(self.q_val_left, self.q_val_right)]
+
+
+def concat_with_dataset_column(reference_data: pd.DataFrame, current_data: pd.DataFrame) -> pd.DataFrame:
+    """Merge reference and current data to a new dataframe with 'dataset' column for facets in plots.
+
+    The column contains 'Reference' or 'Current' values. Source dataframes are not changed.
+    """
+    merged_data = pd.concat([reference_data, current_data])
+    merged_data['dataset'] = ['Reference'] * reference_data.shape[0] + ['Current'] * current_data.shape[0]
+    return merged_data
+
+
+def _to_plot_values(values: Sequence) -> np.ndarray:
+    """Convert values to float numbers for downsampling: datetime values to nanoseconds, other values to codes"""
+    if isinstance(values, (pd.Index, pd.Series)) and pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return np.asarray(values.astype(np.int64), dtype=np.float64)
+
+    if isinstance(values, (pd.Index, pd.Series)) and not pd.api.types.is_numeric_dtype(values.dtype):
+        return pd.factorize(values)[0].astype(np.float64)
+
+    return np.asarray(values, dtype=np.float64)
+
+
+def get_scatter_points_indices(
+    values: Sequence[Sequence],
+    max_points: Optional[int],
+    groups: Optional[Sequence] = None,
+) -> np.ndarray:
+    """Get sorted positions of points to plot a scatter plot with about `max_points` points.
+
+    The plot area is split to a grid for each group, each non-empty cell keeps at least one point, so outliers and
+    rare groups are kept, and the rest of the budget is shared by cells proportionally to their points counts.
+    Points in a cell are taken evenly in their order, so the result is deterministic.
+
+    Args:
+        values: coordinates of points, one or two sequences of the same length
+        max_points: the points budget, if None or there are less points, all points are kept.
+            If there are more groups than half of the budget, one point for each group cell is kept.
+        groups: if set, points are sampled for each group separately, for example, for classes
+    """
+    points_count = len(values[0])
+
+    if max_points is None or points_count <= max_points:
+        return np.arange(points_count)
+
+    group_codes = np.zeros(points_count, dtype=np.int64) if groups is None else pd.factorize(groups)[0]
+    groups_count = int(group_codes.max()) + 1
+    # with half of the budget for cells, the rest of the budget is shared by points in the cells
+    grid_size = max(1, int((max_points / (2 * groups_count)) ** (1 / len(values))))
+    cells = group_codes
+
+    for coordinates in values:
+        coordinates = _to_plot_values(coordinates)
+        finite = np.isfinite(coordinates)
+        coordinates = np.where(finite, coordinates, 0)
+        min_value = coordinates[finite].min() if finite.any() else 0
+        value_range = coordinates[finite].max() - min_value if finite.any() else 0
+        positions = (coordinates - min_value) / value_range * grid_size if value_range > 0 else np.zeros(points_count)
+        cells = cells * grid_size + np.clip(positions.astype(np.int64), 0, grid_size - 1)
+
+    cell_codes, cell_counts = np.unique(cells, return_inverse=True, return_counts=True)[1:]
+    extra_budget = max(0, max_points - len(cell_counts))
+    quotas = np.minimum(cell_counts, 1 + extra_budget * cell_counts // points_count)
+    # position of each point in its cell in the points order
+    order = np.argsort(cell_codes, kind="stable")
+    cell_starts = np.cumsum(cell_counts) - cell_counts
+    ranks = np.empty(points_count, dtype=np.int64)
+    ranks[order] = np.arange(points_count) - np.repeat(cell_starts, cell_counts)
+    point_quotas = quotas[cell_codes]
+    point_counts = cell_counts[cell_codes]
+    selected = (ranks + 1) * point_quotas // point_counts > ranks * point_quotas // point_counts
+    return np.flatnonzero(selected)
+
+
+def get_time_series_points_indices(x: Sequence, y: Sequence, max_points: Optional[int]) -> np.ndarray:
+    """Get sorted positions of points to plot a line with about `max_points` points keeping its shape
+    with largest triangle three buckets algorithm. The first and the last points are always kept.
+
+    Args:
+        x: x coordinates of the points, if they are not sorted, positions of the points are used
+        y: y coordinates of the points
+        max_points: the points budget, if None or there are less points, all points are kept
+    """
+    points_count = len(y)
+
+    if max_points is None or points_count <= max_points:
+        return np.arange(points_count)
+
+    x_values = _to_plot_values(x)
+
+    if not np.all(np.diff(x_values) >= 0):
+        x_values = np.arange(points_count, dtype=np.float64)
+
+    y_values = _to_plot_values(y)
+    # buckets for all points except the first and the last ones
+    edges = np.linspace(1, points_count - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = points_count - 1
+
+    for bucket in range(max_points - 2):
+        start = edges[bucket]
+        end = edges[bucket + 1]
+
+        if bucket + 2 < len(edges):
+            next_x = x_values[end:edges[bucket + 2]].mean()
+            next_y = y_values[end:edges[bucket + 2]].mean()
+
+        else:
+            next_x = x_values[-1]
+            next_y = y_values[-1]
+
+        previous = selected[bucket]
+        areas = np.abs(
+            (x_values[previous] - next_x) * (y_values[start:end] - y_values[previous])
+            - (x_values[previous] - x_values[start:end]) * (next_y - y_values[previous])
+        )
+        selected[bucket + 1] = start + int(np.argmax(areas))
+
+    return selected
+
+
+def get_time_series_rows_indices(x: Sequence, ys: Sequence[Sequence], max_points: Optional[int]) -> np.ndarray:
+    """Get sorted positions of rows to plot lines with shared x coordinates, the budget is split between the lines"""
+    if max_points is None or len(x) <= max_points:
+        return np.arange(len(x))
+
+    line_max_points = max(3, max_points // len(ys))
+    return np.unique(np.concatenate([get_time_series_points_indices(x, y, line_max_points) for y in ys]))
+
+
+def _get_finite_values(values: Sequence) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    return values[np.isfinite(values)]
+
+
+def _get_auto_bins_count(values: np.ndarray) -> int:
+    """Get bins count as the maximum of Freedman–Diaconis and Sturges estimations limited by MAX_HISTOGRAM_BINS"""
+    if values.size == 0:
+        return 1
+
+    bins_count = int(np.ceil(np.log2(values.size))) + 1
+    iqr = np.subtract(*np.percentile(values, [75, 25]))
+
+    if iqr > 0:
+        bin_width = 2 * iqr * values.size ** (-1 / 3)
+        bins_count = max(bins_count, int(np.ceil((values.max() - values.min()) / bin_width)))
+
+    return min(bins_count, MAX_HISTOGRAM_BINS)
+
+
+def get_histogram_bins(values: Sequence[Sequence], nbins: Optional[int] = None, xbins=None) -> np.ndarray:
+    """Get edges of bins shared by histograms of several datasets, not finite values are skipped.
+
+    Args:
+        values: values of the datasets
+        nbins: bins count, if None, it is chosen by the values count and spread
+        xbins: bins in Plotly format, a dict or `go.histogram.XBins` with `start`, `end` and `size`.
+            It has a priority over `nbins`, `start` and `end` are the values range by default.
+    """
+    finite_values = np.concatenate([_get_finite_values(dataset_values) for dataset_values in values])
+
+    if xbins is not None:
+        if not isinstance(xbins, dict):
+            xbins = xbins.to_plotly_json()
+
+        size = xbins.get("size")
+
+        if size:
+            start = xbins.get("start")
+            end = xbins.get("end")
+            start = start if start is not None else (finite_values.min() if finite_values.size else 0)
+            end = end if end is not None else (finite_values.max() if finite_values.size else start)
+            return start + size * np.arange(max(1, int(np.ceil((end - start) / size))) + 1)
+
+    return np.histogram_bin_edges(finite_values, bins=nbins or _get_auto_bins_count(finite_values))
+
+
+def get_histogram(
+    values: Sequence,
+    bins: Optional[np.ndarray] = None,
+    histnorm: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get bars of a histogram to plot it without raw values: centers of the bins and their heights.
+
+    Args:
+        values: values for the histogram, not finite values and missing categories are skipped
+        bins: edges of the bins, if None, values are counted as categories
+        histnorm: heights normalization as in Plotly histograms: None for counts, "percent" or "probability"
+    """
+    if bins is None:
+        value_counts = pd.Series(values).value_counts(sort=False)
+        x = value_counts.index.to_numpy()
+        y = value_counts.to_numpy()
+
+    else:
+        x = (bins[:-1] + bins[1:]) / 2
+        y = np.histogram(_get_finite_values(values), bins=bins)[0]
+
+    if histnorm is None:
+        return x, y
+
+    if histnorm not in ("percent", "probability"):
+        raise ValueError(f"Unexpected histogram normalization {histnorm}")
+
+    total = y.sum()
+    heights = y / total if total > 0 else np.zeros(len(y))
+    return x, heights * 100 if histnorm == "percent" else heights
+
+
+def get_grouped_histograms(
+    data: pd.DataFrame,
+    column: str,
+    groups: List[str],
+    histnorm: Optional[str] = None,
+) -> pd.DataFrame:
+    """Get histograms of a column for groups of rows to plot them with `px.bar` like `px.histogram` with colors
+    or facets. Numeric values are binned with the same bins for all groups, other values are counted as categories.
+
+    Returns a dataframe with the column (bins centers or categories), groups columns
+    and histogram heights in `histnorm` column or "count" column if `histnorm` is None.
+    """
+    heights_column = histnorm or "count"
+    column_values = data[column]
+    is_numeric = pd.api.types.is_numeric_dtype(column_values.dtype) and not pd.api.types.is_bool_dtype(
+        column_values.dtype
+    )
+    bins = get_histogram_bins([column_values]) if is_numeric else None
+    histograms = []
+
+    for group_values, group_data in data.groupby(groups, sort=False):
+        if not isinstance(group_values, tuple):
+            group_values = (group_values,)
+
+        x, y = get_histogram(group_data[column], bins, histnorm)
+        histogram = pd.DataFrame({column: x, heights_column: y})
+
+        for group, group_value in zip(groups, group_values):
+            histogram[group] = group_value
+
+        histograms.append(histogram)
+
+    if not histograms:
+        return pd.DataFrame(columns=[column, heights_column] + groups)
+
+    return pd.concat(histograms, ignore_index=True)
@@ -1,4 +1,7 @@
 from .monitoring import ModelMonitoring
+from .incremental import IncrementalModelMonitoring
+from .exporter import OpenMetricsExporter
+from .exporter import start_metrics_server
 from .monitors.cat_target_drift import CatTargetDriftMonitor
 from .monitors.num_target_drift import NumTargetDriftMonitor
 from .monitors.data_drift import DataDriftMonitor
@@ -0,0 +1,165 @@
+"""Export of model monitoring metrics in the OpenMetrics text format for Prometheus scraping.
+
+    exporter = OpenMetricsExporter()
+    server = start_metrics_server(exporter, port=8000)
+    ...
+    monitoring.execute(reference_data, current_data, column_mapping)
+    exporter.update(monitoring.metrics())
+
+Metrics are rendered once on each update, so scraping returns the prepared text without any calculations.
+"""
+import http.server
+import math
+import re
+import socketserver
+import threading
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from evidently.model_monitoring.monitoring import MetricsType
+from evidently.model_monitoring.monitoring import ModelMonitoringMetric
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEFAULT_PREFIX = "evidently:"
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def get_metric_name(metric: ModelMonitoringMetric, prefix: str = DEFAULT_PREFIX) -> str:
+    """Get OpenMetrics family name for a monitoring metric, characters that are not allowed are replaced with `_`"""
+    name = _INVALID_NAME_CHARS.sub("_", f"{prefix}{metric.name}")
+
+    if name[0].isdigit():
+        name = f"_{name}"
+
+    return name
+
+
+def _escape_label_value(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: Optional[float]) -> str:
+    if value is None:
+        return "NaN"
+
+    value = float(value)
+
+    if math.isnan(value):
+        return "NaN"
+
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(value)
+
+
+class OpenMetricsExporter:
+    """Keep the latest model monitoring metrics as OpenMetrics text.
+
+    Metric families are registered once for each monitoring metric and rendered label sets of samples are cached,
+    so an update with thousands of labelled samples is a string join. All metrics are replaced with each update.
+    """
+
+    def __init__(self, prefix: str = DEFAULT_PREFIX):
+        self.prefix = prefix
+        # family name by metric name and rendered `name{labels}` of samples by label values
+        self._families: Dict[str, str] = {}
+        self._samples_names: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], str] = {}
+        self._content = b"# EOF\n"
+        self._lock = threading.Lock()
+
+    def register(self, metric: ModelMonitoringMetric) -> str:
+        """Register a metric family, the family is present in the output even without samples"""
+        family = self._families.get(metric.name)
+
+        if family is None:
+            family = get_metric_name(metric, self.prefix)
+            self._families[metric.name] = family
+
+        return family
+
+    def _get_sample_name(self, metric: ModelMonitoringMetric, labels: Optional[Dict[str, str]]) -> str:
+        labels_key = tuple(labels.items()) if labels else ()
+        key = (metric.name, labels_key)
+        sample_name = self._samples_names.get(key)
+
+        if sample_name is None:
+            family = self.register(metric)
+
+            if labels:
+                rendered_labels = ",".join(
+                    f'{name}="{_escape_label_value(value)}"' for name, value in sorted(labels_key)
+                )
+                sample_name = f"{family}{{{rendered_labels}}}"
+
+            else:
+                sample_name = family
+
+            self._samples_names[key] = sample_name
+
+        return sample_name
+
+    def update(self, metrics: Iterable[MetricsType]) -> None:
+        """Replace exported metrics with metrics from `ModelMonitoring.metrics()`"""
+        # metrics can be calculated lazily, so take them before the lock
+        metrics = list(metrics)
+
+        with self._lock:
+            self._content = self._render(metrics)
+
+    def _render(self, metrics: List[MetricsType]) -> bytes:
+        samples: Dict[str, List[str]] = {}
+
+        for metric, value, labels in metrics:
+            sample_name = self._get_sample_name(metric, labels)
+            samples.setdefault(self._families[metric.name], []).append(f"{sample_name} {_format_value(value)}\n")
+
+        lines = []
+
+        for family in self._families.values():
+            lines.append(f"# TYPE {family} gauge\n")
+            lines.extend(samples.get(family, ()))
+
+        lines.append("# EOF\n")
+        return "".join(lines).encode("utf-8")
+
+    def render(self) -> bytes:
+        """Get the latest metrics in OpenMetrics text format"""
+        with self._lock:
+            return self._content
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    exporter: OpenMetricsExporter
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        content = self.exporter.render()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        pass
+
+
+class MetricsServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+def start_metrics_server(exporter: OpenMetricsExporter, port: int, address: str = "") -> MetricsServer:
+    """Serve exporter metrics at `/metrics` path in a daemon thread, use `shutdown()` of the result to stop it"""
+    handler = type("MetricsHandler", (_MetricsHandler,), {"exporter": exporter})
+    server = MetricsServer((address, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
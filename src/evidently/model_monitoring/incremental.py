@@ -0,0 +1,606 @@
+"""Model monitoring for a sliding window of the latest rows of current data.
+
+Rows come in batches, and the window keeps them in a ring buffer of batches, so adding a batch does not copy
+the window data. Analyzers that can be calculated from sufficient statistics update the statistics with added
+and removed rows, reference results are calculated once in `start`:
+
+- ClassificationPerformance - counts of target and prediction values pairs
+- CatTargetDrift - target and prediction value counts
+- DataDrift - features value counts
+- NumTargetDrift - target and prediction value counts and sums for their correlations with numerical features
+- RegressionPerformance - moments of errors for quality metrics, error normality, underperformance and error bias
+    are calculated for the window data
+
+Other analyzers (DataQuality and ProbClassificationPerformance) are not incremental, they are calculated
+for the reference data and the window data when metrics are requested:
+
+    monitoring = IncrementalModelMonitoring(monitors=[ClassificationPerformanceMonitor()], window_size=10000)
+    monitoring.start(reference_data, column_mapping)
+
+    for batch in batches:
+        monitoring.update(batch)
+
+    for metric, value, labels in monitoring.metrics():
+        ...
+
+Metrics are the same as `ModelMonitoring` gives for the reference data and the window data.
+"""
+import collections
+from typing import Deque
+from typing import Sequence
+from typing import Dict
+from typing import Generator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+from typing import cast
+
+import numpy as np
+import pandas as pd
+
+from evidently.analyzers.base_analyzer import Analyzer
+from evidently.analyzers.base_analyzer import BaseAnalyzerResult
+from evidently.analyzers.cat_target_drift_analyzer import CatTargetDriftAnalyzer
+from evidently.analyzers.cat_target_drift_analyzer import CatTargetDriftAnalyzerResults
+from evidently.analyzers.cat_target_drift_analyzer import calculate_drift_metrics
+from evidently.analyzers.classification_performance_analyzer import ClassificationPerformanceAnalyzer
+from evidently.analyzers.classification_performance_analyzer import ClassificationPerformanceAnalyzerResults
+from evidently.analyzers.classification_performance_analyzer import calculate_performance_metrics
+from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
+from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzerResults
+from evidently.analyzers.data_quality_accumulators import NumericMoments
+from evidently.analyzers.num_target_drift_analyzer import NumDataDriftMetrics
+from evidently.analyzers.num_target_drift_analyzer import NumTargetDriftAnalyzer
+from evidently.analyzers.num_target_drift_analyzer import NumTargetDriftAnalyzerResults
+from evidently.analyzers.regression_performance_analyzer import RegressionPerformanceAnalyzer
+from evidently.analyzers.regression_performance_analyzer import RegressionPerformanceAnalyzerResults
+from evidently.analyzers.regression_performance_analyzer import RegressionPerformanceMetrics
+from evidently.analyzers.regression_performance_analyzer import _calculate_error_normality
+from evidently.analyzers.regression_performance_analyzer import _calculate_underperformance
+from evidently.analyzers.regression_performance_analyzer import _error_bias_table
+from evidently.analyzers.regression_performance_analyzer import _error_with_qantiles
+from evidently.analyzers.stattests.registry import get_stattest
+from evidently.analyzers.utils import DatasetColumns
+from evidently.analyzers.utils import process_columns
+from evidently.model_monitoring.monitoring import MetricsType
+from evidently.model_monitoring.monitoring import ModelMonitor
+from evidently.model_monitoring.monitoring import ModelMonitoring
+from evidently.model_profile.partial_profile import _pad_with_nan
+from evidently.options import DataDriftOptions
+from evidently.options import OptionsProvider
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.pipeline.pipeline import _calculate_analyzer
+from evidently.utils.data_operations import finite_data_cache
+from evidently.utils.data_operations import get_finite_data
+
+
+class RowsWindow:
+    """Ring buffer with the latest `size` rows, the rows are kept in batches as they were added"""
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("window size should be >= 1")
+
+        self.size = size
+        self.rows_count = 0
+        self.batches: Deque[pd.DataFrame] = collections.deque()
+        self._data: Optional[pd.DataFrame] = None
+
+    def __len__(self) -> int:
+        return self.rows_count
+
+    def append(self, batch: pd.DataFrame) -> List[pd.DataFrame]:
+        """Add a batch with no more than `size` rows to the window and get the rows removed from the window"""
+        if batch.shape[0] > self.size:
+            raise ValueError(f"batch should have no more than {self.size} rows")
+
+        self.batches.append(batch)
+        self.rows_count += batch.shape[0]
+        self._data = None
+        removed = []
+
+        while self.rows_count > self.size:
+            oldest = self.batches[0]
+            extra_rows_count = self.rows_count - self.size
+
+            if oldest.shape[0] <= extra_rows_count:
+                removed.append(self.batches.popleft())
+                self.rows_count -= oldest.shape[0]
+
+            else:
+                removed.append(oldest.iloc[:extra_rows_count])
+                self.batches[0] = oldest.iloc[extra_rows_count:]
+                self.rows_count -= extra_rows_count
+
+        return removed
+
+    def get_data(self) -> pd.DataFrame:
+        """Get all rows of the window as one dataset, it is concatenated once after changes"""
+        if self._data is None:
+            self._data = pd.concat(list(self.batches), ignore_index=True) if self.batches else pd.DataFrame()
+
+        return self._data
+
+
+def _update_counts(counts: Optional[pd.Series], new_counts: pd.Series, sign: int) -> pd.Series:
+    if counts is None:
+        counts = new_counts.iloc[:0]
+
+    counts = counts.add(sign * new_counts, fill_value=0).astype(np.int64)
+    return counts[counts > 0]
+
+
+def _get_values(counts: pd.Series, name: Optional[str] = None) -> pd.Series:
+    """Restore values from value counts, values order is not kept"""
+    return pd.Series(counts.index.repeat(counts.to_numpy()), name=name)
+
+
+class CorrelationSums:
+    """Sums of values, squares and products of a column and other columns for their Pearson correlations.
+
+    The sums are taken over rows where both values are not missing as in `pandas.DataFrame.corr`, values are
+    shifted by the reference means to keep the precision of the sums after many added and removed rows.
+    """
+
+    def __init__(self, column: str, other_columns: Sequence[str], reference_data: pd.DataFrame):
+        self.column = column
+        self.columns = list(other_columns) + [column]
+        self.shifts = reference_data[self.columns].mean().to_numpy(dtype=np.float64, na_value=0.)
+        self.shifts[~np.isfinite(self.shifts)] = 0.
+        self.sums = np.zeros((6, len(self.columns)))
+
+    def update(self, data: pd.DataFrame, sign: int) -> None:
+        values = data[self.columns].to_numpy(dtype=np.float64, na_value=np.nan) - self.shifts
+        main_values = values[:, [-1]]
+        present = ~np.isnan(values) & ~np.isnan(main_values)
+        values = np.where(present, values, 0.)
+        main_values = np.where(present, main_values, 0.)
+        self.sums += sign * np.stack([
+            present.sum(axis=0),
+            values.sum(axis=0),
+            main_values.sum(axis=0),
+            (values ** 2).sum(axis=0),
+            (main_values ** 2).sum(axis=0),
+            (values * main_values).sum(axis=0),
+        ])
+
+    def get_correlations(self) -> Dict[str, float]:
+        count, values_sum, main_sum, squares_sum, main_squares_sum, products_sum = self.sums
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlations = (count * products_sum - values_sum * main_sum) / np.sqrt(
+                (count * squares_sum - values_sum ** 2) * (count * main_squares_sum - main_sum ** 2)
+            )
+
+        correlations[count < 2] = np.nan
+        return dict(zip(self.columns, np.clip(correlations, -1., 1.).tolist()))
+
+
+class IncrementalAnalyzer:
+    """Analyzer results for a sliding window that are updated with added and removed rows of the window"""
+
+    analyzer: Type[Analyzer]
+    options_provider: OptionsProvider
+
+    def start(self, reference_data: pd.DataFrame, column_mapping: ColumnMapping) -> None:
+        raise NotImplementedError()
+
+    def add(self, data: pd.DataFrame) -> None:
+        raise NotImplementedError()
+
+    def remove(self, data: pd.DataFrame) -> None:
+        raise NotImplementedError()
+
+    def get_results(self, window: RowsWindow) -> BaseAnalyzerResult:
+        """Get results for the window, analyzers that need the window rows get them with `window.get_data()`"""
+        raise NotImplementedError()
+
+
+class ClassificationPerformanceIncrementalAnalyzer(IncrementalAnalyzer):
+    """Classification performance with counts of target and prediction values pairs for the window"""
+
+    analyzer = ClassificationPerformanceAnalyzer
+    columns: DatasetColumns
+    reference_results: ClassificationPerformanceAnalyzerResults
+    counts: Optional[pd.Series]
+
+    def start(self, reference_data: pd.DataFrame, column_mapping: ColumnMapping) -> None:
+        analyzer = ClassificationPerformanceAnalyzer()
+        analyzer.options_provider = self.options_provider
+        self.reference_results = analyzer.calculate(reference_data, None, column_mapping)
+        self.columns = self.reference_results.columns
+        self.counts = None
+
+    def _get_counts(self, data: pd.DataFrame) -> pd.Series:
+        data = get_finite_data(data)
+        columns = [self.columns.utility_columns.target, self.columns.utility_columns.prediction]
+        return data.groupby(columns).size()
+
+    def _is_calculated(self) -> bool:
+        return self.reference_results.reference_metrics is not None
+
+    def add(self, data: pd.DataFrame) -> None:
+        if self._is_calculated():
+            self.counts = _update_counts(self.counts, self._get_counts(data), 1)
+
+    def remove(self, data: pd.DataFrame) -> None:
+        if self._is_calculated():
+            self.counts = _update_counts(self.counts, self._get_counts(data), -1)
+
+    def get_results(self, window: RowsWindow) -> ClassificationPerformanceAnalyzerResults:
+        result = ClassificationPerformanceAnalyzerResults(
+            columns=self.columns, reference_metrics=self.reference_results.reference_metrics
+        )
+
+        if self.counts is not None and not self.counts.empty:
+            result.current_metrics = calculate_performance_metrics(
+                pd.Series(self.counts.index.get_level_values(0)),
+                pd.Series(self.counts.index.get_level_values(1)),
+                self.columns.target_names,
+                self.counts.to_numpy(),
+            )
+
+        return result
+
+
+class CatTargetDriftIncrementalAnalyzer(IncrementalAnalyzer):
+    """Categorical target drift with target and prediction value counts for the window"""
+
+    analyzer = CatTargetDriftAnalyzer
+    columns: DatasetColumns
+    reference_data: pd.DataFrame
+    reference_data_count: int
+    current_data_count: int
+    counts: Dict[str, pd.Series]
+
+    def start(self, reference_data: pd.DataFrame, column_mapping: ColumnMapping) -> None:
+        self.columns = process_columns(reference_data, column_mapping)
+        self.reference_data_count = reference_data.shape[0]
+        self.reference_data = get_finite_data(reference_data)
+        self.current_data_count = 0
+        self.counts = {}
+
+        for column in (self.columns.utility_columns.target, self.columns.utility_columns.prediction):
+            if column is not None:
+                if not isinstance(column, str):
+                    raise ValueError("target and prediction should not be a sequence")
+
+                self.counts[column] = self.reference_data[column].value_counts().iloc[:0]
+
+    def _update(self, data: pd.DataFrame, sign: int) -> None:
+        self.current_data_count += sign * data.shape[0]
+        data = get_finite_data(data)
+
+        for column, counts in self.counts.items():
+            self.counts[column] = _update_counts(counts, data[column].value_counts(), sign)
+
+    def add(self, data: pd.DataFrame) -> None:
+        self._update(data, 1)
+
+    def remove(self, data: pd.DataFrame) -> None:
+        self._update(data, -1)
+
+    def get_results(self, window: RowsWindow) -> CatTargetDriftAnalyzerResults:
+        options = self.options_provider.get(DataDriftOptions)
+        result = CatTargetDriftAnalyzerResults(
+            columns=self.columns,
+            reference_data_count=self.reference_data_count,
+            current_data_count=self.current_data_count,
+        )
+        target_column = self.columns.utility_columns.target
+        prediction_column = self.columns.utility_columns.prediction
+
+        if isinstance(target_column, str):
+            result.target_metrics = calculate_drift_metrics(
+                self.reference_data[target_column], _get_values(self.counts[target_column], target_column), options
+            )
+
+        if isinstance(prediction_column, str):
+            result.prediction_metrics = calculate_drift_metrics(
+                self.reference_data[prediction_column],
+                _get_values(self.counts[prediction_column], prediction_column),
+                options,
+            )
+
+        return result
+
+
+class DataDriftIncrementalAnalyzer(IncrementalAnalyzer):
+    """Data drift with features value counts for the window.
+
+    Drift is calculated for the window data restored from the counts, features drift does not depend on rows order.
+    """
+
+    analyzer = DataDriftAnalyzer
+    reference_data: pd.DataFrame
+    column_mapping: ColumnMapping
+    rows_count: int
+    counts: Dict[str, pd.Series]
+
+    def start(self, reference_data: pd.DataFrame, column_mapping: ColumnMapping) -> None:
+        columns = process_columns(reference_data, column_mapping)
+        self.reference_data = reference_data
+        self.column_mapping = column_mapping
+        self.rows_count = 0
+        self.counts = {
+            feature_name: reference_data[feature_name].value_counts().iloc[:0]
+            for feature_name in list(columns.num_feature_names) + list(columns.cat_feature_names)
+        }
+
+    def _update(self, data: pd.DataFrame, sign: int) -> None:
+        self.rows_count += sign * data.shape[0]
+
+        for feature_name, counts in self.counts.items():
+            self.counts[feature_name] = _update_counts(counts, data[feature_name].value_counts(), sign)
+
+    def add(self, data: pd.DataFrame) -> None:
+        self._update(data, 1)
+
+    def remove(self, data: pd.DataFrame) -> None:
+        self._update(data, -1)
+
+    def get_results(self, window: RowsWindow) -> DataDriftAnalyzerResults:
+        # missing values are not counted, they are restored as NaN values
+        current_data = pd.DataFrame(
+            {
+                feature_name: _pad_with_nan(_get_values(counts), self.rows_count)
+                for feature_name, counts in self.counts.items()
+            }
+        )
+        return cast(
+            DataDriftAnalyzerResults,
+            _calculate_analyzer(
+                DataDriftAnalyzer, self.options_provider, self.reference_data, current_data, self.column_mapping
+            ),
+        )
+
+
+class NumTargetDriftIncrementalAnalyzer(IncrementalAnalyzer):
+    """Numerical target drift with target and prediction value counts and sums for their correlations for the window"""
+
+    analyzer = NumTargetDriftAnalyzer
+    columns: DatasetColumns
+    reference_data: pd.DataFrame
+    reference_correlations: Dict[str, Dict[str, float]]
+    current_data_count: int
+    counts: Dict[str, pd.Series]
+    correlation_sums: Dict[str, CorrelationSums]
+
+    def start(self, reference_data: pd.DataFrame, column_mapping: ColumnMapping) -> None:
+        self.columns = process_columns(reference_data, column_mapping)
+        self.reference_data = reference_data
+        self.current_data_count = 0
+        self.reference_correlations = {}
+        self.counts = {}
+        self.correlation_sums = {}
+        num_feature_names = list(self.columns.num_feature_names)
+
+        for column in (self.columns.utility_columns.target, self.columns.utility_columns.prediction):
+            if column is not None:
+                if not isinstance(column, str):
+                    raise ValueError("target and prediction should not be a sequence")
+
+                self._check_numeric(reference_data, column)
+                self.reference_correlations[column] = \
+                    reference_data[num_feature_names + [column]].corr()[column].to_dict()
+                self.counts[column] = reference_data[column].value_counts().iloc[:0]
+                self.correlation_sums[column] = CorrelationSums(column, num_feature_names, reference_data)
+
+    @staticmethod
+    def _check_numeric(data: pd.DataFrame, column: str) -> None:
+        if not pd.api.types.is_numeric_dtype(data[column]):
+            raise ValueError(f"Column {column} should only contain numerical values.")
+
+    def _update(self, data: pd.DataFrame, sign: int) -> None:
+        self.current_data_count += sign * data.shape[0]
+
+        for column, counts in self.counts.items():
+            self._check_numeric(data, column)
+            self.counts[column] = _update_counts(counts, data[column].value_counts(), sign)
+            self.correlation_sums[column].update(data, sign)
+
+    def add(self, data: pd.DataFrame) -> None:
+        self._update(data, 1)
+
+    def remove(self, data: pd.DataFrame) -> None:
+        self._update(data, -1)
+
+    def _get_metrics(self, column: Optional[Union[str, Sequence[str]]]) -> Optional[NumDataDriftMetrics]:
+        # sequences of columns are rejected in `start`
+        if not isinstance(column, str):
+            return None
+
+        options = self.options_provider.get(DataDriftOptions)
+        test = get_stattest(options.num_target_stattest_func or "ks", "num")
+        current_values = _pad_with_nan(_get_values(self.counts[column]), self.current_data_count)
+        return NumDataDriftMetrics(
+            column_name=column,
+            reference_correlations=self.reference_correlations[column],
+            current_correlations=self.correlation_sums[column].get_correlations(),
+            stattest_name=test.display_name,
+            drift=test.func(self.reference_data[column], current_values, "num", 0)[0],
+        )
+
+    def get_results(self, window: RowsWindow) -> NumTargetDriftAnalyzerResults:
+        return NumTargetDriftAnalyzerResults(
+            columns=self.columns,
+            reference_data_count=self.reference_data.shape[0],
+            current_data_count=self.current_data_count,
+            target_metrics=self._get_metrics(self.columns.utility_columns.target),
+            prediction_metrics=self._get_metrics(self.columns.utility_columns.prediction),
+        )
+
+
+class RegressionPerformanceIncrementalAnalyzer(IncrementalAnalyzer):
+    """Regression performance with moments of errors for the window.
+
+    Error normality, underperformance and error bias need all errors, they are calculated for the window data.
+    """
+
+    analyzer = RegressionPerformanceAnalyzer
+    columns: DatasetColumns
+    reference_results: RegressionPerformanceAnalyzerResults
+    errors: NumericMoments
+    abs_errors: NumericMoments
+    abs_perc_errors: NumericMoments
+
+    def start(self, reference_data: pd.DataFrame, column_mapping: ColumnMapping) -> None:
+        analyzer = RegressionPerformanceAnalyzer()
+        analyzer.options_provider = self.options_provider
+        self.reference_results = analyzer.calculate(reference_data, None, column_mapping)
+        self.columns = self.reference_results.columns
+        self.errors = NumericMoments()
+        self.abs_errors = NumericMoments()
+        self.abs_perc_errors = NumericMoments()
+
+    def _is_calculated(self) -> bool:
+        return self.reference_results.reference_metrics is not None
+
+    def _get_errors(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        data = get_finite_data(data)
+        target = data[self.columns.utility_columns.target].to_numpy(dtype=np.float64)
+        error = data[self.columns.utility_columns.prediction].to_numpy(dtype=np.float64) - target
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # zero target values give infinite and NaN values as in the analyzer
+            return error, np.abs(error), 100. * np.abs(error) / target
+
+    def add(self, data: pd.DataFrame) -> None:
+        if self._is_calculated():
+            for moments, values in zip((self.errors, self.abs_errors, self.abs_perc_errors), self._get_errors(data)):
+                moments.update(values)
+
+    def remove(self, data: pd.DataFrame) -> None:
+        if self._is_calculated():
+            for moments, values in zip((self.errors, self.abs_errors, self.abs_perc_errors), self._get_errors(data)):
+                moments.remove(values)
+
+    def get_results(self, window: RowsWindow) -> RegressionPerformanceAnalyzerResults:
+        reference_error_bias = self.reference_results.error_bias
+        result = RegressionPerformanceAnalyzerResults(
+            columns=self.columns,
+            reference_metrics=self.reference_results.reference_metrics,
+            error_bias=None if reference_error_bias is None else {
+                feature: dict(bias) for feature, bias in reference_error_bias.items()
+            },
+        )
+
+        if not self._is_calculated():
+            return result
+
+        current_data = get_finite_data(window.get_data())
+        err_quantiles = _error_with_qantiles(
+            current_data, self.columns.utility_columns.prediction, self.columns.utility_columns.target
+        )
+        mean_error, error_std = self.errors.get_mean_and_std()
+        mean_abs_error, abs_error_std = self.abs_errors.get_mean_and_std()
+        mean_abs_perc_error, abs_perc_error_std = self.abs_perc_errors.get_mean_and_std()
+        result.current_metrics = RegressionPerformanceMetrics(
+            mean_error=float(mean_error),
+            mean_abs_error=float(mean_abs_error),
+            mean_abs_perc_error=float(mean_abs_perc_error),
+            error_std=float(error_std),
+            abs_error_std=float(abs_error_std),
+            abs_perc_error_std=float(abs_perc_error_std),
+            error_normality=_calculate_error_normality(err_quantiles),
+            underperformance=_calculate_underperformance(err_quantiles),
+        )
+        current_feature_bias = _error_bias_table(
+            current_data, err_quantiles, self.columns.num_feature_names, self.columns.cat_feature_names
+        )
+
+        # the reference error bias is calculated with the reference metrics
+        assert result.error_bias is not None
+
+        for feature, bias in current_feature_bias.items():
+            result.error_bias.setdefault(feature, {}).update(bias.as_dict("current_"))
+
+        return result
+
+
+INCREMENTAL_ANALYZERS: Dict[Type[Analyzer], Type[IncrementalAnalyzer]] = {
+    ClassificationPerformanceAnalyzer: ClassificationPerformanceIncrementalAnalyzer,
+    CatTargetDriftAnalyzer: CatTargetDriftIncrementalAnalyzer,
+    DataDriftAnalyzer: DataDriftIncrementalAnalyzer,
+    NumTargetDriftAnalyzer: NumTargetDriftIncrementalAnalyzer,
+    RegressionPerformanceAnalyzer: RegressionPerformanceIncrementalAnalyzer,
+}
+
+
+class IncrementalModelMonitoring(ModelMonitoring):
+    """Model monitoring for the reference data and a sliding window of the latest `window_size` rows.
+
+    Call `start` with the reference data, then `update` with new batches of rows. Metrics are calculated
+    for the current window with `metrics`.
+
+    DataQuality and ProbClassificationPerformance monitors are not incremental: their analyzers are calculated
+    for the whole reference data and window data on every metrics calculation after updates.
+    """
+
+    def __init__(self, monitors: Sequence[ModelMonitor], window_size: int, options: Optional[list] = None):
+        super().__init__(monitors, options)
+        self.window = RowsWindow(window_size)
+        self.reference_data: Optional[pd.DataFrame] = None
+        self.column_mapping = ColumnMapping()
+        self.incremental_analyzers: Dict[Type[Analyzer], IncrementalAnalyzer] = {}
+        self._is_calculated = False
+
+    def start(self, reference_data: pd.DataFrame, column_mapping: Optional[ColumnMapping] = None) -> None:
+        """Set the reference data and clear the window"""
+        self.reference_data = reference_data
+        self.column_mapping = column_mapping if column_mapping is not None else ColumnMapping()
+        self.window = RowsWindow(self.window.size)
+        self.incremental_analyzers = {}
+        self._is_calculated = False
+
+        for analyzer in self.get_analyzers():
+            if analyzer in INCREMENTAL_ANALYZERS:
+                incremental_analyzer = INCREMENTAL_ANALYZERS[analyzer]()
+                incremental_analyzer.options_provider = self.options_provider
+                incremental_analyzer.start(reference_data, self.column_mapping)
+                self.incremental_analyzers[analyzer] = incremental_analyzer
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """Add new rows to the window, the oldest rows are removed if the window is full"""
+        if self.reference_data is None:
+            raise ValueError("start should be called before update")
+
+        # only the latest rows of a large batch get to the window
+        batch = batch.iloc[-self.window.size:]
+        removed = self.window.append(batch)
+
+        for incremental_analyzer in self.incremental_analyzers.values():
+            incremental_analyzer.add(batch)
+
+            for rows in removed:
+                incremental_analyzer.remove(rows)
+
+        self._is_calculated = False
+
+    def _calculate(self) -> None:
+        if len(self.window) == 0:
+            raise ValueError("the window has no rows, update should be called before metrics calculation")
+
+        with finite_data_cache():
+            for analyzer in self.get_analyzers():
+                if analyzer in self.incremental_analyzers:
+                    self.analyzers_results[analyzer] = self.incremental_analyzers[analyzer].get_results(self.window)
+
+                else:
+                    self.analyzers_results[analyzer] = _calculate_analyzer(
+                        analyzer,
+                        self.options_provider,
+                        self.reference_data,
+                        self.window.get_data(),
+                        self.column_mapping,
+                    )
+
+        self._is_calculated = True
+
+    def metrics(self) -> Generator[MetricsType, None, None]:
+        if self.reference_data is not None and not self._is_calculated:
+            self._calculate()
+
+        yield from super().metrics()
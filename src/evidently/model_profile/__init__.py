@@ -2,3 +2,5 @@
 # coding: utf-8
 
 from .model_profile import Profile
+from .binary_format import load_profile
+from .partial_profile import PartialProfile
@@ -0,0 +1,282 @@
+"""Binary format of profiles for fast loading of profiles or their parts.
+
+Values are stored with type tags: numeric lists and NumPy arrays as typed arrays, dicts with sizes of values,
+so a part of a profile (a section or a feature) can be read without decoding the rest of the file:
+
+    profile.save("profile.bin", format="binary")
+    drift_metrics = load_profile("profile.bin", ["data_drift", "data", "metrics", "feature_name"])
+
+Loaded profiles are the same as `Profile.object()` results with Python types instead of NumPy scalars, tuples are
+loaded as lists and NumPy arrays with numeric types are loaded as arrays. Other types are stored as JSON
+serializer converts them.
+"""
+import json
+import mmap
+import struct
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from evidently.utils import json_serializer
+
+MAGIC = b"EVPROF"
+BINARY_FORMAT_VERSION = 1
+JSON_FORMAT = "json"
+BINARY_FORMAT = "binary"
+
+_HEADER = struct.Struct("<6sH")
+_SIZE = struct.Struct("<I")
+_VALUE_SIZE = struct.Struct("<Q")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_INT_MIN = -(2 ** 63)
+_INT_MAX = 2 ** 63 - 1
+
+
+def _encode_list(values: Sequence[Any], buffer: bytearray) -> None:
+    # pylint: disable=unidiomatic-typecheck
+    # bool and NumPy values are subclasses of int and float, they are not stored in typed arrays
+    if values and all(type(value) is float for value in values):
+        buffer += b"R" + _SIZE.pack(len(values)) + np.array(values, dtype="<f8").tobytes()
+        return
+
+    if values and all(type(value) is int and _INT_MIN <= value <= _INT_MAX for value in values):
+        buffer += b"I" + _SIZE.pack(len(values)) + np.array(values, dtype="<i8").tobytes()
+        return
+
+    buffer += b"l" + _SIZE.pack(len(values))
+
+    for value in values:
+        _encode(value, buffer)
+
+
+def _encode_array(array: np.ndarray, buffer: bytearray) -> None:
+    if array.dtype.kind not in "biuf":
+        _encode_list(array.tolist(), buffer)
+        return
+
+    dtype = array.dtype.newbyteorder("<") if array.dtype.byteorder == ">" else array.dtype
+    dtype_name = dtype.str.encode("ascii")
+    buffer += b"a" + bytes([len(dtype_name)]) + dtype_name + bytes([array.ndim])
+
+    for dimension in array.shape:
+        buffer += _VALUE_SIZE.pack(dimension)
+
+    buffer += np.ascontiguousarray(array, dtype=dtype).tobytes()
+
+
+def _encode(value: Any, buffer: bytearray) -> None:
+    # pylint: disable=too-many-return-statements
+    if value is None:
+        buffer += b"N"
+        return
+
+    if isinstance(value, (bool, np.bool_)):
+        buffer += b"T" if value else b"F"
+        return
+
+    if isinstance(value, (int, np.integer)):
+        value = int(value)
+        buffer += b"i" + _INT.pack(value) if _INT_MIN <= value <= _INT_MAX else b"n" + _encode_str(str(value))
+        return
+
+    if isinstance(value, (float, np.floating)):
+        buffer += b"f" + _FLOAT.pack(value)
+        return
+
+    if isinstance(value, str):
+        buffer += b"s" + _encode_str(value)
+        return
+
+    if isinstance(value, (list, tuple)):
+        _encode_list(value, buffer)
+        return
+
+    if isinstance(value, np.ndarray):
+        _encode_array(value, buffer)
+        return
+
+    if isinstance(value, dict):
+        buffer += b"d" + _SIZE.pack(len(value))
+
+        for key, item in value.items():
+            _encode(key, buffer)
+            # values sizes allow to skip values that are not read
+            size_position = len(buffer)
+            buffer += _VALUE_SIZE.pack(0)
+            _encode(item, buffer)
+            _VALUE_SIZE.pack_into(buffer, size_position, len(buffer) - size_position - _VALUE_SIZE.size)
+
+        return
+
+    # dataclasses and other types are stored as they are converted for JSON
+    _encode(json_serializer.to_json_type(value), buffer)
+
+
+def _encode_str(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return _SIZE.pack(len(data)) + data
+
+
+class _Decoder:
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.readers: Dict[int, Callable[[int], Tuple[Any, int]]] = {
+            ord("N"): lambda position: (None, position),
+            ord("T"): lambda position: (True, position),
+            ord("F"): lambda position: (False, position),
+            ord("i"): lambda position: (_INT.unpack_from(self.buffer, position)[0], position + _INT.size),
+            ord("n"): self.read_big_int,
+            ord("f"): lambda position: (_FLOAT.unpack_from(self.buffer, position)[0], position + _FLOAT.size),
+            ord("s"): self.read_str,
+            ord("R"): lambda position: self.read_typed_list(position, "<f8"),
+            ord("I"): lambda position: self.read_typed_list(position, "<i8"),
+            ord("a"): self.read_array,
+            ord("l"): self.read_list,
+            ord("d"): self.read_dict,
+        }
+
+    def read_size(self, position: int) -> Tuple[int, int]:
+        return _SIZE.unpack_from(self.buffer, position)[0], position + _SIZE.size
+
+    def read_str(self, position: int) -> Tuple[str, int]:
+        size = _SIZE.unpack_from(self.buffer, position)[0]
+        position += _SIZE.size
+        return str(self.buffer[position:position + size], "utf-8"), position + size
+
+    def read_big_int(self, position: int) -> Tuple[int, int]:
+        value, position = self.read_str(position)
+        return int(value), position
+
+    def read_typed_list(self, position: int, dtype: str) -> Tuple[list, int]:
+        size, position = self.read_size(position)
+        values = np.frombuffer(self.buffer, dtype=dtype, count=size, offset=position)
+        return values.tolist(), position + size * 8
+
+    def read_list(self, position: int) -> Tuple[list, int]:
+        size, position = self.read_size(position)
+        values = []
+
+        for _ in range(size):
+            value, position = self.read(position)
+            values.append(value)
+
+        return values, position
+
+    def read_dict(self, position: int) -> Tuple[dict, int]:
+        size, position = self.read_size(position)
+        result = {}
+
+        for _ in range(size):
+            key, position = self.read(position)
+            result[key], position = self.read(position + _VALUE_SIZE.size)
+
+        return result, position
+
+    def read(self, position: int) -> Tuple[Any, int]:
+        reader = self.readers.get(self.buffer[position])
+
+        if reader is None:
+            raise ValueError(f"Unexpected value type {self.buffer[position:position + 1]!r} in the binary profile")
+
+        return reader(position + 1)
+
+    def read_array(self, position: int) -> Tuple[np.ndarray, int]:
+        dtype_size = self.buffer[position]
+        dtype = np.dtype(str(self.buffer[position + 1:position + 1 + dtype_size], "ascii"))
+        position += 1 + dtype_size
+        ndim = self.buffer[position]
+        position += 1
+        shape: List[int] = []
+
+        for _ in range(ndim):
+            shape.append(_VALUE_SIZE.unpack_from(self.buffer, position)[0])
+            position += _VALUE_SIZE.size
+
+        count = int(np.prod(shape))
+        array = np.frombuffer(self.buffer, dtype=dtype, count=count, offset=position).reshape(shape).copy()
+        return array, position + count * dtype.itemsize
+
+    def find(self, position: int, key: Any) -> int:
+        """Get position of a value by the key in a dict at the position without decoding other values"""
+        if self.buffer[position:position + 1] != b"d":
+            raise KeyError(key)
+
+        size, position = self.read_size(position + 1)
+
+        for _ in range(size):
+            item_key, position = self.read(position)
+            value_size = _VALUE_SIZE.unpack_from(self.buffer, position)[0]
+            position += _VALUE_SIZE.size
+
+            if item_key == key:
+                return position
+
+            position += value_size
+
+        raise KeyError(key)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a profile object to the binary format"""
+    buffer = bytearray(_HEADER.pack(MAGIC, BINARY_FORMAT_VERSION))
+    _encode(obj, buffer)
+    return bytes(buffer)
+
+
+def loads(data: Union[bytes, mmap.mmap], keys: Sequence[Any] = ()) -> Any:
+    """Deserialize a profile object or its part by `keys` path from the binary format"""
+    magic, version = _HEADER.unpack_from(data)
+
+    if magic != MAGIC or version != BINARY_FORMAT_VERSION:
+        raise ValueError("Unsupported binary profile format")
+
+    decoder = _Decoder(data)
+    position = _HEADER.size
+
+    for key in keys:
+        position = decoder.find(position, key)
+
+    return decoder.read(position)[0]
+
+
+def save_profile(obj: Any, path: str, format: str = JSON_FORMAT) -> None:  # pylint: disable=redefined-builtin
+    """Save a profile object to a file in JSON or binary format"""
+    if format == JSON_FORMAT:
+        with open(path, "w", encoding="utf-8") as out_file:
+            json_serializer.dump(obj, out_file)
+
+    elif format == BINARY_FORMAT:
+        with open(path, "wb") as out_file:
+            out_file.write(dumps(obj))
+
+    else:
+        raise ValueError(f"Unexpected profile format {format}, should be '{JSON_FORMAT}' or '{BINARY_FORMAT}'")
+
+
+def load_profile(path: str, keys: Sequence[Any] = ()) -> Any:
+    """Load a profile object saved in JSON or binary format.
+
+    Args:
+        path: a profile file path, the format is detected by the file content
+        keys: a path to a part of the profile to load, for example `["data_drift", "data", "metrics", "feature"]`.
+            In binary format, other parts of the profile are not decoded.
+    """
+    with open(path, "rb") as profile_file:
+        if profile_file.read(len(MAGIC)) != MAGIC:
+            profile_file.seek(0)
+            result = json.load(profile_file)
+
+            for key in keys:
+                result = result[key]
+
+            return result
+
+        with mmap.mmap(profile_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return loads(data, keys)
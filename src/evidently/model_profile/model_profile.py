@@ -1,4 +1,4 @@
-import json
+import os
 from datetime import datetime
 from typing import Any
 from typing import Dict
@@ -6,14 +6,24 @@ from typing import List
 from typing import Optional
 from typing import Type
 from typing import Sequence
+from typing import Union
 
 import pandas
 
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.pipeline.pipeline import Pipeline
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.pipeline.reference_sketch import ReferenceSketch
+from evidently.pipeline.timings import RENDER
+from evidently.pipeline.timings import measure_timings
+from evidently.model_profile.binary_format import JSON_FORMAT
+from evidently.model_profile.binary_format import save_profile
+from evidently.model_profile.partial_profile import DEFAULT_RANDOM_SEED
+from evidently.model_profile.partial_profile import PartialProfile
+from evidently.model_profile.partial_profile import merge_partial_profiles
 from evidently.model_profile.sections.base_profile_section import ProfileSection
-from evidently.utils import NumpyEncoder
+from evidently.utils import json_serializer
+from evidently.utils.data_operations import finite_data_cache
 
 
 class Profile(Pipeline):
@@ -27,17 +37,65 @@ class Profile(Pipeline):
 
     def calculate(
         self,
-        reference_data: pandas.DataFrame,
+        reference_data: Union[pandas.DataFrame, ReferenceSketch],
         current_data: Optional[pandas.DataFrame] = None,
         column_mapping: Optional[ColumnMapping] = None,
     ) -> None:
         self.execute(reference_data, current_data, column_mapping)
 
+    def calculate_partial(
+        self,
+        current_data: pandas.DataFrame,
+        column_mapping: Optional[ColumnMapping] = None,
+        random_seed: int = DEFAULT_RANDOM_SEED,
+    ) -> PartialProfile:
+        """Calculate mergeable statistics of a part of current data, see `evidently.model_profile.partial_profile`.
+
+        Parts of the same data should be calculated with the same `random_seed`, it sets rows samples of parts.
+        """
+        if column_mapping is None:
+            column_mapping = ColumnMapping()
+
+        return PartialProfile.calculate(self.get_analyzers(), current_data, column_mapping, random_seed)
+
+    def calculate_from_partial(
+        self,
+        reference_data: Union[pandas.DataFrame, ReferenceSketch],
+        partial_profiles: Sequence[PartialProfile],
+        column_mapping: Optional[ColumnMapping] = None,
+    ) -> None:
+        """Calculate the profile for current data that is split to parts with partial profiles of the parts"""
+        if column_mapping is None:
+            column_mapping = ColumnMapping()
+
+        partial_profile = merge_partial_profiles(partial_profiles)
+
+        with finite_data_cache():
+            self.analyzers_results = dict(
+                partial_profile.get_results(reference_data, column_mapping, self.options_provider)
+            )
+
+            for stage in self.stages:
+                stage.options_provider = self.options_provider
+                stage.timings = self.timings
+                self._calculate_stage(stage, reference_data, None, column_mapping)
+
     def get_analyzers(self) -> List[Type[Analyzer]]:
         return list({analyzer for tab in self.stages for analyzer in tab.analyzers()})
 
     def json(self) -> str:
-        return json.dumps(self.object(), cls=NumpyEncoder)
+        with measure_timings(self.timings, RENDER, "json") as record:
+            result = json_serializer.dumps(self.object())
+            if record is not None:
+                record.payload_size = len(result.encode("utf-8"))
+        return result
+
+    def save(self, path: str, format: str = JSON_FORMAT) -> None:  # pylint: disable=redefined-builtin
+        """Save the profile to a file in 'json' or 'binary' format, use `load_profile` to load it"""
+        with measure_timings(self.timings, RENDER, format) as record:
+            save_profile(self.object(), path, format)
+            if record is not None:
+                record.payload_size = os.path.getsize(path)
 
     def object(self) -> Dict[str, Any]:
         result: Dict[str, Any] = {part.part_id(): part.get_results() for part in self.stages}
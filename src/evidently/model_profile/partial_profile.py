@@ -0,0 +1,483 @@
+"""Mergeable partial results of profiles for map-reduce calculations over parts of current data.
+
+Each worker calculates a partial profile for its part of current data (for example, for a day or a region),
+partial profiles are sent to one process and the profile is calculated from them with the reference data:
+
+    profile = Profile(sections=[DataDriftProfileSection(), ClassificationPerformanceProfileSection()])
+    # on workers
+    partial_profile = profile.calculate_partial(current_data_part, column_mapping)
+    # on the reducer
+    profile.calculate_from_partial(reference_data, partial_profiles, column_mapping)
+    profile.json()
+
+Partial profiles keep statistics of current data instead of its rows and can be pickled.
+The results are the same as the profile gives for the concatenated current data, except for:
+
+- numerical features drift, data quality quantiles, unique and most common values: they are exact while
+    sketches keep all values (see `evidently.analyzers.data_quality_accumulators`) and approximate for bigger data
+- data quality correlations, regression error normality, underperformance and error bias: they are calculated
+    for a uniform random sample of `ROWS_SAMPLE_SIZE` rows, so they are exact for smaller data. The sample
+    depends on `random_seed` of `Profile.calculate_partial` and on the parts data, so the same parts give
+    the same profile.
+"""
+import copy
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Type
+from typing import Union
+from typing import cast
+
+import numpy as np
+import pandas as pd
+
+from evidently.analyzers.base_analyzer import Analyzer
+from evidently.analyzers.base_analyzer import BaseAnalyzerResult
+from evidently.analyzers.classification_performance_analyzer import ClassificationPerformanceAnalyzer
+from evidently.analyzers.classification_performance_analyzer import ClassificationPerformanceAnalyzerResults
+from evidently.analyzers.classification_performance_analyzer import calculate_performance_metrics
+from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
+from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzerResults
+from evidently.analyzers.data_quality_accumulators import DataQualityStatsAccumulator
+from evidently.analyzers.data_quality_accumulators import NumericMoments
+from evidently.analyzers.data_quality_accumulators import QuantileSketch
+from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
+from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzerResults
+from evidently.analyzers.data_quality_analyzer import set_values_representation_stats
+from evidently.analyzers.regression_performance_analyzer import RegressionPerformanceAnalyzer
+from evidently.analyzers.regression_performance_analyzer import RegressionPerformanceAnalyzerResults
+from evidently.analyzers.utils import DatasetColumns
+from evidently.analyzers.utils import process_columns
+from evidently.options import OptionsProvider
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.pipeline.pipeline import _calculate_analyzer
+from evidently.pipeline.reference_sketch import ReferenceSketch
+from evidently.utils.data_operations import get_finite_data
+
+ROWS_SAMPLE_SIZE = 2 ** 16
+DEFAULT_RANDOM_SEED = 1
+
+
+def _add_counts(counts: Optional[pd.Series], new_counts: pd.Series) -> pd.Series:
+    if counts is None or counts.empty:
+        return new_counts
+
+    if new_counts.empty:
+        return counts
+
+    # values are kept in order of their first appearance, as `value_counts(sort=False)` gives them
+    levels = list(range(counts.index.nlevels))
+    return pd.concat([counts, new_counts]).groupby(level=levels, sort=False).sum()
+
+
+def _pad_with_nan(values: pd.Series, size: int) -> pd.Series:
+    if len(values) >= size:
+        return values
+
+    return pd.concat([values, pd.Series([np.nan] * (size - len(values)))], ignore_index=True)
+
+
+class RowsSample:
+    """Mergeable uniform random sample of no more than `size` rows: rows with the smallest random keys are kept.
+
+    The rows order is kept, so a sample of data with no more than `size` rows is the data itself.
+    Keys of each added dataset are generated from `random_seed` and a hash of the dataset, so the same datasets
+    give the same sample, and datasets with different rows get independent keys.
+    """
+
+    def __init__(self, size: int = ROWS_SAMPLE_SIZE, random_seed: int = DEFAULT_RANDOM_SEED):
+        self.size = size
+        self.random_seed = random_seed
+        self.data: Optional[pd.DataFrame] = None
+        self.keys = np.empty(0)
+
+    def update(self, data: pd.DataFrame) -> None:
+        data_hash = int(pd.util.hash_pandas_object(data, index=False).to_numpy().sum(dtype=np.uint64))
+        random_generator = np.random.default_rng([self.random_seed, data_hash])
+        self._add(data, random_generator.random(data.shape[0]))
+
+    def merge(self, other: "RowsSample") -> None:
+        if other.random_seed != self.random_seed:
+            raise ValueError("rows samples should have the same random seed")
+
+        if other.data is not None:
+            self._add(other.data, other.keys)
+
+    def _add(self, data: pd.DataFrame, keys: np.ndarray) -> None:
+        if self.data is None:
+            data = data.reset_index(drop=True)
+
+        else:
+            data = pd.concat([self.data, data], ignore_index=True)
+            keys = np.concatenate([self.keys, keys])
+
+        if len(keys) > self.size:
+            selected = np.sort(np.argpartition(keys, self.size - 1)[:self.size])
+            data = data.iloc[selected].reset_index(drop=True)
+            keys = keys[selected]
+
+        self.data = data
+        self.keys = keys
+
+
+class AnalyzerState:
+    """Mergeable statistics of current data parts that are enough to calculate analyzer results"""
+
+    analyzer: Type[Analyzer]
+
+    def __init__(self, columns: DatasetColumns, random_seed: int = DEFAULT_RANDOM_SEED):
+        self.columns = columns
+        self.random_seed = random_seed
+
+    def update(self, current_data: pd.DataFrame) -> None:
+        raise NotImplementedError()
+
+    def merge(self, other: "AnalyzerState") -> None:
+        raise NotImplementedError()
+
+    def get_results(
+        self,
+        reference_data: Union[pd.DataFrame, ReferenceSketch],
+        column_mapping: ColumnMapping,
+        options_provider: OptionsProvider,
+    ) -> BaseAnalyzerResult:
+        raise NotImplementedError()
+
+
+class DataDriftState(AnalyzerState):
+    """Value counts of categorical features and quantile sketches of numerical features.
+
+    Drift is calculated for current data restored from the statistics, features drift does not depend on rows order.
+    """
+
+    analyzer = DataDriftAnalyzer
+
+    def __init__(self, columns: DatasetColumns, random_seed: int = DEFAULT_RANDOM_SEED):
+        super().__init__(columns, random_seed)
+        self.rows_count = 0
+        self.value_counts: Dict[str, Optional[pd.Series]] = dict.fromkeys(columns.cat_feature_names)
+        self.quantiles = {feature_name: QuantileSketch() for feature_name in columns.num_feature_names}
+
+    def update(self, current_data: pd.DataFrame) -> None:
+        self.rows_count += current_data.shape[0]
+
+        for feature_name, counts in self.value_counts.items():
+            self.value_counts[feature_name] = _add_counts(counts, current_data[feature_name].value_counts(sort=False))
+
+        for feature_name, sketch in self.quantiles.items():
+            values = current_data[feature_name].to_numpy(dtype=np.float64, na_value=np.nan)
+            sketch.update(values[~np.isnan(values)])
+
+    def merge(self, other: AnalyzerState) -> None:
+        assert isinstance(other, DataDriftState)
+        self.rows_count += other.rows_count
+
+        for feature_name, counts in self.value_counts.items():
+            self.value_counts[feature_name] = _add_counts(counts, other.value_counts[feature_name])
+
+        for feature_name, sketch in self.quantiles.items():
+            sketch.merge(other.quantiles[feature_name])
+
+    def get_current_data(self) -> pd.DataFrame:
+        """Restore features values of current data, rows are not kept"""
+        features = {}
+
+        for feature_name, counts in self.value_counts.items():
+            values = pd.Series(dtype=object) if counts is None else pd.Series(counts.index.repeat(counts.to_numpy()))
+            features[feature_name] = _pad_with_nan(values, self.rows_count)
+
+        for feature_name, sketch in self.quantiles.items():
+            values = pd.Series(np.repeat(sketch.values, np.round(sketch.weights).astype(np.int64)))
+            features[feature_name] = _pad_with_nan(values, self.rows_count)
+
+        return pd.DataFrame(features)
+
+    def get_results(
+        self,
+        reference_data: Union[pd.DataFrame, ReferenceSketch],
+        column_mapping: ColumnMapping,
+        options_provider: OptionsProvider,
+    ) -> DataDriftAnalyzerResults:
+        return cast(
+            DataDriftAnalyzerResults,
+            _calculate_analyzer(
+                DataDriftAnalyzer, options_provider, reference_data, self.get_current_data(), column_mapping
+            ),
+        )
+
+
+class DataQualityState(AnalyzerState):
+    """Data quality stats accumulator and a rows sample for correlations"""
+
+    analyzer = DataQualityAnalyzer
+
+    def __init__(self, columns: DatasetColumns, random_seed: int = DEFAULT_RANDOM_SEED):
+        super().__init__(columns, random_seed)
+        self.accumulator = DataQualityStatsAccumulator(columns)
+        self.sample = RowsSample(random_seed=random_seed)
+        self.sample_columns = list(columns.num_feature_names) + list(columns.cat_feature_names)
+        self.sample_columns.extend(columns.datetime_feature_names)
+
+        for column in (columns.utility_columns.date, columns.utility_columns.target):
+            if column is not None:
+                self.sample_columns.append(column)
+
+    def update(self, current_data: pd.DataFrame) -> None:
+        self.accumulator.update(current_data)
+        self.sample.update(current_data[[column for column in self.sample_columns if column in current_data]])
+
+    def merge(self, other: AnalyzerState) -> None:
+        assert isinstance(other, DataQualityState)
+        self.accumulator.merge(other.accumulator)
+        self.sample.merge(other.sample)
+
+    def get_results(
+        self,
+        reference_data: pd.DataFrame,
+        column_mapping: ColumnMapping,
+        options_provider: OptionsProvider,
+    ) -> DataQualityAnalyzerResults:
+        # reference stats and current correlations are calculated by the analyzer, current stats are replaced
+        result = cast(
+            DataQualityAnalyzerResults,
+            _calculate_analyzer(
+                DataQualityAnalyzer, options_provider, reference_data, self.sample.data, column_mapping
+            ),
+        )
+
+        if self.sample.data is None:
+            return result
+
+        self.accumulator.task = DataQualityAnalyzer.get_task(
+            reference_data, column_mapping, result.columns.utility_columns.target
+        )
+        current_features_stats = self.accumulator.get_stats()
+        accumulators = dict(self.accumulator.cat_features)
+        all_cat_features = dict(current_features_stats.cat_features_stats or {})
+
+        target_column = self.columns.utility_columns.target
+
+        if self.accumulator.get_task() == "classification" and current_features_stats.target_stats is not None:
+            assert isinstance(target_column, str) and self.accumulator.target is not None
+            accumulators[target_column] = self.accumulator.target
+            all_cat_features.update(current_features_stats.target_stats)
+
+        for feature_name, feature_stats in all_cat_features.items():
+            # values of frequent values sketches are all values while their number is less than the capacity
+            accumulator = accumulators[feature_name]
+            current_values_set = set(accumulator.frequent_values.counts.index)
+
+            if accumulator.missing_count > 0:
+                current_values_set.add(np.nan)
+
+            if feature_name in reference_data:
+                reference_values_set = set(reference_data[feature_name].unique())
+
+            else:
+                reference_values_set = set()
+
+            set_values_representation_stats(feature_stats, reference_values_set, current_values_set)
+
+        result.current_features_stats = current_features_stats
+        return result
+
+
+class ClassificationPerformanceState(AnalyzerState):
+    """Counts of target and prediction values pairs"""
+
+    analyzer = ClassificationPerformanceAnalyzer
+
+    def __init__(self, columns: DatasetColumns, random_seed: int = DEFAULT_RANDOM_SEED):
+        super().__init__(columns, random_seed)
+        self.counts: Optional[pd.Series] = None
+
+    def update(self, current_data: pd.DataFrame) -> None:
+        target_column = self.columns.utility_columns.target
+        prediction_column = self.columns.utility_columns.prediction
+
+        if target_column is None or prediction_column is None:
+            return
+
+        if not isinstance(target_column, str) or not isinstance(prediction_column, str):
+            raise ValueError("target and prediction should not be a sequence")
+
+        data = get_finite_data(current_data)
+        self.counts = _add_counts(self.counts, data.groupby([target_column, prediction_column], sort=False).size())
+
+    def merge(self, other: AnalyzerState) -> None:
+        assert isinstance(other, ClassificationPerformanceState)
+        if other.counts is not None:
+            self.counts = _add_counts(self.counts, other.counts)
+
+    def get_results(
+        self,
+        reference_data: pd.DataFrame,
+        column_mapping: ColumnMapping,
+        options_provider: OptionsProvider,
+    ) -> ClassificationPerformanceAnalyzerResults:
+        result = cast(
+            ClassificationPerformanceAnalyzerResults,
+            _calculate_analyzer(
+                ClassificationPerformanceAnalyzer, options_provider, reference_data, None, column_mapping
+            ),
+        )
+
+        if result.reference_metrics is not None and self.counts is not None and not self.counts.empty:
+            result.current_metrics = calculate_performance_metrics(
+                pd.Series(self.counts.index.get_level_values(0)),
+                pd.Series(self.counts.index.get_level_values(1)),
+                result.columns.target_names,
+                self.counts.to_numpy(),
+            )
+
+        return result
+
+
+class RegressionPerformanceState(AnalyzerState):
+    """Moments of errors and a rows sample for error normality, underperformance and error bias"""
+
+    analyzer = RegressionPerformanceAnalyzer
+
+    def __init__(self, columns: DatasetColumns, random_seed: int = DEFAULT_RANDOM_SEED):
+        super().__init__(columns, random_seed)
+        self.errors = NumericMoments()
+        self.abs_errors = NumericMoments()
+        self.abs_perc_errors = NumericMoments()
+        self.sample = RowsSample(random_seed=random_seed)
+
+    def update(self, current_data: pd.DataFrame) -> None:
+        target_column = self.columns.utility_columns.target
+        prediction_column = self.columns.utility_columns.prediction
+
+        if target_column is None or prediction_column is None:
+            return
+
+        data = get_finite_data(current_data)
+        target = data[target_column].to_numpy(dtype=np.float64)
+        error = data[prediction_column].to_numpy(dtype=np.float64) - target
+        self.errors.update(error)
+        self.abs_errors.update(np.abs(error))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # zero target values give infinite and NaN values as in the analyzer
+            self.abs_perc_errors.update(100. * np.abs(error) / target)
+
+        sample_columns = [target_column, prediction_column]
+        sample_columns.extend(self.columns.num_feature_names)
+        sample_columns.extend(self.columns.cat_feature_names)
+        self.sample.update(data[sample_columns])
+
+    def merge(self, other: AnalyzerState) -> None:
+        assert isinstance(other, RegressionPerformanceState)
+        self.errors.merge(other.errors)
+        self.abs_errors.merge(other.abs_errors)
+        self.abs_perc_errors.merge(other.abs_perc_errors)
+        self.sample.merge(other.sample)
+
+    def get_results(
+        self,
+        reference_data: pd.DataFrame,
+        column_mapping: ColumnMapping,
+        options_provider: OptionsProvider,
+    ) -> RegressionPerformanceAnalyzerResults:
+        result = cast(
+            RegressionPerformanceAnalyzerResults,
+            _calculate_analyzer(
+                RegressionPerformanceAnalyzer, options_provider, reference_data, self.sample.data, column_mapping
+            ),
+        )
+        metrics = result.current_metrics
+
+        if metrics is not None:
+            # mean errors are exact for all rows, not only for the sample
+            mean_error, error_std = self.errors.get_mean_and_std()
+            mean_abs_error, abs_error_std = self.abs_errors.get_mean_and_std()
+            mean_abs_perc_error, abs_perc_error_std = self.abs_perc_errors.get_mean_and_std()
+            metrics.mean_error = float(mean_error)
+            metrics.error_std = float(error_std)
+            metrics.mean_abs_error = float(mean_abs_error)
+            metrics.abs_error_std = float(abs_error_std)
+            metrics.mean_abs_perc_error = float(mean_abs_perc_error)
+            metrics.abs_perc_error_std = float(abs_perc_error_std)
+
+        return result
+
+
+MERGEABLE_ANALYZERS: Dict[Type[Analyzer], Type[AnalyzerState]] = {
+    DataDriftAnalyzer: DataDriftState,
+    DataQualityAnalyzer: DataQualityState,
+    ClassificationPerformanceAnalyzer: ClassificationPerformanceState,
+    RegressionPerformanceAnalyzer: RegressionPerformanceState,
+}
+
+
+class PartialProfile:
+    """Mergeable statistics of a part of current data for profile analyzers, see `Profile.calculate_partial`"""
+
+    def __init__(self, states: Dict[Type[Analyzer], AnalyzerState]):
+        self.states = states
+
+    @classmethod
+    def calculate(
+        cls,
+        analyzers: Sequence[Type[Analyzer]],
+        current_data: pd.DataFrame,
+        column_mapping: ColumnMapping,
+        random_seed: int = DEFAULT_RANDOM_SEED,
+    ) -> "PartialProfile":
+        unsupported_analyzers = [analyzer.__name__ for analyzer in analyzers if analyzer not in MERGEABLE_ANALYZERS]
+
+        if unsupported_analyzers:
+            raise ValueError(f"Partial profiles cannot be calculated for analyzers: {', '.join(unsupported_analyzers)}")
+
+        columns = process_columns(current_data, column_mapping)
+        states = {}
+
+        for analyzer in dict.fromkeys(analyzers):
+            state = MERGEABLE_ANALYZERS[analyzer](columns, random_seed)
+            state.update(current_data)
+            states[analyzer] = state
+
+        return cls(states)
+
+    def merge(self, other: "PartialProfile") -> "PartialProfile":
+        """Add statistics of another partial profile of the same sections, the partial profile itself is returned"""
+        if set(self.states) != set(other.states):
+            raise ValueError("partial profiles should be calculated for the same sections")
+
+        for analyzer, state in self.states.items():
+            state.merge(other.states[analyzer])
+
+        return self
+
+    def get_results(
+        self,
+        reference_data: Union[pd.DataFrame, ReferenceSketch],
+        column_mapping: ColumnMapping,
+        options_provider: OptionsProvider,
+    ) -> Dict[Type[Analyzer], BaseAnalyzerResult]:
+        if isinstance(reference_data, ReferenceSketch):
+            unsupported_analyzers = [
+                analyzer.__name__ for analyzer in self.states if not analyzer.supports_reference_sketch
+            ]
+
+            if unsupported_analyzers:
+                raise ValueError(f"Reference sketch cannot be used with analyzers: {', '.join(unsupported_analyzers)}")
+
+        return {
+            analyzer: state.get_results(reference_data, column_mapping, options_provider)
+            for analyzer, state in self.states.items()
+        }
+
+
+def merge_partial_profiles(partial_profiles: Sequence[PartialProfile]) -> PartialProfile:
+    """Merge partial profiles into a new one, the partial profiles are not changed"""
+    if not partial_profiles:
+        raise ValueError("partial_profiles should contain at least one partial profile")
+
+    result = copy.deepcopy(partial_profiles[0])
+
+    for partial_profile in partial_profiles[1:]:
+        result.merge(partial_profile)
+
+    return result
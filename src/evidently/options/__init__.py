@@ -2,6 +2,9 @@ from typing import TypeVar, Generic, Type, Dict, Any
 
 from .color_scheme import ColorOptions
 from .data_drift import DataDriftOptions
+from .data_quality import DataQualityOptions
+from .execution import ExecutionOptions
+from .plot import PlotOptions
 from .quality_metrics import QualityMetricsOptions
 
 TypeParam = TypeVar('TypeParam')
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+CORRELATION_KINDS = ("pearson", "spearman", "kendall", "cramer_v")
+RANK_CORRELATION_KINDS = ("spearman", "kendall")
+DEFAULT_SAMPLE_RANDOM_STATE = 0
+
+
+@dataclass
+class DataQualityOptions:
+    """Options for data quality calculations
+
+    - correlation_kinds - correlation matrices to calculate: `pearson`, `spearman`, `kendall` and `cramer_v`.
+        All by default.
+    - rank_correlations_max_rows - if a dataset has more rows, `spearman` and `kendall` correlations
+        are calculated on a random sample of this size. If None (default), all rows are used.
+    - sample_random_state - random state for the sample, the same dataset gives the same sample.
+    """
+    correlation_kinds: Sequence[str] = CORRELATION_KINDS
+    rank_correlations_max_rows: Optional[int] = None
+    sample_random_state: int = DEFAULT_SAMPLE_RANDOM_STATE
+
+    def as_dict(self):
+        return {
+            "correlation_kinds": list(self.correlation_kinds),
+            "rank_correlations_max_rows": self.rank_correlations_max_rows,
+            "sample_random_state": self.sample_random_state,
+        }
+
+    def get_correlation_kinds(self) -> Sequence[str]:
+        unknown_kinds = [kind for kind in self.correlation_kinds if kind not in CORRELATION_KINDS]
+
+        if unknown_kinds:
+            raise ValueError(f"Unknown correlation kinds: {', '.join(unknown_kinds)}, "
+                             f"expected: {', '.join(CORRELATION_KINDS)}")
+
+        return [kind for kind in CORRELATION_KINDS if kind in self.correlation_kinds]
+
+    def get_rows_limit(self, kind: str) -> Optional[int]:
+        """Get maximum number of rows for calculating a correlation of the kind, None if there is no limit"""
+        if kind not in RANK_CORRELATION_KINDS:
+            return None
+
+        if self.rank_correlations_max_rows is not None and self.rank_correlations_max_rows < 2:
+            raise ValueError("DataQualityOptions.rank_correlations_max_rows should be >= 2")
+
+        return self.rank_correlations_max_rows
@@ -0,0 +1,58 @@
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+SERIAL_EXECUTOR = "serial"
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
+
+
+@dataclass
+class ExecutionOptions:
+    """Options for running pipeline calculations
+
+    - executor - how analyzers are calculated:
+        - `serial` - one by one in the caller thread (default)
+        - `thread` - concurrently in a thread pool
+        - `process` - concurrently in a process pool. Analyzers, options and data should be picklable.
+    - max_workers - the pool size, if None - the default for the executor type is used.
+
+    Pipeline stages (tabs, profile sections and monitors) keep their state in the caller process,
+    so they are calculated in a thread pool for both `thread` and `process` executors.
+    """
+    executor: str = SERIAL_EXECUTOR
+    max_workers: Optional[int] = None
+
+    def as_dict(self):
+        return {
+            "executor": self.executor,
+            "max_workers": self.max_workers,
+        }
+
+    def is_serial(self) -> bool:
+        self._validate()
+        return self.executor == SERIAL_EXECUTOR
+
+    def is_process_based(self) -> bool:
+        self._validate()
+        return self.executor == PROCESS_EXECUTOR
+
+    def create_analyzers_executor(self) -> Executor:
+        if self.is_process_based():
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def create_stages_executor(self) -> Executor:
+        self._validate()
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _validate(self):
+        if self.executor not in (SERIAL_EXECUTOR, THREAD_EXECUTOR, PROCESS_EXECUTOR):
+            raise ValueError(f"Unexpected executor type {self.executor}, "
+                             f"expected: {SERIAL_EXECUTOR}, {THREAD_EXECUTOR} or {PROCESS_EXECUTOR}")
+
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError("ExecutionOptions.max_workers should be >= 1")
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import Optional
+
+
+@dataclass
+class PlotOptions:
+    """Options for plots in dashboard widgets
+
+    - max_points - if set, scatter plots and time series in widgets are downsampled to about this number
+        of points for each plotted dataset, so dashboards size does not depend on the number of rows.
+        Downsampling is deterministic: scatter plots keep points from all dense and sparse regions
+        (and all classes or error bias groups), time series keep their shape (largest triangle three buckets).
+        If None (default), all rows are plotted.
+    - widgets_max_points - points budgets for widgets by their class names, for example
+        `{"RegPredActualWidget": 5000}`. They override `max_points`, None value disables downsampling for the widget.
+    """
+    max_points: Optional[int] = None
+    widgets_max_points: Dict[str, Optional[int]] = field(default_factory=dict)
+
+    def as_dict(self):
+        return {
+            "max_points": self.max_points,
+            "widgets_max_points": self.widgets_max_points,
+        }
+
+    def get_max_points(self, widget_type: str) -> Optional[int]:
+        max_points = self.widgets_max_points.get(widget_type, self.max_points)
+
+        if max_points is not None and max_points < 3:
+            raise ValueError("PlotOptions points budget should be >= 3")
+
+        return max_points
@@ -7,15 +7,22 @@ DEFAULT_CLASSIFICATION_THRESHOLD = 0.5
 
 @dataclass
 class QualityMetricsOptions:
+    """Options for quality metrics calculations
+
+    - max_curve_points - if set, ROC and PR curves are approximated with at most this number of points
+        (Ramer-Douglas-Peucker algorithm). If None (default), all points of the curves are kept.
+    """
     conf_interval_n_sigmas: int = DEFAULT_CONF_INTERVAL_SIZE
     classification_threshold: float = DEFAULT_CLASSIFICATION_THRESHOLD
     cut_quantile: Union[None, Tuple[str, float], Dict[str, Tuple[str, float]]] = None
+    max_curve_points: Optional[int] = None
 
     def as_dict(self):
         return {
             "conf_interval_n_sigmas": self.conf_interval_n_sigmas,
             "classification_threshold": self.classification_threshold,
-            "cut_quantile": self.cut_quantile
+            "cut_quantile": self.cut_quantile,
+            "max_curve_points": self.max_curve_points,
         }
 
     def get_cut_quantile(self, feature_name: str) -> Optional[Tuple[str, float]]:
@@ -1,12 +1,53 @@
 import itertools
-from typing import List, Dict, Type, Sequence, Optional
+from typing import List, Dict, Type, Sequence, Optional, Tuple, Union
 
 import pandas
 
 from evidently.analyzers.base_analyzer import Analyzer
+from evidently.analyzers.base_analyzer import BaseAnalyzerResult
+from evidently.analyzers.utils import process_columns
+from evidently.options import ExecutionOptions
 from evidently.options import OptionsProvider
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.pipeline.reference_sketch import ReferenceSketch
 from evidently.pipeline.stage import PipelineStage
+from evidently.pipeline.timings import ANALYZER
+from evidently.pipeline.timings import PIPELINE
+from evidently.pipeline.timings import STAGE
+from evidently.pipeline.timings import TimingRecord
+from evidently.pipeline.timings import Timings
+from evidently.pipeline.timings import measure_timings
+from evidently.utils.data_operations import finite_data_cache
+
+
+def _calculate_analyzer(
+    analyzer: Type[Analyzer],
+    options_provider: OptionsProvider,
+    reference_data: Union[pandas.DataFrame, ReferenceSketch],
+    current_data: Optional[pandas.DataFrame],
+    column_mapping: ColumnMapping,
+) -> BaseAnalyzerResult:
+    # module level function for picklability in process pools
+    instance = analyzer()
+    instance.options_provider = options_provider
+    return instance.calculate(reference_data, current_data, column_mapping)
+
+
+def _calculate_analyzer_with_timings(
+    analyzer: Type[Analyzer],
+    options_provider: OptionsProvider,
+    reference_data: Union[pandas.DataFrame, ReferenceSketch],
+    current_data: Optional[pandas.DataFrame],
+    column_mapping: ColumnMapping,
+    trace_memory: bool,
+) -> Tuple[BaseAnalyzerResult, TimingRecord]:
+    # timings of pools workers are returned with results and added to the pipeline timings
+    timings = Timings(trace_memory=trace_memory)
+
+    with timings.measure(ANALYZER, analyzer.__name__):
+        result = _calculate_analyzer(analyzer, options_provider, reference_data, current_data, column_mapping)
+
+    return result, timings.records[0]
 
 
 class Pipeline:
@@ -14,11 +55,14 @@ class Pipeline:
     stages: Sequence[PipelineStage]
     analyzers_results: Dict[Type[Analyzer], object]
     options_provider: OptionsProvider
+    # set timings to record time and memory of analyzers, stages and widgets, see `evidently.pipeline.timings`
+    timings: Optional[Timings]
 
     def __init__(self, stages: Sequence[PipelineStage], options: list):
         self.stages = stages
         self.analyzers_results = {}
         self.options_provider = OptionsProvider()
+        self.timings = None
         self._analyzers = list(itertools.chain.from_iterable([stage.analyzers() for stage in stages]))
         for option in options:
             self.options_provider.add(option)
@@ -26,26 +70,104 @@ class Pipeline:
     def get_analyzers(self) -> List[Type[Analyzer]]:
         return self._analyzers
 
+    def _calculate_stage(
+        self,
+        stage: PipelineStage,
+        reference_data: Union[pandas.DataFrame, ReferenceSketch],
+        current_data: Optional[pandas.DataFrame],
+        column_mapping: ColumnMapping,
+        parent_id: Optional[int] = None,
+    ) -> None:
+        with measure_timings(self.timings, STAGE, type(stage).__name__, parent_id):
+            stage.calculate(reference_data, current_data, column_mapping, self.analyzers_results)
+
     def execute(
         self,
-        reference_data: pandas.DataFrame,
+        reference_data: Union[pandas.DataFrame, ReferenceSketch],
         current_data: Optional[pandas.DataFrame] = None,
         column_mapping: Optional[ColumnMapping] = None,
     ) -> None:
         if column_mapping is None:
             column_mapping = ColumnMapping()
 
-        #  making shallow copy - this copy DOES NOT copy existing data, but contains link to it:
-        #  - this copy WILL DISCARD all columns changes or rows changes (adding or removing)
-        #  - this copy WILL KEEP all values' changes in existing rows and columns.
-        rdata = reference_data.copy()
-        cdata = None if current_data is None else current_data.copy()
-        for analyzer in self.get_analyzers():
-            instance = analyzer()
-            instance.options_provider = self.options_provider
-            self.analyzers_results[analyzer] = instance.calculate(rdata, cdata, column_mapping)
+        execution_options = self.options_provider.get(ExecutionOptions)
+        # the same analyzer can be requested by several stages, calculate it once
+        analyzers = list(dict.fromkeys(self.get_analyzers()))
+
+        if isinstance(reference_data, ReferenceSketch):
+            unsupported_analyzers = [
+                analyzer.__name__ for analyzer in analyzers if not analyzer.supports_reference_sketch
+            ]
+
+            if unsupported_analyzers:
+                raise ValueError(f"Reference sketch cannot be used with analyzers: {', '.join(unsupported_analyzers)}")
+
         for stage in self.stages:
             stage.options_provider = self.options_provider
-            stage.calculate(
-                rdata.copy(), None if cdata is None else cdata.copy(), column_mapping, self.analyzers_results
-            )
+            stage.timings = self.timings
+
+        # analyzers and stages get the same datasets without copying, they should not change them.
+        # Use `evidently.utils.data_operations` for read-only data transformations.
+        with measure_timings(self.timings, PIPELINE, type(self).__name__), finite_data_cache():
+            if analyzers:
+                # columns types are resolved once and analyzers get them from the cache,
+                # in process pools each worker process resolves them for itself
+                process_columns(
+                    reference_data.schema if isinstance(reference_data, ReferenceSketch) else reference_data,
+                    column_mapping,
+                )
+
+            if execution_options.is_serial():
+                for analyzer in analyzers:
+                    with measure_timings(self.timings, ANALYZER, analyzer.__name__):
+                        self.analyzers_results[analyzer] = _calculate_analyzer(
+                            analyzer, self.options_provider, reference_data, current_data, column_mapping
+                        )
+
+                for stage in self.stages:
+                    self._calculate_stage(stage, reference_data, current_data, column_mapping)
+
+                return
+
+            with execution_options.create_analyzers_executor() as executor:
+                futures = [
+                    executor.submit(
+                        _calculate_analyzer,
+                        analyzer,
+                        self.options_provider,
+                        reference_data,
+                        current_data,
+                        column_mapping,
+                    )
+                    if self.timings is None else
+                    executor.submit(
+                        _calculate_analyzer_with_timings,
+                        analyzer,
+                        self.options_provider,
+                        reference_data,
+                        current_data,
+                        column_mapping,
+                        self.timings.trace_memory,
+                    )
+                    for analyzer in analyzers
+                ]
+                # collect results in analyzers order to keep them deterministic
+                for analyzer, future in zip(analyzers, futures):
+                    if self.timings is None:
+                        self.analyzers_results[analyzer] = future.result()
+
+                    else:
+                        self.analyzers_results[analyzer], record = future.result()
+                        self.timings.add(record)
+
+            # stages keep their results in their own state, so they are calculated in the current process
+            parent_id = self.timings.current_span_id() if self.timings is not None else None
+
+            with execution_options.create_stages_executor() as executor:
+                futures = [
+                    executor.submit(self._calculate_stage, stage, reference_data, current_data, column_mapping,
+                                    parent_id)
+                    for stage in self.stages
+                ]
+                for future in futures:
+                    future.result()
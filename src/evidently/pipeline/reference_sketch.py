@@ -0,0 +1,200 @@
+"""Precalculated statistics of a reference dataset that can be used instead of the dataset for drift calculations.
+
+The reference dataset is usually fixed for a long time, so its sorted values, quantile bins and category counts
+can be calculated once, saved to disk and used for many drift calculations with different current datasets:
+
+    sketch = ReferenceSketch.build(reference_data, column_mapping)
+    sketch.save("reference.sketch")
+    ...
+    profile = Profile(sections=[DataDriftProfileSection()])
+    profile.calculate(ReferenceSketch.load("reference.sketch"), current_data, column_mapping)
+
+Only analyzers with `supports_reference_sketch` attribute can get a sketch as reference data.
+"""
+import dataclasses
+import pickle
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from evidently.analyzers.utils import process_columns
+from evidently.pipeline.column_mapping import ColumnMapping
+
+SKETCH_FORMAT_VERSION = 1
+# numerical features with more unique values are split to quantile bins for psi, kl_div and jensenshannon tests
+MAX_UNIQUE_VALUES_WITHOUT_BINS = 20
+DEFAULT_N_BINS = 30
+
+
+def get_n_quantiles(n_unique: int, n_bins: int) -> int:
+    """Get number of quantile bins for a numerical feature with `n_unique` values"""
+    if n_unique < 50:
+        return 15
+
+    return n_bins
+
+
+@dataclasses.dataclass
+class ColumnSketch:
+    """Precalculated statistics of a reference dataset column
+
+    - n_rows - number of values including NaN values
+    - n_unique - number of unique values without NaN values
+    - sorted_values - for numerical features, values as float64 sorted array, NaN values are at the end
+    - mean - for numerical features, mean of values without NaN values
+    - value_counts - for categorical features and numerical features with a few unique values,
+        the same as `pandas.Series.value_counts()` result
+    - unique_values - all unique values including NaN in order of appearance, if value_counts is present
+    - quantile_bins - quantile bins edges and reference values counts in the bins by number of quantiles
+    """
+    n_rows: int
+    n_unique: int
+    sorted_values: Optional[np.ndarray] = None
+    mean: Optional[float] = None
+    value_counts: Optional[pd.Series] = None
+    unique_values: Optional[List[Any]] = None
+    quantile_bins: Dict[int, Tuple[np.ndarray, np.ndarray]] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def build(cls, column: pd.Series, feature_type: str, n_bins: int = DEFAULT_N_BINS) -> "ColumnSketch":
+        n_unique = column.nunique()
+        sketch = cls(n_rows=len(column), n_unique=n_unique)
+
+        if feature_type == "num":
+            sketch.sorted_values = np.sort(column.to_numpy(dtype=np.float64, na_value=np.nan))
+            sketch.mean = np.mean(column)
+
+        if feature_type == "cat" or n_unique <= MAX_UNIQUE_VALUES_WITHOUT_BINS:
+            sketch.value_counts = column.value_counts()
+            sketch.unique_values = list(column.unique())
+
+        else:
+            sketch.get_quantile_bins(get_n_quantiles(n_unique, n_bins))
+
+        return sketch
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def dropna(self) -> "ColumnSketch":
+        """Get a sketch of the column without NaN values"""
+        n_values = self.n_rows
+
+        if self.sorted_values is not None:
+            n_values = int(np.count_nonzero(~np.isnan(self.sorted_values)))
+
+        elif self.value_counts is not None:
+            n_values = int(self.value_counts.sum())
+
+        if n_values == self.n_rows:
+            return self
+
+        return dataclasses.replace(
+            self,
+            n_rows=n_values,
+            sorted_values=None if self.sorted_values is None else self.sorted_values[:n_values],
+            unique_values=None if self.unique_values is None else [
+                value for value in self.unique_values if not pd.isnull(value)
+            ],
+        )
+
+    def get_quantile_bins(self, n_quantiles: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get edges of quantile bins and reference values counts in them, the same as
+        `pd.qcut(..., n_quantiles, retbins=True, duplicates='drop')` and `np.histogram` give for the column."""
+        if n_quantiles not in self.quantile_bins:
+            if self.sorted_values is None:
+                raise ValueError("Quantile bins are available for numerical features only")
+
+            _, bins = pd.qcut(self.sorted_values, n_quantiles, retbins=True, duplicates="drop")
+            self.quantile_bins[n_quantiles] = (bins, np.histogram(self.sorted_values, bins)[0])
+
+        return self.quantile_bins[n_quantiles]
+
+    def to_series(self) -> pd.Series:
+        """Restore column values as a series, values order is not kept"""
+        if self.sorted_values is not None:
+            return pd.Series(self.sorted_values)
+
+        if self.value_counts is None:
+            raise ValueError("Values of the column are not present in the sketch")
+
+        values = pd.Series(self.value_counts.index.repeat(self.value_counts.to_numpy()))
+        n_nans = self.n_rows - len(values)
+
+        if n_nans > 0:
+            values = pd.concat([values, pd.Series([np.nan] * n_nans)], ignore_index=True)
+
+        return values
+
+
+@dataclasses.dataclass
+class ReferenceSketch:
+    """Precalculated statistics of reference dataset features for drift calculations
+
+    - n_rows - number of rows in the reference dataset
+    - schema - empty dataframe with the columns and types of the reference dataset
+    - columns - sketches of the features
+    """
+    n_rows: int
+    schema: pd.DataFrame
+    columns: Dict[str, ColumnSketch]
+
+    @classmethod
+    def build(
+        cls,
+        reference_data: pd.DataFrame,
+        column_mapping: Optional[ColumnMapping] = None,
+        n_bins: int = DEFAULT_N_BINS,
+    ) -> "ReferenceSketch":
+        """Build sketches for numerical and categorical features of the reference dataset
+
+        Args:
+            reference_data: reference dataset
+            column_mapping: the same column mapping that will be used for drift calculations
+            n_bins: number of quantile bins for psi, kl_div and jensenshannon tests
+        """
+        if column_mapping is None:
+            column_mapping = ColumnMapping()
+
+        columns = process_columns(reference_data, column_mapping)
+        sketches = {}
+
+        for feature_name in columns.num_feature_names:
+            sketches[feature_name] = ColumnSketch.build(reference_data[feature_name], "num", n_bins)
+
+        for feature_name in columns.cat_feature_names:
+            sketches[feature_name] = ColumnSketch.build(reference_data[feature_name], "cat", n_bins)
+
+        return cls(n_rows=len(reference_data), schema=reference_data.iloc[:0], columns=sketches)
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __getitem__(self, column_name: str) -> pd.Series:
+        return self.get_column(column_name).to_series()
+
+    def get_column(self, column_name: str) -> ColumnSketch:
+        if column_name not in self.columns:
+            raise ValueError(f"Column {column_name} is not present in the reference sketch")
+
+        return self.columns[column_name]
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as sketch_file:
+            pickle.dump({"version": SKETCH_FORMAT_VERSION, "sketch": self}, sketch_file)
+
+    @classmethod
+    def load(cls, path: str) -> "ReferenceSketch":
+        """Load a sketch saved with `save` method, the file should be from a trusted source"""
+        with open(path, "rb") as sketch_file:
+            data = pickle.load(sketch_file)
+
+        if not isinstance(data, dict) or data.get("version") != SKETCH_FORMAT_VERSION:
+            raise ValueError(f"Unsupported reference sketch format in {path}")
+
+        return data["sketch"]
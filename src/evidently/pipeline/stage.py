@@ -1,17 +1,19 @@
 import abc
-from typing import Type, Dict, Set, Iterable, Any
+from typing import Type, Dict, Set, Iterable, Any, Optional
 
 import pandas
 
 from evidently import ColumnMapping
 from evidently.analyzers.base_analyzer import Analyzer
 from evidently.options import OptionsProvider
+from evidently.pipeline.timings import Timings
 
 
 class PipelineStage:
     _analyzers: Set[Type[Analyzer]]
 
     options_provider: OptionsProvider
+    timings: Optional[Timings] = None
 
     def __init__(self):
         self._analyzers = set()
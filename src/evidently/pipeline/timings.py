@@ -0,0 +1,234 @@
+"""Timings of pipeline calculations for finding slow analyzers, stages and widgets.
+
+Set `Timings` to a pipeline before calculation, every analyzer, stage (tab or profile section), widget and rendering
+is recorded as a span with wall time, CPU time, peak allocated memory and output payload size:
+
+    dashboard = Dashboard(tabs=[DataDriftTab()])
+    dashboard.timings = Timings(trace_memory=True)
+    dashboard.calculate(reference_data, current_data, column_mapping)
+    dashboard.save("report.html")
+    dashboard.timings.save("report_timings.json")
+
+Spans are linked with ids like OpenTelemetry spans, callbacks get every finished span to export it elsewhere.
+"""
+import contextlib
+import dataclasses
+import itertools
+import json
+import threading
+import time
+import tracemalloc
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from evidently.utils import json_serializer
+
+PIPELINE = "pipeline"
+ANALYZER = "analyzer"
+STAGE = "stage"
+WIDGET = "widget"
+RENDER = "render"
+
+
+@dataclasses.dataclass
+class TimingRecord:
+    """A measured span of a calculation
+
+    - kind - one of `pipeline`, `analyzer`, `stage`, `widget` or `render`
+    - name - a class name of the analyzer or the stage, a title of the widget or a rendering format
+    - span_id, parent_id - ids of the span and the enclosing span, parent_id is None for root spans
+    - start_time - Unix time of the span start in seconds
+    - wall_time, cpu_time - elapsed and process CPU time in seconds
+    - peak_memory - peak size of memory allocated during the span in bytes over the memory at the span start,
+        None if memory is not traced
+    - payload_size - size of the serialized output in bytes, None for outputs that are not serialized
+    """
+    kind: str
+    name: str
+    span_id: int
+    parent_id: Optional[int] = None
+    start_time: float = 0.
+    wall_time: float = 0.
+    cpu_time: float = 0.
+    peak_memory: Optional[int] = None
+    payload_size: Optional[int] = None
+
+
+@dataclasses.dataclass
+class _Span:
+    record: TimingRecord
+    start_memory: int = 0
+    peak_memory: int = 0
+
+
+class Timings:
+    """Collect timing records of pipeline calculations.
+
+    Args:
+        trace_memory: trace peak allocated memory with `tracemalloc`, it slows calculations down severalfold.
+            Memory is traced only for spans in the main thread and in process pool workers, because allocations
+            of concurrent threads cannot be separated. Requires Python 3.9+.
+        callbacks: functions that get every finished span
+    """
+    records: List[TimingRecord]
+    callbacks: List[Callable[[TimingRecord], None]]
+
+    def __init__(self, trace_memory: bool = False, callbacks: Optional[List[Callable[[TimingRecord], None]]] = None):
+        self.trace_memory = trace_memory and hasattr(tracemalloc, "reset_peak")
+        self.callbacks = callbacks if callbacks is not None else []
+        self.records = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracing = False
+
+    def _get_stack(self) -> List[_Span]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+
+        return self._local.stack
+
+    def _is_tracing_memory(self) -> bool:
+        return self.trace_memory and threading.current_thread() is threading.main_thread()
+
+    @contextlib.contextmanager
+    def measure(self, kind: str, name: str, parent_id: Optional[int] = None) -> Iterator[TimingRecord]:
+        """Measure a span, spans measured inside it in the same thread are its children.
+
+        The payload size can be set to the yielded record, payload sizes of stages are sums of their widgets sizes.
+        It can be set after the span is finished too, while its parent is measured, but callbacks do not get it.
+
+        Args:
+            parent_id: an id of the parent span for spans in other threads, by default the enclosing span
+                of the current thread is the parent
+        """
+        stack = self._get_stack()
+
+        if parent_id is None and stack:
+            parent_id = stack[-1].record.span_id
+
+        record = TimingRecord(kind, name, self._next_id(), parent_id=parent_id)
+        span = _Span(record)
+        tracing = self._is_tracing_memory()
+
+        if tracing:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+
+            if stack:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, peak_memory)
+
+            tracemalloc.reset_peak()
+            span.start_memory = span.peak_memory = current_memory
+
+        stack.append(span)
+        record.start_time = time.time()
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+
+        try:
+            yield record
+
+        finally:
+            record.wall_time = time.perf_counter() - start_wall_time
+            record.cpu_time = time.process_time() - start_cpu_time
+            stack.pop()
+
+            if tracing:
+                span.peak_memory = max(span.peak_memory, tracemalloc.get_traced_memory()[1])
+                record.peak_memory = span.peak_memory - span.start_memory
+
+                if stack:
+                    stack[-1].peak_memory = max(stack[-1].peak_memory, span.peak_memory)
+                    tracemalloc.reset_peak()
+
+                elif self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+
+            if record.kind == STAGE and record.payload_size is None:
+                record.payload_size = self._get_children_payload_size(record.span_id)
+
+            self._append(record)
+
+    def _get_children_payload_size(self, span_id: int) -> Optional[int]:
+        with self._lock:
+            sizes = [
+                record.payload_size for record in self.records
+                if record.parent_id == span_id and record.payload_size is not None
+            ]
+
+        return sum(sizes) if sizes else None
+
+    def _next_id(self) -> int:
+        with self._lock:
+            return next(self._ids)
+
+    def _append(self, record: TimingRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+        for callback in self.callbacks:
+            callback(record)
+
+    def add(self, record: TimingRecord, parent_id: Optional[int] = None) -> TimingRecord:
+        """Add a record measured by other timings, for example in a process pool worker.
+
+        The record gets a new id of these timings and the parent, by default - the current span of the thread.
+        """
+        if parent_id is None:
+            parent_id = self.current_span_id()
+
+        record = dataclasses.replace(record, span_id=self._next_id(), parent_id=parent_id)
+        self._append(record)
+        return record
+
+    def current_span_id(self) -> Optional[int]:
+        stack = self._get_stack()
+        return stack[-1].record.span_id if stack else None
+
+    def report(self) -> Dict:
+        """Get records and their totals by kinds, records are sorted by start time"""
+        with self._lock:
+            records = sorted(self.records, key=lambda record: record.start_time)
+
+        totals: Dict[str, Dict[str, float]] = {}
+
+        for record in records:
+            total = totals.setdefault(record.kind, {"count": 0, "wall_time": 0., "cpu_time": 0.})
+            total["count"] += 1
+            total["wall_time"] += record.wall_time
+            total["cpu_time"] += record.cpu_time
+
+        return {
+            "records": [dataclasses.asdict(record) for record in records],
+            "totals": totals,
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as out_file:
+            json.dump(self.report(), out_file, indent=2)
+
+
+@contextlib.contextmanager
+def measure_timings(
+    timings: Optional[Timings], kind: str, name: str, parent_id: Optional[int] = None
+) -> Iterator[Optional[TimingRecord]]:
+    """Measure a span if timings are set, yields None otherwise"""
+    if timings is None:
+        yield None
+        return
+
+    with timings.measure(kind, name, parent_id) as record:
+        yield record
+
+
+def payload_size(obj) -> int:
+    """Size of an object serialized to JSON in bytes"""
+    return len(json_serializer.dumps(obj).encode("utf-8"))
@@ -10,6 +10,8 @@ from evidently.dashboard.tabs import DataDriftTab, CatTargetDriftTab, Classifica
 @dataclass
 class DashboardRunnerOptions(RunnerOptions):
     dashboard_tabs: Dict[str, Dict[str, object]]
+    external_graphs: bool = False
+    profile_timings: bool = False
 
 
 tabs_mapping = dict(
@@ -47,5 +49,7 @@ class DashboardRunner(Runner):
             tabs.append(tab_class(verbose_level=verbose_level, include_widgets=include_widgets))
 
         dashboard = Dashboard(tabs=tabs, options=self.options.options)
+        dashboard.timings = self._create_timings(self.options.profile_timings)
         dashboard.calculate(reference_data, current_data, self.options.column_mapping)
-        dashboard.save(self.options.output_path + ".html")
+        dashboard.save(self.options.output_path + ".html", external_graphs=self.options.external_graphs)
+        self._save_timings(dashboard.timings)
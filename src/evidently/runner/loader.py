@@ -1,9 +1,24 @@
 import dataclasses
-import random
-from typing import Callable, Union, Optional, List
+import os
+from typing import Any, Callable, Dict, Iterator, Optional, List
 
+import numpy as np
 import pandas as pd
 
+from evidently.pipeline.column_mapping import ColumnMapping
+
+AUTO_FORMAT = "auto"
+CSV_FORMAT = "csv"
+PARQUET_FORMAT = "parquet"
+FEATHER_FORMAT = "feather"
+FILE_FORMATS_BY_EXTENSION = {
+    ".parquet": PARQUET_FORMAT,
+    ".pq": PARQUET_FORMAT,
+    ".feather": FEATHER_FORMAT,
+    ".arrow": FEATHER_FORMAT,
+    ".ipc": FEATHER_FORMAT,
+}
+
 
 @dataclasses.dataclass
 class SamplingOptions:
@@ -11,6 +26,10 @@ class SamplingOptions:
     random_seed: int = 1
     ratio: float = 1.0
     n: int = 1
+    # a column for stratified sampling, the target column is used by the runner if it is not set
+    column: Optional[str] = None
+    # a period of time buckets for time sampling, for example "H" or "D"
+    period: str = "D"
 
 
 @dataclasses.dataclass
@@ -21,37 +40,310 @@ class DataOptions:
     header: bool
     # should be list of names, or None if columns should be inferred from data
     column_names: Optional[List[str]]
+    # csv, parquet, feather (Arrow IPC) or auto - by the file extension, csv by default
+    file_format: str
+    # columns to read, None for all columns. Columns that are not present in the file are ignored
+    usecols: Optional[List[str]]
+    # explicit types of columns, for example {"feature": "category", "count": "int32"}
+    dtypes: Optional[Dict[str, str]]
+    # if set, the file is read by chunks of this number of rows
+    chunk_size: Optional[int]
 
-    def __init__(self, date_column: str = "datetime", separator=",", header=True, column_names=None):
+    def __init__(self, date_column: str = "datetime", separator=",", header=True, column_names=None,
+                 file_format=AUTO_FORMAT, usecols=None, dtypes=None, chunk_size=None):
         self.date_column = date_column
         self.header = header
         self.separator = separator
         self.column_names = column_names
+        self.file_format = file_format
+        self.usecols = usecols
+        self.dtypes = dtypes
+        self.chunk_size = chunk_size
+
+    def get_file_format(self, filename: str) -> str:
+        if self.file_format != AUTO_FORMAT:
+            if self.file_format not in (CSV_FORMAT, PARQUET_FORMAT, FEATHER_FORMAT):
+                raise ValueError(f"Unexpected file format {self.file_format}")
+
+            return self.file_format
+
+        return FILE_FORMATS_BY_EXTENSION.get(os.path.splitext(filename)[1].lower(), CSV_FORMAT)
+
+
+def get_used_columns(column_mapping: ColumnMapping, date_column: Optional[str] = None) -> Optional[List[str]]:
+    """Get columns that are used with the column mapping or None if all columns can be used.
+
+    Features are inferred from all columns of a dataset if they are not set explicitly,
+    so the columns can be selected only if numerical, categorical and datetime features are set.
+    """
+    if column_mapping.numerical_features is None or column_mapping.categorical_features is None \
+            or column_mapping.datetime_features is None:
+        return None
+
+    columns = [column_mapping.target, column_mapping.datetime, column_mapping.id, date_column]
+
+    if isinstance(column_mapping.prediction, str):
+        columns.append(column_mapping.prediction)
+
+    elif column_mapping.prediction is not None:
+        columns.extend(column_mapping.prediction)
+
+    columns.extend(column_mapping.numerical_features)
+    columns.extend(column_mapping.categorical_features)
+    columns.extend(column_mapping.datetime_features)
+    return list(dict.fromkeys(column for column in columns if column is not None))
+
+
+def _import_pyarrow():
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow.feather
+        import pyarrow.parquet
+        return pyarrow
+
+    except ImportError as err:
+        raise ImportError(
+            "pyarrow is required for parquet and feather files, install it with `pip install evidently[parquet]`"
+        ) from err
+
+
+# files are read by chunks of this number of rows for sampling if the chunk size is not set
+SAMPLING_CHUNK_SIZE = 2 ** 20
+
+
+class RowsSampler:
+    """Base class for sampling rows from a dataset that is read by chunks"""
+
+    def sample(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Get sampled rows of the next chunk, None if the sample is known only after all chunks"""
+        raise NotImplementedError()
+
+    def finish(self) -> Optional[pd.DataFrame]:
+        """Get the rest of sampled rows after all chunks"""
+        return None
+
+
+class NthRowsSampler(RowsSampler):
+    """Take each nth row of the dataset starting from the first one"""
+
+    def __init__(self, n: int):
+        if n < 1:
+            raise ValueError("nth sampling should have 'n' parameter >= 1")
+
+        self.n = n
+        self.rows_count = 0
 
+    def sample(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+        first_row = -self.rows_count % self.n
+        self.rows_count += chunk.shape[0]
+        return chunk.iloc[first_row::self.n].reset_index(drop=True)
 
-def _skiprows(sampling_options: SamplingOptions) -> Union[Callable[[int], bool], None]:
-    if sampling_options.type == "none":
+
+class RandomRowsSampler(RowsSampler):
+    """Take each row of the dataset with `ratio` probability"""
+
+    def __init__(self, ratio: float, random_seed: int):
+        if not 0 <= ratio <= 1:
+            raise ValueError("random sampling should have 'ratio' parameter between 0 and 1")
+
+        self.ratio = ratio
+        self.random = np.random.default_rng(random_seed)
+
+    def sample(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+        return chunk[self.random.random(chunk.shape[0]) < self.ratio].reset_index(drop=True)
+
+
+class ReservoirSampler(RowsSampler):
+    """Take `n` random rows of a dataset with unknown size (reservoir sampling, Algorithm R).
+
+    If `get_groups` is set, it gets group keys of the chunk rows and `n` random rows are taken from each group.
+    Sampled rows keep their order in the dataset.
+    """
+
+    def __init__(self, n: int, random_seed: int, get_groups: Optional[Callable[[pd.DataFrame], pd.Series]] = None):
+        if n < 1:
+            raise ValueError("reservoir sampling should have 'n' parameter >= 1")
+
+        self.n = n
+        self.random = np.random.default_rng(random_seed)
+        self.get_groups = get_groups
+        self.rows_count = 0
+        # ids of group keys and rows count by the group ids
+        self.groups_ids: Dict[Any, int] = {}
+        self.groups_rows_count = np.empty(0, dtype=np.int64)
+        self.reservoir: Optional[pd.DataFrame] = None
+        # reservoir slot, position in the dataset and group id for each row of the reservoir
+        self.slots = np.empty(0, dtype=np.int64)
+        self.positions = np.empty(0, dtype=np.int64)
+        self.groups = np.empty(0, dtype=np.int64)
+
+    def get_groups_ids(self, chunk: pd.DataFrame) -> np.ndarray:
+        if self.get_groups is None:
+            return np.zeros(chunk.shape[0], dtype=np.int64)
+
+        codes, keys = pd.factorize(self.get_groups(chunk))
+        # missing keys get -1 code and are the last key
+        keys = list(keys) + [None]
+        groups_ids = np.array(
+            [self.groups_ids.setdefault(key, len(self.groups_ids)) for key in keys], dtype=np.int64
+        )
+        return groups_ids[codes]
+
+    def _get_positions_in_groups(self, groups: np.ndarray) -> np.ndarray:
+        groups_count = len(self.groups_ids) if self.get_groups is not None else 1
+        previous_rows_count = np.zeros(groups_count, dtype=np.int64)
+        previous_rows_count[:len(self.groups_rows_count)] = self.groups_rows_count
+        self.groups_rows_count = previous_rows_count + np.bincount(groups, minlength=groups_count)
+        return previous_rows_count[groups] + pd.Series(groups).groupby(groups).cumcount().to_numpy()
+
+    def sample(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+        positions = np.arange(self.rows_count, self.rows_count + chunk.shape[0])
+        self.rows_count += chunk.shape[0]
+        groups = self.get_groups_ids(chunk)
+        group_positions = self._get_positions_in_groups(groups)
+        # the first n rows of a group fill its reservoir, after that a row with position i in the group
+        # replaces a random slot of the group reservoir with probability n / (i + 1)
+        random_slots = (self.random.random(chunk.shape[0]) * (group_positions + 1)).astype(np.int64)
+        slots = np.where(group_positions < self.n, group_positions, random_slots)
+        selected_rows = np.flatnonzero(slots < self.n)
+        slots = groups * self.n + slots
+        # the last row of the chunk wins if several rows replace the same slot
+        new_slots, last_indexes = np.unique(slots[selected_rows][::-1], return_index=True)
+        new_rows = selected_rows[::-1][last_indexes]
+        kept = ~np.isin(self.slots, new_slots)
+
+        if self.reservoir is None:
+            self.reservoir = chunk.iloc[new_rows]
+
+        else:
+            self.reservoir = pd.concat([self.reservoir[kept], chunk.iloc[new_rows]])
+
+        self.slots = np.concatenate([self.slots[kept], new_slots])
+        self.positions = np.concatenate([self.positions[kept], positions[new_rows]])
+        self.groups = np.concatenate([self.groups[kept], groups[new_rows]])
+        return None
+
+    def finish(self) -> Optional[pd.DataFrame]:
+        if self.reservoir is None:
+            return None
+
+        return self.reservoir.iloc[np.argsort(self.positions)].reset_index(drop=True)
+
+
+class StratifiedSampler(RowsSampler):
+    """Take each row of the dataset with `ratio` probability, but at least `n` random rows of each value
+    of the `column` (or all rows of the value if there are less rows).
+
+    Shares of frequent values are kept as with random sampling and rare values are not lost.
+    Sampled rows keep their order in the dataset.
+    """
+
+    def __init__(self, column: str, ratio: float, n: int, random_seed: int):
+        if not 0 <= ratio <= 1:
+            raise ValueError("stratified sampling should have 'ratio' parameter between 0 and 1")
+
+        self.column = column
+        self.ratio = ratio
+        self.rows_count = 0
+        # the minimal sample of each value is collected in one pass with the random sample
+        self.reservoir = ReservoirSampler(n, random_seed, self._get_values)
+        # random numbers for the random sample should not depend on the reservoir ones
+        self.random = np.random.default_rng(np.random.SeedSequence(random_seed).spawn(1)[0])
+        self.sampled_chunks: List[pd.DataFrame] = []
+        self.sampled_positions: List[np.ndarray] = []
+        self.sampled_groups: List[np.ndarray] = []
+
+    def _get_values(self, chunk: pd.DataFrame) -> pd.Series:
+        if self.column not in chunk:
+            raise ValueError(f"Column {self.column} for stratified sampling is not present in the dataset")
+
+        return chunk[self.column]
+
+    def sample(self, chunk: pd.DataFrame) -> Optional[pd.DataFrame]:
+        self.reservoir.sample(chunk)
+        selected_rows = np.flatnonzero(self.random.random(chunk.shape[0]) < self.ratio)
+        # group ids of the chunk values are known after the reservoir sampling of the chunk
+        self.sampled_groups.append(self.reservoir.get_groups_ids(chunk.iloc[selected_rows]))
+        self.sampled_chunks.append(chunk.iloc[selected_rows])
+        self.sampled_positions.append(self.rows_count + selected_rows)
+        self.rows_count += chunk.shape[0]
+        return None
+
+    def finish(self) -> Optional[pd.DataFrame]:
+        if self.reservoir.reservoir is None:
+            return None
+
+        sampled_groups = np.concatenate(self.sampled_groups)
+        # use the reservoir for values that have less rows in the random sample
+        minimal_counts = np.minimum(self.reservoir.groups_rows_count, self.reservoir.n)
+        use_reservoir = np.bincount(sampled_groups, minlength=len(minimal_counts)) < minimal_counts
+        sampled_rows = ~use_reservoir[sampled_groups]
+        reservoir_rows = use_reservoir[self.reservoir.groups]
+        sample = pd.concat(
+            [pd.concat(self.sampled_chunks)[sampled_rows], self.reservoir.reservoir[reservoir_rows]]
+        )
+        positions = np.concatenate(
+            [np.concatenate(self.sampled_positions)[sampled_rows], self.reservoir.positions[reservoir_rows]]
+        )
+        return sample.iloc[np.argsort(positions)].reset_index(drop=True)
+
+
+class TimeBucketsSampler(ReservoirSampler):
+    """Take `n` random rows for each time period (`H` for hours, `D` for days, etc.) of the date column,
+    so all periods have the same number of rows in the sample"""
+
+    def __init__(self, date_column: Optional[str], period: str, n: int, random_seed: int):
+        if not date_column:
+            raise ValueError("time sampling requires 'date_column' in the data format options")
+
+        self.date_column = date_column
+        self.period = period
+        super().__init__(n, random_seed, self._get_periods)
+
+    def _get_periods(self, chunk: pd.DataFrame) -> pd.Series:
+        if self.date_column not in chunk:
+            raise ValueError(f"Date column {self.date_column} is not present in the dataset")
+
+        return pd.to_datetime(chunk[self.date_column]).dt.to_period(self.period)
+
+
+def get_sampler(sampling_options: Optional[SamplingOptions], date_column: Optional[str] = None) \
+        -> Optional[RowsSampler]:
+    if sampling_options is None or sampling_options.type == "none":
         return None
     if sampling_options.type == "nth":
-        if sampling_options.n < 1:
-            raise Exception("nth sampling should have 'n' parameter >= 1")
-        return __simple(sampling_options)
+        return NthRowsSampler(sampling_options.n)
     if sampling_options.type == "random":
-        skip_rows = RandomizedSkipRows(sampling_options.ratio, sampling_options.random_seed)
-        return skip_rows.skiprows
+        return RandomRowsSampler(sampling_options.ratio, sampling_options.random_seed)
+    if sampling_options.type == "reservoir":
+        return ReservoirSampler(sampling_options.n, sampling_options.random_seed)
+    if sampling_options.type == "stratified":
+        if sampling_options.column is None:
+            raise ValueError("stratified sampling should have 'column' parameter")
+        return StratifiedSampler(
+            sampling_options.column, sampling_options.ratio, sampling_options.n, sampling_options.random_seed
+        )
+    if sampling_options.type == "time":
+        return TimeBucketsSampler(
+            date_column, sampling_options.period, sampling_options.n, sampling_options.random_seed
+        )
     raise ValueError(f"Unexpected sampling type {sampling_options.type}")
 
 
-def __simple(sampling_options: SamplingOptions):
-    def func(row_idx):
-        if row_idx == 0:
-            result = False
-        else:
-            rem = row_idx % sampling_options.n
-            result = rem != 1
-        return result
+def _concat_chunks(chunks: List[pd.DataFrame], data_options: DataOptions) -> pd.DataFrame:
+    if not chunks:
+        return pd.DataFrame()
+
+    if len(chunks) == 1:
+        return chunks[0]
 
-    return func
+    result = pd.concat(chunks, ignore_index=True)
+
+    if data_options.dtypes:
+        # categories of chunks can be different, concatenation makes object columns from them
+        result = result.astype({column: dtype for column, dtype in data_options.dtypes.items() if column in result})
+
+    return result
 
 
 class DataLoader:
@@ -59,33 +351,130 @@ class DataLoader:
         pass
 
     def load(self, filename: str, data_options: DataOptions, sampling_options: SamplingOptions = None):
-        sampling_opts = SamplingOptions("none", 0, 0) if sampling_options is None else sampling_options
+        """Load the whole file, `chunk_size` is used only to sample the file by chunks"""
+        if get_sampler(sampling_options, data_options.date_column) is None:
+            # chunks and their concatenation would be kept in memory together
+            data_options = dataclasses.replace(data_options, chunk_size=None)
+
+        return _concat_chunks(list(self.iterate(filename, data_options, sampling_options)), data_options)
+
+    def iterate(self, filename: str, data_options: DataOptions,
+                sampling_options: SamplingOptions = None) -> Iterator[pd.DataFrame]:
+        """Read the file by chunks of `data_options.chunk_size` rows or at once if the chunk size is not set.
+
+        With sampling, each chunk is sampled, so chunks can have less rows. If the chunk size is not set,
+        the file is sampled by chunks of `SAMPLING_CHUNK_SIZE` rows and the sample is returned at once.
+
+        Chunks can be used for incremental calculations without loading the whole dataset,
+        for example with `evidently.analyzers.data_quality_accumulators.calculate_data_quality_stats`.
+        """
+        sampler = get_sampler(sampling_options, data_options.date_column)
+
+        if sampler is None:
+            yield from self._read_chunks(filename, data_options, data_options.chunk_size)
+            return
+
+        chunks = self._read_chunks(filename, data_options, data_options.chunk_size or SAMPLING_CHUNK_SIZE)
+        sampled_chunks = self._sample_chunks(chunks, sampler)
+
+        if data_options.chunk_size is None:
+            yield _concat_chunks(list(sampled_chunks), data_options)
+
+        else:
+            yield from sampled_chunks
+
+    @staticmethod
+    def _sample_chunks(chunks: Iterator[pd.DataFrame], sampler: RowsSampler) -> Iterator[pd.DataFrame]:
+        for chunk in chunks:
+            sampled_chunk = sampler.sample(chunk)
+
+            if sampled_chunk is not None:
+                yield sampled_chunk
+
+        rest = sampler.finish()
+
+        if rest is not None:
+            yield rest
+
+    def _read_chunks(self, filename: str, data_options: DataOptions,
+                     chunk_size: Optional[int]) -> Iterator[pd.DataFrame]:
+        file_format = data_options.get_file_format(filename)
+
+        if file_format == CSV_FORMAT:
+            if chunk_size is None:
+                yield self._read_csv(filename, data_options)
+
+            else:
+                yield from self._read_csv(filename, data_options, chunk_size)
+
+            return
+
+        for chunk in self._read_arrow_batches(filename, file_format, data_options, chunk_size):
+            if data_options.dtypes:
+                chunk = chunk.astype({
+                    column: dtype for column, dtype in data_options.dtypes.items() if column in chunk
+                })
+
+            date_column = data_options.date_column
+
+            if date_column and date_column in chunk and not pd.api.types.is_datetime64_any_dtype(chunk[date_column]):
+                chunk[date_column] = pd.to_datetime(chunk[date_column])
+
+            yield chunk
+
+    @staticmethod
+    def _read_csv(filename: str, data_options: DataOptions, chunk_size: Optional[int] = None):
+        usecols = None
         parse_dates = [data_options.date_column] \
             if data_options.date_column \
             else False
+
+        if data_options.usecols is not None:
+            used_columns = set(data_options.usecols)
+            # a callable ignores columns that are not present in the file
+            usecols = used_columns.__contains__
+
+            if data_options.date_column not in used_columns:
+                parse_dates = False
+
         return pd.read_csv(filename,
                            header=0 if data_options.header else None,
                            sep=data_options.separator,
-                           skiprows=_skiprows(sampling_opts),
-                           parse_dates=parse_dates)
+                           parse_dates=parse_dates,
+                           usecols=usecols,
+                           dtype=data_options.dtypes,
+                           chunksize=chunk_size)
 
+    @staticmethod
+    def _read_arrow_batches(filename: str, file_format: str, data_options: DataOptions,
+                            chunk_size: Optional[int]) -> Iterator[pd.DataFrame]:
+        pyarrow = _import_pyarrow()
 
-CHUNK_SIZE = 1000
+        if file_format == PARQUET_FORMAT:
+            parquet_file = pyarrow.parquet.ParquetFile(filename, memory_map=True)
+            columns = data_options.usecols
 
+            if columns is not None:
+                columns = [column for column in columns if column in parquet_file.schema_arrow.names]
 
-class RandomizedSkipRows:
-    def __init__(self, ratio: float, random_seed: int):
-        self.random = random.Random(random_seed)
-        self.ratio = ratio
-        self.selected_rows = self._select()
-
-    def skiprows(self, row_index: int):
-        if row_index == 0:
-            return False
-        if row_index % CHUNK_SIZE == 0:
-            self.selected_rows = self._select()
-        idx = row_index - int(row_index / CHUNK_SIZE) * CHUNK_SIZE
-        return self.selected_rows[idx]
-
-    def _select(self):
-        return [bool(self.random.random() < self.ratio) for _ in range(1000)]
+            if chunk_size is None:
+                yield parquet_file.read(columns=columns).to_pandas()
+                return
+
+            for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+                yield batch.to_pandas()
+
+            return
+
+        # uncompressed feather files are read without copying with memory mapping
+        table = pyarrow.feather.read_table(filename, memory_map=True)
+
+        if data_options.usecols is not None:
+            table = table.select([column for column in data_options.usecols if column in table.column_names])
+
+        if chunk_size is None:
+            yield table.to_pandas()
+            return
+
+        for batch in table.to_batches(max_chunksize=chunk_size):
+            yield batch.to_pandas()
@@ -1,8 +1,9 @@
-import json
 from dataclasses import dataclass
 from typing import Dict
 
 from evidently.model_profile import Profile
+from evidently.model_profile.partial_profile import MERGEABLE_ANALYZERS
+from evidently.model_profile.partial_profile import PartialProfile
 from evidently.model_profile.sections.data_drift_profile_section import DataDriftProfileSection
 from evidently.model_profile.sections.data_quality_profile_section import DataQualityProfileSection
 from evidently.model_profile.sections.cat_target_drift_profile_section import CatTargetDriftProfileSection
@@ -12,14 +13,17 @@ from evidently.model_profile.sections.classification_performance_profile_section
 from evidently.model_profile.sections.prob_classification_performance_profile_section import \
     ProbClassificationPerformanceProfileSection
 from evidently.model_profile.sections.regression_performance_profile_section import RegressionPerformanceProfileSection
+from evidently.pipeline.timings import RENDER
+from evidently.pipeline.timings import measure_timings
 from evidently.runner.runner import RunnerOptions, Runner
-from evidently.utils import NumpyEncoder
+from evidently.utils import json_serializer
 
 
 @dataclass
 class ProfileRunnerOptions(RunnerOptions):
     profile_parts: Dict[str, Dict[str, str]]
     pretty_print: bool
+    profile_timings: bool = False
 
 
 parts_mapping = dict(
@@ -38,9 +42,25 @@ class ProfileRunner(Runner):
         super().__init__(options)
         self.options = options
 
-    def run(self):
-        (reference_data, current_data) = self._parse_data()
+    def _can_calculate_by_chunks(self, profile: Profile) -> bool:
+        return bool(self.options.current_data_path) \
+            and self.options.current_data_options is not None \
+            and self.options.current_data_options.chunk_size is not None \
+            and all(analyzer in MERGEABLE_ANALYZERS for analyzer in profile.get_analyzers())
+
+    def _calculate_partial_profile(self, profile: Profile) -> PartialProfile:
+        partial_profile = None
+
+        for chunk in self._iterate_current_data():
+            chunk_profile = profile.calculate_partial(chunk, self.options.column_mapping)
+            partial_profile = chunk_profile if partial_profile is None else partial_profile.merge(chunk_profile)
+
+        if partial_profile is None:
+            raise ValueError("current dataset is empty")
 
+        return partial_profile
+
+    def run(self):
         parts = []
 
         for part, _ in self.options.profile_parts.items():
@@ -50,10 +70,24 @@ class ProfileRunner(Runner):
             parts.append(part_class())
 
         profile = Profile(sections=parts, options=self.options.options)
-        profile.calculate(reference_data, current_data, self.options.column_mapping)
+        profile.timings = self._create_timings(self.options.profile_timings)
+
+        if self._can_calculate_by_chunks(profile):
+            # current data is not loaded at once, statistics of its chunks are merged
+            reference_data = self._load_reference_data()
+            profile.calculate_from_partial(
+                reference_data, [self._calculate_partial_profile(profile)], self.options.column_mapping
+            )
+        else:
+            (reference_data, current_data) = self._parse_data()
+            profile.calculate(reference_data, current_data, self.options.column_mapping)
         output_path = self.options.output_path \
             if self.options.output_path.endswith(".json") \
             else self.options.output_path + ".json"
 
-        with open(output_path, 'w', encoding='utf-8') as out_file:
-            json.dump(profile.object(), out_file, indent=2 if self.options.pretty_print else None, cls=NumpyEncoder)
+        with measure_timings(profile.timings, RENDER, "json") as record, \
+                open(output_path, 'w', encoding='utf-8') as out_file:
+            json_serializer.dump(profile.object(), out_file, indent=2 if self.options.pretty_print else None)
+            if record is not None:
+                record.payload_size = out_file.tell()
+        self._save_timings(profile.timings)
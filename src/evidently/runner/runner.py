@@ -1,14 +1,16 @@
+import dataclasses
 import logging
-from typing import Optional, List, Dict, Type
+from typing import Optional, Iterator, List, Dict, Tuple, Type
 
-from dataclasses import dataclass
+import pandas as pd
 
-from evidently.options import DataDriftOptions, QualityMetricsOptions
+from evidently.options import DataDriftOptions, DataQualityOptions, ExecutionOptions, PlotOptions, QualityMetricsOptions
 from evidently.pipeline.column_mapping import ColumnMapping
-from evidently.runner.loader import DataLoader, SamplingOptions, DataOptions
+from evidently.pipeline.timings import Timings
+from evidently.runner.loader import DataLoader, SamplingOptions, DataOptions, get_used_columns
 
 
-@dataclass
+@dataclasses.dataclass
 class RunnerOptions:
     reference_data_path: str
     reference_data_options: DataOptions
@@ -23,7 +25,10 @@ class RunnerOptions:
 
 options_mapping: Dict[str, Type] = {
     'data_drift': DataDriftOptions,
+    'data_quality': DataQualityOptions,
     'quality_metrics': QualityMetricsOptions,
+    'execution': ExecutionOptions,
+    'plot': PlotOptions,
 }
 
 
@@ -43,19 +48,75 @@ class Runner:
     def __init__(self, options: RunnerOptions):
         self.options = options
 
-    def _parse_data(self):
-        loader = DataLoader()
+    def _get_sampling_options(self, sampling_options: Optional[SamplingOptions]) -> Optional[SamplingOptions]:
+        if sampling_options is None or sampling_options.type != "stratified" or sampling_options.column is not None:
+            return sampling_options
+
+        # stratify by the target, so rare classes are kept in the sample
+        return dataclasses.replace(sampling_options, column=self.options.column_mapping.target)
+
+    def _get_data_options(self, data_options: DataOptions,
+                          sampling_options: Optional[SamplingOptions]) -> DataOptions:
+        if data_options.usecols is not None:
+            return data_options
+
+        # do not parse columns that are not used with the column mapping
+        usecols = get_used_columns(self.options.column_mapping, data_options.date_column)
 
-        reference_data = loader.load(self.options.reference_data_path,
-                                     self.options.reference_data_options,
-                                     self.options.reference_data_sampling)
+        if usecols is not None and sampling_options is not None and sampling_options.column is not None \
+                and sampling_options.column not in usecols:
+            usecols.append(sampling_options.column)
+
+        return dataclasses.replace(data_options, usecols=usecols)
+
+    def _load_reference_data(self) -> pd.DataFrame:
+        reference_sampling = self._get_sampling_options(self.options.reference_data_sampling)
+        reference_data = DataLoader().load(
+            self.options.reference_data_path,
+            self._get_data_options(self.options.reference_data_options, reference_sampling),
+            reference_sampling,
+        )
         logging.info(f"reference dataset loaded: {len(reference_data)} rows")
+        return reference_data
+
+    def _get_current_data_options(self) -> Tuple[DataOptions, Optional[SamplingOptions]]:
+        if self.options.current_data_options is None:
+            raise ValueError("current data options should be present")
+
+        current_sampling = self._get_sampling_options(self.options.current_data_sampling)
+        return self._get_data_options(self.options.current_data_options, current_sampling), current_sampling
+
+    def _iterate_current_data(self) -> Iterator[pd.DataFrame]:
+        """Read current data by chunks of `chunk_size` rows, without loading the whole dataset"""
+        if not self.options.current_data_path:
+            raise ValueError("current data path should be present")
+
+        data_options, sampling_options = self._get_current_data_options()
+        rows = 0
+
+        for chunk in DataLoader().iterate(self.options.current_data_path, data_options, sampling_options):
+            rows += len(chunk)
+            yield chunk
+
+        logging.info(f"current dataset read by chunks: {rows} rows")
+
+    def _parse_data(self):
+        reference_data = self._load_reference_data()
         if self.options.current_data_path:
-            current_data = loader.load(self.options.current_data_path,
-                                       self.options.current_data_options,
-                                       self.options.current_data_sampling)
+            data_options, sampling_options = self._get_current_data_options()
+            current_data = DataLoader().load(self.options.current_data_path, data_options, sampling_options)
             logging.info(f"current dataset loaded: {len(current_data)} rows")
         else:
             current_data = None
 
         return reference_data, current_data
+
+    def _create_timings(self, profile_timings: bool) -> Optional[Timings]:
+        return Timings(trace_memory=True) if profile_timings else None
+
+    def _save_timings(self, timings: Optional[Timings]):
+        if timings is None:
+            return
+        timings_path = self.options.output_path + "_timings.json"
+        timings.save(timings_path)
+        logging.info(f"timings report saved: {timings_path}")
@@ -1,26 +1,111 @@
 import logging
 import os
 import platform
+import queue
+import threading
+import time
+from typing import Optional
 
 import requests
 
 import evidently
 
+DEFAULT_QUEUE_SIZE = 100
+# a short connection timeout to fail fast without network
+DEFAULT_CONNECT_TIMEOUT = 0.5
+DEFAULT_TIMEOUT = 3
+
 
 class TelemetrySender:
-    def __init__(self, address):
+    """Send usage data from a background daemon thread, so sending never blocks the caller.
+
+    Data is put to a bounded queue and sent with one keep-alive connection. If the queue is full, the data is dropped.
+    If the address is not reachable, the sender is disabled and all queued and new data is dropped.
+    Data that is not sent before the interpreter exits is lost, use `flush` to wait for sending.
+    """
+    def __init__(
+        self,
+        address,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
         self.address = address
+        self.connect_timeout = connect_timeout
+        self.timeout = timeout
         self.env = _collect_environment()
         self.evi = _collect_package()
+        self.disabled = False
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
 
     def send(self, usage):
+        if self.disabled:
+            return
+
         collected = dict(
             environment=self.env,
             evidently=self.evi,
             usage=usage,
         )
+
+        with self._condition:
+            try:
+                self._queue.put_nowait(collected)
+
+            except queue.Full:
+                logging.debug("telemetry queue is full, usage data is dropped")
+                return
+
+            self._pending += 1
+
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="evidently-telemetry", daemon=True)
+                self._worker.start()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued data is sent or dropped.
+
+        Returns:
+            False if the timeout is exceeded
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            while self._pending > 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+
+                if remaining is not None and remaining <= 0:
+                    return False
+
+                self._condition.wait(remaining)
+
+        return True
+
+    def _run(self):
+        session = requests.Session()
+
+        while True:
+            collected = self._queue.get()
+
+            if not self.disabled:
+                self._post(session, collected)
+
+            with self._condition:
+                self._pending -= 1
+                self._condition.notify_all()
+
+    def _post(self, session: requests.Session, collected: dict):
         try:
-            requests.post(self.address, json=collected, timeout=3)
+            session.post(self.address, json=collected, timeout=(self.connect_timeout, self.timeout))
+
+        except requests.ConnectionError as error:
+            # no network, do not wait for timeouts again
+            self.disabled = True
+            logging.warning(f"failed to send telemetry, telemetry is disabled: {error}")
+
         except Exception as error:  # pylint: disable=broad-except
             logging.warning(f"failed to send telemetry: {error}")
 
@@ -0,0 +1,120 @@
+"""Read-only operations with datasets that are shared between analyzers and widgets.
+
+Analyzers and widgets get the same reference and current dataframes from a pipeline and should never change them.
+If a calculation needs data without NaN and infinite values, use `get_finite_data` instead of in-place
+`replace` and `dropna` calls: it returns a new dataframe or the original one if there is nothing to remove.
+
+While a pipeline is executed the results of `get_finite_data` and other values calculated with
+`get_cached_value` (for example, columns types of datasets) are cached, so they are calculated
+once per dataset for all analyzers and widgets.
+"""
+import contextlib
+import threading
+import weakref
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+
+import numpy as np
+import pandas as pd
+
+_CacheKey = Tuple[int, Hashable]
+_T = TypeVar("_T")
+
+_cache_lock = threading.Lock()
+_cache_users = 0
+_cache: Dict[_CacheKey, Tuple[weakref.ref, Any]] = {}
+
+
+@contextlib.contextmanager
+def finite_data_cache() -> Iterator[None]:
+    """Cache `get_finite_data` and `get_cached_value` results inside the context.
+
+    The datasets should not be changed inside the context, otherwise cached results become outdated.
+    Contexts can be nested and used from different threads, the cache is cleared when the last context is closed.
+    """
+    global _cache_users  # pylint: disable=global-statement
+
+    with _cache_lock:
+        _cache_users += 1
+
+    try:
+        yield
+
+    finally:
+        with _cache_lock:
+            _cache_users -= 1
+
+            if _cache_users == 0:
+                _cache.clear()
+
+
+def _get_infinite_rows_mask(dataset: pd.DataFrame) -> np.ndarray:
+    mask = np.zeros(dataset.shape[0], dtype=bool)
+
+    for _, column in dataset.items():
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind == "f":
+            mask |= np.isinf(column.to_numpy())
+
+        elif column.dtype == object or pd.api.types.is_float_dtype(column.dtype):
+            mask |= column.isin([np.inf, -np.inf]).to_numpy()
+
+    return mask
+
+
+def _calculate_finite_data(dataset: pd.DataFrame) -> pd.DataFrame:
+    drop_mask = dataset.isnull().any(axis=1).to_numpy() | _get_infinite_rows_mask(dataset)
+
+    if not drop_mask.any():
+        return dataset
+
+    return dataset[~drop_mask]
+
+
+def get_cached_value(dataset: pd.DataFrame, key: Hashable, calculate: Callable[[], _T]) -> _T:
+    """Get a value calculated for the dataset from the cache or calculate it.
+
+    Values are cached by the dataset identity and the key only inside `finite_data_cache` context,
+    the key should include all other arguments of the calculation.
+    """
+    cache_key = (id(dataset), key)
+
+    with _cache_lock:
+        use_cache = _cache_users > 0
+        cached = _cache.get(cache_key) if use_cache else None
+
+    if cached is not None and cached[0]() is dataset:
+        return cached[1]
+
+    result = calculate()
+
+    if use_cache:
+        with _cache_lock:
+            if _cache_users > 0:
+                _cache[cache_key] = (weakref.ref(dataset), result)
+
+    return result
+
+
+def get_finite_data(dataset: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Get rows of the dataset without NaN and infinite values.
+
+    The dataset is not changed. If there are no such values, the dataset itself is returned, so the result
+    should be treated as read-only too.
+
+    Args:
+        dataset: source data.
+        columns: if defined, take into account and return only these columns.
+    """
+    columns_key = None if columns is None else tuple(columns)
+    return get_cached_value(
+        dataset,
+        ("finite_data", columns_key),
+        lambda: _calculate_finite_data(dataset if columns is None else dataset[list(columns)]),
+    )
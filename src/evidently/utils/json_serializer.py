@@ -0,0 +1,179 @@
+"""JSON serialization of profiles and dashboards.
+
+Dataclasses are serialized by their fields without copying (unlike `dataclasses.asdict`), NumPy and Pandas types
+are converted with a lookup by the exact type. If `orjson` is installed (`pip install evidently[fast-json]`),
+it is used as a faster backend: it serializes NumPy arrays and dataclasses natively.
+
+Values are written the same way as `NumpyEncoder` writes them: NaN and infinite values as `NaN` and `Infinity`,
+NumPy datetimes arrays as integers. orjson writes them differently, so objects with such values are serialized
+with the standard `json` backend.
+"""
+import dataclasses
+import json
+import math
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import IO
+from typing import Iterator
+from typing import Optional
+
+import numpy as np
+
+from evidently.utils.numpy_encoder import _TYPES_MAPPING
+
+# values that are not dicts, lists and dataclasses are not split to chunks for writing to a file
+STREAMING_DEPTH = 2
+
+# converters for types that are not supported by JSON by exact type of objects, None for unsupported types
+_converters: Dict[type, Optional[Callable[[Any], Any]]] = {}
+
+
+def _get_converter(obj_type: type) -> Optional[Callable[[Any], Any]]:
+    if obj_type not in _converters:
+        _converters[obj_type] = next(
+            (python_type for types_list, python_type in _TYPES_MAPPING if issubclass(obj_type, types_list)), None
+        )
+
+    return _converters[obj_type]
+
+
+def to_json_type(obj: Any) -> Any:
+    """Convert an object that is not supported by JSON to a JSON type, dataclasses are converted to dicts
+    of their fields without copying of the fields values"""
+    converter = _get_converter(type(obj))
+
+    if converter is not None:
+        return converter(obj)
+
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _get_orjson():
+    try:
+        # pylint: disable=import-outside-toplevel
+        import orjson
+        return orjson
+
+    except ImportError:
+        return None
+
+
+_JSON_SCALAR_TYPES = (str, int, bool, type(None))
+
+
+def _has_values_written_differently_by_orjson(obj: Any) -> bool:
+    """Check if an object has NaN or infinite values or NumPy datetimes, arrays are checked without iteration"""
+    stack = [obj]
+
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+
+        if obj_type is float:
+            if not math.isfinite(obj):
+                return True
+
+        elif obj_type is dict:
+            stack.extend(obj.values())
+
+        elif obj_type is list or obj_type is tuple:
+            stack.extend(obj)
+
+        elif obj_type in _JSON_SCALAR_TYPES:
+            continue
+
+        elif obj_type is np.ndarray:
+            if obj.dtype.kind == "M" or obj.dtype.kind == "f" and not np.isfinite(obj).all():
+                return True
+
+            if obj.dtype.kind == "O":
+                stack.extend(obj.flat)
+
+        elif isinstance(obj, (float, np.floating)):
+            if not np.isfinite(obj):
+                return True
+
+        elif isinstance(obj, np.datetime64):
+            return True
+
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            stack.extend(getattr(obj, field.name) for field in dataclasses.fields(obj))
+
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+
+    return False
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize an object with dataclasses, NumPy and Pandas values to a JSON string"""
+    orjson = _get_orjson()
+
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2
+
+        # orjson writes NaN and infinite values as null and NumPy datetimes as ISO strings
+        if not _has_values_written_differently_by_orjson(obj):
+            return orjson.dumps(obj, default=to_json_type, option=option).decode("utf-8")
+
+    return json.dumps(
+        obj,
+        default=to_json_type,
+        indent=indent,
+        separators=(",", ":") if indent is None else None,
+        ensure_ascii=False,
+    )
+
+
+def _iterencode(obj: Any, depth: int) -> Iterator[str]:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        obj = to_json_type(obj)
+
+    if depth >= STREAMING_DEPTH or not isinstance(obj, (dict, list, tuple)) or not obj:
+        yield dumps(obj)
+        return
+
+    if isinstance(obj, dict):
+        separator = "{"
+
+        for key, value in obj.items():
+            # non-string keys are converted to strings the same way as without streaming
+            yield f"{separator}{json.dumps({key: 0}, separators=(',', ':'))[1:-3]}:"
+            yield from _iterencode(value, depth + 1)
+            separator = ","
+
+        yield "}"
+        return
+
+    separator = "["
+
+    for value in obj:
+        yield separator
+        yield from _iterencode(value, depth + 1)
+        separator = ","
+
+    yield "]"
+
+
+def dump(obj: Any, file: IO[str], indent: Optional[int] = None) -> None:
+    """Serialize an object to a JSON text file.
+
+    Without indent, the top levels of dicts, lists and dataclasses are written by parts, so the whole JSON
+    string is not kept in memory.
+    """
+    if indent is not None:
+        file.write(dumps(obj, indent))
+        return
+
+    for chunk in _iterencode(obj, 0):
+        file.write(chunk)
@@ -1,9 +1,11 @@
 import numpy as np
 import pandas as pd
 from pytest import approx
+from scipy.stats import ks_2samp
 
 from evidently.analyzers.stattests import z_stat_test
 from evidently.analyzers.stattests.chisquare_stattest import chi_stat_test
+from evidently.analyzers.stattests.ks_stattest import ks_sorted_p_values
 
 
 def test_freq_obs_eq_freq_exp() -> None:
@@ -36,3 +38,13 @@ def test_freq_obs_not_eq_freq_exp() -> None:
     reference = pd.Series([1, 2, 3, 4, 5, 6]).repeat([x * 2 for x in [16, 18, 16, 14, 12, 12]])
     current = pd.Series([1, 2, 3, 4, 5, 6]).repeat([16, 16, 16, 16, 16, 8])
     assert chi_stat_test.func(reference, current, "cat", 0.5) == (approx(0.62338, abs=1e-5), False)
+
+
+def test_ks_sorted_p_values_are_the_same_as_ks_2samp() -> None:
+    random_generator = np.random.default_rng(0)
+    reference = np.round(random_generator.normal(size=(12000, 3)), 2)
+    current = np.round(random_generator.normal(loc=0.03, size=(3000, 3)), 2)
+    p_values = ks_sorted_p_values(np.sort(reference, axis=0), np.sort(current, axis=0))
+
+    for column_idx in range(3):
+        assert p_values[column_idx] == ks_2samp(reference[:, column_idx], current[:, column_idx])[1]
@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 from pandas import DataFrame
+from scipy.stats import ks_2samp
 
 from evidently import ColumnMapping
 from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
@@ -63,3 +65,29 @@ def test_data_drift_analyzer_as_dict_format(data_drift_analyzer: DataDriftAnalyz
     # check data drift results
     assert result.columns.target_names == ['drift_target']
     assert result.metrics.dataset_drift is False
+
+
+def test_data_drift_analyzer_batch_calculation_for_big_datasets() -> None:
+    # K-S test for datasets bigger than KS_EXACT_MAX_SIZE is calculated for all features at once
+    random_generator = np.random.default_rng(0)
+    reference_data = DataFrame(random_generator.normal(size=(12000, 4)), columns=['f1', 'f2', 'f3', 'f4'])
+    current_data = DataFrame(random_generator.normal(loc=0.1, size=(3000, 4)), columns=['f1', 'f2', 'f3', 'f4'])
+    current_data.loc[0, 'f2'] = np.nan
+    current_data.loc[1, 'f3'] = np.inf
+    options_provider = OptionsProvider()
+    options_provider.add(DataDriftOptions(nbinsx={'f1': 5}, feature_stattest_func={'f4': 'wasserstein'}))
+    analyzer = DataDriftAnalyzer()
+    analyzer.options_provider = options_provider
+    result = analyzer.calculate(reference_data, current_data, ColumnMapping())
+
+    for feature_name in ('f1', 'f2', 'f3'):
+        feature_metrics = result.metrics.features[feature_name]
+        assert feature_metrics.stattest_name == 'K-S p_value'
+        assert feature_metrics.p_value == ks_2samp(reference_data[feature_name], current_data[feature_name])[1]
+        current_column = current_data[feature_name]
+        expected_hist = np.histogram(
+            current_column[np.isfinite(current_column)], bins=5 if feature_name == 'f1' else 10, density=True
+        )
+        assert feature_metrics.current_small_hist == [t.tolist() for t in expected_hist]
+
+    assert result.metrics.features['f4'].stattest_name == 'Wasserstein distance (normed)'
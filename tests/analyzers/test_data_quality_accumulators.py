@@ -0,0 +1,161 @@
+import dataclasses
+
+import numpy as np
+import pandas as pd
+
+from evidently import ColumnMapping
+from evidently.analyzers.data_quality_accumulators import DataQualityStatsAccumulator
+from evidently.analyzers.data_quality_accumulators import FrequentValuesSketch
+from evidently.analyzers.data_quality_accumulators import NumericMoments
+from evidently.analyzers.data_quality_accumulators import QuantileSketch
+from evidently.analyzers.data_quality_accumulators import UniqueCountSketch
+from evidently.analyzers.data_quality_accumulators import calculate_data_quality_stats
+from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
+from evidently.analyzers.utils import process_columns
+
+import pytest
+
+
+def _sample_data(size: int) -> pd.DataFrame:
+    random_generator = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            # values are rounded to have a single most common value, ties are resolved differently by chunks
+            "numerical_feature": random_generator.normal(size=size).round(1),
+            "integer_feature": random_generator.integers(0, 10, size=size),
+            "category_feature": random_generator.choice(["a", "b", "c", "d"], size=size),
+            "datetime_feature": pd.to_datetime("2020-01-01") + pd.to_timedelta(
+                random_generator.geometric(0.1, size=size), unit="D"
+            ),
+            "target": random_generator.integers(0, 3, size=size),
+        }
+    )
+    data.loc[::7, "numerical_feature"] = np.nan
+    data.loc[5, "numerical_feature"] = np.inf
+    data.loc[::11, "category_feature"] = np.nan
+    data.loc[::13, "integer_feature"] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("task", (None, "classification", "regression"))
+def test_calculate_data_quality_stats_by_chunks(task) -> None:
+    data = _sample_data(2000)
+    column_mapping = ColumnMapping(datetime_features=["datetime_feature"], task=task)
+    columns, stats = calculate_data_quality_stats(
+        (data.iloc[start:start + 300] for start in range(0, len(data), 300)), column_mapping
+    )
+    expected_task = task or "classification"
+    expected_stats = DataQualityAnalyzer()._calculate_stats(data, columns, expected_task)
+
+    assert columns == process_columns(data, column_mapping)
+
+    for feature_name, feature_stats in stats.get_all_features().items():
+        # NaN values are not equal to each other, compare the stats as series
+        pd.testing.assert_series_equal(
+            pd.Series(dataclasses.asdict(feature_stats), dtype=object),
+            pd.Series(dataclasses.asdict(expected_stats[feature_name]), dtype=object),
+            obj=feature_name,
+        )
+
+
+def test_data_quality_stats_accumulators_merge() -> None:
+    data = _sample_data(1000)
+    columns = process_columns(data, ColumnMapping())
+    first = DataQualityStatsAccumulator(columns)
+    first.update(data.iloc[:400])
+    second = DataQualityStatsAccumulator(columns)
+    second.update(data.iloc[400:])
+    first.merge(second)
+    expected = DataQualityStatsAccumulator(columns)
+    expected.update(data)
+
+    assert first.get_stats() == expected.get_stats()
+
+
+def test_calculate_data_quality_stats_without_chunks() -> None:
+    with pytest.raises(ValueError):
+        calculate_data_quality_stats([])
+
+
+def test_quantile_sketch_accuracy() -> None:
+    values = np.random.default_rng(0).normal(size=500000)
+    sketch = QuantileSketch(max_exact_size=10000, compression=2000)
+
+    for start in range(0, len(values), 50000):
+        chunk_sketch = QuantileSketch(max_exact_size=10000, compression=2000)
+        chunk_sketch.update(values[start:start + 50000])
+        sketch.merge(chunk_sketch)
+
+    assert sketch.count() == len(values)
+
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        # rank error is about 1 / compression
+        assert abs(np.mean(values <= sketch.quantile(q)) - q) < 0.002
+
+
+def test_unique_count_sketch_accuracy() -> None:
+    values = pd.Series(np.random.default_rng(0).integers(0, 100000, size=500000))
+    sketch = UniqueCountSketch(max_exact_size=1000)
+
+    for start in range(0, len(values), 100000):
+        sketch.update(values.iloc[start:start + 100000])
+
+    assert sketch.count() == pytest.approx(values.nunique(), rel=0.03)
+
+    small_sketch = UniqueCountSketch()
+    small_sketch.update(values.iloc[:100])
+    assert small_sketch.count() == values.iloc[:100].nunique()
+
+
+def test_frequent_values_sketch_accuracy() -> None:
+    values = pd.Series(np.random.default_rng(0).zipf(1.5, size=200000))
+    capacity = 100
+    sketch = FrequentValuesSketch(capacity=capacity)
+
+    for start in range(0, len(values), 20000):
+        sketch.update(values.iloc[start:start + 20000])
+
+    expected = values.value_counts().head(3)
+    result = sketch.most_common(3)
+
+    assert list(result.index) == list(expected.index)
+    # counts are underestimated by at most number of values / (capacity + 1)
+    assert ((expected - result).abs() <= len(values) / (capacity + 1)).all()
+
+
+def test_frequent_values_sketch_equal_counts() -> None:
+    # all values are unique, so all counts are equal when the capacity is exceeded
+    values = pd.Series([f"value_{index}" for index in range(3000)])
+    sketch = FrequentValuesSketch(capacity=100)
+
+    for start in range(0, len(values), 1000):
+        sketch.update(values.iloc[start:start + 1000])
+
+    assert len(sketch.counts) == 100
+    assert sketch.most_common(1).index[0] in set(values)
+
+    _, stats = calculate_data_quality_stats([pd.DataFrame({"category_feature": values})])
+    assert stats.cat_features_stats["category_feature"].most_common_value in set(values)
+
+
+def test_numeric_moments_remove() -> None:
+    values = np.random.default_rng(0).normal(10, 2, size=1000)
+    values[::100] = np.inf
+    moments = NumericMoments()
+
+    for start in range(0, 1000, 100):
+        moments.update(values[start:start + 100])
+
+    moments.remove(values[:300])
+    moments.remove(values[300:350])
+    assert moments.get_infinite_count() == 6
+    assert moments.get_mean_and_std()[0] == np.inf
+
+    moments.remove(values[400::100])
+    rest = values[350:][np.isfinite(values[350:])]
+    assert moments.count == len(rest)
+    assert moments.get_mean_and_std() == pytest.approx((rest.mean(), rest.std(ddof=1)))
+
+    moments.remove(rest)
+    assert moments.count == 0
+    assert np.isnan(moments.get_mean_and_std()[0])
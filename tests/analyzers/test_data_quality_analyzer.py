@@ -7,8 +7,11 @@ from evidently import ColumnMapping
 from evidently.analyzers.data_quality_analyzer import DataQualityAnalyzer
 from evidently.analyzers.data_quality_analyzer import FeatureQualityStats
 from evidently.analyzers.utils import process_columns
+from evidently.options import DataQualityOptions
+from evidently.options import OptionsProvider
 
 import pytest
+from scipy.stats import chi2_contingency
 
 
 @pytest.mark.parametrize(
@@ -90,6 +93,7 @@ import pytest
 )
 def test_data_profile_analyzer_num_features(dataset: pd.DataFrame, expected_metrics: FeatureQualityStats) -> None:
     data_profile_analyzer = DataQualityAnalyzer()
+    data_profile_analyzer.options_provider = OptionsProvider()
 
     data_mapping = ColumnMapping(
         numerical_features=["numerical_feature"],
@@ -231,6 +235,7 @@ def test_data_profile_analyzer_num_features(dataset: pd.DataFrame, expected_metr
 )
 def test_data_profile_analyzer_cat_features(dataset: pd.DataFrame, expected_metrics: FeatureQualityStats) -> None:
     data_profile_analyzer = DataQualityAnalyzer()
+    data_profile_analyzer.options_provider = OptionsProvider()
 
     for task_type in (None, "regression", "classification"):
         result = data_profile_analyzer.calculate(
@@ -257,6 +262,7 @@ def test_data_profile_analyzer_classification_with_target() -> None:
         }
     )
     data_profile_analyzer = DataQualityAnalyzer()
+    data_profile_analyzer.options_provider = OptionsProvider()
     data_mapping = ColumnMapping(task="classification")
 
     result = data_profile_analyzer.calculate(reference_data, current_data, data_mapping)
@@ -375,6 +381,7 @@ def test_data_profile_analyzer_new_and_unused_count_for_cat_features(
     reference_dataset: pd.DataFrame, current_dataset: pd.DataFrame, expected_new: int, expected_unused: int
 ) -> None:
     data_profile_analyzer = DataQualityAnalyzer()
+    data_profile_analyzer.options_provider = OptionsProvider()
     data_mapping = ColumnMapping(
         categorical_features=["category_feature"],
         numerical_features=[],
@@ -452,6 +459,7 @@ def test_data_profile_analyzer_new_and_unused_count_for_cat_features(
 )
 def test_data_profile_analyzer_datetime_features(dataset: pd.DataFrame, expected_metrics: FeatureQualityStats) -> None:
     data_profile_analyzer = DataQualityAnalyzer()
+    data_profile_analyzer.options_provider = OptionsProvider()
 
     data_mapping = ColumnMapping(
         datetime_features=["datetime_feature"],
@@ -466,6 +474,7 @@ def test_data_profile_analyzer_datetime_features(dataset: pd.DataFrame, expected
 def test_data_profile_analyzer_datetime_features_zero_lenth() -> None:
     reference_data = pd.DataFrame({"datetime_feature": []})
     data_profile_analyzer = DataQualityAnalyzer()
+    data_profile_analyzer.options_provider = OptionsProvider()
 
     data_mapping = ColumnMapping(
         datetime_features=["datetime_feature"],
@@ -476,6 +485,7 @@ def test_data_profile_analyzer_datetime_features_zero_lenth() -> None:
 
 def test_data_profile_analyzer_empty_features() -> None:
     data_profile_analyzer = DataQualityAnalyzer()
+    data_profile_analyzer.options_provider = OptionsProvider()
     reference_data = pd.DataFrame(
         {
             "datetime_feature": [np.nan, np.nan, np.nan],
@@ -515,6 +525,7 @@ def test_data_profile_analyzer_empty_features() -> None:
 
 def test_data_profile_analyzer_regression() -> None:
     data_profile_analyzer = DataQualityAnalyzer()
+    data_profile_analyzer.options_provider = OptionsProvider()
     reference_data = pd.DataFrame(
         {
             "my_target": [1, 2, 3, 1],
@@ -806,6 +817,30 @@ def test_corr_matrix(df: pd.DataFrame, expected: np.array) -> None:
 
     assert np.allclose(corr_matrix.values, expected)
 
+def test_cramer_v_matrix() -> None:
+    random_generator = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "x": random_generator.choice(["a", "b", "c"], size=500),
+            "y": random_generator.integers(0, 4, size=500),
+            "z": random_generator.choice([True, False], size=500),
+            "constant": ["a"] * 500,
+        }
+    )
+    df["xy"] = df["x"] + df["y"].astype(str)
+    df.loc[::7, "x"] = np.nan
+    df.loc[::5, "y"] = np.nan
+    data_quality_analyzer = DataQualityAnalyzer()
+
+    def cramer_v(x: pd.Series, y: pd.Series) -> float:
+        arr = pd.crosstab(x, y).values
+        phi2 = chi2_contingency(arr, correction=False)[0] / arr.sum()
+        return np.sqrt(phi2 / min(arr.shape[0] - 1, arr.shape[1] - 1)) if min(arr.shape) > 1 else np.nan
+
+    expected = data_quality_analyzer._corr_matrix(df, cramer_v)
+    pd.testing.assert_frame_equal(data_quality_analyzer._cramer_v_matrix(df), expected)
+
+
 @pytest.mark.parametrize(
     "kind, expected_corr_df",
     [
@@ -885,4 +920,35 @@ def test_calculate_correlations(kind: str, expected_corr_df: np.array) -> None:
     corr_df = data_quality_analyzer._calculate_correlations(df, num_for_corr, cat_for_corr, kind)
     assert num_for_corr == ["num_feature_1", "num_feature_2", "num_feature_3", "num_feature_4", "target"]
     assert cat_for_corr == ["cat_feature_1", "cat_feature_2", "cat_feature_3", "cat_feature_4"]
-    assert np.allclose(corr_df, expected_corr_df, equal_nan=True)
\ No newline at end of file
+    assert np.allclose(corr_df, expected_corr_df, equal_nan=True)
+
+def test_data_quality_analyzer_correlations_options() -> None:
+    random_generator = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "num_feature_1": random_generator.normal(size=1000),
+            "num_feature_2": random_generator.normal(size=1000),
+            "cat_feature": random_generator.choice(["a", "b", "c"], size=1000),
+        }
+    )
+    df["num_feature_2"] += df["num_feature_1"]
+    column_mapping = ColumnMapping(
+        numerical_features=["num_feature_1", "num_feature_2"], categorical_features=["cat_feature"]
+    )
+    options = DataQualityOptions(correlation_kinds=["pearson", "kendall"], rank_correlations_max_rows=300)
+    data_quality_analyzer = DataQualityAnalyzer()
+    data_quality_analyzer.options_provider = OptionsProvider()
+    data_quality_analyzer.options_provider.add(options)
+    result = data_quality_analyzer.calculate(df, df.iloc[:200], column_mapping)
+
+    assert list(result.reference_correlations) == ["pearson", "kendall"]
+    assert list(result.current_correlations) == ["pearson", "kendall"]
+    # pearson correlation is calculated for all rows, kendall - for a sample of the reference data
+    pd.testing.assert_frame_equal(result.reference_correlations["pearson"], df[["num_feature_1", "num_feature_2"]].corr())
+    sample = df.sample(n=300, random_state=options.sample_random_state)
+    pd.testing.assert_frame_equal(
+        result.reference_correlations["kendall"], sample[["num_feature_1", "num_feature_2"]].corr("kendall")
+    )
+    pd.testing.assert_frame_equal(
+        result.current_correlations["kendall"], df.iloc[:200][["num_feature_1", "num_feature_2"]].corr("kendall")
+    )
@@ -1,9 +1,11 @@
+import numpy as np
 import pandas as pd
 from pytest import approx
 
 from evidently import ColumnMapping
 from evidently.analyzers.prob_classification_performance_analyzer import ProbClassificationPerformanceAnalyzer
 from evidently.options import OptionsProvider
+from evidently.options import QualityMetricsOptions
 
 
 def test_single_dataset_with_two_classes() -> None:
@@ -532,3 +534,26 @@ def test_two_dataset_with_two_classes_when_dataset_is_different() -> None:
 # )
 
 # test above tests cases with data frames with more than two classes
+
+
+def test_curves_max_points() -> None:
+    random_generator = np.random.default_rng(0)
+    target = random_generator.choice(["label_a", "label_b", "label_c"], size=2000)
+    prediction = random_generator.dirichlet([1, 1, 1], size=2000).round(4)
+    reference_data = pd.DataFrame(prediction, columns=["label_a", "label_b", "label_c"])
+    reference_data["target"] = target
+    column_mapping = ColumnMapping(target="target", prediction=["label_a", "label_b", "label_c"])
+    analyzer = ProbClassificationPerformanceAnalyzer()
+    analyzer.options_provider = OptionsProvider()
+    analyzer.options_provider.add(QualityMetricsOptions(max_curve_points=50))
+    result = analyzer.calculate(reference_data, reference_data, column_mapping)
+
+    for metrics in (result.reference_metrics, result.current_metrics):
+        for label in ["label_a", "label_b", "label_c"]:
+            roc_curve = metrics.roc_curve[label]
+            pr_curve = metrics.pr_curve[label]
+
+            assert len(roc_curve["fpr"]) == len(roc_curve["tpr"]) == len(roc_curve["thrs"]) == 50
+            assert len(pr_curve["pr"]) == len(pr_curve["rcl"]) == len(pr_curve["thrs"]) + 1 == 50
+            assert roc_curve["fpr"][0] == 0 and roc_curve["fpr"][-1] == 1
+            assert pr_curve["rcl"][0] == 1 and pr_curve["pr"][-1] == 1 and pr_curve["rcl"][-1] == 0
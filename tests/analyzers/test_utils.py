@@ -4,10 +4,15 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from evidently.analyzers import utils as analyzers_utils
+from evidently.analyzers.utils import calculate_pr_table
+from evidently.analyzers.utils import calculate_sorted_histograms
+from evidently.analyzers.utils import get_curve_points_indices
 from evidently.analyzers.utils import process_columns
 from evidently.analyzers.utils import DatasetColumns
 from evidently.analyzers.utils import DatasetUtilityColumns
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.utils.data_operations import finite_data_cache
 
 
 @pytest.mark.parametrize(
@@ -180,3 +185,92 @@ def test_dataset_column_default_to_dict(
     columns = process_columns(test_dataset, column_mapping)
     columns_dict = columns.as_dict()
     assert columns_dict == expected_dict
+
+
+def test_process_columns_cache(monkeypatch) -> None:
+    dataset = pd.DataFrame({"target": [1, 0], "num_1": [1.0, 2.0], "cat_1": ["a", "b"]})
+    calls = []
+    original_process_columns = analyzers_utils._process_columns
+
+    def _process_columns(*args):
+        calls.append(args)
+        return original_process_columns(*args)
+
+    monkeypatch.setattr(analyzers_utils, "_process_columns", _process_columns)
+
+    with finite_data_cache():
+        columns = process_columns(dataset, ColumnMapping())
+        assert process_columns(dataset, ColumnMapping()) == columns
+        assert len(calls) == 1
+
+        # the result is resolved again for another mapping or schema
+        assert process_columns(dataset, ColumnMapping(categorical_features=[])).cat_feature_names == []
+        assert process_columns(dataset.astype({"num_1": str}), ColumnMapping()).cat_feature_names == ["cat_1", "num_1"]
+        assert len(calls) == 3
+
+    process_columns(dataset, ColumnMapping())
+    assert len(calls) == 4
+
+
+def test_calculate_sorted_histograms() -> None:
+    data = np.array(
+        [
+            [0.5, 1, np.nan],
+            [0.0, 1, np.nan],
+            [4.8, 1, np.nan],
+            [np.inf, 1, np.nan],
+            [np.nan, 1, np.nan],
+        ]
+    )
+    histograms = calculate_sorted_histograms(np.sort(data, axis=0), bins=3)
+
+    assert len(histograms) == 3
+
+    for column_idx in range(2):
+        column = data[:, column_idx]
+        expected_density, expected_edges = np.histogram(column[np.isfinite(column)], bins=3, density=True)
+        density, edges = histograms[column_idx]
+        np.testing.assert_array_equal(density, expected_density)
+        np.testing.assert_array_equal(edges, expected_edges)
+
+    # no finite values in the column
+    assert np.isnan(histograms[2][0]).all()
+    np.testing.assert_array_equal(histograms[2][1], [0, 1 / 3, 2 / 3, 1])
+
+
+def test_calculate_pr_table() -> None:
+    target = pd.Series([1, 0, 1, 1, 0, 0, 1, 0, 0, 0])
+    prediction = pd.Series([0.9, 0.8, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1])
+
+    assert calculate_pr_table(target, prediction, step_size=0.2) == [
+        [20.0, 2, 0.8, 1, 1, 50.0, 25.0],
+        [40.0, 4, 0.6, 3, 1, 75.0, 75.0],
+        [60.0, 6, 0.4, 3, 3, 50.0, 75.0],
+        [80.0, 8, 0.2, 4, 4, 50.0, 100.0],
+        [100.0, 10, 0.1, 4, 6, 40.0, 100.0],
+    ]
+    # the last step contains the rest of the data
+    assert [row[1] for row in calculate_pr_table(target, prediction, step_size=0.3)] == [3, 6, 9, 10]
+    assert calculate_pr_table(pd.Series([], dtype=int), pd.Series([], dtype=float)) == []
+
+
+def test_get_curve_points_indices() -> None:
+    x = np.array([0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 1.0])
+    y = np.array([0.0, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0])
+
+    assert get_curve_points_indices(x, y, 10).tolist() == [0, 1, 2, 3, 4, 5, 6]
+    assert get_curve_points_indices(x, y, 3).tolist() == [0, 1, 6]
+    # points 2-4 lie on the line between points 1 and 5
+    assert get_curve_points_indices(x, y, 6).tolist() == [0, 1, 5, 6]
+
+    with pytest.raises(ValueError):
+        get_curve_points_indices(x, y, 1)
+
+
+def test_get_curve_points_indices_error() -> None:
+    x = np.linspace(0, 1, 10000)
+    y = np.sqrt(x)
+    indices = get_curve_points_indices(x, y, 100)
+
+    assert len(indices) == 100
+    assert np.max(np.abs(np.interp(x, x[indices], y[indices]) - y)) < 0.005
@@ -1,10 +1,14 @@
+import json
+import os
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from evidently import ColumnMapping
 from evidently.dashboard import Dashboard
+from evidently.dashboard import dashboard as dashboard_module
 from evidently.dashboard.tabs import DataDriftTab
 from evidently.dashboard.tabs import DataQualityTab
 from evidently.dashboard.tabs import NumTargetDriftTab
@@ -68,3 +72,58 @@ def test_dashboards_without_current_data_prob_classification() -> None:
     assert dashboard.analyzers_results is not None
     dashboard.calculate(test_data, test_data, data_mapping)
     assert dashboard.analyzers_results is not None
+
+
+def test_dashboard_save_with_external_graphs(tmp_path, monkeypatch) -> None:
+    test_data = pd.DataFrame({"num_feature": [1.0, 2.0, 3.0, 4.0], "cat_feature": ["a", "b", "a", "b"]})
+    dashboard = Dashboard(tabs=[DataDriftTab()])
+    dashboard.calculate(test_data, test_data)
+    # the template is replaced to check graphs passed to the dashboard without built UI scripts
+    monkeypatch.setattr(dashboard_module, "file_html_template", lambda params: json.dumps(params.additional_graphs))
+    dashboard.save(os.path.join(tmp_path, "report.html"), external_graphs=True)
+
+    with open(os.path.join(tmp_path, "report.html"), encoding="utf-8") as html_file:
+        graphs_urls = json.load(html_file)
+
+    assert graphs_urls
+    expected_graphs = {
+        graph.id: json.loads(json.dumps(graph.params, default=str))
+        for tab_widgets in (tab.info() for tab in dashboard.stages)
+        for widget in tab_widgets
+        if widget is not None
+        for graph in widget.get_additional_graphs()
+    }
+    assert set(graphs_urls) == set(expected_graphs)
+
+    for graph_id, graph_url in graphs_urls.items():
+        assert graph_url.startswith("report_graphs/")
+
+        with open(os.path.join(tmp_path, graph_url), encoding="utf-8") as graph_file:
+            script = graph_file.read()
+
+        prefix = f"window.evidentlyGraphLoaded({json.dumps(graph_url)}, "
+        assert script.startswith(prefix)
+        assert script.endswith(");\n")
+        assert json.loads(script[len(prefix):-3]) == expected_graphs[graph_id]
+
+
+def test_regression_and_num_target_drift_tabs_with_not_finite_prediction() -> None:
+    """Widgets get shared datasets that are not cleaned by analyzers, so they should skip NaN and infinite values"""
+    reference_data = pd.DataFrame(
+        {
+            "target": np.arange(20, dtype=float),
+            "prediction": np.arange(20, dtype=float) + 0.5,
+            "num_feature": np.linspace(0, 1, 20),
+        }
+    )
+    current_data = reference_data.copy()
+    current_data.loc[3, "prediction"] = np.inf
+    current_data.loc[5, "prediction"] = np.nan
+    reference_data.loc[7, "target"] = -np.inf
+    dashboard = Dashboard(tabs=[RegressionPerformanceTab(), NumTargetDriftTab()])
+    dashboard.calculate(reference_data, current_data, ColumnMapping(numerical_features=["num_feature"]))
+
+    assert np.isinf(current_data.loc[3, "prediction"])
+    # the feature table widget is shown only for one of the target and the prediction
+    assert all(widget is not None for widget in dashboard.stages[1].info()[:-1])
+    json.loads(dashboard._json())
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pandas import DataFrame
 
@@ -5,6 +6,7 @@ from evidently import ColumnMapping
 from evidently.analyzers.data_drift_analyzer import DataDriftAnalyzer
 from evidently.dashboard.widgets.data_drift_table_widget import DataDriftTableWidget
 from evidently.options import OptionsProvider
+from evidently.options import PlotOptions
 
 
 def sample_data(feature1, feature2, feature3):
@@ -34,3 +36,22 @@ def test_data_drift_analyzer_no_exceptions(reference, current, column_mapping):
             DataDriftAnalyzer: results,
         },
     )
+
+
+def test_data_drift_table_widget_max_points():
+    reference = DataFrame({"feature1": np.arange(10000, dtype=float), "feature2": np.arange(10000) % 5})
+    current = DataFrame({"feature1": np.arange(10000, dtype=float) * 2, "feature2": np.arange(10000) % 7})
+    options_provider = OptionsProvider()
+    options_provider.add(PlotOptions(max_points=100))
+    analyzer = DataDriftAnalyzer()
+    analyzer.options_provider = options_provider
+    results = analyzer.calculate(reference, current, ColumnMapping(categorical_features=["feature2"]))
+
+    widget = DataDriftTableWidget("")
+    widget.options_provider = options_provider
+    result = widget.calculate(reference, current, ColumnMapping(), {DataDriftAnalyzer: results})
+
+    drift_graph = next(graph for graph in result.additionalGraphs if graph.id == "feature1_drift")
+    assert 0 < len(drift_graph.params["params"]["data"][0]["x"]) <= 100
+    assert all(len(trace["x"]) <= 100 for graph in result.additionalGraphs
+               for trace in graph.params.get("params", graph.params)["data"])
@@ -52,6 +52,7 @@ def test_data_profile_widget_no_exceptions(reference, current, column_mapping):
 
 def test_data_profile_widget_regression_data():
     analyzer = DataQualityAnalyzer()
+    analyzer.options_provider = OptionsProvider()
     reference_data = pd.DataFrame(
         {
             "target": [1, 2, 3, 1],
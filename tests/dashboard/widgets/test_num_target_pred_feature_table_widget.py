@@ -7,6 +7,7 @@ import pytest
 from evidently.analyzers.num_target_drift_analyzer import NumTargetDriftAnalyzer
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options import OptionsProvider
+from evidently.options import PlotOptions
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.dashboard.widgets.num_target_pred_feature_table_widget import NumTargetPredFeatureTable
 
@@ -123,3 +124,20 @@ def test_num_target_pred_feature_table_widget_value_error(
 
     with pytest.raises(ValueError):
         widget.calculate(reference_data, current_data, data_mapping, {NumTargetDriftAnalyzer: analyzer_results})
+
+
+def test_num_target_pred_feature_table_widget_max_points(widget: NumTargetPredFeatureTable) -> None:
+    widget.options_provider.add(PlotOptions(max_points=100))
+    reference_data = pd.DataFrame({"target": range(10000), "num_feature": range(10000)})
+    current_data = pd.DataFrame({"target": range(10000), "num_feature": range(0, 20000, 2)})
+    data_mapping = ColumnMapping(numerical_features=["num_feature"])
+    analyzer = NumTargetDriftAnalyzer()
+    analyzer.options_provider = widget.options_provider
+    analyzer_results = analyzer.calculate(reference_data, current_data, data_mapping)
+    result = widget.calculate(
+        reference_data, current_data, data_mapping, {NumTargetDriftAnalyzer: analyzer_results}
+    )
+
+    traces = result.additionalGraphs[0].params["data"]
+    assert len(traces) == 2
+    assert all(0 < len(trace["x"]) <= 100 for trace in traces)
@@ -7,6 +7,7 @@ import pytest
 from evidently.analyzers.prob_classification_performance_analyzer import ProbClassificationPerformanceAnalyzer
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options import OptionsProvider
+from evidently.options import PlotOptions
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.dashboard.widgets.prob_class_confusion_based_feature_distr_table_widget import (
     ProbClassConfusionBasedFeatureDistrTable,
@@ -104,3 +105,31 @@ def test_prob_class_conf_distr_table_widget_simple_case(
     assert result.title == expected_result.title
     assert result.size == expected_result.size
     assert result.params is not None
+
+
+def test_prob_class_conf_distr_table_widget_max_points(widget: ProbClassConfusionBasedFeatureDistrTable) -> None:
+    widget.options_provider.add(PlotOptions(max_points=100))
+    rows = 10000
+    label_a = [index / rows for index in range(rows)]
+    reference_data = pd.DataFrame(
+        {
+            # a rare label is kept in the downsampled points
+            "target": ["label_b" if index % 1000 == 0 else "label_a" for index in range(rows)],
+            "label_a": label_a,
+            "label_b": [1 - value for value in label_a],
+            "num_feature": range(rows),
+        }
+    )
+    data_mapping = ColumnMapping(prediction=["label_a", "label_b"], numerical_features=["num_feature"])
+    analyzer = ProbClassificationPerformanceAnalyzer()
+    analyzer.options_provider = widget.options_provider
+    analyzer_results = analyzer.calculate(reference_data, reference_data, data_mapping)
+    result = widget.calculate(
+        reference_data, reference_data, data_mapping, {ProbClassificationPerformanceAnalyzer: analyzer_results}
+    )
+
+    for graph in result.additionalGraphs:
+        assert all(len(trace["x"]) <= 100 for trace in graph.params["data"])
+
+    label_b_graph = next(graph for graph in result.additionalGraphs if graph.id == "num_feature_label_b")
+    assert [len(trace["x"]) > 0 for trace in label_b_graph.params["data"]] == [True] * 4
@@ -7,6 +7,7 @@ import pytest
 from evidently.analyzers.regression_performance_analyzer import RegressionPerformanceAnalyzer
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options import OptionsProvider
+from evidently.options import PlotOptions
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.dashboard.widgets.reg_pred_vs_actual_widget import RegPredActualWidget
 
@@ -71,3 +72,14 @@ def test_reg_pred_actual_widget_simple_case(
     else:
         # no widget data, show nothing
         assert result is None
+
+
+def test_reg_pred_actual_widget_max_points(widget: RegPredActualWidget) -> None:
+    widget.options_provider.add(PlotOptions(max_points=100))
+    reference_data = pd.DataFrame({"target": range(10000), "prediction": range(10000)})
+    analyzer = RegressionPerformanceAnalyzer()
+    analyzer.options_provider = widget.options_provider
+    analyzer_results = analyzer.calculate(reference_data, None, ColumnMapping())
+    result = widget.calculate(reference_data, None, ColumnMapping(), {RegressionPerformanceAnalyzer: analyzer_results})
+
+    assert 0 < len(result.params["data"][0]["x"]) <= 100
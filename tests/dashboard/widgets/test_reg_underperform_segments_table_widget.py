@@ -84,3 +84,24 @@ def test_reg_underperform_segments_table_widget_simple_case(
     else:
         # no widget data, show nothing
         assert result is None
+
+
+def test_reg_underperform_segments_table_widget_cat_feature_colors(widget: UnderperformSegmTableWidget) -> None:
+    reference_data = pd.DataFrame(
+        {
+            "target": [1, 2, 3, 4, 5, 6],
+            "prediction": [1, 3, 3, 5, 5, 6],
+            "num_feature": [3, 5, 3, 1, 2, 4],
+            "cat_feature": [1, 2, 1, 2, 3, 3],
+        }
+    )
+    data_mapping = ColumnMapping(numerical_features=["num_feature"], categorical_features=["cat_feature"])
+    analyzer = RegressionPerformanceAnalyzer()
+    analyzer.options_provider = widget.options_provider
+    analyzer_results = analyzer.calculate(reference_data, None, data_mapping)
+    result = widget.calculate(reference_data, None, data_mapping, {RegressionPerformanceAnalyzer: analyzer_results})
+
+    segments_graph = next(graph for graph in result.additionalGraphs if graph.id == "cat_feature_segm")
+    # a trace for every category instead of a continuous colorscale
+    assert sorted(trace["name"] for trace in segments_graph.params["data"]) == ["1", "2", "3"]
+    assert reference_data["cat_feature"].dtype == "int64"
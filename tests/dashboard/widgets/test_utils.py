@@ -1,6 +1,13 @@
+import numpy as np
 import pandas as pd
 
 from evidently.dashboard.widgets.utils import CutQuantileTransformer
+from evidently.dashboard.widgets.utils import get_grouped_histograms
+from evidently.dashboard.widgets.utils import get_histogram
+from evidently.dashboard.widgets.utils import get_histogram_bins
+from evidently.dashboard.widgets.utils import get_scatter_points_indices
+from evidently.dashboard.widgets.utils import get_time_series_points_indices
+from evidently.dashboard.widgets.utils import get_time_series_rows_indices
 
 import pytest
 
@@ -29,3 +36,81 @@ def test_cut_quantile_transformer(
     transformer.fit(test_data["data"])
     transformer.transform(test_data["data"])
     transformer.transform_df(test_data, "data")
+
+
+def test_get_scatter_points_indices() -> None:
+    random_generator = np.random.default_rng(0)
+    x = random_generator.normal(size=100000)
+    y = x + random_generator.normal(size=100000)
+    # an outlier and a rare group
+    x[10] = 100
+    groups = np.where(np.arange(100000) % 1000 == 0, "rare", "common")
+    indices = get_scatter_points_indices([x, y], 1000, groups)
+
+    assert len(indices) <= 1000
+    assert np.all(np.diff(indices) > 0)
+    assert 10 in indices
+    # the rare group has more points than its share of the budget
+    assert np.count_nonzero(groups[indices] == "rare") >= 5
+    np.testing.assert_array_equal(get_scatter_points_indices([x, y], 1000, groups), indices)
+    np.testing.assert_array_equal(get_scatter_points_indices([x[:500], y[:500]], 1000), np.arange(500))
+    np.testing.assert_array_equal(get_scatter_points_indices([x, y], None), np.arange(100000))
+
+
+def test_get_time_series_points_indices() -> None:
+    x = pd.Series(pd.date_range("2022-01-01", periods=10000, freq="min"))
+    y = np.sin(np.arange(10000) / 500)
+    # a spike is kept
+    y[5000] = 10
+    indices = get_time_series_points_indices(x, y, 100)
+
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 9999
+    assert np.all(np.diff(indices) > 0)
+    assert 5000 in indices
+    # the line is close to the original one except for the spike neighbours
+    errors = np.abs(np.interp(np.arange(10000), indices, y[indices]) - y)
+    assert np.delete(errors, np.arange(4800, 5200)).max() < 0.05
+
+    rows_indices = get_time_series_rows_indices(x, [y, -y], 100)
+    assert len(rows_indices) <= 100
+    np.testing.assert_array_equal(get_time_series_rows_indices(x, [y], None), np.arange(10000))
+
+
+def test_get_histogram() -> None:
+    values = pd.Series([0.0, 1.0, 1.5, 2.0, np.nan, np.inf, 4.0])
+    bins = get_histogram_bins([values, pd.Series([-4.0])], nbins=4)
+    np.testing.assert_allclose(bins, [-4, -2, 0, 2, 4])
+
+    x, y = get_histogram(values, bins)
+    np.testing.assert_allclose(x, [-3, -1, 1, 3])
+    np.testing.assert_array_equal(y, [0, 0, 3, 2])
+
+    x, y = get_histogram(values, bins, histnorm="percent")
+    np.testing.assert_allclose(y, [0, 0, 60, 40])
+
+    # xbins have a priority over bins count
+    bins = get_histogram_bins([values], nbins=4, xbins={"start": 0, "end": 4, "size": 0.5})
+    np.testing.assert_allclose(bins, np.arange(0, 4.5, 0.5))
+
+    x, y = get_histogram(pd.Series(["a", "b", "a", None]), histnorm="probability")
+    assert dict(zip(x, y)) == {"a": pytest.approx(2 / 3), "b": pytest.approx(1 / 3)}
+
+
+def test_get_grouped_histograms() -> None:
+    data = pd.DataFrame(
+        {
+            "value": np.arange(1000, dtype=float),
+            "category": ["x", "y"] * 500,
+            "group": ["a"] * 900 + ["b"] * 100,
+        }
+    )
+    histograms = get_grouped_histograms(data, "value", ["group"])
+
+    # bins are shared by the groups
+    assert set(histograms[histograms["group"] == "a"]["value"]) == set(histograms[histograms["group"] == "b"]["value"])
+    assert histograms.groupby("group")["count"].sum().to_dict() == {"a": 900, "b": 100}
+
+    histograms = get_grouped_histograms(data, "category", ["group", "category"], histnorm="percent")
+    assert histograms.shape[0] == 4
+    assert histograms["percent"].tolist() == [100.0] * 4
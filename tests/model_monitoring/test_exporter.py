@@ -0,0 +1,86 @@
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.model_monitoring import DataDriftMonitor
+from evidently.model_monitoring import ModelMonitoring
+from evidently.model_monitoring import OpenMetricsExporter
+from evidently.model_monitoring import start_metrics_server
+from evidently.model_monitoring.exporter import CONTENT_TYPE
+from evidently.model_monitoring.monitoring import ModelMonitoringMetric
+
+count = ModelMonitoringMetric("test:count")
+p_value = ModelMonitoringMetric("test:p_value", ["feature", "feature_type"])
+unused = ModelMonitoringMetric("test:unused-metric", ["dataset"])
+
+
+def test_open_metrics_exporter() -> None:
+    exporter = OpenMetricsExporter()
+    exporter.register(unused)
+
+    assert exporter.render() == b"# EOF\n"
+
+    exporter.update(
+        [
+            count.create(10),
+            p_value.create(0.5, dict(feature="a", feature_type="num")),
+            p_value.create(np.nan, dict(feature_type="cat", feature='b "quoted"\\')),
+            p_value.create(float("inf"), dict(feature="c", feature_type="num")),
+        ]
+    )
+
+    assert exporter.render().decode() == (
+        "# TYPE evidently:test:unused_metric gauge\n"
+        "# TYPE evidently:test:count gauge\n"
+        "evidently:test:count 10.0\n"
+        "# TYPE evidently:test:p_value gauge\n"
+        'evidently:test:p_value{feature="a",feature_type="num"} 0.5\n'
+        'evidently:test:p_value{feature="b \\"quoted\\"\\\\",feature_type="cat"} NaN\n'
+        'evidently:test:p_value{feature="c",feature_type="num"} +Inf\n'
+        "# EOF\n"
+    )
+
+    # all samples are replaced, families stay registered
+    exporter.update([p_value.create(0.1, dict(feature="a", feature_type="num"))])
+
+    assert exporter.render().decode() == (
+        "# TYPE evidently:test:unused_metric gauge\n"
+        "# TYPE evidently:test:count gauge\n"
+        "# TYPE evidently:test:p_value gauge\n"
+        'evidently:test:p_value{feature="a",feature_type="num"} 0.1\n'
+        "# EOF\n"
+    )
+
+
+def test_open_metrics_exporter_with_monitoring() -> None:
+    data = pd.DataFrame({"feature_1": [1.0, 2.0, 3.0, 4.0], "feature_2": ["a", "b", "a", "b"]})
+    monitoring = ModelMonitoring(monitors=[DataDriftMonitor()])
+    monitoring.execute(data, data)
+    exporter = OpenMetricsExporter(prefix="")
+    exporter.update(monitoring.metrics())
+    lines = exporter.render().decode().splitlines()
+
+    assert "data_drift:dataset_drift 0.0" in lines
+    assert 'data_drift:p_value{feature="feature_1",feature_type="num"} 1.0' in lines
+
+
+def test_metrics_server() -> None:
+    exporter = OpenMetricsExporter()
+    exporter.update([count.create(3)])
+    server = start_metrics_server(exporter, port=0, address="127.0.0.1")
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert response.read() == exporter.render()
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{url}/other")
+
+    finally:
+        server.shutdown()
+        server.server_close()
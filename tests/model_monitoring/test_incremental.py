@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.model_monitoring import CatTargetDriftMonitor
+from evidently.model_monitoring import ClassificationPerformanceMonitor
+from evidently.model_monitoring import DataDriftMonitor
+from evidently.model_monitoring import IncrementalModelMonitoring
+from evidently.model_monitoring import ModelMonitoring
+from evidently.model_monitoring import NumTargetDriftMonitor
+from evidently.model_monitoring import RegressionPerformanceMonitor
+from evidently.model_monitoring.incremental import RowsWindow
+from evidently.pipeline.column_mapping import ColumnMapping
+
+
+def test_rows_window() -> None:
+    window = RowsWindow(5)
+    data = pd.DataFrame({"value": range(10)})
+
+    assert window.append(data.iloc[0:3]) == []
+    removed = window.append(data.iloc[3:7])
+
+    assert len(window) == 5
+    assert [rows["value"].tolist() for rows in removed] == [[0, 1]]
+    assert window.get_data()["value"].tolist() == [2, 3, 4, 5, 6]
+
+    removed = window.append(data.iloc[7:10])
+
+    assert [rows["value"].tolist() for rows in removed] == [[2], [3, 4]]
+    assert window.get_data()["value"].tolist() == [5, 6, 7, 8, 9]
+
+    with pytest.raises(ValueError):
+        window.append(data)
+
+
+def _sample_data(size: int, seed: int) -> pd.DataFrame:
+    random_generator = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        {
+            "target": random_generator.choice(["a", "b", "c"], size=size, p=[0.6, 0.3, 0.1]),
+            "prediction": random_generator.choice(["a", "b", "c"], size=size),
+            "num_feature": random_generator.normal(size=size),
+            "cat_feature": random_generator.integers(0, 4, size=size),
+        }
+    )
+    data.loc[::13, "num_feature"] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("batch_size", [3, 37, 200])
+def test_incremental_monitoring_metrics(batch_size: int) -> None:
+    reference_data = _sample_data(300, 0)
+    current_data = _sample_data(250, 1)
+    column_mapping = ColumnMapping(numerical_features=["num_feature"], categorical_features=["cat_feature"])
+    window_size = 120
+
+    def create_monitors():
+        return [ClassificationPerformanceMonitor(), CatTargetDriftMonitor(), DataDriftMonitor()]
+
+    monitoring = IncrementalModelMonitoring(monitors=create_monitors(), window_size=window_size)
+    monitoring.start(reference_data, column_mapping)
+
+    for start in range(0, current_data.shape[0], batch_size):
+        monitoring.update(current_data.iloc[start:start + batch_size])
+
+    expected_monitoring = ModelMonitoring(monitors=create_monitors())
+    expected_monitoring.execute(
+        reference_data, current_data.iloc[-window_size:].reset_index(drop=True), column_mapping
+    )
+    metrics = [(metric.name, value, labels) for metric, value, labels in monitoring.metrics()]
+    expected_metrics = [(metric.name, value, labels) for metric, value, labels in expected_monitoring.metrics()]
+
+    assert sorted(metrics, key=str) == sorted(expected_metrics, key=str)
+
+
+def _regression_sample_data(size: int, seed: int) -> pd.DataFrame:
+    random_generator = np.random.default_rng(seed)
+    target = random_generator.normal(10, 2, size=size)
+    data = pd.DataFrame(
+        {
+            "target": target,
+            "prediction": target + random_generator.normal(size=size),
+            "num_feature": target + random_generator.normal(size=size),
+            "other_num_feature": random_generator.normal(size=size),
+            "cat_feature": random_generator.integers(0, 4, size=size),
+        }
+    )
+    data.loc[::13, "num_feature"] = np.nan
+    data.loc[::17, "prediction"] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("batch_size", [3, 37, 200])
+def test_incremental_monitoring_regression_metrics(batch_size: int) -> None:
+    reference_data = _regression_sample_data(300, 0)
+    current_data = _regression_sample_data(250, 1)
+    column_mapping = ColumnMapping(
+        numerical_features=["num_feature", "other_num_feature"], categorical_features=["cat_feature"]
+    )
+    window_size = 120
+
+    def create_monitors():
+        return [RegressionPerformanceMonitor(), NumTargetDriftMonitor(), DataDriftMonitor()]
+
+    monitoring = IncrementalModelMonitoring(monitors=create_monitors(), window_size=window_size)
+    monitoring.start(reference_data, column_mapping)
+
+    for start in range(0, current_data.shape[0], batch_size):
+        monitoring.update(current_data.iloc[start:start + batch_size])
+
+    assert set(monitoring.incremental_analyzers) == {analyzer for monitor in create_monitors()
+                                                    for analyzer in monitor.analyzers()}
+
+    expected_monitoring = ModelMonitoring(monitors=create_monitors())
+    expected_monitoring.execute(
+        reference_data, current_data.iloc[-window_size:].reset_index(drop=True), column_mapping
+    )
+    # error moments and correlations are updated with added and removed rows, so they are equal up to rounding
+    metrics = {(metric.name, str(labels)): value for metric, value, labels in monitoring.metrics()}
+    expected_metrics = {(metric.name, str(labels)): value for metric, value, labels in expected_monitoring.metrics()}
+
+    assert metrics.keys() == expected_metrics.keys()
+    assert [metrics[key] for key in expected_metrics] == pytest.approx(list(expected_metrics.values()), nan_ok=True)
+
+
+def test_incremental_monitoring_errors() -> None:
+    monitoring = IncrementalModelMonitoring(monitors=[ClassificationPerformanceMonitor()], window_size=10)
+
+    with pytest.raises(ValueError, match="start should be called"):
+        monitoring.update(_sample_data(5, 0))
+
+    monitoring.start(_sample_data(5, 0))
+
+    with pytest.raises(ValueError, match="the window has no rows"):
+        list(monitoring.metrics())
@@ -0,0 +1,84 @@
+import dataclasses
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.model_profile import Profile
+from evidently.model_profile import load_profile
+from evidently.model_profile.binary_format import dumps
+from evidently.model_profile.binary_format import loads
+from evidently.model_profile.sections import ClassificationPerformanceProfileSection
+from evidently.model_profile.sections import DataDriftProfileSection
+
+
+@dataclasses.dataclass
+class _Item:
+    name: str
+    value: float
+
+
+def test_binary_format_values() -> None:
+    obj = {
+        "scalars": [None, True, False, 1, -2 ** 70, 0.5, np.float32(0.25), np.int64(3), np.bool_(False), "текст"],
+        "floats": [0.1, 0.2, np.nan],
+        "ints": (1, 2, 3),
+        "array": np.arange(6, dtype=np.int16).reshape(2, 3),
+        "objects": np.array(["a", None], dtype=object),
+        "nested": {1: {"item": _Item("x", 1.5)}, None: [], "empty": {}},
+        "timestamp": pd.Timestamp(2022, 1, 1),
+    }
+    result = loads(dumps(obj))
+    array = result.pop("array")
+    floats = result.pop("floats")
+
+    np.testing.assert_array_equal(array, obj["array"])
+    assert array.dtype == np.int16
+    assert floats[:2] == [0.1, 0.2] and math.isnan(floats[2])
+    assert result == {
+        "scalars": [None, True, False, 1, -2 ** 70, 0.5, 0.25, 3, False, "текст"],
+        "ints": [1, 2, 3],
+        "objects": ["a", None],
+        "nested": {1: {"item": {"name": "x", "value": 1.5}}, None: [], "empty": {}},
+        "timestamp": "2022-01-01 00:00:00",
+    }
+    assert loads(dumps(obj), ["nested", None]) == []
+    assert loads(dumps(obj), ["nested", 1, "item", "name"]) == "x"
+
+    with pytest.raises(KeyError):
+        loads(dumps(obj), ["nested", 2])
+
+    with pytest.raises(ValueError):
+        loads(b"NOTPROFILE")
+
+
+@pytest.mark.parametrize("profile_format", ["json", "binary"])
+def test_profile_save_and_load(tmp_path, profile_format: str) -> None:
+    data = pd.DataFrame(
+        {
+            "target": [1, 0, 1, 1, 0, 1],
+            "prediction": [1, 0, 0, 1, 0, 1],
+            "num_feature": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "cat_feature": ["a", "b", "a", "b", "a", "b"],
+        }
+    )
+    profile = Profile(sections=[DataDriftProfileSection(), ClassificationPerformanceProfileSection()])
+    profile.calculate(
+        data, data, ColumnMapping(numerical_features=["num_feature"], categorical_features=["cat_feature"])
+    )
+    path = str(tmp_path / "profile")
+    profile.save(path, format=profile_format)
+    expected = json.loads(profile.json())
+    result = json.loads(json.dumps(load_profile(path)))
+    # the timestamp is set on each `Profile.object()` call
+    del result["timestamp"], expected["timestamp"]
+
+    assert result == expected
+    assert load_profile(path, ["data_drift", "data", "metrics", "num_feature"]) == \
+        expected["data_drift"]["data"]["metrics"]["num_feature"]
+
+    with pytest.raises(ValueError):
+        profile.save(path, format="unknown")
@@ -0,0 +1,173 @@
+import math
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.model_profile import PartialProfile
+from evidently.model_profile import Profile
+from evidently.model_profile.partial_profile import RowsSample
+from evidently.model_profile.sections import ClassificationPerformanceProfileSection
+from evidently.model_profile.sections import DataDriftProfileSection
+from evidently.model_profile.sections import DataQualityProfileSection
+from evidently.model_profile.sections import NumTargetDriftProfileSection
+from evidently.model_profile.sections import RegressionPerformanceProfileSection
+from evidently.pipeline.reference_sketch import ReferenceSketch
+
+
+def _sample_data(size: int, seed: int, regression: bool) -> pd.DataFrame:
+    random_generator = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        {
+            # values are rounded to have a single most common value, ties are resolved differently by parts
+            "num_feature": random_generator.normal(size=size).round(1),
+            "int_feature": random_generator.integers(0, 5, size=size),
+            "cat_feature": random_generator.choice([10, 20, 30], size=size),
+        }
+    )
+
+    if regression:
+        data["target"] = random_generator.normal(10, 2, size=size)
+        data["prediction"] = data["target"] + random_generator.normal(size=size)
+
+    else:
+        data["target"] = random_generator.choice(["x", "y", "z"], size=size)
+        data["prediction"] = random_generator.choice(["x", "y", "z"], size=size)
+
+    data.loc[::17, "num_feature"] = np.nan
+    data.loc[::23, "cat_feature"] = np.nan
+    return data
+
+
+def _assert_results_equal(result, expected, path="") -> None:
+    if isinstance(expected, dict):
+        assert set(result) == set(expected), path
+
+        for key, value in expected.items():
+            # calculation times differ
+            if key not in ("datetime", "timestamp"):
+                _assert_results_equal(result[key], value, f"{path}/{key}")
+
+    elif isinstance(expected, (list, tuple)):
+        assert len(result) == len(expected), path
+
+        for index, (item, expected_item) in enumerate(zip(result, expected)):
+            _assert_results_equal(item, expected_item, f"{path}/{index}")
+
+    elif isinstance(expected, float) and math.isnan(expected):
+        assert isinstance(result, float) and math.isnan(result), path
+
+    elif isinstance(expected, float):
+        assert result == pytest.approx(expected, rel=1e-9, abs=1e-12), path
+
+    else:
+        assert result == expected, path
+
+
+@pytest.mark.parametrize(
+    "sections,regression",
+    (
+        ([DataDriftProfileSection, DataQualityProfileSection, ClassificationPerformanceProfileSection], False),
+        ([DataDriftProfileSection, DataQualityProfileSection, RegressionPerformanceProfileSection], True),
+    ),
+)
+def test_profile_from_partial_profiles(sections, regression: bool) -> None:
+    reference_data = _sample_data(400, 0, regression)
+    current_data = _sample_data(900, 1, regression)
+    column_mapping = ColumnMapping(categorical_features=["int_feature", "cat_feature"])
+    profile = Profile(sections=[section() for section in sections])
+    partial_profiles = [
+        # partial profiles are sent between processes
+        pickle.loads(pickle.dumps(profile.calculate_partial(current_data.iloc[start:start + 300], column_mapping)))
+        for start in range(0, current_data.shape[0], 300)
+    ]
+    profile.calculate_from_partial(reference_data, partial_profiles, column_mapping)
+
+    expected_profile = Profile(sections=[section() for section in sections])
+    expected_profile.calculate(reference_data, current_data, column_mapping)
+
+    _assert_results_equal(profile.object(), expected_profile.object())
+
+
+def test_profile_from_partial_profiles_with_reference_sketch() -> None:
+    reference_data = _sample_data(400, 0, False)
+    current_data = _sample_data(900, 1, False)
+    profile = Profile(sections=[DataDriftProfileSection()])
+    partial_profiles = [
+        profile.calculate_partial(current_data.iloc[:500]),
+        profile.calculate_partial(current_data.iloc[500:]),
+    ]
+    profile.calculate_from_partial(ReferenceSketch.build(reference_data), partial_profiles)
+
+    expected_profile = Profile(sections=[DataDriftProfileSection()])
+    expected_profile.calculate(reference_data, current_data)
+
+    _assert_results_equal(profile.object(), expected_profile.object())
+
+
+def test_partial_profiles_errors() -> None:
+    data = _sample_data(100, 0, True)
+
+    with pytest.raises(ValueError, match="cannot be calculated"):
+        Profile(sections=[NumTargetDriftProfileSection()]).calculate_partial(data)
+
+    drift_partial_profile = Profile(sections=[DataDriftProfileSection()]).calculate_partial(data)
+    quality_partial_profile = Profile(sections=[DataQualityProfileSection()]).calculate_partial(data)
+
+    with pytest.raises(ValueError, match="the same sections"):
+        drift_partial_profile.merge(quality_partial_profile)
+
+    with pytest.raises(ValueError, match="Reference sketch cannot be used"):
+        Profile(sections=[DataQualityProfileSection()]).calculate_from_partial(
+            ReferenceSketch.build(data), [quality_partial_profile]
+        )
+
+    with pytest.raises(ValueError):
+        Profile(sections=[DataQualityProfileSection()]).calculate_from_partial(data, [])
+
+    assert isinstance(quality_partial_profile, PartialProfile)
+
+
+def test_rows_sample() -> None:
+    data = pd.DataFrame({"value": range(1000)})
+    sample = RowsSample(size=100)
+    other_sample = RowsSample(size=100)
+
+    for start in range(0, 500, 50):
+        sample.update(data.iloc[start:start + 50])
+
+    other_sample.update(data.iloc[500:])
+    sample.merge(other_sample)
+    values = sample.data["value"].to_numpy()
+
+    assert len(values) == 100
+    assert np.all(np.diff(values) > 0)
+    # both parts are represented in the sample
+    assert 20 < np.count_nonzero(values < 500) < 80
+
+    small_sample = RowsSample(size=100)
+    small_sample.update(data.iloc[:30])
+    small_sample.update(data.iloc[30:60])
+    assert small_sample.data["value"].tolist() == list(range(60))
+
+
+def test_rows_sample_random_seed() -> None:
+    data = pd.DataFrame({"value": range(1000)})
+
+    def get_sample(random_seed: int) -> RowsSample:
+        sample = RowsSample(size=100, random_seed=random_seed)
+
+        for start in range(0, 1000, 250):
+            part_sample = RowsSample(size=100, random_seed=random_seed)
+            part_sample.update(data.iloc[start:start + 250])
+            sample.merge(part_sample)
+
+        return sample
+
+    assert get_sample(0).data.equals(get_sample(0).data)
+    assert not get_sample(0).data.equals(get_sample(1).data)
+
+    with pytest.raises(ValueError, match="the same random seed"):
+        get_sample(0).merge(get_sample(1))
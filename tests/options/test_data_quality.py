@@ -0,0 +1,27 @@
+import pytest
+
+from evidently.options import DataQualityOptions
+
+
+def test_correlation_kinds() -> None:
+    assert DataQualityOptions().get_correlation_kinds() == ["pearson", "spearman", "kendall", "cramer_v"]
+    assert DataQualityOptions(correlation_kinds=["cramer_v", "pearson"]).get_correlation_kinds() == [
+        "pearson",
+        "cramer_v",
+    ]
+
+    with pytest.raises(ValueError, match="Unknown correlation kinds: tau"):
+        DataQualityOptions(correlation_kinds=["pearson", "tau"]).get_correlation_kinds()
+
+
+def test_rows_limit() -> None:
+    options = DataQualityOptions(rank_correlations_max_rows=1000)
+
+    assert options.get_rows_limit("spearman") == 1000
+    assert options.get_rows_limit("kendall") == 1000
+    assert options.get_rows_limit("pearson") is None
+    assert options.get_rows_limit("cramer_v") is None
+    assert DataQualityOptions().get_rows_limit("kendall") is None
+
+    with pytest.raises(ValueError):
+        DataQualityOptions(rank_correlations_max_rows=1).get_rows_limit("kendall")
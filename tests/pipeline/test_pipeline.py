@@ -0,0 +1,101 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from evidently import ColumnMapping
+from evidently.dashboard import Dashboard
+from evidently.dashboard.tabs import CatTargetDriftTab
+from evidently.dashboard.tabs import DataDriftTab
+from evidently.dashboard.tabs import DataQualityTab
+from evidently.dashboard.tabs import RegressionPerformanceTab
+from evidently.model_profile import Profile
+from evidently.model_profile.sections import DataDriftProfileSection
+from evidently.model_profile.sections import DataQualityProfileSection
+from evidently.model_profile.sections import NumTargetDriftProfileSection
+from evidently.model_profile.sections import RegressionPerformanceProfileSection
+from evidently.options import ExecutionOptions
+
+
+def _profile_without_timestamps(options: list) -> dict:
+    reference_data = pd.DataFrame(
+        {
+            "target": [1, 2, 3, 4, 5, 6, 7, 8],
+            "prediction": [1, 2, 7, 2, 1, 5, 6, 9],
+            "num_feature": [0.5, 0.0, 4.8, 2.1, 4.2, 1.1, 0.3, 2.2],
+            "cat_feature": [1, 2, 1, 1, 3, 2, 1, 3],
+        }
+    )
+    current_data = pd.DataFrame(
+        {
+            "target": [5, 4, 3, 2, 1, 8, 7, 6],
+            "prediction": [1, 7, 2, 7, 1, 3, 2, 6],
+            "num_feature": [0.6, 0.1, 45.3, 2.6, 4.2, 1.9, 0.7, 5.1],
+            "cat_feature": [1, 1, 2, 1, 2, 3, 3, 1],
+        }
+    )
+    profile = Profile(
+        sections=[
+            DataDriftProfileSection(),
+            DataQualityProfileSection(),
+            NumTargetDriftProfileSection(),
+            RegressionPerformanceProfileSection(),
+        ],
+        options=options,
+    )
+    profile.calculate(reference_data, current_data, ColumnMapping(categorical_features=["cat_feature"]))
+    result = json.loads(profile.json())
+    del result["timestamp"]
+
+    for section in result.values():
+        del section["datetime"]
+
+    return result
+
+
+@pytest.mark.parametrize(
+    "execution_options",
+    (
+        ExecutionOptions(executor="thread"),
+        ExecutionOptions(executor="thread", max_workers=1),
+        ExecutionOptions(executor="process", max_workers=2),
+    ),
+)
+def test_concurrent_execution_results_are_equal_to_serial(execution_options: ExecutionOptions) -> None:
+    assert _profile_without_timestamps([execution_options]) == _profile_without_timestamps([])
+
+
+@pytest.mark.parametrize(
+    "execution_options",
+    (
+        ExecutionOptions(executor="unknown"),
+        ExecutionOptions(executor="thread", max_workers=0),
+    ),
+)
+def test_execution_options_validation(execution_options: ExecutionOptions) -> None:
+    with pytest.raises(ValueError):
+        _profile_without_timestamps([execution_options])
+
+
+def test_pipeline_does_not_change_datasets() -> None:
+    reference_data = pd.DataFrame(
+        {
+            "target": [1, 2, 3, 4, 5, 6],
+            "prediction": [1.0, 2.0, np.inf, 2.0, np.nan, 5.0],
+            "num_feature": [0.5, np.nan, 4.8, 2.1, 4.2, -np.inf],
+            "cat_feature": [1, 2, 1, 1, 3, 2],
+        }
+    )
+    current_data = reference_data.iloc[::-1].reset_index(drop=True)
+    reference_source = reference_data.copy()
+    current_source = current_data.copy()
+    dashboard = Dashboard(
+        tabs=[DataDriftTab(), DataQualityTab(), CatTargetDriftTab(), RegressionPerformanceTab()]
+    )
+
+    dashboard.calculate(reference_data, current_data, ColumnMapping(categorical_features=["cat_feature"]))
+
+    assert_frame_equal(reference_data, reference_source)
+    assert_frame_equal(current_data, current_source)
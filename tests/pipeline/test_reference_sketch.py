@@ -0,0 +1,82 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently import ReferenceSketch
+from evidently.dashboard import Dashboard
+from evidently.dashboard.tabs import RegressionPerformanceTab
+from evidently.model_profile import Profile
+from evidently.model_profile.sections import DataDriftProfileSection
+from evidently.options import DataDriftOptions
+
+
+def _sample_data(size: int, shift: float) -> pd.DataFrame:
+    random_generator = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "num_1": random_generator.normal(loc=shift, size=size),
+            "num_2": random_generator.integers(0, 40, size=size),
+            "few_values": random_generator.integers(0, 5, size=size),
+            "cat_1": random_generator.choice(["a", "b", "c"], size=size),
+            "cat_2": random_generator.choice(["x", "y"], size=size),
+        }
+    )
+    data.loc[::17, "cat_1"] = np.nan
+    return data
+
+
+def _calculate_data_drift(reference_data, current_data, column_mapping, stattest) -> dict:
+    profile = Profile(
+        sections=[DataDriftProfileSection()], options=[DataDriftOptions(feature_stattest_func=stattest)]
+    )
+    profile.calculate(reference_data, current_data, column_mapping)
+    return profile.object()["data_drift"]["data"]
+
+
+@pytest.mark.parametrize(
+    "size, stattest",
+    (
+        (300, None),
+        (12000, None),
+        (300, "psi"),
+        (300, "kl_div"),
+        (300, "jensenshannon"),
+        (300, {"num_1": "wasserstein", "num_2": "wasserstein", "cat_1": "chisquare", "cat_2": "z"}),
+        (300, lambda reference, current, feature_type, threshold: (float(reference.nunique()), False)),
+    ),
+)
+def test_data_drift_with_reference_sketch(tmp_path, size, stattest) -> None:
+    column_mapping = ColumnMapping(
+        numerical_features=["num_1", "num_2"], categorical_features=["few_values", "cat_1", "cat_2"]
+    )
+    reference_data = _sample_data(size, 0)
+    current_data = _sample_data(size // 3, 0.1)
+    sketch_path = str(tmp_path / "reference.sketch")
+    ReferenceSketch.build(reference_data, column_mapping).save(sketch_path)
+    sketch = ReferenceSketch.load(sketch_path)
+
+    assert len(sketch) == size
+    assert _calculate_data_drift(sketch, current_data, column_mapping, stattest) == _calculate_data_drift(
+        reference_data, current_data, column_mapping, stattest
+    )
+
+
+def test_reference_sketch_with_unsupported_analyzers() -> None:
+    data = _sample_data(100, 0)
+    dashboard = Dashboard(tabs=[RegressionPerformanceTab()])
+
+    with pytest.raises(ValueError, match="RegressionPerformanceAnalyzer"):
+        dashboard.calculate(ReferenceSketch.build(data), data)
+
+
+def test_reference_sketch_load_unsupported_version(tmp_path) -> None:
+    sketch_path = str(tmp_path / "reference.sketch")
+
+    with open(sketch_path, "wb") as sketch_file:
+        pickle.dump({"version": 0, "sketch": None}, sketch_file)
+
+    with pytest.raises(ValueError, match="Unsupported reference sketch format"):
+        ReferenceSketch.load(sketch_path)
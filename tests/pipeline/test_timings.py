@@ -0,0 +1,113 @@
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.dashboard import Dashboard
+from evidently.dashboard.tabs import DataDriftTab
+from evidently.dashboard.tabs import RegressionPerformanceTab
+from evidently.model_profile import Profile
+from evidently.model_profile.sections import DataDriftProfileSection
+from evidently.options import ExecutionOptions
+from evidently.pipeline.timings import Timings
+from evidently.pipeline.timings import measure_timings
+
+
+def _get_datasets():
+    reference_data = pd.DataFrame({
+        "target": np.arange(100),
+        "prediction": np.arange(100) + 1,
+        "num_feature": np.linspace(0, 1, 100),
+        "cat_feature": np.arange(100) % 3,
+    })
+    current_data = reference_data.assign(num_feature=reference_data["num_feature"] * 2)
+    return reference_data, current_data, ColumnMapping(categorical_features=["cat_feature"])
+
+
+def test_timings_nested_spans():
+    finished = []
+    timings = Timings(callbacks=[finished.append])
+
+    with timings.measure("stage", "stage") as stage_record:
+        with timings.measure("widget", "first") as record:
+            record.payload_size = 10
+        with timings.measure("widget", "second") as record:
+            record.payload_size = 5
+
+    assert [record.name for record in finished] == ["first", "second", "stage"]
+    assert all(record.parent_id == stage_record.span_id for record in finished[:2])
+    assert stage_record.parent_id is None
+    assert stage_record.payload_size == 15
+    assert stage_record.wall_time >= finished[0].wall_time + finished[1].wall_time
+    assert all(record.peak_memory is None for record in finished)
+
+    report = timings.report()
+    assert report["totals"]["widget"]["count"] == 2
+    assert [record["name"] for record in report["records"]] == ["stage", "first", "second"]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="tracemalloc.reset_peak requires Python 3.9+")
+def test_timings_peak_memory():
+    timings = Timings(trace_memory=True)
+
+    with timings.measure("stage", "stage") as stage_record:
+        with timings.measure("widget", "large") as large_record:
+            data = np.ones(10 ** 6)
+            del data
+        with timings.measure("widget", "small") as small_record:
+            data = np.ones(10 ** 3)
+            del data
+
+    assert large_record.peak_memory >= 8 * 10 ** 6
+    assert small_record.peak_memory < 10 ** 6
+    assert stage_record.peak_memory >= large_record.peak_memory
+
+
+def test_measure_timings_without_timings():
+    with measure_timings(None, "stage", "stage") as record:
+        assert record is None
+
+
+@pytest.mark.parametrize("executor", ("serial", "thread", "process"))
+def test_dashboard_timings(executor):
+    reference_data, current_data, column_mapping = _get_datasets()
+    dashboard = Dashboard(
+        tabs=[DataDriftTab(), RegressionPerformanceTab()], options=[ExecutionOptions(executor=executor)]
+    )
+    dashboard.timings = Timings()
+    dashboard.calculate(reference_data, current_data, column_mapping)
+
+    records = {(record.kind, record.name): record for record in dashboard.timings.records}
+    pipeline_record = records[("pipeline", "Dashboard")]
+    assert records[("analyzer", "DataDriftAnalyzer")].parent_id == pipeline_record.span_id
+    assert records[("analyzer", "RegressionPerformanceAnalyzer")].parent_id == pipeline_record.span_id
+    tab_record = records[("stage", "DataDriftTab")]
+    assert tab_record.parent_id == pipeline_record.span_id
+
+    widget_records = [record for record in dashboard.timings.records if record.kind == "widget"]
+    assert len(widget_records) == len(dashboard.stages[0].info()) + len(dashboard.stages[1].info())
+    assert all(record.payload_size > 0 for record in widget_records)
+    assert tab_record.payload_size == sum(
+        record.payload_size for record in widget_records if record.parent_id == tab_record.span_id
+    )
+
+
+def test_profile_timings(tmp_path):
+    reference_data, current_data, column_mapping = _get_datasets()
+    profile = Profile(sections=[DataDriftProfileSection()])
+    profile.timings = Timings()
+    profile.calculate(reference_data, current_data, column_mapping)
+    result = profile.json()
+
+    render_record = profile.timings.records[-1]
+    assert (render_record.kind, render_record.name) == ("render", "json")
+    assert render_record.payload_size == len(result)
+
+    timings_path = tmp_path / "timings.json"
+    profile.timings.save(str(timings_path))
+    report = json.loads(timings_path.read_text())
+    assert {record["kind"] for record in report["records"]} == {"pipeline", "analyzer", "stage", "render"}
+    assert set(report["totals"]) == {"pipeline", "analyzer", "stage", "render"}
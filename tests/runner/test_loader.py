@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.runner.loader import DataLoader
+from evidently.runner.loader import DataOptions
+from evidently.runner.loader import NthRowsSampler
+from evidently.runner.loader import RandomRowsSampler
+from evidently.runner.loader import ReservoirSampler
+from evidently.runner.loader import SamplingOptions
+from evidently.runner.loader import StratifiedSampler
+from evidently.runner.loader import TimeBucketsSampler
+from evidently.runner.loader import get_sampler
+from evidently.runner.loader import get_used_columns
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "datetime": pd.date_range("2022-01-01", periods=10),
+            "num_feature": range(10),
+            "cat_feature": ["a", "b"] * 5,
+            "unused": [0.5] * 10,
+        }
+    )
+
+
+def test_load_csv_columns_and_dtypes(tmp_path, data: pd.DataFrame) -> None:
+    filename = str(tmp_path / "data.csv")
+    data.to_csv(filename, index=False)
+    data_options = DataOptions(
+        usecols=["datetime", "num_feature", "cat_feature", "target"], dtypes={"cat_feature": "category"}
+    )
+    result = DataLoader().load(filename, data_options)
+
+    assert list(result.columns) == ["datetime", "num_feature", "cat_feature"]
+    assert pd.api.types.is_datetime64_any_dtype(result["datetime"])
+    assert isinstance(result["cat_feature"].dtype, pd.CategoricalDtype)
+
+
+def test_load_csv_by_chunks(tmp_path, data: pd.DataFrame) -> None:
+    filename = str(tmp_path / "data.csv")
+    data.to_csv(filename, index=False)
+    loader = DataLoader()
+    data_options = DataOptions(chunk_size=3, dtypes={"cat_feature": "category"})
+
+    assert [len(chunk) for chunk in loader.iterate(filename, data_options)] == [3, 3, 3, 1]
+
+    result = loader.load(filename, data_options)
+    assert isinstance(result["cat_feature"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(result.astype({"cat_feature": object}), data)
+    # sampling gives the same rows with and without chunks
+    sampling_options = SamplingOptions(type="nth", n=3)
+    pd.testing.assert_frame_equal(
+        loader.load(filename, data_options, sampling_options),
+        loader.load(filename, DataOptions(dtypes={"cat_feature": "category"}), sampling_options),
+    )
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_load_columnar_formats(tmp_path, data: pd.DataFrame, file_format: str) -> None:
+    pytest.importorskip("pyarrow")
+    filename = str(tmp_path / f"data.{file_format}")
+    getattr(data, f"to_{file_format}")(filename)
+    loader = DataLoader()
+
+    pd.testing.assert_frame_equal(loader.load(filename, DataOptions()), data)
+
+    data_options = DataOptions(usecols=["num_feature", "cat_feature", "target"], chunk_size=4)
+    assert [len(chunk) for chunk in loader.iterate(filename, data_options)] == [4, 4, 2]
+    pd.testing.assert_frame_equal(loader.load(filename, data_options), data[["num_feature", "cat_feature"]])
+
+    csv_filename = str(tmp_path / "data.csv")
+    data.to_csv(csv_filename, index=False)
+    sampling_options = SamplingOptions(type="nth", n=3)
+    pd.testing.assert_frame_equal(
+        loader.load(filename, DataOptions(), sampling_options),
+        loader.load(csv_filename, DataOptions(), sampling_options),
+    )
+
+
+def test_get_used_columns() -> None:
+    assert get_used_columns(ColumnMapping()) is None
+    assert get_used_columns(ColumnMapping(numerical_features=["num_feature"], categorical_features=[])) is None
+    assert get_used_columns(
+        ColumnMapping(
+            prediction=["label_a", "label_b"],
+            numerical_features=["num_feature"],
+            categorical_features=["cat_feature"],
+            datetime_features=[],
+        ),
+        date_column="datetime",
+    ) == ["target", "datetime", "label_a", "label_b", "num_feature", "cat_feature"]
+
+
+def _sample(sampler, data: pd.DataFrame, chunk_size: int) -> pd.DataFrame:
+    chunks = [sampler.sample(data.iloc[start:start + chunk_size]) for start in range(0, len(data), chunk_size)]
+    chunks.append(sampler.finish())
+    return pd.concat([chunk for chunk in chunks if chunk is not None], ignore_index=True)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100])
+def test_nth_rows_sampler(chunk_size: int) -> None:
+    data = pd.DataFrame({"value": range(100)})
+
+    assert _sample(NthRowsSampler(3), data, chunk_size)["value"].tolist() == list(range(0, 100, 3))
+    assert _sample(NthRowsSampler(1), data, chunk_size)["value"].tolist() == list(range(100))
+
+
+def test_random_rows_sampler() -> None:
+    data = pd.DataFrame({"value": range(10000)})
+    sample = _sample(RandomRowsSampler(0.1, random_seed=1), data, 1000)
+
+    assert 900 < len(sample) < 1100
+    assert sample["value"].is_monotonic_increasing
+    pd.testing.assert_frame_equal(sample, _sample(RandomRowsSampler(0.1, random_seed=1), data, 1000))
+
+    with pytest.raises(ValueError):
+        RandomRowsSampler(1.5, random_seed=1)
+
+
+def test_reservoir_sampler() -> None:
+    data = pd.DataFrame({"value": range(100)})
+    counts = np.zeros(100)
+
+    for random_seed in range(300):
+        sample = _sample(ReservoirSampler(10, random_seed), data, 25)
+        assert len(sample) == 10
+        assert sample["value"].is_monotonic_increasing
+        counts[sample["value"]] += 1
+
+    # each row is sampled with probability 0.1
+    assert counts.min() > 10 and counts.max() < 50
+    # the sample does not depend on chunks
+    pd.testing.assert_frame_equal(_sample(ReservoirSampler(10, 1), data, 3), _sample(ReservoirSampler(10, 1), data, 100))
+    assert _sample(ReservoirSampler(200, 1), data, 30)["value"].tolist() == list(range(100))
+
+
+def test_load_csv_with_reservoir_sampling(tmp_path, data: pd.DataFrame) -> None:
+    filename = str(tmp_path / "data.csv")
+    data.to_csv(filename, index=False)
+    sampling_options = SamplingOptions(type="reservoir", n=4, random_seed=2)
+    loader = DataLoader()
+    sample = loader.load(filename, DataOptions(), sampling_options)
+
+    assert len(sample) == 4
+    pd.testing.assert_frame_equal(sample, loader.load(filename, DataOptions(chunk_size=3), sampling_options))
+
+
+def test_grouped_reservoir_sampler() -> None:
+    data = pd.DataFrame({"value": range(100), "group": [1, None, 2, 2, 3] * 20})
+    sample = _sample(ReservoirSampler(5, 1, lambda chunk: chunk["group"]), data, 7)
+
+    assert sample["value"].is_monotonic_increasing
+    assert sample["group"].value_counts().to_dict() == {1: 5, 2: 5, 3: 5}
+    assert sample["group"].isna().sum() == 5
+
+
+def test_stratified_sampler() -> None:
+    data = pd.DataFrame({"value": range(10000), "target": ["a"] * 9000 + ["b"] * 990 + ["c"] * 10})
+    data = data.sample(frac=1, random_state=0).reset_index(drop=True)
+    sample = _sample(StratifiedSampler("target", 0.1, 20, random_seed=1), data, 1000)
+    counts = sample["target"].value_counts()
+
+    assert 800 < counts["a"] < 1000
+    # rare values have at least n rows or all their rows
+    assert 20 <= counts["b"] < 130
+    assert counts["c"] == 10
+    assert sample["value"].is_unique
+    assert sample["value"].tolist() == data["value"][data["value"].isin(sample["value"])].tolist()
+    pd.testing.assert_frame_equal(
+        sample, _sample(StratifiedSampler("target", 0.1, 20, random_seed=1), data, 333)
+    )
+
+
+def test_time_buckets_sampler() -> None:
+    data = pd.DataFrame(
+        {
+            "value": range(100),
+            "date": [pd.Timestamp("2022-01-01") + pd.Timedelta(hours=i ** 2 / 100) for i in range(100)],
+        }
+    )
+    sample = _sample(TimeBucketsSampler("date", "H", 3, random_seed=1), data, 10)
+    hours = data["date"].dt.floor("H")
+
+    assert sample["value"].is_monotonic_increasing
+    assert sample["date"].dt.floor("H").value_counts().to_dict() == {
+        hour: min(count, 3) for hour, count in hours.value_counts().items()
+    }
+
+
+def test_get_sampler_errors() -> None:
+    with pytest.raises(ValueError, match="column"):
+        get_sampler(SamplingOptions(type="stratified"))
+
+    with pytest.raises(ValueError, match="date_column"):
+        get_sampler(SamplingOptions(type="time"))
+
+    with pytest.raises(ValueError, match="Unexpected sampling type"):
+        get_sampler(SamplingOptions(type="unknown"))
+
+
+def test_load_csv_with_time_sampling(tmp_path) -> None:
+    filename = str(tmp_path / "data.csv")
+    data = pd.DataFrame({"date": pd.date_range("2022-01-01", periods=48, freq="H"), "value": range(48)})
+    data.to_csv(filename, index=False)
+    sample = DataLoader().load(
+        filename, DataOptions(date_column="date", chunk_size=5), SamplingOptions(type="time", period="D", n=2)
+    )
+
+    assert len(sample) == 4
+    assert sample["date"].dt.day.tolist() == [1, 1, 2, 2]
@@ -0,0 +1,85 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently import ColumnMapping
+from evidently.runner.loader import DataLoader
+from evidently.runner.loader import DataOptions
+from evidently.runner.profile_runner import ProfileRunner
+from evidently.runner.profile_runner import ProfileRunnerOptions
+
+
+def _run_profile(tmp_path, name: str, chunk_size, profile_parts) -> dict:
+    options = ProfileRunnerOptions(
+        reference_data_path=str(tmp_path / "reference.csv"),
+        reference_data_options=DataOptions(date_column=None),
+        reference_data_sampling=None,
+        current_data_path=str(tmp_path / "current.csv"),
+        current_data_options=DataOptions(date_column=None, chunk_size=chunk_size),
+        current_data_sampling=None,
+        column_mapping=ColumnMapping(numerical_features=["num_feature"], categorical_features=["cat_feature"]),
+        options=[],
+        output_path=str(tmp_path / name),
+        profile_parts=profile_parts,
+        pretty_print=False,
+    )
+    ProfileRunner(options).run()
+
+    with open(str(tmp_path / f"{name}.json"), encoding="utf-8") as profile_file:
+        result = json.load(profile_file)
+
+    del result["timestamp"]
+
+    for section in result.values():
+        del section["datetime"]
+
+    return result
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    random_generator = np.random.default_rng(0)
+
+    for name in ("reference", "current"):
+        pd.DataFrame(
+            {
+                "target": random_generator.normal(size=100),
+                "num_feature": random_generator.normal(size=100),
+                "cat_feature": random_generator.choice(["a", "b", "c"], size=100),
+            }
+        ).to_csv(str(tmp_path / f"{name}.csv"), index=False)
+
+
+def test_profile_runner_reads_current_data_by_chunks(tmp_path, data_files, monkeypatch) -> None:
+    profile_parts = {"data_drift": {}, "data_quality": {}}
+    expected = _run_profile(tmp_path, "profile", None, profile_parts)
+
+    original_load = DataLoader.load
+
+    def load(loader, filename, *args):
+        assert not filename.endswith("current.csv"), "current data should not be loaded at once"
+        return original_load(loader, filename, *args)
+
+    monkeypatch.setattr(DataLoader, "load", load)
+    chunks_sizes = []
+    original_iterate = ProfileRunner._iterate_current_data
+
+    def iterate_current_data(runner):
+        for chunk in original_iterate(runner):
+            chunks_sizes.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr(ProfileRunner, "_iterate_current_data", iterate_current_data)
+    result = _run_profile(tmp_path, "chunked_profile", 30, profile_parts)
+
+    assert chunks_sizes == [30, 30, 30, 10]
+    assert result == expected
+
+
+def test_profile_runner_loads_current_data_for_not_mergeable_sections(tmp_path, data_files) -> None:
+    profile_parts = {"num_target_drift": {}}
+
+    assert _run_profile(tmp_path, "chunked_profile", 30, profile_parts) == \
+        _run_profile(tmp_path, "profile", None, profile_parts)
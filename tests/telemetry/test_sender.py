@@ -0,0 +1,99 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from typing import Iterator
+from typing import List
+
+import pytest
+
+from evidently.telemetry import TelemetrySender
+
+
+class _StubServer(HTTPServer):
+    received: List[dict]
+    response_delay: float = 0
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: _StubServer
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.server.response_delay)
+        self.server.received.append(json.loads(body))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[_StubServer]:
+    stub_server = _StubServer(("127.0.0.1", 0), _StubHandler)
+    stub_server.received = []
+    thread = threading.Thread(target=stub_server.serve_forever, daemon=True)
+    thread.start()
+    yield stub_server
+    stub_server.shutdown()
+    stub_server.server_close()
+
+
+def _address(stub_server: HTTPServer) -> str:
+    return f"http://127.0.0.1:{stub_server.server_address[1]}/"
+
+
+def test_telemetry_sender(server: _StubServer) -> None:
+    sender = TelemetrySender(_address(server))
+    sender.send({"type": "dashboard"})
+    sender.send({"type": "profile"})
+
+    assert sender.flush(timeout=10)
+    assert [item["usage"] for item in server.received] == [{"type": "dashboard"}, {"type": "profile"}]
+    assert server.received[0]["evidently"]["version"]
+    assert not sender.disabled
+
+
+def test_telemetry_sender_does_not_wait_for_server(server: _StubServer) -> None:
+    server.response_delay = 1
+    sender = TelemetrySender(_address(server))
+    start = time.monotonic()
+    sender.send({"type": "dashboard"})
+
+    assert time.monotonic() - start < 0.5
+    assert not sender.flush(timeout=0.1)
+    assert sender.flush(timeout=10)
+    assert len(server.received) == 1
+
+
+def test_telemetry_sender_without_network() -> None:
+    # a free port without a server
+    with socket.socket() as free_socket:
+        free_socket.bind(("127.0.0.1", 0))
+        port = free_socket.getsockname()[1]
+
+    sender = TelemetrySender(f"http://127.0.0.1:{port}/")
+    sender.send({"type": "dashboard"})
+
+    assert sender.flush(timeout=10)
+    assert sender.disabled
+
+    # new data is dropped
+    sender.send({"type": "profile"})
+    assert sender.flush(timeout=0)
+
+
+def test_telemetry_sender_queue_size(server: _StubServer) -> None:
+    server.response_delay = 0.2
+    sender = TelemetrySender(_address(server), queue_size=2)
+
+    for _ in range(10):
+        sender.send({"type": "dashboard"})
+
+    assert sender.flush(timeout=10)
+    # the first item can be taken from the queue by the sender thread before others are put
+    assert 2 <= len(server.received) <= 3
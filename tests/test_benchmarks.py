@@ -0,0 +1,46 @@
+from benchmarks.__main__ import main
+from benchmarks.runner import BenchmarkResult
+from benchmarks.runner import compare
+from benchmarks.runner import load_results
+
+
+def test_run_benchmarks(tmp_path):
+    output = tmp_path / "results.json"
+
+    assert main(["--rows", "100", "--num-columns", "2", "--cat-columns", "1", "--filter", "analyzers.",
+                 "--repeat", "1", "--output", str(output)]) == 0
+
+    results = load_results(str(output))
+    assert len(results) == 7
+    assert all(result.error is None and result.time > 0 and result.peak_memory > 0 for result in results)
+    assert main(["--rows", "100", "--num-columns", "2", "--cat-columns", "1", "--filter", "DataDriftAnalyzer",
+                 "--repeat", "1", "--baseline", str(output), "--time-tolerance", "100"]) == 0
+
+
+def test_compare():
+    baseline = [
+        BenchmarkResult("same", time=1.0, peak_memory=100),
+        BenchmarkResult("slower", time=1.0, peak_memory=100),
+        BenchmarkResult("more_memory", time=1.0, peak_memory=100),
+        BenchmarkResult("failed", time=1.0, peak_memory=100),
+        BenchmarkResult("fixed", error="ValueError"),
+    ]
+    results = [
+        BenchmarkResult("same", time=1.1, peak_memory=90),
+        BenchmarkResult("slower", time=1.5, peak_memory=100),
+        BenchmarkResult("more_memory", time=1.0, peak_memory=150),
+        BenchmarkResult("failed", error="ValueError"),
+        BenchmarkResult("fixed", time=1.0, peak_memory=100),
+        BenchmarkResult("new", time=1.0, peak_memory=100),
+    ]
+
+    comparisons = compare(results, baseline, time_tolerance=0.2, memory_tolerance=0.2)
+
+    assert {comparison.name: comparison.regression for comparison in comparisons} == {
+        "same": False,
+        "slower": True,
+        "more_memory": True,
+        "failed": True,
+        "fixed": False,
+    }
+    assert comparisons[1].time_ratio == 1.5
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module", ("evidently", "evidently.model_profile", "evidently.model_monitoring", "evidently.dashboard")
+)
+def test_heavy_dependencies_are_not_imported(module: str) -> None:
+    # a new interpreter, modules are already imported in the tests process
+    code = (
+        f"import sys, {module}; "
+        "print(','.join(name for name in ('plotly', 'scipy', 'sklearn') if name in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True, universal_newlines=True)
+    assert result.stdout.strip() == ""
+
+
+def test_tabs_lazy_import() -> None:
+    from evidently.dashboard import tabs
+    from evidently.dashboard.tabs import DataDriftTab
+    from evidently.dashboard.tabs.data_drift_tab import DataDriftTab as DataDriftTabFromModule
+
+    assert DataDriftTab is DataDriftTabFromModule
+    assert "DataQualityTab" in dir(tabs)
+
+    with pytest.raises(AttributeError):
+        getattr(tabs, "UnknownTab")
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from evidently.utils.data_operations import finite_data_cache
+from evidently.utils.data_operations import get_finite_data
+
+
+def test_get_finite_data() -> None:
+    dataset = pd.DataFrame(
+        {
+            "num": [1.0, np.inf, 3.0, 4.0, -np.inf],
+            "obj": ["a", "b", None, "d", "e"],
+            "int": [1, 2, 3, 4, 5],
+        }
+    )
+    source = dataset.copy()
+
+    result = get_finite_data(dataset)
+
+    assert_frame_equal(result, dataset.iloc[[0, 3]])
+    # source data is not changed
+    assert_frame_equal(dataset, source)
+
+
+def test_get_finite_data_with_columns() -> None:
+    dataset = pd.DataFrame({"num": [1.0, np.nan, 3.0], "other": [np.inf, 2.0, 3.0]})
+
+    assert_frame_equal(get_finite_data(dataset, ["num"]), dataset[["num"]].iloc[[0, 2]])
+
+
+def test_get_finite_data_without_missing_values_is_not_copied() -> None:
+    dataset = pd.DataFrame({"num": [1.0, 2.0], "obj": ["a", "b"]})
+
+    assert get_finite_data(dataset) is dataset
+
+
+def test_finite_data_cache() -> None:
+    dataset = pd.DataFrame({"num": [1.0, np.nan, 3.0]})
+
+    assert get_finite_data(dataset) is not get_finite_data(dataset)
+
+    with finite_data_cache():
+        first_result = get_finite_data(dataset)
+
+        assert get_finite_data(dataset) is first_result
+        assert get_finite_data(dataset, ["num"]) is not first_result
+
+    assert get_finite_data(dataset) is not first_result
@@ -0,0 +1,110 @@
+import dataclasses
+import io
+import json
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.utils import json_serializer
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch) -> str:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+
+    else:
+        monkeypatch.setattr(json_serializer, "_get_orjson", lambda: None)
+
+    return request.param
+
+
+@dataclasses.dataclass
+class _Item:
+    name: str
+    values: Any
+    children: tuple = ()
+
+
+_TEST_OBJECT = {
+    "items": [
+        _Item("a", np.array([0.5, 1.5])),
+        _Item("b", np.arange(6, dtype=np.int32).reshape(2, 3), (_Item("c", {"flag": np.bool_(True)}),)),
+    ],
+    "scalars": [np.int64(3), np.float32(0.25), np.uint8(7), pd.Timestamp(2022, 2, 3, 12), pd.Timedelta(days=1)],
+    "objects": np.array([1, "x", None], dtype=object),
+    "empty": {},
+    1: None,
+}
+_EXPECTED = {
+    "items": [
+        {"name": "a", "values": [0.5, 1.5], "children": []},
+        {
+            "name": "b",
+            "values": [[0, 1, 2], [3, 4, 5]],
+            "children": [{"name": "c", "values": {"flag": True}, "children": []}],
+        },
+    ],
+    "scalars": [3, 0.25, 7, "2022-02-03 12:00:00", "1 days 00:00:00"],
+    "objects": [1, "x", None],
+    "empty": {},
+    "1": None,
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_dumps(backend: str, indent) -> None:
+    assert json.loads(json_serializer.dumps(_TEST_OBJECT, indent=indent)) == _EXPECTED
+
+
+def test_dump_by_chunks(backend: str) -> None:
+    out_file = io.StringIO()
+    json_serializer.dump(_TEST_OBJECT, out_file)
+
+    assert json.loads(out_file.getvalue()) == _EXPECTED
+
+
+_NOT_FINITE_OBJECT = {
+    "floats": [np.nan, np.inf, -np.inf, 1.5, np.float32(np.nan)],
+    "arrays": [np.array([np.nan, 1.0]), np.array([[np.inf]], dtype=np.float32)],
+    "items": [_Item("a", np.array([np.nan, -np.inf]))],
+    "datetimes": pd.Series(pd.date_range("2022-01-01", periods=2)).to_numpy(),
+    "text": "é",
+}
+
+
+def _dumps_by_chunks(obj: Any) -> str:
+    out_file = io.StringIO()
+    json_serializer.dump(obj, out_file)
+    return out_file.getvalue()
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_not_finite_values(monkeypatch, indent) -> None:
+    pytest.importorskip("orjson")
+    orjson_results = [json_serializer.dumps(_NOT_FINITE_OBJECT, indent=indent), _dumps_by_chunks(_NOT_FINITE_OBJECT)]
+    orjson_finite_result = json_serializer.dumps(_TEST_OBJECT, indent=indent)
+
+    monkeypatch.setattr(json_serializer, "_get_orjson", lambda: None)
+
+    assert [json_serializer.dumps(_NOT_FINITE_OBJECT, indent=indent), _dumps_by_chunks(_NOT_FINITE_OBJECT)] == \
+        orjson_results
+    assert json_serializer.dumps(_TEST_OBJECT, indent=indent) == orjson_finite_result
+
+    # values are written as NumpyEncoder writes them
+    result = json.loads(orjson_results[0])
+    assert np.isnan(result["floats"][0]) and result["floats"][1:4] == [np.inf, -np.inf, 1.5]
+    assert np.isnan(result["floats"][4])
+    assert np.isnan(result["arrays"][0][0]) and result["arrays"][1] == [[np.inf]]
+    assert np.isnan(result["items"][0]["values"][0]) and result["items"][0]["values"][1] == -np.inf
+    assert result["datetimes"] == _NOT_FINITE_OBJECT["datetimes"].astype(np.int64).tolist()
+    assert result["text"] == "é"
+
+
+@pytest.mark.parametrize("test_object", [datetime(2022, 1, 13), {1, 2, 3}])
+def test_unsupported_types(backend: str, test_object) -> None:
+    with pytest.raises(TypeError):
+        json_serializer.dumps(test_object)
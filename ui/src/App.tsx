@@ -47,7 +47,7 @@ const theme = createTheme({
     }
 });
 
-function App(props: { dashboard: DashboardInfo, additionalGraphs: Map<string, AdditionalGraphInfo>}) {
+function App(props: { dashboard: DashboardInfo, additionalGraphs: Map<string, AdditionalGraphInfo | string>}) {
     return (
         <ThemeProvider theme={theme}>
             <ApiContext.Provider value={{Api: new LocalApi(props.dashboard, props.additionalGraphs)}}>
@@ -1,22 +1,77 @@
 import {AdditionalGraphInfo, Api, DashboardInfo, ProjectInfo, WidgetInfo} from "./Api";
 
+type GraphData = AdditionalGraphInfo | WidgetInfo;
+
+const graphCallbacks = new Map<string, (graph: GraphData) => void>();
+
+// graphs saved to separate files are scripts that call this function with their urls
+// @ts-ignore
+window.evidentlyGraphLoaded = (url: string, graph: GraphData) => {
+    const callback = graphCallbacks.get(url);
+    if (callback !== undefined) {
+        graphCallbacks.delete(url);
+        callback(graph);
+    }
+};
+
+function loadGraphScript(url: string): Promise<GraphData> {
+    return new Promise((resolve, reject) => {
+        graphCallbacks.set(url, resolve);
+        const script = document.createElement("script");
+        script.src = url;
+        script.onload = () => script.remove();
+        script.onerror = () => {
+            graphCallbacks.delete(url);
+            script.remove();
+            reject(`Failed to load graph from ${url}`);
+        };
+        document.head.appendChild(script);
+    });
+}
+
+// in-flight and finished loads, so repeated requests of a graph share one script and callback
+const graphLoads = new Map<string, Promise<GraphData>>();
+
+function loadGraph(url: string): Promise<GraphData> {
+    let load = graphLoads.get(url);
+    if (load === undefined) {
+        load = loadGraphScript(url);
+        // failed loads are forgotten to allow retrying them
+        load.catch(() => graphLoads.delete(url));
+        graphLoads.set(url, load);
+    }
+    return load;
+}
+
 export default class LocalApi implements Api {
     private readonly dashboard: DashboardInfo;
-    private additionalGraphs: Map<string, AdditionalGraphInfo | WidgetInfo>;
+    private additionalGraphs: Map<string, GraphData | string>;
 
-    constructor(dashboard: DashboardInfo, additionalGraphs: Map<string, AdditionalGraphInfo | WidgetInfo>) {
+    constructor(dashboard: DashboardInfo, additionalGraphs: Map<string, GraphData | string>) {
         this.dashboard = dashboard;
         this.additionalGraphs = additionalGraphs;
     }
 
+    private async getGraph(graphId: string): Promise<GraphData> {
+        const graph = this.additionalGraphs.get(graphId);
+        if (graph === undefined) {
+            throw "No graph found";
+        }
+        if (typeof graph !== "string") {
+            return graph;
+        }
+        // the graph is saved to a separate file, the value is its url
+        const loaded = await loadGraph(graph);
+        this.additionalGraphs.set(graphId, loaded);
+        return loaded;
+    }
+
     getAdditionalGraphData(projectId: string, dashboardId: string, graphId: string): Promise<AdditionalGraphInfo> {
-        var graph = this.additionalGraphs.get(graphId);
-        return graph ? Promise.resolve(graph as AdditionalGraphInfo) : Promise.reject("No graph found");
+        return this.getGraph(graphId).then(graph => graph as AdditionalGraphInfo);
     }
 
     getAdditionalWidgetData(projectId: string, dashboardId: string, widgetId: string): Promise<WidgetInfo> {
-        var graph = this.additionalGraphs.get(widgetId);
-        return graph ? Promise.resolve(graph as WidgetInfo) : Promise.reject("No graph found");
+        return this.getGraph(widgetId).then(graph => graph as WidgetInfo);
     }
 
     getDashboard(projectId: string, dashboardId: string): Promise<DashboardInfo> {
@@ -26,4 +81,4 @@ export default class LocalApi implements Api {
     getProjects(): Promise<ProjectInfo[]> {
         return Promise.resolve([]);
     }
-}
\ No newline at end of file
+}
@@ -5,7 +5,7 @@ import App from './App';
 import {AdditionalGraphInfo, DashboardInfo} from "./api/Api";
 
 
-export function drawDashboard(dashboard: DashboardInfo, additionalGraphs: Map<string, AdditionalGraphInfo>, tagId: string) {
+export function drawDashboard(dashboard: DashboardInfo, additionalGraphs: Map<string, AdditionalGraphInfo | string>, tagId: string) {
     ReactDOM.render(
         <React.StrictMode>
             <App dashboard={dashboard} additionalGraphs={additionalGraphs} />